@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 from pydantic import BaseModel
+from starlette.responses import PlainTextResponse
 
 from api.services import angelia_service
 
@@ -23,6 +24,13 @@ async def tick_timer(req: TickTimerRequest):
     return angelia_service.tick_timer(project_id=req.project_id)
 
 
+@router.get("/leases")
+async def leases(project_id: str | None = None):
+    return angelia_service.leases(project_id=project_id)
+
+
 @router.get("/metrics")
-async def metrics():
+async def metrics(format: str = "json"):
+    if str(format or "").strip().lower() == "prometheus":
+        return PlainTextResponse(angelia_service.metrics_prometheus(), media_type="text/plain; version=0.0.4")
     return angelia_service.metrics()
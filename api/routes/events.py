@@ -58,6 +58,7 @@ async def list_events(
     state: str = "",
     agent_id: str = "",
     limit: int = 100,
+    include_archived: bool = False,
 ) -> dict:
     return event_service.list(
         project_id=project_id,
@@ -66,6 +67,7 @@ async def list_events(
         state=state,
         limit=limit,
         agent_id=agent_id,
+        include_archived=include_archived,
     )
 
 
@@ -115,6 +115,11 @@ async def mnemo_template_vars(project_id: str | None = None, intent_key: str = "
     return mnemosyne_service.list_template_vars(project_id=project_id, intent_key=intent_key)
 
 
+@router.get("/compaction-metrics")
+async def mnemo_compaction_metrics(project_id: str | None = None) -> dict:
+    return mnemosyne_service.compaction_metrics(project_id=project_id)
+
+
 @router.get("/artifacts")
 async def mnemo_artifact_list(
     project_id: str | None = None,
@@ -45,6 +45,7 @@ class AgentService:
             queued = int(row.get("queued_events", 0) or 0)
             worker_state = str(row.get("run_state", "idle") or "idle")
             llm_state = self._derive_llm_state(row, queued)
+            inbox = iris_facade.get_mailbox_summary(pid, aid, unread_limit=0, handled_limit=0, include_receipts=False)
             items.append(
                 {
                     "project_id": pid,
@@ -61,7 +62,7 @@ class AgentService:
                     "last_next_step": "",
                     "last_error": row.get("last_error", ""),
                     "queued_pulse_events": queued,
-                    "has_pending_inbox": bool(iris_facade.has_pending(pid, aid)),
+                    "has_pending_inbox": inbox.unread_count > 0,
                 }
             )
         return {"project_id": pid, "agents": items}
@@ -21,8 +21,15 @@ class AngeliaService:
         pid = resolve_project(project_id)
         return angelia_facade.tick_timer_once(pid)
 
+    def leases(self, project_id: str | None = None) -> dict[str, Any]:
+        pid = resolve_project(project_id)
+        return angelia_facade.list_worker_leases(pid)
+
     def metrics(self) -> dict[str, Any]:
-        return {"metrics": angelia_facade.metrics_snapshot()}
+        return {"metrics": angelia_facade.metrics_snapshot(), "histograms": angelia_facade.latency_histograms()}
+
+    def metrics_prometheus(self) -> str:
+        return angelia_facade.metrics_prometheus()
 
 
 angelia_service = AngeliaService()
@@ -246,9 +246,11 @@ class EventService:
         state: str = "",
         limit: int = 100,
         agent_id: str = "",
+        include_archived: bool = False,
     ) -> dict[str, Any]:
         pid = resolve_project(project_id)
         st = events_bus.EventState(state) if state else None
+        limit = max(1, min(limit, 1000))
         rows = [
             x.to_dict()
             for x in events_bus.list_events(
@@ -256,10 +258,27 @@ class EventService:
                 domain=domain,
                 event_type=event_type,
                 state=st,
-                limit=max(1, min(limit, 1000)),
+                limit=limit,
                 agent_id=agent_id,
             )
         ]
+        if include_archived and len(rows) < limit:
+            live_ids = {str(x.get("event_id", "")) for x in rows}
+            for x in events_bus.list_archived_events(
+                pid,
+                domain=domain,
+                event_type=event_type,
+                state=st,
+                limit=limit - len(rows) + len(live_ids),
+                agent_id=agent_id,
+            ):
+                if x.event_id in live_ids:
+                    continue
+                row = x.to_dict()
+                row["archived"] = True
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
         return {"project_id": pid, "items": rows}
 
     def retry(self, project_id: str | None, event_id: str) -> dict[str, Any]:
@@ -115,6 +115,10 @@ class MnemosyneService:
             raise HTTPException(status_code=400, detail="intent_key is required")
         return {"project_id": pid, **intent_schema_registry.template_vars_for_intent(pid, key)}
 
+    def compaction_metrics(self, project_id: str | None) -> dict[str, Any]:
+        pid = resolve_project(project_id)
+        return {"project_id": pid, **mnemosyne_facade.compaction_metrics(pid)}
+
     def list_artifacts(
         self,
         project_id: str | None,
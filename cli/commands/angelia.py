@@ -18,6 +18,15 @@ def _pid(args) -> str:
 
 
 def cmd_angelia(args):
+    if args.subcommand == "workers":
+        # Runs locally next to the server; workers coordinate through the project event store.
+        from gods.angelia.worker_pool import run_worker_pool
+
+        projects = [args.project] if args.project else None
+        print(f"Starting {max(1, args.processes)} Angelia worker processes (Ctrl+C to stop)")
+        run_worker_pool(args.processes, project_ids=projects)
+        return
+
     base = get_base_url()
     pid = _pid(args)
 
@@ -48,6 +57,7 @@ def cmd_angelia(args):
             "state": args.state or "",
             "event_type": raw_type or "",
             "limit": args.limit,
+            "include_archived": bool(getattr(args, "archived", False)),
         }
         res = requests.get(f"{base}/events", params=params, timeout=10)
         print(json.dumps(res.json(), ensure_ascii=False, indent=2))
@@ -56,6 +66,10 @@ def cmd_angelia(args):
         res = requests.get(f"{base}/angelia/agents/status", params={"project_id": pid}, timeout=10)
         print(json.dumps(res.json(), ensure_ascii=False, indent=2))
 
+    elif args.subcommand == "leases":
+        res = requests.get(f"{base}/angelia/leases", params={"project_id": pid}, timeout=10)
+        print(json.dumps(res.json(), ensure_ascii=False, indent=2))
+
     elif args.subcommand == "retry":
         res = requests.post(
             f"{base}/events/{args.event_id}/retry",
@@ -37,11 +37,17 @@ def _resolve_project_key(raw_key: str) -> str:
         "memory.keep": "summarize_keep_count",
         "memory.compact_trigger": "memory_compact_trigger_tokens",
         "memory.compact_strategy": "memory_compact_strategy",
+        "memory.intent_durability": "memory_intent_durability",
+        "memory.intent_flush_ms": "memory_intent_flush_ms",
+        "memory.pulse_segment_kb": "memory_pulse_segment_kb",
+        "memory.pulse_segment_compress": "memory_pulse_segment_compress",
         "phase.strategy": "phase_strategy",
         "hermes.enabled": "hermes_enabled",
         "hermes.timeout": "hermes_default_timeout_sec",
         "hermes.rate": "hermes_default_rate_per_minute",
         "hermes.concurrency": "hermes_default_max_concurrency",
+        "hermes.http_pool_size": "hermes_http_pool_size",
+        "hermes.http_keepalive": "hermes_http_keepalive",
         "llm.control": "llm_control_enabled",
         "llm.global.max_concurrency": "llm_global_max_concurrency",
         "llm.global.rate": "llm_global_rate_per_minute",
@@ -88,6 +94,12 @@ def cmd_config(args):
             print(f"   Angelia Pick Batch Size: {proj.get('angelia_pick_batch_size', 10)}")
             print(f"   Angelia Cooldown Preempt Types: {proj.get('angelia_cooldown_preempt_types', ['mail_event','manual'])}")
             print(f"   Angelia Dedupe Window: {proj.get('angelia_dedupe_window_sec', 5)}s")
+            print(f"   Angelia Idle Recheck: {proj.get('angelia_idle_recheck_sec', 30)}s")
+            print(f"   Angelia Supervisor Mode: {proj.get('angelia_supervisor_mode', 'threads')}")
+            print(f"   Angelia Lease TTL: {proj.get('angelia_lease_ttl_sec', 30)}s")
+            print(f"   Angelia Latency Metrics: {proj.get('angelia_latency_metrics_enabled', False)}")
+            print(f"   Event Store Backend: {proj.get('event_store_backend', 'jsonl')}")
+            print(f"   Event Archive After: {proj.get('event_archive_after_sec', 86400)}s")
             
             print(f"\n📊 Memory:")
             print(f"   Summarize Threshold: {proj.get('summarize_threshold', 12)} messages")
@@ -95,6 +107,9 @@ def cmd_config(args):
             print(f"   Tool Loop Max: {proj.get('tool_loop_max', 8)} per pulse")
             print(f"   Memory Compact Trigger Tokens: {proj.get('memory_compact_trigger_tokens', 12000)}")
             print(f"   Memory Compact Strategy: {proj.get('memory_compact_strategy', 'semantic_llm')}")
+            print(f"   Intent Durability: {proj.get('memory_intent_durability', 'intent')}")
+            print(f"   Intent Flush Interval: {proj.get('memory_intent_flush_ms', 200)}ms")
+            print(f"   Pulse Ledger Segment: {proj.get('memory_pulse_segment_kb', 4096)}KB ({proj.get('memory_pulse_segment_compress', 'gzip')})")
             print(f"\n🪞 Janus Context:")
             print(f"   Strategy: {proj.get('context_strategy', 'structured_v1')}")
             print(f"   Token Budget Total: {proj.get('context_token_budget_total', 32000)}")
@@ -131,6 +146,7 @@ def cmd_config(args):
             print(f"   Default Rate Limit: {proj.get('hermes_default_rate_per_minute', 60)} /min")
             print(f"   Default Max Concurrency: {proj.get('hermes_default_max_concurrency', 2)}")
             print(f"   Allow agent_tool Provider: {proj.get('hermes_allow_agent_tool_provider', False)}")
+            print(f"   HTTP Provider Pool: {proj.get('hermes_http_pool_size', 8)} (keep-alive: {proj.get('hermes_http_keepalive', True)})")
             print(f"\n🐳 Runtime (Command Executor):")
             print(f"   Executor: {proj.get('command_executor', 'local')}")
             print(f"   Docker Enabled: {proj.get('docker_enabled', True)}")
@@ -233,6 +249,12 @@ def cmd_config(args):
                 "angelia_timer_enabled",
                 "angelia_timer_idle_sec",
                 "angelia_dedupe_window_sec",
+                "angelia_idle_recheck_sec",
+                "angelia_supervisor_mode",
+                "angelia_lease_ttl_sec",
+                "angelia_latency_metrics_enabled",
+                "event_store_backend",
+                "event_archive_after_sec",
                 "command_executor",
                 "docker_enabled",
                 "docker_image",
@@ -277,6 +299,9 @@ def cmd_config(args):
                     "angelia_pick_batch_size",
                     "angelia_timer_idle_sec",
                     "angelia_dedupe_window_sec",
+                    "angelia_idle_recheck_sec",
+                    "angelia_lease_ttl_sec",
+                    "event_archive_after_sec",
                 }:
                     data["projects"][pid][direct_key] = int(args.value)
                 elif direct_key in {"docker_memory_limit_mb"}:
@@ -304,7 +329,7 @@ def cmd_config(args):
                     data["projects"][pid][direct_key] = int(args.value)
                 elif direct_key in {"docker_cpu_limit"}:
                     data["projects"][pid][direct_key] = float(args.value)
-                elif direct_key in {"angelia_enabled", "angelia_timer_enabled"}:
+                elif direct_key in {"angelia_enabled", "angelia_timer_enabled", "angelia_latency_metrics_enabled"}:
                     data["projects"][pid][direct_key] = args.value.lower() == "true"
                 elif direct_key in {
                     "docker_enabled",
@@ -322,6 +347,16 @@ def cmd_config(args):
                         print("❌ context_strategy must be: structured_v1")
                         return
                     data["projects"][pid][direct_key] = args.value
+                elif direct_key == "event_store_backend":
+                    if args.value not in {"jsonl", "sqlite"}:
+                        print("❌ event_store_backend must be one of: jsonl, sqlite")
+                        return
+                    data["projects"][pid][direct_key] = args.value
+                elif direct_key == "angelia_supervisor_mode":
+                    if args.value not in {"threads", "asyncio", "processes"}:
+                        print("❌ angelia_supervisor_mode must be one of: threads, asyncio, processes")
+                        return
+                    data["projects"][pid][direct_key] = args.value
                 elif direct_key == "command_executor":
                     if args.value not in {"docker", "local"}:
                         print("❌ command_executor must be one of: docker, local")
@@ -397,6 +432,22 @@ def cmd_config(args):
                         print("❌ memory.compact_strategy must be semantic_llm | rule_based")
                         return
                     data["projects"][pid]["memory_compact_strategy"] = value
+                elif parts[1] == "intent_durability":
+                    value = str(args.value).strip().lower()
+                    if value not in {"intent", "pulse", "interval"}:
+                        print("❌ memory.intent_durability must be intent | pulse | interval")
+                        return
+                    data["projects"][pid]["memory_intent_durability"] = value
+                elif parts[1] == "intent_flush_ms":
+                    data["projects"][pid]["memory_intent_flush_ms"] = int(args.value)
+                elif parts[1] == "pulse_segment_kb":
+                    data["projects"][pid]["memory_pulse_segment_kb"] = int(args.value)
+                elif parts[1] == "pulse_segment_compress":
+                    value = str(args.value).strip().lower()
+                    if value not in {"none", "gzip"}:
+                        print("❌ memory.pulse_segment_compress must be none | gzip")
+                        return
+                    data["projects"][pid]["memory_pulse_segment_compress"] = value
                 else:
                     print(f"❌ Unknown memory key: {parts[1]}")
                     return
@@ -509,6 +560,10 @@ def cmd_config(args):
                     data["projects"][pid]["hermes_default_max_concurrency"] = int(args.value)
                 elif parts[1] == "allow_agent_tool":
                     data["projects"][pid]["hermes_allow_agent_tool_provider"] = args.value.lower() == "true"
+                elif parts[1] == "http_pool_size":
+                    data["projects"][pid]["hermes_http_pool_size"] = int(args.value)
+                elif parts[1] == "http_keepalive":
+                    data["projects"][pid]["hermes_http_keepalive"] = args.value.lower() == "true"
                 else:
                     print(f"❌ Unknown hermes key: {parts[1]}")
                     return
@@ -695,6 +750,8 @@ def cmd_config(args):
                 print("  hermes.rate (calls/min)")
                 print("  hermes.concurrency (number)")
                 print("  hermes.allow_agent_tool (true/false)")
+                print("  hermes.http_pool_size (number)")
+                print("  hermes.http_keepalive (true/false)")
                 print("  command_executor (docker|local)")
                 print("  docker_enabled (true/false)")
                 print("  docker_image (image tag)")
@@ -42,6 +42,7 @@ def cmd_events(args):
             "state": args.state or "",
             "agent_id": args.agent or "",
             "limit": args.limit,
+            "include_archived": bool(getattr(args, "archived", False)),
         }
         res = requests.get(f"{base}/events", params=params, timeout=10)
         print(json.dumps(res.json(), ensure_ascii=False, indent=2))
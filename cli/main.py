@@ -389,10 +389,14 @@ def main():
     p_ang_events.add_argument("--state", default="")
     p_ang_events.add_argument("--type", default="")
     p_ang_events.add_argument("--limit", type=int, default=50)
+    p_ang_events.add_argument("--archived", action="store_true", help="Also include archived terminal events")
     ang_sub.add_parser("agents", help="Show agent runtime statuses")
     p_ang_retry = ang_sub.add_parser("retry", help="Retry dead/failed event")
     p_ang_retry.add_argument("event_id")
     ang_sub.add_parser("timer-tick", help="Run one timer injection pass")
+    p_ang_workers = ang_sub.add_parser("workers", help="Run leased worker processes for projects in 'processes' supervisor mode")
+    p_ang_workers.add_argument("--processes", type=int, default=os.cpu_count() or 2)
+    ang_sub.add_parser("leases", help="Show worker process agent leases")
 
     # unified events operations
     p_ev = subparsers.add_parser("events", help="Unified event bus operations")
@@ -410,6 +414,7 @@ def main():
     p_ev_list.add_argument("--state", default="")
     p_ev_list.add_argument("--agent", default="")
     p_ev_list.add_argument("--limit", type=int, default=50)
+    p_ev_list.add_argument("--archived", action="store_true", help="Also include archived terminal events")
     p_ev_retry = ev_sub.add_parser("retry", help="Retry dead/failed event")
     p_ev_retry.add_argument("event_id")
     p_ev_ack = ev_sub.add_parser("ack", help="Ack one event")
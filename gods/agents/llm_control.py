@@ -7,6 +7,7 @@ from collections import deque
 from dataclasses import dataclass
 
 from gods.config import runtime_config
+from gods.metrics import latency_metrics
 
 
 @dataclass(frozen=True)
@@ -76,7 +77,8 @@ class LLMControlPlane:
         if not limits.enabled:
             return LLMControlTicket(self, project_id, acquired=False)
 
-        deadline = time.time() + limits.acquire_timeout_sec
+        started = time.time()
+        deadline = started + limits.acquire_timeout_sec
         while True:
             now = time.time()
             if now > deadline:
@@ -101,6 +103,7 @@ class LLMControlPlane:
                     ts = time.time()
                     self._global_calls.append(ts)
                     pq.append(ts)
+                    latency_metrics.observe("llm_acquire_wait_ms", (ts - started) * 1000.0, project_id=project_id)
                     return LLMControlTicket(self, project_id, acquired=True)
 
                 if global_rate_limited and self._global_calls:
@@ -0,0 +1,247 @@
+"""Asyncio Angelia dispatcher: one event loop per process, bounded pulse pool.
+
+Alternative to one OS thread per agent (`angelia_supervisor_mode = "asyncio"`).
+Agents are plain registrations; mailbox wakes (immediate or deadline) are
+forwarded into the loop, which runs `drain_ready_events` for ready agents on a
+shared thread pool. Pool size follows `llm_global_max_concurrency` and each
+project is further capped by `llm_project_max_concurrency`, so the number of
+threads tracks pulse concurrency rather than agent count.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from gods.angelia import policy
+from gods.angelia.mailbox import angelia_mailbox
+from gods.angelia.metrics import angelia_metrics
+from gods.angelia.worker import (
+    WorkerContext,
+    drain_ready_events,
+    has_idle_work,
+    mark_worker_started,
+    mark_worker_stopped,
+)
+from gods.config import runtime_config
+
+logger = logging.getLogger("GodsServer")
+
+_RECHECK_TICK_SEC = 1.0
+
+
+@dataclass
+class _AgentSlot:
+    ctx: WorkerContext
+    running: bool = False
+    dirty: bool = False
+    timer: asyncio.TimerHandle | None = None
+    timer_at: float = 0.0
+    next_recheck: float = field(default_factory=time.time)
+
+
+def _pool_size() -> int:
+    sizes = [int(getattr(p, "llm_global_max_concurrency", 8) or 8) for p in runtime_config.projects.values()]
+    return max(1, max(sizes) if sizes else 8)
+
+
+def _project_limit(project_id: str) -> int:
+    proj = runtime_config.projects.get(project_id)
+    return max(1, int(getattr(proj, "llm_project_max_concurrency", 4) if proj else 4))
+
+
+class AsyncPulseDispatcher:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._agents: dict[tuple[str, str], _AgentSlot] = {}
+        self._project_sems: dict[str, asyncio.Semaphore] = {}
+        self._recheck_task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            self._pool = ThreadPoolExecutor(max_workers=_pool_size(), thread_name_prefix="angelia-pulse")
+            ready = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                self._recheck_task = loop.create_task(self._recheck_loop())
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=_run, name="angelia-async", daemon=True)
+            self._thread.start()
+            ready.wait(timeout=2.0)
+            angelia_mailbox.add_listener(self._on_mailbox)
+        logger.info("Angelia async dispatcher started")
+
+    def stop(self):
+        with self._lock:
+            loop = self._loop
+            if loop is None:
+                return
+            angelia_mailbox.remove_listener(self._on_mailbox)
+            slots = list(self._agents.values())
+            self._agents.clear()
+            self._loop = None
+        for slot in slots:
+            slot.ctx.stop_event.set()
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_tasks(), loop).result(timeout=2.0)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            if not self._thread.is_alive():
+                loop.close()
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        for slot in slots:
+            mark_worker_stopped(slot.ctx.project_id, slot.ctx.agent_id)
+        self._thread = None
+        self._pool = None
+        self._project_sems.clear()
+        logger.info("Angelia async dispatcher stopped")
+
+    def is_registered(self, project_id: str, agent_id: str) -> bool:
+        with self._lock:
+            return (project_id, agent_id) in self._agents
+
+    def registered(self) -> list[tuple[str, str]]:
+        with self._lock:
+            return list(self._agents.keys())
+
+    def register(self, project_id: str, agent_id: str):
+        self.start()
+        key = (project_id, agent_id)
+        with self._lock:
+            if key in self._agents:
+                return
+            ctx = WorkerContext(project_id=project_id, agent_id=agent_id, stop_event=threading.Event())
+            self._agents[key] = _AgentSlot(ctx=ctx)
+        mark_worker_started(project_id, agent_id)
+        # First pass drains any backlog left from before registration.
+        angelia_mailbox.notify(project_id, agent_id)
+
+    def unregister(self, project_id: str, agent_id: str):
+        with self._lock:
+            slot = self._agents.pop((project_id, agent_id), None)
+        if slot is None:
+            return
+        slot.ctx.stop_event.set()
+        if self._loop is not None and slot.timer is not None:
+            self._loop.call_soon_threadsafe(slot.timer.cancel)
+        mark_worker_stopped(project_id, agent_id)
+
+    def unregister_project(self, project_id: str):
+        for pid, aid in self.registered():
+            if pid == project_id:
+                self.unregister(pid, aid)
+
+    async def _cancel_tasks(self):
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Called from arbitrary threads via the mailbox listener.
+    def _on_mailbox(self, project_id: str, agent_id: str, when: float | None):
+        loop = self._loop
+        if loop is None or not self.is_registered(project_id, agent_id):
+            return
+        loop.call_soon_threadsafe(self._wake, (project_id, agent_id), when)
+
+    # Everything below runs on the dispatcher loop.
+    def _wake(self, key: tuple[str, str], when: float | None):
+        slot = self._agents.get(key)
+        if slot is None or slot.ctx.stop_event.is_set():
+            return
+        now = time.time()
+        if when is not None and when > now:
+            if slot.timer is not None and slot.timer_at <= when:
+                return
+            if slot.timer is not None:
+                slot.timer.cancel()
+            slot.timer_at = when
+            slot.timer = self._loop.call_later(when - now, self._fire_timer, key)
+            return
+        if slot.running:
+            slot.dirty = True
+            return
+        slot.running = True
+        self._loop.create_task(self._run(key, slot))
+
+    def _fire_timer(self, key: tuple[str, str]):
+        slot = self._agents.get(key)
+        if slot is None:
+            return
+        slot.timer = None
+        slot.timer_at = 0.0
+        self._wake(key, None)
+
+    def _sem(self, project_id: str) -> asyncio.Semaphore:
+        sem = self._project_sems.get(project_id)
+        if sem is None:
+            sem = asyncio.Semaphore(_project_limit(project_id))
+            self._project_sems[project_id] = sem
+        return sem
+
+    async def _run(self, key: tuple[str, str], slot: _AgentSlot):
+        loop = asyncio.get_running_loop()
+        pid, aid = key
+        try:
+            while not slot.ctx.stop_event.is_set():
+                slot.dirty = False
+                async with self._sem(pid):
+                    if slot.ctx.stop_event.is_set():
+                        break
+                    # Thread-mode wakes are buffered in the slot; this consumer does not wait on them.
+                    angelia_mailbox.reset(pid, aid)
+                    angelia_metrics.inc("WORKER_WAKEUP")
+                    try:
+                        await loop.run_in_executor(self._pool, drain_ready_events, slot.ctx)
+                    except Exception as e:
+                        logger.warning(f"Angelia async pulse failed for {pid}/{aid}: {e}")
+                if not slot.dirty:
+                    break
+        finally:
+            slot.running = False
+            slot.next_recheck = time.time() + policy.idle_recheck_sec(pid)
+
+    async def _recheck_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(_RECHECK_TICK_SEC)
+            now = time.time()
+            for key, slot in list(self._agents.items()):
+                if slot.running or slot.next_recheck > now:
+                    continue
+                slot.next_recheck = now + policy.idle_recheck_sec(key[0])
+                loop.create_task(self._recheck(key))
+
+    async def _recheck(self, key: tuple[str, str]):
+        loop = asyncio.get_running_loop()
+        angelia_metrics.inc("WORKER_IDLE_RECHECK")
+        try:
+            pending = await loop.run_in_executor(self._pool, has_idle_work, key[0], key[1])
+        except Exception:
+            return
+        if pending:
+            self._wake(key, None)
+
+
+angelia_async_dispatcher = AsyncPulseDispatcher()
@@ -4,6 +4,8 @@ from __future__ import annotations
 from typing import Any
 
 from gods.angelia import store
+from gods.events import leases
+from gods.metrics import latency_metrics
 from gods.angelia.metrics import angelia_metrics
 from gods.angelia.models import AngeliaEventState
 from gods.angelia.scheduler import angelia_supervisor
@@ -72,6 +74,18 @@ def metrics_snapshot() -> dict[str, Any]:
     return angelia_metrics.snapshot()
 
 
+def latency_histograms() -> dict[str, Any]:
+    return latency_metrics.snapshot()
+
+
+def metrics_prometheus() -> str:
+    return latency_metrics.prometheus(counters=angelia_metrics.snapshot())
+
+
+def list_worker_leases(project_id: str) -> dict[str, Any]:
+    return leases.list_leases(project_id)
+
+
 def start_supervisor():
     angelia_supervisor.start()
 
@@ -93,8 +107,11 @@ __all__ = [
     "list_events",
     "retry_event",
     "list_agent_status",
+    "list_worker_leases",
     "tick_timer_once",
     "metrics_snapshot",
+    "latency_histograms",
+    "metrics_prometheus",
     "start_supervisor",
     "stop_supervisor",
     "stop_project_workers",
@@ -2,18 +2,44 @@
 from __future__ import annotations
 
 import threading
+import time
+from typing import Callable
+
+# listener(project_id, agent_id, when): `when` is None for an immediate wake.
+WakeListener = Callable[[str, str, "float | None"], None]
 
 
 class _MailboxSlot:
     def __init__(self):
         self.cv = threading.Condition()
         self.pending = 0
+        # Earliest scheduled self-wake (epoch sec); 0 means none.
+        self.wake_at = 0.0
 
 
 class AngeliaMailbox:
     def __init__(self):
         self._guard = threading.Lock()
         self._slots: dict[tuple[str, str], _MailboxSlot] = {}
+        self._listeners: list[WakeListener] = []
+
+    def add_listener(self, listener: WakeListener):
+        """Forward wakes to a non-blocking consumer (the asyncio dispatcher)."""
+        with self._guard:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: WakeListener):
+        with self._guard:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _emit(self, project_id: str, agent_id: str, when: float | None):
+        for fn in list(self._listeners):
+            try:
+                fn(project_id, agent_id, when)
+            except Exception:
+                continue
 
     def _slot(self, project_id: str, agent_id: str) -> _MailboxSlot:
         key = (project_id, agent_id)
@@ -29,16 +55,48 @@ class AngeliaMailbox:
         with slot.cv:
             slot.pending += 1
             slot.cv.notify()
+        self._emit(project_id, agent_id, None)
+
+    def notify_at(self, project_id: str, agent_id: str, when: float):
+        """Schedule a wake at `when` (e.g. an `available_at` or cooldown deadline); earliest wins."""
+        when = float(when or 0.0)
+        if when <= 0:
+            return
+        slot = self._slot(project_id, agent_id)
+        with slot.cv:
+            if slot.wake_at <= 0 or when < slot.wake_at:
+                slot.wake_at = when
+                slot.cv.notify()
+        self._emit(project_id, agent_id, when)
+
+    def notify_project(self, project_id: str):
+        with self._guard:
+            keys = [k for k in self._slots if k[0] == project_id]
+        for pid, aid in keys:
+            self.notify(pid, aid)
+
+    def reset(self, project_id: str, agent_id: str):
+        """Drop buffered wakes; used by consumers that do not block in `wait`."""
+        slot = self._slot(project_id, agent_id)
+        with slot.cv:
+            slot.pending = 0
+            slot.wake_at = 0.0
 
     def wait(self, project_id: str, agent_id: str, timeout: float = 1.0) -> bool:
         slot = self._slot(project_id, agent_id)
+        deadline = time.time() + max(0.05, float(timeout))
         with slot.cv:
-            if slot.pending <= 0:
-                slot.cv.wait(timeout=max(0.05, float(timeout)))
-            if slot.pending > 0:
-                slot.pending -= 1
-                return True
-            return False
+            while slot.pending <= 0:
+                now = time.time()
+                if 0 < slot.wake_at <= now:
+                    slot.wake_at = 0.0
+                    return True
+                until = min(deadline, slot.wake_at) if slot.wake_at > 0 else deadline
+                if until <= now:
+                    return False
+                slot.cv.wait(timeout=until - now)
+            slot.pending -= 1
+            return True
 
 
 angelia_mailbox = AngeliaMailbox()
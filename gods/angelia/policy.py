@@ -40,6 +40,29 @@ def dedupe_window_sec(project_id: str) -> int:
     return max(0, min(v, 300))
 
 
+def supervisor_mode(project_id: str) -> str:
+    proj = _project(project_id)
+    v = str(getattr(proj, "angelia_supervisor_mode", "threads") if proj else "threads").strip().lower()
+    return v if v in {"threads", "asyncio", "processes"} else "threads"
+
+
+def lease_ttl_sec(project_id: str) -> int:
+    proj = _project(project_id)
+    v = int(getattr(proj, "angelia_lease_ttl_sec", 30) if proj else 30)
+    return max(5, min(v, 600))
+
+
+def idle_recheck_sec(project_id: str) -> int:
+    proj = _project(project_id)
+    v = int(getattr(proj, "angelia_idle_recheck_sec", 30) if proj else 30)
+    return max(1, min(v, 600))
+
+
+def stale_sweep_interval_sec(project_id: str) -> int:
+    # Sweep twice per processing timeout so a stalled event is reclaimed within ~1.5x the timeout.
+    return max(5, processing_timeout_sec(project_id) // 2)
+
+
 def timer_idle_sec(project_id: str) -> int:
     proj = _project(project_id)
     v = int(getattr(proj, "angelia_timer_idle_sec", 60) if proj else 60)
@@ -1,4 +1,9 @@
-"""Angelia supervisor: worker lifecycle + timer injector."""
+"""Angelia supervisor: worker lifecycle + timer injector.
+
+Per project, agents run either on a dedicated thread each (`threads`, default),
+on the shared asyncio dispatcher (`asyncio`), or in external leased worker
+processes (`processes`, see `worker_pool`), per `angelia_supervisor_mode`.
+"""
 from __future__ import annotations
 
 import logging
@@ -7,8 +12,10 @@ import time
 from dataclasses import dataclass
 
 from . import policy, store
+from gods.angelia.async_dispatch import angelia_async_dispatcher
 from gods.angelia.mailbox import angelia_mailbox
 from gods.angelia.metrics import angelia_metrics
+from gods.angelia.wakeup_bridge import install_wakeup_bridge
 from gods.angelia.worker import WorkerContext, worker_loop
 from gods.agents import registry as agent_registry
 from gods.config import runtime_config
@@ -16,6 +23,9 @@ from gods.identity import is_valid_agent_id
 
 logger = logging.getLogger("GodsServer")
 
+# Retention sweeps scan every terminal row, so run them far less often than the 1s manager tick.
+ARCHIVE_SWEEP_INTERVAL_SEC = 60.0
+
 
 @dataclass
 class _WorkerHandle:
@@ -31,6 +41,8 @@ class AngeliaSupervisor:
         self._manager_thread: threading.Thread | None = None
         self._workers: dict[tuple[str, str], _WorkerHandle] = {}
         self._last_timer_emit: dict[tuple[str, str], float] = {}
+        self._last_archive_sweep: dict[str, float] = {}
+        self._last_stale_sweep: dict[str, float] = {}
 
     def start(self):
         with self._lock:
@@ -38,6 +50,8 @@ class AngeliaSupervisor:
                 return
             self._running = True
             self._stop_event.clear()
+            # Enqueue hooks are the primary wake path for workers; make sure they are wired.
+            install_wakeup_bridge()
             self._manager_thread = threading.Thread(target=self._manager_loop, name="angelia-manager", daemon=True)
             self._manager_thread.start()
             logger.info("Angelia supervisor started")
@@ -51,10 +65,12 @@ class AngeliaSupervisor:
             workers = list(self._workers.items())
             self._workers.clear()
 
-        for (_, _), h in workers:
+        for (pid, aid), h in workers:
             h.stop_event.set()
+            angelia_mailbox.notify(pid, aid)
             h.thread.join(timeout=2.0)
 
+        angelia_async_dispatcher.stop()
         mt = self._manager_thread
         if mt:
             mt.join(timeout=2.0)
@@ -80,9 +96,11 @@ class AngeliaSupervisor:
             for key, _handle in to_stop:
                 self._workers.pop(key, None)
 
-        for (_pid, _aid), handle in to_stop:
+        for (pid, aid), handle in to_stop:
             handle.stop_event.set()
+            angelia_mailbox.notify(pid, aid)
             handle.thread.join(timeout=1.0)
+        angelia_async_dispatcher.unregister_project(project_id)
 
     def enqueue_event(
         self,
@@ -171,6 +189,12 @@ class AngeliaSupervisor:
     def _ensure_worker(self, project_id: str, agent_id: str):
         if not self._is_active_agent(project_id, agent_id):
             return
+        mode = policy.supervisor_mode(project_id)
+        if mode == "processes":
+            return
+        if mode == "asyncio":
+            angelia_async_dispatcher.register(project_id, agent_id)
+            return
         key = (project_id, agent_id)
         with self._lock:
             h = self._workers.get(key)
@@ -182,6 +206,37 @@ class AngeliaSupervisor:
             self._workers[key] = _WorkerHandle(stop_event=stop_event, thread=th)
             th.start()
 
+    def _maybe_reclaim_stale(self, project_id: str):
+        """One stale-PROCESSING sweep per project, replacing per-worker reclaim on every poll."""
+        if policy.supervisor_mode(project_id) == "processes":
+            # Leased worker processes recover in-flight events on lease expiry instead.
+            return
+        now = time.time()
+        if now - self._last_stale_sweep.get(project_id, 0.0) < policy.stale_sweep_interval_sec(project_id):
+            return
+        self._last_stale_sweep[project_id] = now
+        try:
+            recovered = store.reclaim_stale_processing(project_id, policy.processing_timeout_sec(project_id))
+        except Exception as e:
+            logger.warning(f"Angelia stale sweep failed for {project_id}: {e}")
+            return
+        if recovered > 0:
+            angelia_metrics.inc("QUEUE_STALL_TIMEOUT_RECOVERED_COUNT", recovered)
+            angelia_mailbox.notify_project(project_id)
+
+    def _maybe_archive(self, project_id: str):
+        now = time.time()
+        if now - self._last_archive_sweep.get(project_id, 0.0) < ARCHIVE_SWEEP_INTERVAL_SEC:
+            return
+        self._last_archive_sweep[project_id] = now
+        try:
+            moved = store.archive_terminal_events(project_id)
+        except Exception as e:
+            logger.warning(f"Angelia archive sweep failed for {project_id}: {e}")
+            return
+        if moved:
+            logger.info(f"Angelia archived {moved} terminal events for {project_id}")
+
     def _manager_loop(self):
         while not self._stop_event.is_set():
             try:
@@ -194,11 +249,13 @@ class AngeliaSupervisor:
                         for aid in list(agent_registry.list_active_agents(pid) or []):
                             self._ensure_worker(pid, aid)
                         self.tick_timer_once(pid)
+                        self._maybe_reclaim_stale(pid)
+                        self._maybe_archive(pid)
 
                 with self._lock:
                     stale = []
                     for (pid, aid), h in self._workers.items():
-                        if pid not in enabled_projects:
+                        if pid not in enabled_projects or policy.supervisor_mode(pid) != "threads":
                             stale.append((pid, aid, h))
                             continue
                         proj = runtime_config.projects.get(pid)
@@ -206,8 +263,17 @@ class AngeliaSupervisor:
                             stale.append((pid, aid, h))
                     for pid, aid, h in stale:
                         h.stop_event.set()
+                        angelia_mailbox.notify(pid, aid)
                         h.thread.join(timeout=1.0)
                         self._workers.pop((pid, aid), None)
+
+                for pid, aid in angelia_async_dispatcher.registered():
+                    if (
+                        pid not in enabled_projects
+                        or policy.supervisor_mode(pid) != "asyncio"
+                        or aid not in set(agent_registry.list_active_agents(pid) or [])
+                    ):
+                        angelia_async_dispatcher.unregister(pid, aid)
             except Exception as e:
                 logger.warning(f"Angelia manager loop error: {e}")
 
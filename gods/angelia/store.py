@@ -170,14 +170,8 @@ def pick_next_event(
     preempt_types: set[str],
     force_after_sec: float = 0.0,
 ) -> AngeliaEvent | None:
-    rows = events_bus.list_events(
-        project_id=project_id,
-        state=events_bus.EventState.QUEUED,
-        limit=5000,
-        agent_id=agent_id,
-    )
     cand = None
-    for row in rows:
+    for row in events_bus.iter_ready_events(project_id, agent_id, now=now):
         _assert_queue_domain_allowed(project_id, row)
         gate = sync_council.evaluate_pick_gate(project_id, agent_id, row)
         if not gate.allowed:
@@ -213,18 +207,10 @@ def pick_batch_events(
     limit: int = 10,
     force_after_sec: float = 0.0,
 ) -> list[AngeliaEvent]:
-    rows = events_bus.list_events(
-        project_id=project_id,
-        state=events_bus.EventState.QUEUED,
-        limit=5000,
-        agent_id=agent_id,
-    )
-    picked: list[AngeliaEvent] = []
-    
-    # Simple FIFO within priority buckets is handled by list_events (if it sorts)
-    # Angelia events usually sort by priority DESC, created_at ASC
-    
-    for row in rows:
+    cands = []
+    # Ready events arrive in priority DESC, created_at ASC order from the agent's own queue;
+    # pages widen only when gates/cooldown skip the head of the queue.
+    for row in events_bus.iter_ready_events(project_id, agent_id, now=now, first_page=max(32, 2 * int(limit))):
         _assert_queue_domain_allowed(project_id, row)
         gate = sync_council.evaluate_pick_gate(project_id, agent_id, row)
         if not gate.allowed:
@@ -238,18 +224,23 @@ def pick_batch_events(
             waited = float(now) - float(getattr(row, "created_at", 0.0) or 0.0)
             if waited < float(force_after_sec or 0.0):
                 continue
-        
-        ok = events_bus.transition_state(project_id, row.event_id, events_bus.EventState.PICKED)
-        if ok:
-            raw = row.to_dict()
-            raw["state"] = events_bus.EventState.PICKED.value
-            raw["agent_id"] = str((row.payload or {}).get("agent_id", ""))
-            picked.append(AngeliaEvent.from_dict(raw))
-            if len(picked) >= limit:
-                break
-                
+        cands.append(row)
+        if len(cands) >= limit:
+            break
+
+    # One lock hold for the whole batch; rows claimed concurrently fail validation and are dropped.
+    oks = events_bus.transition_many(project_id, [(row.event_id, events_bus.EventState.PICKED) for row in cands])
+    picked: list[AngeliaEvent] = []
+    for row, ok in zip(cands, oks):
+        if not ok:
+            continue
+        raw = row.to_dict()
+        raw["state"] = events_bus.EventState.PICKED.value
+        raw["agent_id"] = str((row.payload or {}).get("agent_id", ""))
+        picked.append(AngeliaEvent.from_dict(raw))
     return picked
 
+
 def mark_processing(project_id: str, event_id: str) -> bool:
     return bool(events_bus.transition_state(project_id, event_id, events_bus.EventState.PROCESSING))
 
@@ -262,6 +253,19 @@ def mark_failed_or_requeue(project_id: str, event_id: str, error_code: str, erro
     return str(events_bus.requeue_or_dead(project_id, event_id, error_code, error_message, retry_delay_sec) or "")
 
 
+def mark_processing_many(project_id: str, event_ids: list[str]) -> list[bool]:
+    return events_bus.transition_many(project_id, [(eid, events_bus.EventState.PROCESSING) for eid in event_ids])
+
+
+def mark_done_many(project_id: str, event_ids: list[str]) -> list[bool]:
+    return events_bus.transition_many(project_id, [(eid, events_bus.EventState.DONE) for eid in event_ids])
+
+
+def mark_failed_or_requeue_many(project_id: str, items: list[tuple[str, str, str, int]]) -> list[str]:
+    """`items` are `(event_id, error_code, error_message, retry_delay_sec)`."""
+    return events_bus.requeue_or_dead_many(project_id, items)
+
+
 def retry_event(project_id: str, event_id: str) -> bool:
     return bool(events_bus.retry_event(project_id, event_id))
 
@@ -270,6 +274,10 @@ def reclaim_stale_processing(project_id: str, timeout_sec: int) -> int:
     return int(events_bus.reconcile_stale(project_id, timeout_sec) or 0)
 
 
+def archive_terminal_events(project_id: str) -> int:
+    return int(events_bus.archive_terminal_events(project_id) or 0)
+
+
 def get_agent_status(project_id: str, agent_id: str) -> AgentRuntimeStatus:
     raw = _load_agent_statuses(project_id)
     row = raw.get(agent_id)
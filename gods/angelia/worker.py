@@ -11,11 +11,14 @@ from dataclasses import dataclass
 from . import policy, store
 from gods.angelia.mailbox import angelia_mailbox
 from gods.angelia.metrics import angelia_metrics
+from gods.metrics import latency_metrics
 from gods.angelia.models import AgentRunState, AgentRuntimeStatus, AngeliaEvent
 from gods import events as events_bus
 from gods.iris.facade import ack_handled, has_pending, mark_as_delivered
 from gods.mnemosyne.facade import (
     append_pulse_entry,
+    flush_agent_writes,
+    flush_observed_schema,
     intent_from_angelia_event,
     intent_from_inbox_read,
     intent_from_inbox_received,
@@ -46,6 +49,7 @@ class WorkerContext:
     project_id: str
     agent_id: str
     stop_event: threading.Event
+    empty_cycles: int = 0
 
 
 class _AgentRunHandler(events_bus.EventHandler):
@@ -139,6 +143,21 @@ def _run_agent(
     reason: str,
     pulse_id: str,
     event_records: list[events_bus.EventRecord],
+) -> dict:
+    try:
+        return _run_pulse(project_id, agent_id, reason, pulse_id, event_records)
+    finally:
+        # Pulse end is the commit point for memory_intent_durability = pulse | interval.
+        flush_agent_writes(project_id, agent_id)
+        flush_observed_schema(project_id)
+
+
+def _run_pulse(
+    project_id: str,
+    agent_id: str,
+    reason: str,
+    pulse_id: str,
+    event_records: list[events_bus.EventRecord],
 ) -> dict:
     from gods.agents.base import GodAgent
 
@@ -470,226 +489,298 @@ def _set_error_backoff(st: AgentRuntimeStatus, err: str, delay_sec: int):
     _save_status(st)
 
 
-def worker_loop(ctx: WorkerContext):
+def _schedule_next_wake(project_id: str, agent_id: str, now: float, cooldown_until: float, force_after_sec: float):
+    """Arm a mailbox deadline for work that becomes eligible without any new enqueue."""
+    due = float(events_bus.next_ready_at(project_id, agent_id, now=now) or 0.0)
+    if now < cooldown_until and events_bus.list_ready_events(project_id, agent_id, now=now, limit=1):
+        # Ready work is held back by cooldown/backoff; the force-pick SLA may release it earlier.
+        release = cooldown_until
+        if force_after_sec > 0:
+            release = min(release, now + force_after_sec)
+        due = min(due, release) if due > 0 else release
+    if due > 0:
+        angelia_mailbox.notify_at(project_id, agent_id, due)
+
+
+def drain_ready_events(ctx: WorkerContext) -> None:
+    """Pick and pulse until nothing is eligible for this agent.
+
+    Shared by the per-agent thread loop and the asyncio dispatcher.
+    """
     _ensure_interaction_handlers_registered()
     project_id = ctx.project_id
     agent_id = ctx.agent_id
     stop_event = ctx.stop_event
     preempt_types = policy.cooldown_preempt_types(project_id)
-    processing_timeout = policy.processing_timeout_sec(project_id)
-    empty_cycles = 0
-
-    st = _status(project_id, agent_id)
-    st.run_state = AgentRunState.IDLE
-    _save_status(st)
-
     while not stop_event.is_set():
-        recovered = int(store.reclaim_stale_processing(project_id, processing_timeout) or 0)
-        if recovered > 0:
-            angelia_metrics.inc("QUEUE_STALL_TIMEOUT_RECOVERED_COUNT", recovered)
+        st = _status(project_id, agent_id)
+        now = time.time()
+        cooldown_until = max(float(st.cooldown_until or 0.0), float(st.backoff_until or 0.0))
 
-        woke = angelia_mailbox.wait(project_id, agent_id, timeout=1.0)
-        if stop_event.is_set():
-            break
-        if not woke:
-            # allow pending inbox or queued events to trigger when direct notify was missed
-            if has_pending(project_id, agent_id) or store.has_queued(project_id, agent_id):
-                angelia_mailbox.notify(project_id, agent_id)
+        # Batch pick size is runtime-configurable via angelia_pick_batch_size.
+        try:
+            pick_limit = policy.pick_batch_size(project_id)
+            batch = store.pick_batch_events(
+                project_id=project_id,
+                agent_id=agent_id,
+                now=now,
+                cooldown_until=cooldown_until,
+                preempt_types=preempt_types,
+                limit=pick_limit,
+                force_after_sec=policy.force_pick_after_sec(project_id),
+            )
+        except Exception as e:
+            _set_error_backoff(st, str(e), delay_sec=2)
             continue
 
-        while not stop_event.is_set():
-            st = _status(project_id, agent_id)
-            now = time.time()
-            cooldown_until = max(float(st.cooldown_until or 0.0), float(st.backoff_until or 0.0))
-            
-            # Batch pick size is runtime-configurable via angelia_pick_batch_size.
+        if not batch:
             try:
-                pick_limit = policy.pick_batch_size(project_id)
-                batch = store.pick_batch_events(
-                    project_id=project_id,
-                    agent_id=agent_id,
-                    now=now,
-                    cooldown_until=cooldown_until,
-                    preempt_types=preempt_types,
-                    limit=pick_limit,
-                    force_after_sec=policy.force_pick_after_sec(project_id),
+                sync_council.tick(project_id, agent_id, has_queued=False)
+            except Exception:
+                pass
+            try:
+                # Lifecycle intents recorded after the last pulse must not wait for the next one.
+                flush_agent_writes(project_id, agent_id)
+            except Exception as e:
+                logger.warning("MNEMOSYNE_FLUSH_FAILED: project=%s agent=%s err=%s", project_id, agent_id, e)
+            if now >= float(st.cooldown_until or 0.0) and now >= float(st.backoff_until or 0.0):
+                st.run_state = AgentRunState.IDLE
+                _save_status(st)
+            try:
+                _schedule_next_wake(
+                    project_id, agent_id, now, cooldown_until, float(policy.force_pick_after_sec(project_id))
                 )
             except Exception as e:
-                _set_error_backoff(st, str(e), delay_sec=2)
-                continue
+                logger.warning("ANGELIA_SCHEDULE_WAKE_FAILED: project=%s agent=%s err=%s", project_id, agent_id, e)
+            break
 
-            if not batch:
-                try:
-                    sync_council.tick(project_id, agent_id, has_queued=False)
-                except Exception:
-                    pass
-                if now >= float(st.cooldown_until or 0.0) and now >= float(st.backoff_until or 0.0):
-                    st.run_state = AgentRunState.IDLE
-                    _save_status(st)
-                break
-            
-            # Use the first event as the 'primary' for status tracking
-            primary_event = batch[0]
-            
+        # Use the first event as the 'primary' for status tracking
+        primary_event = batch[0]
+        picked_at = time.time()
+        if latency_metrics.enabled(project_id):
             for evt in batch:
-                store.mark_processing(project_id, evt.event_id)
-            
-            _set_running(st, primary_event.event_id, primary_event.event_type)
-            angelia_metrics.inc("event_picked", len(batch))
+                latency_metrics.observe(
+                    "angelia_enqueue_to_pick_ms",
+                    (picked_at - float(evt.created_at or picked_at)) * 1000.0,
+                    project_id=project_id,
+                    agent_id=agent_id,
+                    event_type=evt.event_type,
+                )
 
-            records = [_to_record(evt) for evt in batch]
-            
-            # We assume ALL events for an agent use the same handler (_AgentRunHandler).
-            # If not, we should technically group them. 
-            # But currently `_resolve_handler` returns DEFAULT_AGENT_RUN_HANDLER for all.
-            handler = _resolve_handler(records[0].event_type)
-            if handler is None:
-                for evt in batch:
-                    store.mark_done(project_id, evt.event_id)
-                    _record_event_lifecycle_intent(evt, stage="done", extra_payload={"next_step": "skipped"})
-                _set_idle(st, cooldown_sec=0)
-                angelia_metrics.inc("event_done", len(batch))
-                continue
-            
-            # on_pick semantics: technically we should call on_pick for each?
-            for r in records:
-                handler.on_pick(r)
+        store.mark_processing_many(project_id, [evt.event_id for evt in batch])
 
-            start = time.time()
-            result: dict = {}
-            pulse_id = uuid.uuid4().hex[:12]
-            try:
-                for evt in batch:
-                    _record_event_lifecycle_intent(evt, stage="processing", pulse_id=pulse_id)
-                
-                # Combine payloads or just pick first reason?
-                # The handler will now take list of records.
-                # But `handler.on_process` signature takes ONE record.
-                # We need to hack `_AgentRunHandler`'s on_process or call `_run_agent` directly.
-                # `_AgentRunHandler` is internal private class.
-                # Let's see `_AgentRunHandler.on_process` (lines 47).
-                # It takes one record.
-                # We should update `_AgentRunHandler` to accept batch, or custom logic here.
-                # Since `_run_agent` is what we want, and `_AgentRunHandler` is a thin wrapper...
-                # We can construct a synthetic 'BatchRecord' or just call `_run_agent` directly here?
-                # No, `handler` abstraction is for future extensibility.
-                
-                # OPTION: Update `EventHandler.on_process` to support batch? No, base class change risky.
-                # OPTION: Just pass the whole list in `payload` of a synthetic record?
-                # OPTION: Special case for _AgentRunHandler since we know it.
-                
-                if isinstance(handler, _AgentRunHandler):
-                    # Direct call to robust batch method
-                    primary_rec = records[0]
-                    reason = str((primary_rec.payload or {}).get("reason") or primary_rec.event_type)
-                    result = _run_agent(project_id, agent_id, reason, pulse_id, records)
-                else:
-                    # Fallback for non-agent handlers: process one by one?
-                    # This branch shouldn't happen for Agent worker loop if we only pick agent events.
-                    # But if we support custom handlers...
-                    # For safety, if handler is not our batch-aware one, process only first one and requeue rest?
-                    # Or loop on_process?
-                    # Let's loop on_process for now to be safe, though inefficient context.
-                    # BUT `_run_agent` does a full pulse!
-                    # So looping means N pulses.
-                    # This defeats the purpose of batching.
-                    # Since we are in `worker_loop` specifically for `Angelia`, we know we want `_run_agent`.
-                    # Let's assume all picked events are for _run_agent.
-                    primary_rec = records[0]
-                    reason = str((primary_rec.payload or {}).get("reason") or primary_rec.event_type)
-                    result = _run_agent(project_id, agent_id, reason, pulse_id, records)
-
-                extra_events: list[AngeliaEvent] = []
-                seen_ids = {str(evt.event_id) for evt in batch}
-                for row in list(result.get("__worker_claimed_events", []) or []):
-                    if not isinstance(row, dict):
-                        continue
-                    try:
-                        evt = AngeliaEvent.from_dict(row)
-                    except Exception:
-                        continue
-                    eid = str(getattr(evt, "event_id", "") or "")
-                    if not eid or eid in seen_ids:
-                        continue
-                    seen_ids.add(eid)
-                    extra_events.append(evt)
-
-                all_events = list(batch) + extra_events
-                next_step = str(result.get("next_step", "finish"))
-                if next_step == "finish":
-                    empty_cycles += 1
-                else:
-                    empty_cycles = 0
-                
-                cooldown = _next_cooldown(project_id, next_step, empty_cycles)
-                quiescent_cooldown = _finalize_quiescent_cooldown(project_id, result)
-                if quiescent_cooldown > 0:
-                    cooldown = max(int(cooldown), int(quiescent_cooldown))
-                
-                # Mark ALL done
-                for evt in all_events:
-                    store.mark_done(project_id, evt.event_id)
-                    _record_event_lifecycle_intent(
-                        evt,
-                        stage="done",
-                        extra_payload={"next_step": next_step},
-                        pulse_id=pulse_id,
-                    )
+        _set_running(st, primary_event.event_id, primary_event.event_type)
+        angelia_metrics.inc("event_picked", len(batch))
+
+        records = [_to_record(evt) for evt in batch]
+
+        # We assume ALL events for an agent use the same handler (_AgentRunHandler).
+        # If not, we should technically group them.
+        # But currently `_resolve_handler` returns DEFAULT_AGENT_RUN_HANDLER for all.
+        handler = _resolve_handler(records[0].event_type)
+        if handler is None:
+            store.mark_done_many(project_id, [evt.event_id for evt in batch])
+            for evt in batch:
+                _record_event_lifecycle_intent(evt, stage="done", extra_payload={"next_step": "skipped"})
+            _set_idle(st, cooldown_sec=0)
+            angelia_metrics.inc("event_done", len(batch))
+            continue
 
-                # on_success for primary? or all?
-                handler.on_success(records[0], result)
-                
-                _set_idle(st, cooldown)
-                angelia_metrics.inc("event_done", len(all_events))
+        # on_pick semantics: technically we should call on_pick for each?
+        for r in records:
+            handler.on_pick(r)
+
+        start = time.time()
+        latency_metrics.observe(
+            "angelia_pick_to_pulse_start_ms",
+            (start - picked_at) * 1000.0,
+            project_id=project_id,
+            agent_id=agent_id,
+            event_type=primary_event.event_type,
+        )
+        result: dict = {}
+        pulse_id = uuid.uuid4().hex[:12]
+        try:
+            for evt in batch:
+                _record_event_lifecycle_intent(evt, stage="processing", pulse_id=pulse_id)
+
+            # Combine payloads or just pick first reason?
+            # The handler will now take list of records.
+            # But `handler.on_process` signature takes ONE record.
+            # We need to hack `_AgentRunHandler`'s on_process or call `_run_agent` directly.
+            # `_AgentRunHandler` is internal private class.
+            # Let's see `_AgentRunHandler.on_process` (lines 47).
+            # It takes one record.
+            # We should update `_AgentRunHandler` to accept batch, or custom logic here.
+            # Since `_run_agent` is what we want, and `_AgentRunHandler` is a thin wrapper...
+            # We can construct a synthetic 'BatchRecord' or just call `_run_agent` directly here?
+            # No, `handler` abstraction is for future extensibility.
+
+            # OPTION: Update `EventHandler.on_process` to support batch? No, base class change risky.
+            # OPTION: Just pass the whole list in `payload` of a synthetic record?
+            # OPTION: Special case for _AgentRunHandler since we know it.
+
+            if isinstance(handler, _AgentRunHandler):
+                # Direct call to robust batch method
+                primary_rec = records[0]
+                reason = str((primary_rec.payload or {}).get("reason") or primary_rec.event_type)
+                result = _run_agent(project_id, agent_id, reason, pulse_id, records)
+            else:
+                # Fallback for non-agent handlers: process one by one?
+                # This branch shouldn't happen for Agent worker loop if we only pick agent events.
+                # But if we support custom handlers...
+                # For safety, if handler is not our batch-aware one, process only first one and requeue rest?
+                # Or loop on_process?
+                # Let's loop on_process for now to be safe, though inefficient context.
+                # BUT `_run_agent` does a full pulse!
+                # So looping means N pulses.
+                # This defeats the purpose of batching.
+                # Since we are in `worker_loop` specifically for `Angelia`, we know we want `_run_agent`.
+                # Let's assume all picked events are for _run_agent.
+                primary_rec = records[0]
+                reason = str((primary_rec.payload or {}).get("reason") or primary_rec.event_type)
+                result = _run_agent(project_id, agent_id, reason, pulse_id, records)
+
+            extra_events: list[AngeliaEvent] = []
+            seen_ids = {str(evt.event_id) for evt in batch}
+            for row in list(result.get("__worker_claimed_events", []) or []):
+                if not isinstance(row, dict):
+                    continue
                 try:
-                    sync_council.note_pulse_finished(project_id, agent_id)
+                    evt = AngeliaEvent.from_dict(row)
                 except Exception:
-                    pass
+                    continue
+                eid = str(getattr(evt, "event_id", "") or "")
+                if not eid or eid in seen_ids:
+                    continue
+                seen_ids.add(eid)
+                extra_events.append(evt)
+
+            all_events = list(batch) + extra_events
+            next_step = str(result.get("next_step", "finish"))
+            if next_step == "finish":
+                ctx.empty_cycles += 1
+            else:
+                ctx.empty_cycles = 0
+
+            cooldown = _next_cooldown(project_id, next_step, ctx.empty_cycles)
+            quiescent_cooldown = _finalize_quiescent_cooldown(project_id, result)
+            if quiescent_cooldown > 0:
+                cooldown = max(int(cooldown), int(quiescent_cooldown))
+
+            # Mark ALL done in one store commit
+            store.mark_done_many(project_id, [evt.event_id for evt in all_events])
+            for evt in all_events:
+                _record_event_lifecycle_intent(
+                    evt,
+                    stage="done",
+                    extra_payload={"next_step": next_step},
+                    pulse_id=pulse_id,
+                )
 
-            except Exception as e:
-                # Batch Failure: Fail ALL.
-                # In future we might want partial success, but for now atomic batch.
-                handler.on_fail(records[0], e)
-                all_events = list(batch)
-                for row in list((result or {}).get("__worker_claimed_events", []) or []):
-                    if not isinstance(row, dict):
-                        continue
-                    try:
-                        evt = AngeliaEvent.from_dict(row)
-                    except Exception:
-                        continue
-                    if str(evt.event_id) in {str(x.event_id) for x in all_events}:
-                        continue
-                    all_events.append(evt)
-                for evt in all_events:
-                    state = store.mark_failed_or_requeue(
-                        project_id,
-                        evt.event_id,
-                        error_code="WORKER_EXEC_ERROR",
-                        error_message=str(e),
-                        retry_delay_sec=min(30, max(2, 2 ** min(evt.attempt + 1, 5))),
-                    )
-                    _record_event_lifecycle_intent(
-                        evt,
-                        stage="failed",
-                        extra_payload={"error": str(e)},
-                        pulse_id=pulse_id,
-                    )
-                
-                _set_error_backoff(st, str(e), delay_sec=5)
-                angelia_metrics.inc("event_requeued", len(all_events))
+            # on_success for primary? or all?
+            handler.on_success(records[0], result)
+
+            _set_idle(st, cooldown)
+            angelia_metrics.inc("event_done", len(all_events))
+            try:
+                sync_council.note_pulse_finished(project_id, agent_id)
+            except Exception:
+                pass
+
+        except Exception as e:
+            # Batch Failure: Fail ALL.
+            # In future we might want partial success, but for now atomic batch.
+            handler.on_fail(records[0], e)
+            all_events = list(batch)
+            for row in list((result or {}).get("__worker_claimed_events", []) or []):
+                if not isinstance(row, dict):
+                    continue
                 try:
-                    sync_council.note_pulse_finished(project_id, agent_id)
+                    evt = AngeliaEvent.from_dict(row)
                 except Exception:
-                    pass
+                    continue
+                if str(evt.event_id) in {str(x.event_id) for x in all_events}:
+                    continue
+                all_events.append(evt)
+            store.mark_failed_or_requeue_many(
+                project_id,
+                [
+                    (evt.event_id, "WORKER_EXEC_ERROR", str(e), min(30, max(2, 2 ** min(evt.attempt + 1, 5))))
+                    for evt in all_events
+                ],
+            )
+            for evt in all_events:
+                _record_event_lifecycle_intent(
+                    evt,
+                    stage="failed",
+                    extra_payload={"error": str(e)},
+                    pulse_id=pulse_id,
+                )
+
+            _set_error_backoff(st, str(e), delay_sec=5)
+            angelia_metrics.inc("event_requeued", len(all_events))
+            try:
+                sync_council.note_pulse_finished(project_id, agent_id)
+            except Exception:
+                pass
+
+        finally:
+            latency_ms = int((time.time() - start) * 1000)
+            if latency_ms >= 0:
+                angelia_metrics.inc("pulse_runs")
+                latency_metrics.observe(
+                    "angelia_pulse_duration_ms",
+                    latency_ms,
+                    project_id=project_id,
+                    agent_id=agent_id,
+                    event_type=primary_event.event_type,
+                )
+
+
+def mark_worker_started(project_id: str, agent_id: str) -> None:
+    st = _status(project_id, agent_id)
+    st.run_state = AgentRunState.IDLE
+    _save_status(st)
 
-            finally:
-                latency_ms = int((time.time() - start) * 1000)
-                if latency_ms >= 0:
-                    angelia_metrics.inc("pulse_runs")
 
+def mark_worker_stopped(project_id: str, agent_id: str) -> None:
     st = _status(project_id, agent_id)
     st.run_state = AgentRunState.STOPPED
     st.current_event_id = ""
     st.current_event_type = ""
     _save_status(st)
+
+
+def has_idle_work(project_id: str, agent_id: str) -> bool:
+    """Safety-net probe for work whose wake notification was lost."""
+    return bool(has_pending(project_id, agent_id) or store.has_queued(project_id, agent_id))
+
+
+def worker_loop(ctx: WorkerContext):
+    _ensure_interaction_handlers_registered()
+    project_id = ctx.project_id
+    agent_id = ctx.agent_id
+    stop_event = ctx.stop_event
+    idle_recheck = policy.idle_recheck_sec(project_id)
+
+    mark_worker_started(project_id, agent_id)
+
+    # Stale PROCESSING reclamation runs in the supervisor's per-project sweeper, not here.
+    angelia_mailbox.notify(project_id, agent_id)
+    while not stop_event.is_set():
+        # Wakes are pushed by enqueue hooks, Iris delivery, timers and available_at/cooldown
+        # deadlines; the timeout is only a slow safety net for notifications lost across processes.
+        woke = angelia_mailbox.wait(project_id, agent_id, timeout=idle_recheck)
+        if stop_event.is_set():
+            break
+        if not woke:
+            angelia_metrics.inc("WORKER_IDLE_RECHECK")
+            if has_idle_work(project_id, agent_id):
+                angelia_mailbox.notify(project_id, agent_id)
+            continue
+        angelia_metrics.inc("WORKER_WAKEUP")
+
+        drain_ready_events(ctx)
+
+    mark_worker_stopped(project_id, agent_id)
@@ -0,0 +1,270 @@
+"""Multi-process Angelia worker pool (`angelia_supervisor_mode = "processes"`).
+
+`temple.sh angelia workers --processes N` starts N worker processes next to the
+API server. Each process runs a `LeasedWorkerPool`: it heartbeats a membership
+row and leases up to its fair share of active agents through
+`gods.events.leases`, then runs the ordinary `worker_loop` thread for every
+agent it holds. Pulses for one world therefore spread over all cores instead of
+sharing the server's GIL.
+
+Crash recovery is lease based: a dead process stops heartbeating, its leases
+expire after `angelia_lease_ttl_sec`, and whichever process takes an agent over
+first requeues that agent's PICKED/PROCESSING events. The in-process supervisor
+keeps timers and archiving for these projects but runs no workers and no
+`reconcile_stale` sweep for them.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+
+from . import policy
+from gods import events as events_bus
+from gods.agents import registry as agent_registry
+from gods.angelia.mailbox import angelia_mailbox
+from gods.angelia.metrics import angelia_metrics
+from gods.angelia.wakeup_bridge import install_wakeup_bridge
+from gods.angelia.worker import WorkerContext, worker_loop
+from gods.config import runtime_config
+from gods.config.loader import load_system_config
+from gods.config.models import CONFIG_FILE
+from gods.events import leases
+
+logger = logging.getLogger("GodsServer")
+
+_TICK_SEC = 1.0
+_RESTART_BACKOFF_SEC = 2.0
+
+
+@dataclass
+class _LeasedWorker:
+    ctx: WorkerContext
+    thread: threading.Thread
+    retiring: bool = False
+
+
+def new_owner_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def _processes_projects(project_ids: set[str] | None) -> list[str]:
+    out: list[str] = []
+    for pid, proj in runtime_config.projects.items():
+        if project_ids and pid not in project_ids:
+            continue
+        if not bool(getattr(proj, "angelia_enabled", True)):
+            continue
+        if not bool(getattr(proj, "simulation_enabled", False)):
+            continue
+        if policy.supervisor_mode(pid) != "processes":
+            continue
+        out.append(pid)
+    return out
+
+
+class LeasedWorkerPool:
+    """Per-process owner of agent leases; `tick()` is one reconcile pass."""
+
+    def __init__(self, owner_id: str | None = None, project_ids: set[str] | None = None):
+        self.owner_id = owner_id or new_owner_id()
+        self.project_ids = set(project_ids or []) or None
+        self._workers: dict[tuple[str, str], _LeasedWorker] = {}
+        self._last_heartbeat: dict[str, float] = {}
+        self._members: dict[str, int] = {}
+        self._tokens: dict[str, tuple] = {}
+        self._touched: set[str] = set()
+        self._config_mtime = 0.0
+
+    def held(self, project_id: str | None = None) -> list[tuple[str, str]]:
+        return [k for k in self._workers if project_id is None or k[0] == project_id]
+
+    def _refresh_config(self):
+        try:
+            mtime = CONFIG_FILE.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._config_mtime:
+            return
+        self._config_mtime = mtime
+        try:
+            runtime_config.projects = load_system_config().projects
+        except Exception as e:
+            logger.warning(f"Angelia worker {self.owner_id}: config reload failed: {e}")
+
+    def _start(self, project_id: str, agent_id: str):
+        ctx = WorkerContext(project_id=project_id, agent_id=agent_id, stop_event=threading.Event())
+        th = threading.Thread(target=worker_loop, args=(ctx,), name=f"angelia-{project_id}-{agent_id}", daemon=True)
+        self._workers[(project_id, agent_id)] = _LeasedWorker(ctx=ctx, thread=th)
+        th.start()
+
+    def _retire(self, key: tuple[str, str]):
+        w = self._workers.get(key)
+        if w is None or w.retiring:
+            return
+        w.retiring = True
+        w.ctx.stop_event.set()
+        angelia_mailbox.notify(*key)
+
+    def _reap(self, project_id: str) -> list[str]:
+        """Forget retired workers whose thread has exited; returns their agent ids."""
+        done: list[str] = []
+        for key, w in list(self._workers.items()):
+            if key[0] != project_id or not w.retiring or w.thread.is_alive():
+                continue
+            self._workers.pop(key, None)
+            done.append(key[1])
+        return done
+
+    def _heartbeat(self, project_id: str, now: float, ttl: int) -> bool:
+        if now - self._last_heartbeat.get(project_id, 0.0) < ttl / 3.0:
+            return True
+        self._last_heartbeat[project_id] = now
+        self._members[project_id] = leases.heartbeat_member(project_id, self.owner_id, ttl)
+        mine = [aid for pid, aid in self.held(project_id)]
+        if not mine:
+            return True
+        kept = set(leases.renew_leases(project_id, self.owner_id, mine, ttl))
+        for aid in mine:
+            if aid not in kept:
+                # Someone else took the lease over (we stalled past the TTL): stop without releasing.
+                logger.warning(f"Angelia worker {self.owner_id}: lost lease on {project_id}/{aid}")
+                angelia_metrics.inc("LEASE_LOST")
+                self._retire((project_id, aid))
+        return True
+
+    def _tick_project(self, project_id: str, now: float):
+        self._touched.add(project_id)
+        ttl = policy.lease_ttl_sec(project_id)
+        self._heartbeat(project_id, now, ttl)
+
+        released = self._reap(project_id)
+        if released:
+            leases.release_leases(project_id, self.owner_id, released)
+
+        active = [str(a) for a in (agent_registry.list_active_agents(project_id) or [])]
+        active_set = set(active)
+        for pid, aid in self.held(project_id):
+            w = self._workers[(pid, aid)]
+            if aid not in active_set:
+                self._retire((pid, aid))
+            elif not w.retiring and not w.thread.is_alive():
+                # worker_loop only returns on stop; a dead thread means it crashed.
+                self._workers.pop((pid, aid), None)
+                self._start(pid, aid)
+
+        live = [k for k in self.held(project_id) if not self._workers[k].retiring]
+        share = math.ceil(len(active) / max(1, self._members.get(project_id, 1))) if active else 0
+        if len(live) > share:
+            for key in live[share:]:
+                self._retire(key)
+        elif len(live) < share:
+            held_ids = {aid for _pid, aid in self.held(project_id)}
+            # Start probing at an owner-specific offset so processes do not all race for the same agents.
+            offset = hash(self.owner_id) % len(active)
+            for aid in active[offset:] + active[:offset]:
+                if len(live) >= share:
+                    break
+                if aid in held_ids:
+                    continue
+                ok, expired_owner = leases.acquire_lease(project_id, aid, self.owner_id, ttl)
+                if not ok:
+                    continue
+                if expired_owner:
+                    recovered = events_bus.reclaim_agent_events(project_id, aid, reason=f"owner {expired_owner}")
+                    if recovered:
+                        angelia_metrics.inc("LEASE_EXPIRED_RECOVERED_COUNT", recovered)
+                self._start(project_id, aid)
+                live.append((project_id, aid))
+
+        token = events_bus.change_token(project_id)
+        if token != self._tokens.get(project_id):
+            # Enqueues from other processes never reach this process's mailbox; wake on store writes.
+            self._tokens[project_id] = token
+            for pid, aid in self.held(project_id):
+                angelia_mailbox.notify(pid, aid)
+
+    def tick(self, now: float | None = None):
+        now = time.time() if now is None else float(now)
+        self._refresh_config()
+        eligible = _processes_projects(self.project_ids)
+        for pid in eligible:
+            try:
+                self._tick_project(pid, now)
+            except Exception as e:
+                logger.warning(f"Angelia worker {self.owner_id}: tick failed for {pid}: {e}")
+        for pid in sorted(self._touched - set(eligible)):
+            for key in self.held(pid):
+                self._retire(key)
+            released = self._reap(pid)
+            if released:
+                leases.release_leases(pid, self.owner_id, released)
+
+    def run(self, stop_event: threading.Event):
+        install_wakeup_bridge()
+        logger.info(f"Angelia worker process {self.owner_id} started")
+        while not stop_event.is_set():
+            self.tick()
+            stop_event.wait(_TICK_SEC)
+        self.shutdown()
+
+    def shutdown(self):
+        for key in list(self._workers):
+            self._retire(key)
+        for w in list(self._workers.values()):
+            w.thread.join(timeout=5.0)
+        self._workers.clear()
+        for pid in sorted(self._touched):
+            try:
+                leases.release_leases(pid, self.owner_id)
+            except Exception as e:
+                logger.warning(f"Angelia worker {self.owner_id}: lease release failed for {pid}: {e}")
+        logger.info(f"Angelia worker process {self.owner_id} stopped")
+
+
+def run_worker_process(project_ids: list[str] | None = None):
+    """Entry point of one pool process; exits cleanly on SIGTERM/SIGINT."""
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    LeasedWorkerPool(project_ids=set(project_ids or [])).run(stop)
+
+
+def run_worker_pool(processes: int, project_ids: list[str] | None = None, stop_event: threading.Event | None = None):
+    """Start `processes` pool processes and restart any that die until stopped."""
+    n = max(1, int(processes))
+    mp = multiprocessing.get_context("spawn")
+    stop = stop_event or threading.Event()
+    if stop_event is None:
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    def _spawn(i: int):
+        p = mp.Process(target=run_worker_process, args=(project_ids,), name=f"angelia-worker-{i}", daemon=False)
+        p.start()
+        return p
+
+    procs = [_spawn(i) for i in range(n)]
+    logger.info(f"Angelia worker pool started: {n} processes")
+    try:
+        while not stop.wait(_RESTART_BACKOFF_SEC):
+            for i, p in enumerate(procs):
+                if p.is_alive():
+                    continue
+                # Its leases expire on their own; a replacement (or a sibling) reclaims the agents.
+                logger.warning(f"Angelia worker process {p.name} exited with {p.exitcode}; restarting")
+                procs[i] = _spawn(i)
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+        for p in procs:
+            p.join(timeout=10.0)
+    logger.info("Angelia worker pool stopped")
@@ -18,7 +18,13 @@ CONFIG_BLOCKS: list[ConfigBlockDecl] = [
             ConfigFieldDecl("angelia_cooldown_preempt_types", "project", "array", ["mail_event", "manual", "detach_failed_event", "detach_lost_event"], False, "冷却期间可抢占事件类型。", "project-runtime", ["gods/angelia/policy.py"]),
             ConfigFieldDecl("angelia_timer_enabled", "project", "boolean", True, False, "是否启用 idle timer 脉冲。", "project-runtime", ["gods/angelia/policy.py"]),
             ConfigFieldDecl("angelia_timer_idle_sec", "project", "integer", 60, False, "idle timer 秒数。", "project-runtime", ["gods/angelia/policy.py", "gods/angelia/pulse/policy.py"]),
+            ConfigFieldDecl("angelia_supervisor_mode", "project", "string", "threads", False, "worker 调度模式：threads=每个 agent 一个线程；asyncio=单事件循环 + 有界 pulse 线程池（受 llm_*_max_concurrency 约束）；processes=由 `angelia workers --processes N` 启动的外部进程通过租约认领 agent。", "project-runtime", ["gods/angelia/policy.py", "gods/angelia/scheduler.py", "gods/angelia/async_dispatch.py", "gods/angelia/worker_pool.py"], enum=["threads", "asyncio", "processes"]),
+            ConfigFieldDecl("angelia_lease_ttl_sec", "project", "integer", 30, False, "processes 模式下 agent 租约有效期（秒）；持有进程每 1/3 周期续约，过期后由其他进程接管并回收其处理中事件。", "project-runtime", ["gods/angelia/policy.py", "gods/angelia/worker_pool.py"], constraints={"min": 5, "max": 600}),
+            ConfigFieldDecl("angelia_idle_recheck_sec", "project", "integer", 30, False, "空闲 worker 兜底复查间隔（秒）；正常唤醒由入队/投递/到期推送，复查仅用于补救丢失的跨进程通知。", "project-runtime", ["gods/angelia/policy.py", "gods/angelia/worker.py"], constraints={"min": 1, "max": 600}),
+            ConfigFieldDecl("angelia_latency_metrics_enabled", "project", "boolean", False, False, "是否记录调度/存储延迟直方图（入队→拾取、拾取→pulse、pulse 时长、LLM 排队、事件/Iris 锁持有），经 /angelia/metrics 输出 JSON 或 Prometheus 文本；关闭时几乎零开销。", "project-runtime", ["gods/metrics.py", "gods/angelia/worker.py", "gods/events/store.py", "gods/iris/store.py", "gods/agents/llm_control.py"]),
             ConfigFieldDecl("angelia_dedupe_window_sec", "project", "integer", 5, False, "事件去重窗口（秒）。", "project-runtime", ["gods/angelia/policy.py"]),
+            ConfigFieldDecl("event_store_backend", "project", "string", "jsonl", False, "事件总线存储后端；切换到 sqlite 时首次访问会自动迁移 events.jsonl。", "project-runtime", ["gods/events/policy.py", "gods/events/store.py"], enum=["jsonl", "sqlite"]),
+            ConfigFieldDecl("event_archive_after_sec", "project", "integer", 86400, False, "终态事件（done/failed/dead）保留在热存储中的秒数，超时后移入压缩归档段；0 表示不归档。", "project-runtime", ["gods/events/policy.py", "gods/angelia/scheduler.py"], constraints={"min": 0, "max": 31536000}),
         ],
     ),
 ]
@@ -13,6 +13,10 @@ CONFIG_BLOCKS: list[ConfigBlockDecl] = [
         fields=[
             ConfigFieldDecl("memory_compact_trigger_tokens", "project", "integer", 12000, False, "触发记忆压缩的 token 阈值。", "project-runtime", ["gods/mnemosyne/compaction.py"]),
             ConfigFieldDecl("memory_compact_strategy", "project", "string", "semantic_llm", False, "记忆压缩策略。", "project-runtime", ["gods/mnemosyne/compaction.py"], enum=["semantic_llm", "rule_based"]),
+            ConfigFieldDecl("memory_intent_durability", "project", "string", "intent", False, "intent 写入提交点：每条 intent / 每个 pulse / 每 N 毫秒。", "project-runtime", ["gods/mnemosyne/intent_writer.py"], enum=["intent", "pulse", "interval"]),
+            ConfigFieldDecl("memory_intent_flush_ms", "project", "integer", 200, False, "interval 模式下的 intent 提交间隔（毫秒）。", "project-runtime", ["gods/mnemosyne/intent_writer.py"], constraints={"min": 10, "max": 10000}),
+            ConfigFieldDecl("memory_pulse_segment_kb", "project", "integer", 4096, False, "pulse ledger 单个分段的轮转大小（KB）。", "project-runtime", ["gods/mnemosyne/pulse_ledger.py"], constraints={"min": 64, "max": 1048576}),
+            ConfigFieldDecl("memory_pulse_segment_compress", "project", "string", "gzip", False, "pulse ledger 已封存分段的压缩方式。", "project-runtime", ["gods/mnemosyne/pulse_ledger.py"], enum=["none", "gzip"]),
         ],
     ),
     ConfigBlockDecl(
@@ -30,6 +30,8 @@ CONFIG_BLOCKS: list[ConfigBlockDecl] = [
             ConfigFieldDecl("tool_policies", "project", "object", {}, False, "项目级策略/阶段工具白名单（推荐主路径）。", "project-runtime", ["gods/agents/base.py"], ui=_tool_policies_ui()),
             ConfigFieldDecl("agent_settings", "project", "object", {}, False, "按 agent_id 的运行覆盖配置。", "project-runtime", ["gods/agents/base.py", "gods/agents/brain.py"]),
             ConfigFieldDecl("hermes_allow_agent_tool_provider", "project", "boolean", False, False, "允许 agent_tool 作为 Hermes provider。", "project-runtime", ["gods/hermes/policy.py", "api/services/hermes_service.py"]),
+            ConfigFieldDecl("hermes_http_pool_size", "project", "integer", 8, False, "每个 HTTP provider 的连接池大小。", "project-runtime", ["gods/hermes/http_pool.py"], constraints={"min": 1, "max": 64}),
+            ConfigFieldDecl("hermes_http_keepalive", "project", "boolean", True, False, "HTTP provider 连接复用（keep-alive）。", "project-runtime", ["gods/hermes/http_pool.py"]),
         ],
     ),
 ]
@@ -77,12 +77,22 @@ class ProjectConfig(BaseModel):
     angelia_timer_enabled: bool = PROJECT_DEFAULTS["angelia_timer_enabled"]
     angelia_timer_idle_sec: int = PROJECT_DEFAULTS["angelia_timer_idle_sec"]
     angelia_dedupe_window_sec: int = PROJECT_DEFAULTS["angelia_dedupe_window_sec"]
+    angelia_idle_recheck_sec: int = PROJECT_DEFAULTS["angelia_idle_recheck_sec"]
+    angelia_supervisor_mode: str = PROJECT_DEFAULTS["angelia_supervisor_mode"]
+    angelia_lease_ttl_sec: int = PROJECT_DEFAULTS["angelia_lease_ttl_sec"]
+    angelia_latency_metrics_enabled: bool = PROJECT_DEFAULTS["angelia_latency_metrics_enabled"]
+    event_store_backend: str = PROJECT_DEFAULTS["event_store_backend"]
+    event_archive_after_sec: int = PROJECT_DEFAULTS["event_archive_after_sec"]
 
     summarize_threshold: int = PROJECT_DEFAULTS["summarize_threshold"]
     summarize_keep_count: int = PROJECT_DEFAULTS["summarize_keep_count"]
 
     memory_compact_trigger_tokens: int = PROJECT_DEFAULTS["memory_compact_trigger_tokens"]
     memory_compact_strategy: str = PROJECT_DEFAULTS["memory_compact_strategy"]
+    memory_intent_durability: str = PROJECT_DEFAULTS["memory_intent_durability"]
+    memory_intent_flush_ms: int = PROJECT_DEFAULTS["memory_intent_flush_ms"]
+    memory_pulse_segment_kb: int = PROJECT_DEFAULTS["memory_pulse_segment_kb"]
+    memory_pulse_segment_compress: str = PROJECT_DEFAULTS["memory_pulse_segment_compress"]
 
     context_strategy: str = PROJECT_DEFAULTS["context_strategy"]
     context_token_budget_total: int = PROJECT_DEFAULTS["context_token_budget_total"]
@@ -157,6 +167,8 @@ class ProjectConfig(BaseModel):
     hermes_default_rate_per_minute: int = PROJECT_DEFAULTS["hermes_default_rate_per_minute"]
     hermes_default_max_concurrency: int = PROJECT_DEFAULTS["hermes_default_max_concurrency"]
     hermes_allow_agent_tool_provider: bool = PROJECT_DEFAULTS["hermes_allow_agent_tool_provider"]
+    hermes_http_pool_size: int = PROJECT_DEFAULTS["hermes_http_pool_size"]
+    hermes_http_keepalive: bool = PROJECT_DEFAULTS["hermes_http_keepalive"]
 
 
 class SystemConfig(BaseModel):
@@ -13,6 +13,8 @@ logger = logging.getLogger("GodsConfig")
 _ALLOWED_PHASE_STRATEGIES = {"react_graph", "freeform"}
 _ALLOWED_CONTEXT_STRATEGIES = {"sequential_v1"}
 _ALLOWED_COMPACT_STRATEGIES = {"semantic_llm", "rule_based"}
+_ALLOWED_INTENT_DURABILITY = {"intent", "pulse", "interval"}
+_ALLOWED_PULSE_SEGMENT_COMPRESS = {"none", "gzip"}
 _ALLOWED_EXECUTORS = {"docker", "local"}
 _ALLOWED_DOCKER_NET = {"bridge_local_only", "none"}
 _ALLOWED_PULSE_INTERRUPT = {"after_action"}
@@ -26,6 +28,8 @@ _ALLOWED_ANGELIA_PREEMPT_TYPES = {
     "detach_lost_event",
 }
 _ALLOWED_METIS_REFRESH_MODE = {"pulse", "node"}
+_ALLOWED_EVENT_STORE_BACKENDS = {"jsonl", "sqlite"}
+_ALLOWED_ANGELIA_SUPERVISOR_MODES = {"threads", "asyncio", "processes"}
 _STRATEGY_NAME_RE = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
 _PHASE_NAME_RE = re.compile(r"^[a-z][a-z0-9_]{0,63}$")
 _LEGACY_TOOL_NAME_MAP = {
@@ -147,6 +151,20 @@ def normalize_project_config(project_id: str, proj: ProjectConfig) -> ProjectCon
         "memory_compact_strategy",
         project_id,
     )
+    proj.memory_intent_durability = _fallback_str(
+        proj.memory_intent_durability,
+        _ALLOWED_INTENT_DURABILITY,
+        "intent",
+        "memory_intent_durability",
+        project_id,
+    )
+    proj.memory_pulse_segment_compress = _fallback_str(
+        proj.memory_pulse_segment_compress,
+        _ALLOWED_PULSE_SEGMENT_COMPRESS,
+        "gzip",
+        "memory_pulse_segment_compress",
+        project_id,
+    )
     proj.command_executor = _fallback_str(proj.command_executor, _ALLOWED_EXECUTORS, "local", "command_executor", project_id)
     proj.docker_network_mode = _fallback_str(
         proj.docker_network_mode,
@@ -162,6 +180,20 @@ def normalize_project_config(project_id: str, proj: ProjectConfig) -> ProjectCon
         "pulse_interrupt_mode",
         project_id,
     )
+    proj.event_store_backend = _fallback_str(
+        proj.event_store_backend,
+        _ALLOWED_EVENT_STORE_BACKENDS,
+        "jsonl",
+        "event_store_backend",
+        project_id,
+    )
+    proj.angelia_supervisor_mode = _fallback_str(
+        proj.angelia_supervisor_mode,
+        _ALLOWED_ANGELIA_SUPERVISOR_MODES,
+        "threads",
+        "angelia_supervisor_mode",
+        project_id,
+    )
 
     proj.autonomous_batch_size = _clamp_int(proj.autonomous_batch_size, 1, 64)
     proj.simulation_interval_min = _clamp_int(proj.simulation_interval_min, 1, 600)
@@ -175,6 +207,9 @@ def normalize_project_config(project_id: str, proj: ProjectConfig) -> ProjectCon
     proj.angelia_pick_batch_size = _clamp_int(proj.angelia_pick_batch_size, 1, 100)
     proj.angelia_timer_idle_sec = _clamp_int(proj.angelia_timer_idle_sec, 5, 3600)
     proj.angelia_dedupe_window_sec = _clamp_int(proj.angelia_dedupe_window_sec, 0, 300)
+    proj.angelia_idle_recheck_sec = _clamp_int(proj.angelia_idle_recheck_sec, 1, 600)
+    proj.angelia_lease_ttl_sec = _clamp_int(proj.angelia_lease_ttl_sec, 5, 600)
+    proj.event_archive_after_sec = _clamp_int(proj.event_archive_after_sec, 0, 31536000)
     normalized_types = [
         str(x).strip()
         for x in proj.angelia_cooldown_preempt_types
@@ -188,6 +223,8 @@ def normalize_project_config(project_id: str, proj: ProjectConfig) -> ProjectCon
     ]
 
     proj.memory_compact_trigger_tokens = _clamp_int(proj.memory_compact_trigger_tokens, 2000, 256000)
+    proj.memory_intent_flush_ms = _clamp_int(proj.memory_intent_flush_ms, 10, 10000)
+    proj.memory_pulse_segment_kb = _clamp_int(proj.memory_pulse_segment_kb, 64, 1048576)
 
     proj.context_token_budget_total = _clamp_int(proj.context_token_budget_total, 4000, 256000)
     proj.context_budget_task_state = _clamp_int(proj.context_budget_task_state, 200, 128000)
@@ -261,6 +298,7 @@ def normalize_project_config(project_id: str, proj: ProjectConfig) -> ProjectCon
     proj.hermes_default_timeout_sec = _clamp_int(proj.hermes_default_timeout_sec, 1, 600)
     proj.hermes_default_rate_per_minute = _clamp_int(proj.hermes_default_rate_per_minute, 1, 100000)
     proj.hermes_default_max_concurrency = _clamp_int(proj.hermes_default_max_concurrency, 1, 128)
+    proj.hermes_http_pool_size = _clamp_int(proj.hermes_http_pool_size, 1, 64)
 
     weights = {}
     for k, v in (proj.pulse_priority_weights or {}).items():
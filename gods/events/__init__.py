@@ -5,16 +5,31 @@ from gods.events.registry import all_handlers, clear_handlers, get_handler, regi
 from gods.events.enqueue_hooks import register_enqueue_hook
 from gods.events.store import (
     append_event,
+    append_events,
+    archive_terminal_events,
+    change_token,
+    compact_events,
     events_path,
+    iter_ready_events,
+    list_archived_events,
     list_events,
+    list_ready_events,
     lock_path,
+    lock_stats,
+    log_path,
+    migrate_events_to_sqlite,
+    next_ready_at,
     pick_next,
+    reclaim_agent_events,
     reconcile_stale,
     requeue_or_dead,
+    requeue_or_dead_many,
     retry_event,
     set_event_meta_field,
+    transition_many,
     transition_state,
 )
+from gods.events.archive import archive_summary
 from gods.events.catalog import event_catalog, event_meta
 
 __all__ = [
@@ -29,14 +44,29 @@ __all__ = [
     "register_enqueue_hook",
     "events_path",
     "lock_path",
+    "lock_stats",
+    "log_path",
+    "compact_events",
+    "migrate_events_to_sqlite",
     "append_event",
+    "append_events",
     "list_events",
+    "list_ready_events",
+    "iter_ready_events",
+    "next_ready_at",
+    "list_archived_events",
+    "archive_terminal_events",
     "pick_next",
     "transition_state",
+    "transition_many",
     "requeue_or_dead",
+    "requeue_or_dead_many",
     "retry_event",
     "reconcile_stale",
+    "reclaim_agent_events",
+    "change_token",
     "set_event_meta_field",
+    "archive_summary",
     "event_catalog",
     "event_meta",
 ]
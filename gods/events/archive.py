@@ -0,0 +1,214 @@
+"""Dated, gzip-compressed archive segments for terminal event-bus rows.
+
+Terminal rows (done/failed/dead) older than `event_archive_after_sec` are moved
+out of the hot store into `runtime/events_archive/events-YYYYMMDD.jsonl.gz`,
+keyed by the UTC day of `done_at`. Segments are appended as extra gzip members,
+so writers never rewrite existing archive bytes. Each segment has a small
+`events-YYYYMMDD.manifest.json` sidecar (row counts by state plus the segment
+size it describes) so summaries never have to decompress history.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from gods.events.models import EventRecord, EventState
+from gods.paths import runtime_dir
+
+TERMINAL_STATES = (EventState.DONE, EventState.FAILED, EventState.DEAD)
+
+_SEGMENT_PREFIX = "events-"
+_SEGMENT_SUFFIX = ".jsonl.gz"
+_MANIFEST_SUFFIX = ".manifest.json"
+
+
+def archive_dir(project_id: str) -> Path:
+    return runtime_dir(project_id) / "events_archive"
+
+
+def _row_day(row: dict[str, Any]) -> str:
+    ts = row.get("done_at") or row.get("created_at") or 0.0
+    return time.strftime("%Y%m%d", time.gmtime(float(ts or 0.0)))
+
+
+def segment_path(project_id: str, day: str) -> Path:
+    return archive_dir(project_id) / f"{_SEGMENT_PREFIX}{day}{_SEGMENT_SUFFIX}"
+
+
+def manifest_path(project_id: str, day: str) -> Path:
+    return archive_dir(project_id) / f"{_SEGMENT_PREFIX}{day}{_MANIFEST_SUFFIX}"
+
+
+def _load_manifest(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _save_manifest(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _rebuild_manifest(seg: Path, manifest: Path) -> dict[str, Any]:
+    by_state: dict[str, int] = {}
+    seen: set[str] = set()
+    for row in _read_segment(seg):
+        eid = str(row.get("event_id", ""))
+        if eid in seen:
+            continue
+        seen.add(eid)
+        st = str(row.get("state", "") or "unknown")
+        by_state[st] = by_state.get(st, 0) + 1
+    data = {"rows": len(seen), "by_state": by_state, "bytes": int(seg.stat().st_size)}
+    _save_manifest(manifest, data)
+    return data
+
+
+def _segment_manifest(project_id: str, day: str) -> dict[str, Any]:
+    """Manifest for one day; rebuilt from the segment only if missing or stale."""
+    seg = segment_path(project_id, day)
+    manifest = manifest_path(project_id, day)
+    data = _load_manifest(manifest)
+    if data is not None and int(data.get("bytes", -1)) == int(seg.stat().st_size):
+        return data
+    return _rebuild_manifest(seg, manifest)
+
+
+def write_segments(project_id: str, rows: Iterable[dict[str, Any]]) -> dict[str, int]:
+    """Append rows to their day segments; returns rows written per day."""
+    by_day: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        by_day.setdefault(_row_day(row), []).append(row)
+    if not by_day:
+        return {}
+    d = archive_dir(project_id)
+    d.mkdir(parents=True, exist_ok=True)
+    for day, items in by_day.items():
+        seg = segment_path(project_id, day)
+        manifest = manifest_path(project_id, day)
+        prior = _load_manifest(manifest) if seg.exists() else {"rows": 0, "by_state": {}, "bytes": 0}
+        if prior is not None and int(prior.get("bytes", -1)) != (seg.stat().st_size if seg.exists() else 0):
+            prior = None
+        blob = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in items).encode("utf-8")
+        with gzip.open(seg, "ab", compresslevel=6) as f:
+            f.write(blob)
+        if prior is None:
+            # No trustworthy manifest for the bytes already on disk; recount once.
+            _rebuild_manifest(seg, manifest)
+            continue
+        by_state = dict(prior.get("by_state") or {})
+        for r in items:
+            st = str(r.get("state", "") or "unknown")
+            by_state[st] = by_state.get(st, 0) + 1
+        _save_manifest(
+            manifest,
+            {"rows": int(prior.get("rows", 0)) + len(items), "by_state": by_state, "bytes": int(seg.stat().st_size)},
+        )
+    return {day: len(items) for day, items in by_day.items()}
+
+
+def list_segments(project_id: str) -> list[dict[str, Any]]:
+    d = archive_dir(project_id)
+    if not d.exists():
+        return []
+    out: list[dict[str, Any]] = []
+    for p in sorted(d.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}")):
+        day = p.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]
+        out.append({"day": day, "path": str(p), "bytes": int(p.stat().st_size)})
+    return out
+
+
+def _read_segment(path: Path) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except Exception:
+                    continue
+                if isinstance(row, dict):
+                    out.append(row)
+    except (OSError, EOFError):
+        # Truncated trailing gzip member from an interrupted append; keep what decoded.
+        pass
+    return out
+
+
+def _day_of(ts: float) -> str:
+    return time.strftime("%Y%m%d", time.gmtime(float(ts)))
+
+
+def list_archived_events(
+    project_id: str,
+    domain: str = "",
+    event_type: str = "",
+    state: EventState | None = None,
+    limit: int = 100,
+    agent_id: str = "",
+    since: float = 0.0,
+    until: float = 0.0,
+) -> list[EventRecord]:
+    """Archived rows newest-first; `since`/`until` (epoch sec) prune whole segments by day."""
+    lo = _day_of(since) if since > 0 else ""
+    hi = _day_of(until) if until > 0 else ""
+    limit = max(1, min(int(limit), 5000))
+    seen: set[str] = set()
+    out: list[EventRecord] = []
+    for seg in reversed(list_segments(project_id)):
+        day = str(seg["day"])
+        if (lo and day < lo) or (hi and day > hi):
+            continue
+        rows = _read_segment(Path(seg["path"]))
+        rows.sort(key=lambda r: float(r.get("done_at") or r.get("created_at") or 0.0), reverse=True)
+        for row in rows:
+            eid = str(row.get("event_id", ""))
+            if not eid or eid in seen:
+                continue
+            seen.add(eid)
+            if domain and str(row.get("domain", "")) != domain:
+                continue
+            if event_type and str(row.get("event_type", "")) != event_type:
+                continue
+            if state and str(row.get("state", "")) != state.value:
+                continue
+            if agent_id and str((row.get("payload") or {}).get("agent_id", row.get("agent_id", ""))) != agent_id:
+                continue
+            done = float(row.get("done_at") or row.get("created_at") or 0.0)
+            if (since > 0 and done < since) or (until > 0 and done > until):
+                continue
+            out.append(EventRecord.from_dict(row))
+            if len(out) >= limit:
+                return out
+    return out
+
+
+def archive_summary(project_id: str) -> dict[str, Any]:
+    """Totals from the per-segment manifests; segment bytes are never decompressed."""
+    segments = list_segments(project_id)
+    by_state: dict[str, int] = {}
+    total = 0
+    for seg in segments:
+        data = _segment_manifest(project_id, str(seg["day"]))
+        total += int(data.get("rows", 0))
+        for st, n in (data.get("by_state") or {}).items():
+            by_state[st] = by_state.get(st, 0) + int(n)
+    return {
+        "segment_count": len(segments),
+        "bytes": sum(int(s["bytes"]) for s in segments),
+        "total": total,
+        "by_state": by_state,
+        "first_day": segments[0]["day"] if segments else "",
+        "last_day": segments[-1]["day"] if segments else "",
+    }
@@ -0,0 +1,346 @@
+"""Append-only transition log + in-process index for the event bus.
+
+Layout per project runtime dir:
+- `events.jsonl`: compacted snapshot, one full event row per line (legacy format).
+- `events.log.jsonl`: transition log appended after the snapshot. First line is a
+  header `{"op": "open", "log_id": ...}`; following lines are either
+  `{"op": "put", "row": {...}}`, `{"op": "set", "event_id": ..., "fields": {...}}`
+  or `{"op": "del", "event_id": ...}` (rows moved to the archive).
+
+Readers replay snapshot + log into an `EventIndex` once and afterwards only
+consume the log tail appended since their last visit. Compaction rewrites the
+snapshot from the index and truncates the log with a fresh header.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable
+
+from gods.events.models import EventState
+from gods.events.ready_queue import ReadyQueues
+
+logger = logging.getLogger(__name__)
+
+# Compact once the log holds at least this many records and at least as many
+# records as live rows, so compaction cost stays amortized O(1) per transition.
+COMPACT_MIN_RECORDS = 2000
+
+
+def row_agent_keys(row: dict[str, Any]) -> set[str]:
+    payload = row.get("payload") or {}
+    keys = {str(row.get("agent_id", "") or "")}
+    if isinstance(payload, dict):
+        keys.add(str(payload.get("agent_id", row.get("agent_id", "")) or ""))
+    keys.discard("")
+    return keys
+
+
+_LIVE_STATE_VALUES = {EventState.QUEUED.value, EventState.PICKED.value, EventState.PROCESSING.value}
+
+
+def _dedupe_key(row: dict[str, Any]) -> tuple[str, str, str] | None:
+    dk = str(row.get("dedupe_key", "") or "")
+    if not dk or str(row.get("state", "")) not in _LIVE_STATE_VALUES:
+        return None
+    return (str(row.get("project_id", "")), str(row.get("event_type", "")), dk)
+
+
+class EventIndex:
+    """event_id -> row map with secondary indexes on state, domain and agent,
+    a dedupe index over live rows, plus per-agent ready queues for pickers."""
+
+    def __init__(self):
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.order: dict[str, int] = {}
+        self.by_state: dict[str, set[str]] = defaultdict(set)
+        self.by_domain: dict[str, set[str]] = defaultdict(set)
+        self.by_agent: dict[str, set[str]] = defaultdict(set)
+        # (project_id, event_type, dedupe_key) -> live event ids; terminal rows drop out.
+        self.by_dedupe: dict[tuple[str, str, str], set[str]] = {}
+        self.ready = ReadyQueues(self.rows, self.order)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, event_id: str) -> dict[str, Any] | None:
+        return self.rows.get(str(event_id or ""))
+
+    def _index(self, eid: str, row: dict[str, Any]) -> None:
+        agents = row_agent_keys(row)
+        self.by_state[str(row.get("state", ""))].add(eid)
+        self.by_domain[str(row.get("domain", ""))].add(eid)
+        for aid in agents:
+            self.by_agent[aid].add(eid)
+        key = _dedupe_key(row)
+        if key is not None:
+            self.by_dedupe.setdefault(key, set()).add(eid)
+        self.ready.track(eid, row, agents)
+
+    def _unindex(self, eid: str, row: dict[str, Any]) -> None:
+        self.by_state[str(row.get("state", ""))].discard(eid)
+        self.by_domain[str(row.get("domain", ""))].discard(eid)
+        for aid in row_agent_keys(row):
+            self.by_agent[aid].discard(eid)
+        key = _dedupe_key(row)
+        if key is not None:
+            ids = self.by_dedupe.get(key)
+            if ids is not None:
+                ids.discard(eid)
+                if not ids:
+                    self.by_dedupe.pop(key, None)
+
+    def put(self, row: dict[str, Any]) -> None:
+        eid = str(row.get("event_id", "") or "")
+        if not eid:
+            return
+        old = self.rows.get(eid)
+        if old is not None:
+            self._unindex(eid, old)
+        else:
+            self._seq += 1
+            self.order[eid] = self._seq
+        self.rows[eid] = row
+        self._index(eid, row)
+
+    def patch(self, event_id: str, fields: dict[str, Any]) -> None:
+        eid = str(event_id or "")
+        row = self.rows.get(eid)
+        if row is None:
+            return
+        self._unindex(eid, row)
+        row.update(fields)
+        self._index(eid, row)
+
+    def remove(self, event_id: str) -> dict[str, Any] | None:
+        eid = str(event_id or "")
+        row = self.rows.pop(eid, None)
+        if row is not None:
+            self._unindex(eid, row)
+            self.order.pop(eid, None)
+            self.ready.untrack(eid)
+        return row
+
+    def apply(self, rec: dict[str, Any]) -> None:
+        op = str(rec.get("op", ""))
+        if op == "put" and isinstance(rec.get("row"), dict):
+            self.put(rec["row"])
+        elif op == "set" and isinstance(rec.get("fields"), dict):
+            self.patch(str(rec.get("event_id", "")), rec["fields"])
+        elif op == "del":
+            self.remove(str(rec.get("event_id", "")))
+
+    def select(self, *, domain: str = "", state: str = "", agent_id: str = "") -> list[dict[str, Any]]:
+        """Return candidate rows in insertion order, narrowed by the smallest index."""
+        sets: list[set[str]] = []
+        if state:
+            sets.append(self.by_state.get(state, set()))
+        if domain:
+            sets.append(self.by_domain.get(domain, set()))
+        if agent_id:
+            sets.append(self.by_agent.get(agent_id, set()))
+        if not sets:
+            return list(self.rows.values())
+        sets.sort(key=len)
+        ids = set(sets[0])
+        for s in sets[1:]:
+            ids &= s
+            if not ids:
+                return []
+        return [self.rows[i] for i in sorted(ids, key=lambda x: self.order.get(x, 0))]
+
+    def live_duplicate(self, project_id: str, event_type: str, dedupe_key: str, since: float) -> dict[str, Any] | None:
+        """Oldest live row for the dedupe key created at or after `since`."""
+        ids = self.by_dedupe.get((str(project_id), str(event_type), str(dedupe_key)))
+        if not ids:
+            return None
+        for eid in sorted(ids, key=lambda x: self.order.get(x, 0)):
+            row = self.rows[eid]
+            if float(row.get("created_at", 0.0) or 0.0) >= since:
+                return row
+        return None
+
+    def ready_rows(self, agent_id: str, now: float, limit: int) -> list[dict[str, Any]]:
+        """Queued rows owned by `agent_id` with `available_at <= now`, in pick order."""
+        return self.ready.take(str(agent_id or ""), float(now), int(limit))
+
+    def next_ready_at(self, agent_id: str, now: float) -> float:
+        return self.ready.next_due(str(agent_id or ""), float(now))
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (int(st.st_ino), int(st.st_size), int(st.st_mtime_ns))
+
+
+def read_snapshot_rows(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    out: list[dict[str, Any]] = []
+    bad_decode = 0
+    bad_json = 0
+    # Be tolerant to occasional partial/corrupt bytes from interrupted writes.
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if "\ufffd" in line:
+                bad_decode += 1
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                out.append(json.loads(line))
+            except Exception:
+                bad_json += 1
+                continue
+    if bad_decode or bad_json:
+        logger.warning(
+            "EVENT_STORE_READ_TOLERANT: path=%s bad_decode_lines=%s bad_json_lines=%s",
+            str(path),
+            bad_decode,
+            bad_json,
+        )
+    return out
+
+
+def write_snapshot_rows(path: Path, rows: Iterable[dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
+
+
+class EventLog:
+    """Replay state for one project's snapshot + transition log.
+
+    All methods must be called while holding the project events lock
+    (shared for reads, exclusive for writes) and `self.guard`.
+    """
+
+    def __init__(self, snapshot_path: Path, log_path: Path):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.guard = threading.RLock()
+        self.index = EventIndex()
+        self._snap_key: tuple[int, int, int] | None = None
+        self._log_id: str | None = None
+        self._offset = 0
+        self._records = 0
+        self._loaded = False
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    @property
+    def log_records(self) -> int:
+        return self._records
+
+    def _read_header(self) -> tuple[str | None, int]:
+        try:
+            with open(self.log_path, "rb") as f:
+                first = f.readline()
+        except FileNotFoundError:
+            return None, 0
+        if not first.endswith(b"\n"):
+            return None, 0
+        try:
+            rec = json.loads(first)
+        except Exception:
+            return "", 0
+        if isinstance(rec, dict) and rec.get("op") == "open":
+            return str(rec.get("log_id", "")), len(first)
+        return "", 0
+
+    def _start_log(self) -> None:
+        header = json.dumps({"op": "open", "log_id": uuid.uuid4().hex}) + "\n"
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "w", encoding="utf-8") as f:
+            f.write(header)
+
+    def sync(self, *, writable: bool) -> EventIndex:
+        if writable:
+            if not self.snapshot_path.exists():
+                self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+                self.snapshot_path.touch()
+            if self._read_header()[0] is None:
+                self._start_log()
+        snap_key = _stat_key(self.snapshot_path)
+        log_id, header_len = self._read_header()
+        try:
+            log_size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            log_size = 0
+        if (
+            not self._loaded
+            or snap_key != self._snap_key
+            or log_id != self._log_id
+            or log_size < self._offset
+        ):
+            self.index = EventIndex()
+            for row in read_snapshot_rows(self.snapshot_path):
+                if isinstance(row, dict):
+                    self.index.put(row)
+            self._snap_key = snap_key
+            self._log_id = log_id
+            self._offset = header_len
+            self._records = 0
+            self._loaded = True
+        if log_size > self._offset:
+            self._consume_tail(writable=writable)
+        return self.index
+
+    def _consume_tail(self, *, writable: bool) -> None:
+        with open(self.log_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n")
+        complete = data[: end + 1] if end >= 0 else b""
+        bad = 0
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+            except Exception:
+                bad += 1
+                continue
+            if isinstance(rec, dict):
+                self.index.apply(rec)
+                self._records += 1
+        self._offset += len(complete)
+        if bad:
+            logger.warning("EVENT_LOG_READ_TOLERANT: path=%s bad_json_lines=%s", str(self.log_path), bad)
+        if writable and len(complete) < len(data):
+            # Torn tail from an interrupted writer; we hold the exclusive lock so drop it.
+            with open(self.log_path, "r+b") as f:
+                f.truncate(self._offset)
+            logger.warning("EVENT_LOG_TORN_TAIL_TRUNCATED: path=%s offset=%s", str(self.log_path), self._offset)
+
+    def append(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+        blob = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+        with open(self.log_path, "ab") as f:
+            f.write(blob)
+        self._offset += len(blob)
+        self._records += len(records)
+
+    def should_compact(self) -> bool:
+        return self._records >= max(COMPACT_MIN_RECORDS, len(self.index))
+
+    def compact(self) -> None:
+        write_snapshot_rows(self.snapshot_path, self.index.rows.values())
+        self._start_log()
+        self._snap_key = _stat_key(self.snapshot_path)
+        self._log_id, self._offset = self._read_header()
+        self._records = 0
@@ -0,0 +1,169 @@
+"""Cross-process agent leases kept next to the event store.
+
+External Angelia worker processes coordinate through one small JSON table per
+project (`runtime/event_leases.json`) guarded by its own flock:
+
+- `members`: owner_id -> heartbeat expiry, used to size each owner's fair share;
+- `leases`:  agent_id -> {owner_id, acquired_at, heartbeat_at, expires_at}.
+
+An owner only processes events of agents it holds a live lease on. When a lease
+expires (its process crashed or hung) the next acquirer takes it over and the
+previous owner is reported back so in-flight events can be requeued.
+"""
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from gods.paths import runtime_dir, runtime_locks_dir
+
+
+def leases_path(project_id: str) -> Path:
+    return runtime_dir(project_id) / "event_leases.json"
+
+
+def _lease_lock_path(project_id: str) -> Path:
+    d = runtime_locks_dir(project_id)
+    d.mkdir(parents=True, exist_ok=True)
+    return d / "event_leases.lock"
+
+
+def _load(path: Path) -> dict[str, Any]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError, OSError):
+        return {"members": {}, "leases": {}}
+    if not isinstance(raw, dict):
+        return {"members": {}, "leases": {}}
+    members = raw.get("members") if isinstance(raw.get("members"), dict) else {}
+    leases = raw.get("leases") if isinstance(raw.get("leases"), dict) else {}
+    return {"members": dict(members), "leases": dict(leases)}
+
+
+def _save(path: Path, table: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(table, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _with_table(project_id: str, mutator, *, write: bool = True):
+    lp = _lease_lock_path(project_id)
+    lp.touch(exist_ok=True)
+    path = leases_path(project_id)
+    with open(lp, "r+", encoding="utf-8") as lf:
+        fcntl.flock(lf, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+        try:
+            table = _load(path)
+            result = mutator(table)
+            if write:
+                _save(path, table)
+            return result
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+
+
+def _live(expires_at: Any, now: float) -> bool:
+    try:
+        return float(expires_at or 0.0) > now
+    except (TypeError, ValueError):
+        return False
+
+
+def heartbeat_member(project_id: str, owner_id: str, ttl_sec: float) -> int:
+    """Refresh `owner_id` membership, drop dead members; returns live member count."""
+    now = time.time()
+
+    def _mut(table: dict[str, Any]) -> int:
+        members = {k: v for k, v in table["members"].items() if _live(v, now)}
+        members[str(owner_id)] = now + float(ttl_sec)
+        table["members"] = members
+        return len(members)
+
+    return int(_with_table(project_id, _mut))
+
+
+def acquire_lease(project_id: str, agent_id: str, owner_id: str, ttl_sec: float) -> tuple[bool, str]:
+    """Take or renew the lease on `agent_id`.
+
+    Returns `(acquired, expired_owner)`; `expired_owner` is the previous holder
+    when this call took over an expired lease from another owner, else "".
+    """
+    now = time.time()
+    aid = str(agent_id)
+    owner = str(owner_id)
+
+    def _mut(table: dict[str, Any]) -> tuple[bool, str]:
+        row = table["leases"].get(aid)
+        prev_owner = str((row or {}).get("owner_id", "") or "")
+        if isinstance(row, dict) and prev_owner != owner and _live(row.get("expires_at"), now):
+            return False, ""
+        acquired_at = float(row.get("acquired_at", now)) if isinstance(row, dict) and prev_owner == owner else now
+        table["leases"][aid] = {
+            "owner_id": owner,
+            "acquired_at": acquired_at,
+            "heartbeat_at": now,
+            "expires_at": now + float(ttl_sec),
+        }
+        return True, (prev_owner if prev_owner and prev_owner != owner else "")
+
+    return _with_table(project_id, _mut)
+
+
+def renew_leases(project_id: str, owner_id: str, agent_ids: list[str], ttl_sec: float) -> list[str]:
+    """Heartbeat every lease in `agent_ids` still held by `owner_id`; returns the ones kept."""
+    now = time.time()
+    owner = str(owner_id)
+
+    def _mut(table: dict[str, Any]) -> list[str]:
+        kept: list[str] = []
+        for aid in agent_ids:
+            row = table["leases"].get(str(aid))
+            if not isinstance(row, dict) or str(row.get("owner_id", "")) != owner:
+                continue
+            row["heartbeat_at"] = now
+            row["expires_at"] = now + float(ttl_sec)
+            kept.append(str(aid))
+        return kept
+
+    return list(_with_table(project_id, _mut))
+
+
+def release_leases(project_id: str, owner_id: str, agent_ids: list[str] | None = None) -> int:
+    """Drop leases held by `owner_id` (all of them when `agent_ids` is None)."""
+    owner = str(owner_id)
+    wanted = None if agent_ids is None else {str(x) for x in agent_ids}
+
+    def _mut(table: dict[str, Any]) -> int:
+        released = 0
+        for aid, row in list(table["leases"].items()):
+            if not isinstance(row, dict) or str(row.get("owner_id", "")) != owner:
+                continue
+            if wanted is not None and aid not in wanted:
+                continue
+            table["leases"].pop(aid, None)
+            released += 1
+        if wanted is None:
+            table["members"].pop(owner, None)
+        return released
+
+    return int(_with_table(project_id, _mut))
+
+
+def list_leases(project_id: str) -> dict[str, Any]:
+    now = time.time()
+
+    def _read(table: dict[str, Any]) -> dict[str, Any]:
+        leases = []
+        for aid, row in sorted(table["leases"].items()):
+            if not isinstance(row, dict):
+                continue
+            leases.append({"agent_id": aid, **row, "live": _live(row.get("expires_at"), now)})
+        members = sorted(k for k, v in table["members"].items() if _live(v, now))
+        return {"project_id": project_id, "members": members, "leases": leases}
+
+    return _with_table(project_id, _read, write=False)
@@ -1,10 +1,13 @@
-"""Startup legacy-file guards for strict zero-compat mode."""
+"""Startup legacy-file guards for strict zero-compat mode + event store backend migration."""
 from __future__ import annotations
 
 import json
 from pathlib import Path
 
+from gods.events import sqlite_store
+from gods.events.event_log import EventLog
 from gods.events.models import EventState
+from gods.paths import runtime_dir
 
 
 _LEGACY_RUNTIME_FILES = (
@@ -31,10 +34,10 @@ def assert_no_legacy_files(project_id: str):
             "remove/migrate these files manually: " + ", ".join(exists)
         )
         raise RuntimeError(msg)
+    allowed = {x.value for x in EventState}
+    bad_states: set[str] = set()
     ep = rt / "events.jsonl"
     if ep.exists():
-        allowed = {x.value for x in EventState}
-        bad_states: set[str] = set()
         for line in ep.read_text(encoding="utf-8").splitlines():
             line = line.strip()
             if not line:
@@ -46,11 +49,27 @@ def assert_no_legacy_files(project_id: str):
             st = str(row.get("state", "")).strip()
             if st and st not in allowed:
                 bad_states.add(st)
-        if bad_states:
-            raise RuntimeError(
-                "events.jsonl contains unsupported legacy states in strict mode: "
-                + ", ".join(sorted(bad_states))
-            )
+    lp = rt / "events.log.jsonl"
+    if lp.exists():
+        for line in lp.read_text(encoding="utf-8", errors="replace").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except Exception:
+                continue
+            if not isinstance(rec, dict):
+                continue
+            fields = rec.get("row") if rec.get("op") == "put" else rec.get("fields")
+            st = str((fields or {}).get("state", "")).strip() if isinstance(fields, dict) else ""
+            if st and st not in allowed:
+                bad_states.add(st)
+    if bad_states:
+        raise RuntimeError(
+            "events.jsonl contains unsupported legacy states in strict mode: "
+            + ", ".join(sorted(bad_states))
+        )
 
 
 def assert_no_legacy_files_all_projects() -> dict[str, str]:
@@ -62,3 +81,24 @@ def assert_no_legacy_files_all_projects() -> dict[str, str]:
         assert_no_legacy_files(p.name)
         rows[p.name] = "ok"
     return rows
+
+
+def import_jsonl_into_sqlite(project_id: str) -> dict[str, int | str]:
+    """Copy the replayed `events.jsonl` + transition log into `events.db`.
+
+    The JSONL files are rotated to `*.migrated` only after `events.db` has been
+    renamed into place, and an empty `events.jsonl` is left in place for
+    project layout checks. A failed import leaves the JSONL history untouched. Caller must hold
+    the project events lock (see `gods.events.store.migrate_events_to_sqlite`).
+    """
+    rt = runtime_dir(project_id)
+    snapshot = rt / "events.jsonl"
+    log = rt / "events.log.jsonl"
+    rows = list(EventLog(snapshot, log).sync(writable=False).rows.values())
+    imported = sqlite_store.import_rows(project_id, rows)
+    for p in (snapshot, log):
+        if p.exists() and p.stat().st_size > 0:
+            p.replace(p.with_name(p.name + ".migrated"))
+    if not snapshot.exists():
+        snapshot.write_text("", encoding="utf-8")
+    return {"project_id": project_id, "imported": int(imported), "db_path": str(sqlite_store.db_path(project_id))}
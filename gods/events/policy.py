@@ -0,0 +1,18 @@
+"""Event bus policy helpers."""
+from __future__ import annotations
+
+from gods.config import runtime_config
+
+_BACKENDS = {"jsonl", "sqlite"}
+
+
+def store_backend(project_id: str) -> str:
+    proj = runtime_config.projects.get(project_id)
+    v = str(getattr(proj, "event_store_backend", "jsonl") if proj else "jsonl").strip().lower()
+    return v if v in _BACKENDS else "jsonl"
+
+
+def archive_after_sec(project_id: str) -> int:
+    proj = runtime_config.projects.get(project_id)
+    v = int(getattr(proj, "event_archive_after_sec", 86400) if proj else 86400)
+    return max(0, min(v, 31536000))
@@ -0,0 +1,126 @@
+"""Per-agent ready queues over the in-process event index.
+
+Each agent owns two heaps:
+- `ready`: queued rows whose `available_at` has passed, ordered like
+  `list_events` (priority DESC, created_at ASC, insertion order).
+- `delayed`: queued rows still waiting on `available_at`, ordered by due time;
+  they are promoted into `ready` lazily when a picker looks at the queue.
+
+Entries are invalidated lazily: every (re)index of a row bumps its version and
+stale heap entries are dropped when they surface, so updates stay O(log n).
+"""
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Any
+
+QUEUED = "queued"
+
+# Rebuild an agent's heaps once they grow this many times past their last live size;
+# the threshold scales geometrically so the sweep is amortized O(1) per push.
+_REBUILD_FACTOR = 4
+_REBUILD_MIN = 64
+
+
+class _AgentQueue:
+    __slots__ = ("ready", "delayed", "rebuild_at")
+
+    def __init__(self):
+        self.ready: list[tuple[int, float, int, int, str]] = []
+        self.delayed: list[tuple[float, int, str]] = []
+        self.rebuild_at = _REBUILD_MIN
+
+
+class ReadyQueues:
+    """Heaps keyed by agent id over the owning index's `rows` / `order` maps."""
+
+    def __init__(self, rows: dict[str, dict[str, Any]], order: dict[str, int]):
+        self._rows = rows
+        self._order = order
+        self._queues: dict[str, _AgentQueue] = {}
+        self._ver: dict[str, int] = {}
+        self._clock = 0
+
+    def _valid(self, eid: str, ver: int) -> dict[str, Any] | None:
+        if self._ver.get(eid) != ver:
+            return None
+        row = self._rows.get(eid)
+        if row is None or str(row.get("state", "")) != QUEUED:
+            return None
+        return row
+
+    def track(self, eid: str, row: dict[str, Any], agents: set[str]) -> None:
+        """Register the current version of `row`; only queued rows enter a heap."""
+        self._clock += 1
+        ver = self._clock
+        self._ver[eid] = ver
+        if str(row.get("state", "")) != QUEUED or not agents:
+            return
+        available_at = float(row.get("available_at", 0.0) or 0.0)
+        due = available_at <= time.time()
+        for aid in agents:
+            q = self._queues.get(aid)
+            if q is None:
+                q = self._queues[aid] = _AgentQueue()
+            if due:
+                heapq.heappush(q.ready, _ready_key(row, self._order.get(eid, 0), ver, eid))
+            else:
+                heapq.heappush(q.delayed, (available_at, ver, eid))
+            self._maybe_rebuild(q)
+
+    def untrack(self, eid: str) -> None:
+        self._ver.pop(eid, None)
+
+    def take(self, agent_id: str, now: float, limit: int) -> list[dict[str, Any]]:
+        """Return up to `limit` ready rows for `agent_id` in pick order without consuming them."""
+        q = self._queues.get(agent_id)
+        if q is None or limit <= 0:
+            return []
+        while q.delayed and q.delayed[0][0] <= now:
+            _, ver, eid = heapq.heappop(q.delayed)
+            row = self._valid(eid, ver)
+            if row is not None:
+                heapq.heappush(q.ready, _ready_key(row, self._order.get(eid, 0), ver, eid))
+        out: list[dict[str, Any]] = []
+        keep: list[tuple[int, float, int, int, str]] = []
+        while q.ready and len(out) < limit:
+            entry = heapq.heappop(q.ready)
+            row = self._valid(entry[4], entry[3])
+            if row is None:
+                continue
+            keep.append(entry)
+            if float(row.get("available_at", 0.0) or 0.0) > now:
+                # Indexed as due against wall clock but the caller asked about an earlier `now`.
+                continue
+            out.append(row)
+        for entry in keep:
+            heapq.heappush(q.ready, entry)
+        return out
+
+    def next_due(self, agent_id: str, now: float) -> float:
+        """Earliest `available_at` among the agent's delayed rows after `now`; 0 if none."""
+        q = self._queues.get(agent_id)
+        if q is None:
+            return 0.0
+        while q.delayed:
+            due, ver, eid = q.delayed[0]
+            if self._valid(eid, ver) is None:
+                heapq.heappop(q.delayed)
+                continue
+            return due if due > now else 0.0
+        return 0.0
+
+    def _maybe_rebuild(self, q: _AgentQueue) -> None:
+        if len(q.ready) + len(q.delayed) < q.rebuild_at:
+            return
+        ready = [e for e in q.ready if self._valid(e[4], e[3]) is not None]
+        delayed = [e for e in q.delayed if self._valid(e[2], e[1]) is not None]
+        heapq.heapify(ready)
+        heapq.heapify(delayed)
+        q.ready, q.delayed = ready, delayed
+        q.rebuild_at = max(_REBUILD_MIN, _REBUILD_FACTOR * (len(ready) + len(delayed)))
+
+
+def _ready_key(row: dict[str, Any], order: int, ver: int, eid: str) -> tuple[int, float, int, int, str]:
+    return (-int(row.get("priority", 0) or 0), float(row.get("created_at", 0.0) or 0.0), int(order), ver, eid)
@@ -0,0 +1,364 @@
+"""SQLite (WAL) backend for the unified event bus.
+
+Selected per project via `event_store_backend = "sqlite"`. One `events.db`
+per project runtime dir; connections are cached per thread. Writers serialize
+on SQLite's own write lock (`BEGIN IMMEDIATE`) instead of `events.lock`.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+from gods.events.models import EventState
+from gods.paths import runtime_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    project_id TEXT NOT NULL DEFAULT '',
+    domain TEXT NOT NULL DEFAULT '',
+    event_type TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL DEFAULT 'queued',
+    priority INTEGER NOT NULL DEFAULT 0,
+    agent_id TEXT NOT NULL DEFAULT '',
+    attempt INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    dedupe_key TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL DEFAULT 0,
+    picked_at REAL,
+    done_at REAL,
+    error_code TEXT NOT NULL DEFAULT '',
+    error_message TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL DEFAULT '{}',
+    meta TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_events_pick ON events(domain, state, available_at);
+CREATE INDEX IF NOT EXISTS idx_events_agent ON events(agent_id, state);
+CREATE INDEX IF NOT EXISTS idx_events_dedupe ON events(dedupe_key, event_type);
+"""
+
+_COLUMNS = (
+    "event_id",
+    "project_id",
+    "domain",
+    "event_type",
+    "state",
+    "priority",
+    "agent_id",
+    "attempt",
+    "max_attempts",
+    "dedupe_key",
+    "created_at",
+    "available_at",
+    "picked_at",
+    "done_at",
+    "error_code",
+    "error_message",
+    "payload",
+    "meta",
+)
+_JSON_COLUMNS = {"payload", "meta"}
+_DEFAULTS: dict[str, Any] = {"priority": 0, "attempt": 0, "max_attempts": 3, "created_at": 0.0, "available_at": 0.0}
+_LIVE_STATES = (EventState.QUEUED.value, EventState.PICKED.value, EventState.PROCESSING.value)
+
+_local = threading.local()
+
+
+def db_path(project_id: str) -> Path:
+    return runtime_dir(project_id) / "events.db"
+
+
+def _connect(project_id: str) -> sqlite3.Connection:
+    path = db_path(project_id)
+    conns: dict[str, sqlite3.Connection] = getattr(_local, "conns", None) or {}
+    _local.conns = conns
+    key = str(path.resolve())
+    conn = conns.get(key)
+    if conn is not None:
+        if path.exists():
+            return conn
+        # Runtime dir was torn down under us; drop the stale handle.
+        conns.pop(key, None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30.0, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    conn.executescript(_SCHEMA)
+    conns[key] = conn
+    return conn
+
+
+def _owner(row: dict[str, Any]) -> str:
+    payload = row.get("payload") or {}
+    if isinstance(payload, dict):
+        return str(payload.get("agent_id", row.get("agent_id", "")) or "")
+    return str(row.get("agent_id", "") or "")
+
+
+def _to_row(r: sqlite3.Row) -> dict[str, Any]:
+    out = {k: r[k] for k in _COLUMNS if k != "agent_id"}
+    for k in _JSON_COLUMNS:
+        try:
+            out[k] = json.loads(out[k] or "{}")
+        except Exception:
+            out[k] = {}
+    return out
+
+
+def _to_params(row: dict[str, Any]) -> list[Any]:
+    vals: list[Any] = []
+    for k in _COLUMNS:
+        if k == "agent_id":
+            vals.append(_owner(row))
+        elif k in _JSON_COLUMNS:
+            vals.append(json.dumps(row.get(k) or {}, ensure_ascii=False))
+        elif k in {"picked_at", "done_at"}:
+            vals.append(row.get(k))
+        else:
+            v = row.get(k)
+            vals.append(v if v is not None else _DEFAULTS.get(k, ""))
+    return vals
+
+
+_UPSERT_SQL = (
+    f"INSERT INTO events ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' for _ in _COLUMNS)}) "
+    "ON CONFLICT(event_id) DO UPDATE SET "
+    + ", ".join(f"{k}=excluded.{k}" for k in _COLUMNS if k != "event_id")
+)
+
+
+class SqliteTxn:
+    """Store mutator surface backed by one `BEGIN IMMEDIATE` transaction."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def get(self, event_id: str) -> dict[str, Any] | None:
+        r = self.conn.execute("SELECT * FROM events WHERE event_id = ?", (str(event_id or ""),)).fetchone()
+        return _to_row(r) if r is not None else None
+
+    def rows(self, *, domain: str = "", state: str = "", agent_id: str = "") -> list[dict[str, Any]]:
+        where, args = _where(domain=domain, state=state, agent_id=agent_id)
+        sql = f"SELECT * FROM events {where} ORDER BY seq"
+        return [_to_row(r) for r in self.conn.execute(sql, args)]
+
+    def find_live_duplicate(self, project_id: str, event_type: str, dedupe_key: str, since: float) -> dict[str, Any] | None:
+        r = self.conn.execute(
+            "SELECT * FROM events WHERE dedupe_key = ? AND event_type = ? AND project_id = ? "
+            f"AND state IN ({', '.join('?' for _ in _LIVE_STATES)}) AND created_at >= ? ORDER BY seq LIMIT 1",
+            (dedupe_key, event_type, project_id, *_LIVE_STATES, float(since)),
+        ).fetchone()
+        return _to_row(r) if r is not None else None
+
+    def count(self) -> int:
+        return int(self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0])
+
+    def ready(self, agent_id: str, now: float, limit: int) -> list[dict[str, Any]]:
+        return _ready(self.conn, agent_id, now, limit)
+
+    def put(self, row: dict[str, Any]) -> None:
+        self.conn.execute(_UPSERT_SQL, _to_params(row))
+
+    def delete(self, event_id: str) -> None:
+        self.conn.execute("DELETE FROM events WHERE event_id = ?", (str(event_id or ""),))
+
+    def set(self, event_id: str, fields: dict[str, Any]) -> None:
+        cols: list[str] = []
+        args: list[Any] = []
+        for k, v in fields.items():
+            if k not in _COLUMNS or k in {"event_id", "agent_id"}:
+                raise ValueError(f"EVENT_SQLITE_UNKNOWN_FIELD: {k}")
+            cols.append(f"{k} = ?")
+            args.append(json.dumps(v or {}, ensure_ascii=False) if k in _JSON_COLUMNS else v)
+            if k == "payload":
+                cols.append("agent_id = ?")
+                args.append(_owner({"payload": v}))
+        if not cols:
+            return
+        args.append(str(event_id or ""))
+        self.conn.execute(f"UPDATE events SET {', '.join(cols)} WHERE event_id = ?", args)
+
+
+def _where(*, domain: str = "", state: str = "", agent_id: str = "", event_type: str = "") -> tuple[str, list[Any]]:
+    conds: list[str] = []
+    args: list[Any] = []
+    if domain:
+        conds.append("domain = ?")
+        args.append(domain)
+    if state:
+        conds.append("state = ?")
+        args.append(state)
+    if agent_id:
+        conds.append("agent_id = ?")
+        args.append(agent_id)
+    if event_type:
+        conds.append("event_type = ?")
+        args.append(event_type)
+    return ("WHERE " + " AND ".join(conds)) if conds else "", args
+
+
+def run(project_id: str, mutator):
+    conn = _connect(project_id)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = mutator(SqliteTxn(conn))
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return result
+
+
+def query(
+    project_id: str,
+    *,
+    domain: str = "",
+    event_type: str = "",
+    state: str = "",
+    agent_id: str = "",
+    limit: int = 100,
+) -> list[dict[str, Any]]:
+    where, args = _where(domain=domain, state=state, agent_id=agent_id, event_type=event_type)
+    sql = f"SELECT * FROM events {where} ORDER BY priority DESC, created_at ASC, seq ASC LIMIT ?"
+    conn = _connect(project_id)
+    return [_to_row(r) for r in conn.execute(sql, [*args, int(limit)])]
+
+
+_READY_SQL = (
+    "SELECT * FROM events WHERE agent_id = ? AND state = ? AND available_at <= ? "
+    "ORDER BY priority DESC, created_at ASC, seq ASC LIMIT ?"
+)
+
+
+def _ready(conn: sqlite3.Connection, agent_id: str, now: float, limit: int) -> list[dict[str, Any]]:
+    args = (str(agent_id or ""), EventState.QUEUED.value, float(now), int(limit))
+    return [_to_row(r) for r in conn.execute(_READY_SQL, args)]
+
+
+def ready(project_id: str, agent_id: str, now: float, limit: int = 100) -> list[dict[str, Any]]:
+    """Queued rows owned by `agent_id` and due at `now`; served by `idx_events_agent`."""
+    return _ready(_connect(project_id), agent_id, now, limit)
+
+
+def next_ready_at(project_id: str, agent_id: str, now: float) -> float:
+    r = _connect(project_id).execute(
+        "SELECT MIN(available_at) FROM events WHERE agent_id = ? AND state = ? AND available_at > ?",
+        (str(agent_id or ""), EventState.QUEUED.value, float(now)),
+    ).fetchone()
+    return float(r[0]) if r is not None and r[0] is not None else 0.0
+
+
+def pick_next(
+    project_id: str,
+    *,
+    domain: str,
+    preempt_types: set[str],
+    cooldown_until: float,
+    now: float,
+    owner_id: str = "",
+) -> dict[str, Any] | None:
+    conds = ["domain = ?", "state = ?", "available_at <= ?"]
+    args: list[Any] = [domain, EventState.QUEUED.value, float(now)]
+    if owner_id:
+        conds.append("agent_id = ?")
+        args.append(owner_id)
+    if now < float(cooldown_until or 0.0):
+        types = sorted(str(x) for x in (preempt_types or set()))
+        if not types:
+            return None
+        conds.append(f"event_type IN ({', '.join('?' for _ in types)})")
+        args.extend(types)
+    sql = (
+        "UPDATE events SET state = ?, picked_at = ? WHERE seq = ("
+        f"SELECT seq FROM events WHERE {' AND '.join(conds)} "
+        "ORDER BY priority DESC, created_at ASC, seq ASC LIMIT 1) RETURNING *"
+    )
+    conn = _connect(project_id)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        r = conn.execute(sql, [EventState.PICKED.value, float(now), *args]).fetchone()
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return _to_row(r) if r is not None else None
+
+
+def import_rows(project_id: str, rows: Iterable[dict[str, Any]]) -> int:
+    """Build `events.db` from `rows`; the file only appears once fully written.
+
+    Rows go into `events.db.tmp` first, which is fsynced and renamed into place,
+    so a failed import never leaves a half-filled database that later callers
+    would take as "already migrated".
+    """
+    path = db_path(project_id)
+    tmp = path.with_name(path.name + ".tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in (tmp, tmp.with_name(tmp.name + "-journal")):
+        stale.unlink(missing_ok=True)
+    conn = sqlite3.connect(str(tmp), isolation_level=None)
+    try:
+        conn.executescript(_SCHEMA)
+        conn.execute("BEGIN IMMEDIATE")
+        n = 0
+        for row in rows:
+            if not isinstance(row, dict) or not str(row.get("event_id", "") or ""):
+                continue
+            conn.execute(_UPSERT_SQL, _to_params(row))
+            n += 1
+        conn.execute("COMMIT")
+        conn.close()
+        fd = os.open(str(tmp), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        _drop_connection(path)
+        os.replace(tmp, path)
+        _fsync_dir(path.parent)
+    except BaseException:
+        conn.close()
+        tmp.unlink(missing_ok=True)
+        raise
+    return n
+
+
+def _drop_connection(path: Path) -> None:
+    conns: dict[str, sqlite3.Connection] = getattr(_local, "conns", None) or {}
+    conn = conns.pop(str(path.resolve()), None)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def checkpoint(project_id: str) -> int:
+    conn = _connect(project_id)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return int(conn.execute("SELECT COUNT(*) FROM events").fetchone()[0])
@@ -1,15 +1,22 @@
-"""Unified per-project event bus store backed by events.jsonl."""
+"""Unified per-project event bus store.
+
+Default backend is events.jsonl + an append-only transition log; projects with
+`event_store_backend = "sqlite"` use `gods.events.sqlite_store` instead.
+"""
 from __future__ import annotations
 
 import fcntl
-import json
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
+from gods.events import archive, migrate, policy, sqlite_store
+from gods.events.event_log import EventIndex, EventLog
 from gods.events.models import EventRecord, EventState
 from gods.events.enqueue_hooks import dispatch_enqueue_hooks
+from gods.metrics import latency_metrics
 from gods.paths import runtime_dir, runtime_locks_dir
 
 logger = logging.getLogger(__name__)
@@ -61,57 +68,135 @@ def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def _read_rows(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: list[dict[str, Any]] = []
-    bad_decode = 0
-    bad_json = 0
-    # Be tolerant to occasional partial/corrupt bytes from interrupted writes.
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if "\ufffd" in line:
-                bad_decode += 1
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except Exception:
-                bad_json += 1
-                continue
-    if bad_decode or bad_json:
-        logger.warning(
-            "EVENT_STORE_READ_TOLERANT: path=%s bad_decode_lines=%s bad_json_lines=%s",
-            str(path),
-            bad_decode,
-            bad_json,
-        )
-    return out
+def log_path(project_id: str) -> Path:
+    return events_path(project_id).with_name("events.log.jsonl")
 
 
-def _write_rows(path: Path, rows: list[dict[str, Any]]):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+_LOGS: dict[str, EventLog] = {}
+_LOGS_GUARD = threading.Lock()
+
+
+def _event_log(project_id: str) -> EventLog:
+    ep = events_path(project_id)
+    key = str(ep.resolve())
+    with _LOGS_GUARD:
+        log = _LOGS.get(key)
+        if log is None:
+            log = EventLog(ep, log_path(project_id))
+            _LOGS[key] = log
+        return log
+
+
+# Process-wide JSONL lock acquisition counters (observability / benchmarks).
+_LOCK_STATS = {"exclusive": 0, "shared": 0}
+_LOCK_STATS_GUARD = threading.Lock()
+
+
+def _count_lock(kind: str) -> None:
+    with _LOCK_STATS_GUARD:
+        _LOCK_STATS[kind] += 1
+
+
+def lock_stats() -> dict[str, int]:
+    with _LOCK_STATS_GUARD:
+        return dict(_LOCK_STATS)
+
+
+class _Txn:
+    """Mutations applied to the in-process index and queued as log records.
+
+    `sqlite_store.SqliteTxn` exposes the same surface so mutators stay backend-agnostic.
+    """
+
+    def __init__(self, index: EventIndex):
+        self.index = index
+        self.records: list[dict[str, Any]] = []
+
+    def get(self, event_id: str) -> dict[str, Any] | None:
+        return self.index.get(event_id)
+
+    def rows(self, *, domain: str = "", state: str = "", agent_id: str = "") -> list[dict[str, Any]]:
+        return self.index.select(domain=domain, state=state, agent_id=agent_id)
+
+    def ready(self, agent_id: str, now: float, limit: int) -> list[dict[str, Any]]:
+        return self.index.ready_rows(agent_id, now, limit)
+
+    def find_live_duplicate(self, project_id: str, event_type: str, dedupe_key: str, since: float) -> dict[str, Any] | None:
+        return self.index.live_duplicate(project_id, event_type, dedupe_key, since)
+
+    def count(self) -> int:
+        return len(self.index)
+
+    def put(self, row: dict[str, Any]) -> None:
+        self.index.put(row)
+        self.records.append({"op": "put", "row": row})
+
+    def set(self, event_id: str, fields: dict[str, Any]) -> None:
+        if not fields:
+            return
+        self.index.patch(event_id, fields)
+        self.records.append({"op": "set", "event_id": event_id, "fields": fields})
+
+    def delete(self, event_id: str) -> None:
+        if self.index.remove(event_id) is not None:
+            self.records.append({"op": "del", "event_id": event_id})
+
+
+def _record(row: dict[str, Any]) -> EventRecord:
+    # Index rows are shared; hand out records that do not alias their dicts.
+    rec = EventRecord.from_dict(row)
+    rec.payload = dict(rec.payload or {})
+    rec.meta = dict(rec.meta or {})
+    return rec
+
+
+def _sqlite_enabled(project_id: str) -> bool:
+    if policy.store_backend(project_id) != "sqlite":
+        return False
+    if not sqlite_store.db_path(project_id).exists():
+        migrate_events_to_sqlite(project_id)
+    return True
 
 
 def _with_lock(project_id: str, mutator):
+    timed = latency_metrics.enabled(project_id)
+    if _sqlite_enabled(project_id):
+        if not timed:
+            return sqlite_store.run(project_id, mutator)
+        t0 = time.perf_counter()
+        try:
+            return sqlite_store.run(project_id, mutator)
+        finally:
+            latency_metrics.observe(
+                "event_store_lock_hold_ms", (time.perf_counter() - t0) * 1000.0, project_id=project_id
+            )
     last_err: Exception | None = None
     for _ in range(3):
         try:
             lp = lock_path(project_id)
             lp.touch(exist_ok=True)
-            ep = events_path(project_id)
+            log = _event_log(project_id)
             with open(lp, "r+", encoding="utf-8") as lf:
                 fcntl.flock(lf, fcntl.LOCK_EX)
+                _count_lock("exclusive")
+                held_at = time.perf_counter() if timed else 0.0
                 try:
-                    rows = _read_rows(ep)
-                    rows2, result = mutator(rows)
-                    _write_rows(ep, rows2)
-                    return result
+                    with log.guard:
+                        txn = _Txn(log.sync(writable=True))
+                        try:
+                            result = mutator(txn)
+                            log.append(txn.records)
+                        except BaseException:
+                            log.invalidate()
+                            raise
+                        if log.should_compact():
+                            log.compact()
+                        return result
                 finally:
+                    if timed:
+                        latency_metrics.observe(
+                            "event_store_lock_hold_ms", (time.perf_counter() - held_at) * 1000.0, project_id=project_id
+                        )
                     fcntl.flock(lf, fcntl.LOCK_UN)
         except (FileNotFoundError, FileExistsError, OSError) as e:
             last_err = e
@@ -122,18 +207,20 @@ def _with_lock(project_id: str, mutator):
     raise RuntimeError("events lock failed unexpectedly")
 
 
-def _read_rows_with_lock(project_id: str) -> list[dict[str, Any]]:
-    """Read events.jsonl under the same lock used by mutating paths."""
+def _with_read_lock(project_id: str, reader):
+    """Run `reader(index)` against the replayed index under a shared lock."""
     last_err: Exception | None = None
     for _ in range(3):
         try:
             lp = lock_path(project_id)
             lp.touch(exist_ok=True)
-            ep = events_path(project_id)
+            log = _event_log(project_id)
             with open(lp, "r+", encoding="utf-8") as lf:
                 fcntl.flock(lf, fcntl.LOCK_SH)
+                _count_lock("shared")
                 try:
-                    return _read_rows(ep)
+                    with log.guard:
+                        return reader(log.sync(writable=False))
                 finally:
                     fcntl.flock(lf, fcntl.LOCK_UN)
         except (FileNotFoundError, FileExistsError, OSError) as e:
@@ -142,41 +229,96 @@ def _read_rows_with_lock(project_id: str) -> list[dict[str, Any]]:
             continue
     if last_err is not None:
         raise last_err
-    return _read_rows(events_path(project_id))
+    raise RuntimeError("events lock failed unexpectedly")
 
 
-def append_event(record: EventRecord, dedupe_window_sec: int = 0) -> EventRecord:
+def compact_events(project_id: str) -> int:
+    """Fold the transition log into the `events.jsonl` snapshot; returns live row count."""
+    if _sqlite_enabled(project_id):
+        return sqlite_store.checkpoint(project_id)
+
+    def _mut(txn: _Txn):
+        _event_log(project_id).compact()
+        return len(txn.index)
+
+    return int(_with_lock(project_id, _mut) or 0)
+
+
+def migrate_events_to_sqlite(project_id: str) -> dict[str, Any]:
+    """Move this project's JSONL event history into `events.db` (idempotent)."""
+    # Runs under the JSONL lock so no JSONL writer can race the import.
+    lp = lock_path(project_id)
+    lp.touch(exist_ok=True)
+    log = _event_log(project_id)
+    with open(lp, "r+", encoding="utf-8") as lf:
+        fcntl.flock(lf, fcntl.LOCK_EX)
+        try:
+            with log.guard:
+                db = sqlite_store.db_path(project_id)
+                if db.exists():
+                    return {"project_id": project_id, "imported": 0, "db_path": str(db)}
+                out = migrate.import_jsonl_into_sqlite(project_id)
+                log.invalidate()
+                return out
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+
+
+def _check_payload(record: EventRecord) -> None:
     if any(k in (record.payload or {}) for k in _FORBIDDEN_BUSINESS_FIELDS):
         bad = sorted([k for k in (record.payload or {}).keys() if k in _FORBIDDEN_BUSINESS_FIELDS])
         raise ValueError(f"event payload contains forbidden business-state fields: {', '.join(bad)}")
+
+
+def append_event(record: EventRecord, dedupe_window_sec: int = 0) -> EventRecord:
+    _check_payload(record)
     now = time.time()
 
-    def _mut(rows: list[dict[str, Any]]):
+    def _mut(txn: _Txn):
         if record.dedupe_key and dedupe_window_sec > 0:
             win_start = now - float(dedupe_window_sec)
-            for row in rows:
-                if str(row.get("project_id", "")) != record.project_id:
-                    continue
-                if str(row.get("event_type", "")) != record.event_type:
-                    continue
-                if str(row.get("dedupe_key", "")) != record.dedupe_key:
-                    continue
-                if float(row.get("created_at", 0.0) or 0.0) < win_start:
-                    continue
-                if str(row.get("state", "")) in {
-                    EventState.QUEUED.value,
-                    EventState.PICKED.value,
-                    EventState.PROCESSING.value,
-                }:
-                    return rows, EventRecord.from_dict(row)
-        rows.append(record.to_dict())
-        return rows, record
+            row = txn.find_live_duplicate(record.project_id, record.event_type, record.dedupe_key, win_start)
+            if row is not None:
+                return _record(row)
+        txn.put(record.to_dict())
+        return record
 
     out = _with_lock(record.project_id, _mut)
     dispatch_enqueue_hooks(out)
     return out
 
 
+def append_events(records: list[EventRecord]) -> list[EventRecord]:
+    """Append several records of one project in a single store transaction (no dedupe).
+
+    Enqueue hooks (wakeups) run once per record after the transaction commits.
+    """
+    records = list(records or [])
+    if not records:
+        return []
+    project_ids = {r.project_id for r in records}
+    if len(project_ids) != 1:
+        raise ValueError("append_events requires records of a single project")
+    for record in records:
+        _check_payload(record)
+
+    def _mut(txn: _Txn):
+        for record in records:
+            txn.put(record.to_dict())
+        return records
+
+    out = _with_lock(records[0].project_id, _mut)
+    for record in out:
+        dispatch_enqueue_hooks(record)
+    return out
+
+
+def _agent_matches(row: dict[str, Any], agent_id: str) -> bool:
+    if str((row.get("payload") or {}).get("agent_id", row.get("agent_id", ""))) == agent_id:
+        return True
+    return str(row.get("agent_id", "")) == agent_id
+
+
 def list_events(
     project_id: str,
     domain: str = "",
@@ -185,48 +327,134 @@ def list_events(
     limit: int = 100,
     agent_id: str = "",
 ) -> list[EventRecord]:
-    rows = _read_rows_with_lock(project_id)
-    out: list[EventRecord] = []
-    for row in rows:
-        if domain and str(row.get("domain", "")) != domain:
-            continue
-        if event_type and str(row.get("event_type", "")) != event_type:
-            continue
-        if state and str(row.get("state", "")) != state.value:
-            continue
-        if agent_id and str((row.get("payload") or {}).get("agent_id", row.get("agent_id", ""))) != agent_id:
-            if str(row.get("agent_id", "")) != agent_id:
+    if _sqlite_enabled(project_id):
+        rows = sqlite_store.query(
+            project_id,
+            domain=domain,
+            event_type=event_type,
+            state=state.value if state else "",
+            agent_id=agent_id,
+            limit=max(1, min(limit, 5000)),
+        )
+        return [_record(row) for row in rows]
+
+    def _read(index: EventIndex):
+        out: list[tuple[int, dict[str, Any]]] = []
+        for row in index.select(domain=domain, state=state.value if state else "", agent_id=agent_id):
+            if domain and str(row.get("domain", "")) != domain:
+                continue
+            if event_type and str(row.get("event_type", "")) != event_type:
+                continue
+            if state and str(row.get("state", "")) != state.value:
                 continue
-        out.append(EventRecord.from_dict(row))
-    out.sort(key=lambda x: (-int(x.priority), float(x.created_at)))
-    return out[: max(1, min(limit, 5000))]
+            if agent_id and not _agent_matches(row, agent_id):
+                continue
+            out.append((index.order.get(str(row.get("event_id", "")), 0), row))
+        out.sort(key=lambda x: (-int(x[1].get("priority", 0)), float(x[1].get("created_at", 0.0)), x[0]))
+        return [_record(row) for _, row in out[: max(1, min(limit, 5000))]]
 
+    return _with_read_lock(project_id, _read)
 
-def transition_state(project_id: str, event_id: str, target: EventState, *, error_code: str = "", error_message: str = "") -> bool:
-    now = time.time()
 
-    def _mut(rows: list[dict[str, Any]]):
+def _iter_pages(fetch, agent_id: str, now: float, first_page: int = 32):
+    """Yield `fetch(agent_id, now, limit)` rows in pick order, widening the page on demand.
+
+    Rows are de-duplicated by event_id so callers may transition yielded rows between pages.
+    """
+    seen: set[str] = set()
+    page = max(1, int(first_page))
+    while True:
+        rows = fetch(agent_id, now, page)
         for row in rows:
-            if str(row.get("event_id", "")) != event_id:
+            eid = str(row.get("event_id", "") if isinstance(row, dict) else getattr(row, "event_id", ""))
+            if eid in seen:
                 continue
-            cur = EventState(str(row.get("state", EventState.QUEUED.value)))
-            if target not in _ALLOWED_TRANSITIONS.get(cur, set()) and target != EventState.DONE:
-                return rows, False
-            row["state"] = target.value
-            if target == EventState.PICKED:
-                row["picked_at"] = now
-            if target in {EventState.DONE, EventState.FAILED, EventState.DEAD}:
-                row["done_at"] = row.get("done_at") or now
-            if error_code:
-                row["error_code"] = error_code
-            if error_message:
-                row["error_message"] = error_message[:2000]
-            return rows, True
-        return rows, False
+            seen.add(eid)
+            yield row
+        if len(rows) < page or page >= 5000:
+            return
+        page = min(page * 8, 5000)
+
+
+def list_ready_events(project_id: str, agent_id: str, now: float | None = None, limit: int = 100) -> list[EventRecord]:
+    """Queued events owned by `agent_id` that are due at `now`, in pick order.
+
+    Served from the per-agent ready queue (jsonl) or `idx_events_agent` (sqlite),
+    so the cost scales with the agent's own backlog rather than the whole bus.
+    """
+    ts = time.time() if now is None else float(now)
+    lim = max(1, min(int(limit), 5000))
+    if _sqlite_enabled(project_id):
+        return [_record(row) for row in sqlite_store.ready(project_id, agent_id, ts, lim)]
+    return _with_read_lock(project_id, lambda index: [_record(row) for row in index.ready_rows(agent_id, ts, lim)])
+
+
+def next_ready_at(project_id: str, agent_id: str, now: float | None = None) -> float:
+    """Earliest future `available_at` among `agent_id`'s queued events; 0.0 when none are delayed."""
+    ts = time.time() if now is None else float(now)
+    if _sqlite_enabled(project_id):
+        return sqlite_store.next_ready_at(project_id, agent_id, ts)
+    return float(_with_read_lock(project_id, lambda index: index.next_ready_at(agent_id, ts)) or 0.0)
+
+
+def iter_ready_events(project_id: str, agent_id: str, now: float | None = None, first_page: int = 32):
+    """Lazily walk `agent_id`'s ready events in pick order, fetching larger pages only when needed."""
+    ts = time.time() if now is None else float(now)
+    return _iter_pages(lambda aid, t, lim: list_ready_events(project_id, aid, t, lim), agent_id, ts, first_page)
+
+
+def _transition_row(txn: _Txn, event_id: str, target: EventState, now: float, error_code: str = "", error_message: str = "") -> bool:
+    row = txn.get(event_id)
+    if row is None:
+        return False
+    cur = EventState(str(row.get("state", EventState.QUEUED.value)))
+    if target not in _ALLOWED_TRANSITIONS.get(cur, set()) and target != EventState.DONE:
+        return False
+    fields: dict[str, Any] = {"state": target.value}
+    if target == EventState.PICKED:
+        fields["picked_at"] = now
+    if target in {EventState.DONE, EventState.FAILED, EventState.DEAD}:
+        fields["done_at"] = row.get("done_at") or now
+    if error_code:
+        fields["error_code"] = error_code
+    if error_message:
+        fields["error_message"] = error_message[:2000]
+    txn.set(event_id, fields)
+    return True
+
+
+def transition_state(project_id: str, event_id: str, target: EventState, *, error_code: str = "", error_message: str = "") -> bool:
+    now = time.time()
+
+    def _mut(txn: _Txn):
+        return _transition_row(txn, event_id, target, now, error_code, error_message)
 
     return bool(_with_lock(project_id, _mut))
 
 
+def transition_many(project_id: str, items: list[tuple]) -> list[bool]:
+    """Apply several transitions under one lock hold.
+
+    `items` are `(event_id, target[, error_code[, error_message]])`; each one is
+    validated against `_ALLOWED_TRANSITIONS` exactly like `transition_state`.
+    Returns one flag per item, in order.
+    """
+    if not items:
+        return []
+    now = time.time()
+
+    def _mut(txn: _Txn):
+        out: list[bool] = []
+        for item in items:
+            event_id, target = str(item[0]), EventState(item[1])
+            error_code = str(item[2] or "") if len(item) > 2 else ""
+            error_message = str(item[3] or "") if len(item) > 3 else ""
+            out.append(_transition_row(txn, event_id, target, now, error_code, error_message))
+        return out
+
+    return list(_with_lock(project_id, _mut) or [])
+
+
 def pick_next(
     project_id: str,
     *,
@@ -236,74 +464,114 @@ def pick_next(
     now: float,
     owner_id: str = "",
 ) -> EventRecord | None:
-    def _mut(rows: list[dict[str, Any]]):
+    if _sqlite_enabled(project_id):
+        row = sqlite_store.pick_next(
+            project_id,
+            domain=domain,
+            preempt_types=preempt_types,
+            cooldown_until=cooldown_until,
+            now=now,
+            owner_id=owner_id,
+        )
+        return _record(row) if row is not None else None
+
+    def _mut(txn: _Txn):
+        if owner_id:
+            in_cooldown = now < float(cooldown_until or 0.0)
+            for row in _iter_pages(txn.ready, owner_id, now):
+                if str(row.get("domain", "")) != domain:
+                    continue
+                if in_cooldown and str(row.get("event_type", "")) not in preempt_types:
+                    continue
+                eid = str(row.get("event_id", ""))
+                txn.set(eid, {"state": EventState.PICKED.value, "picked_at": now})
+                return _record(txn.get(eid) or row)
+            return None
         cands: list[dict[str, Any]] = []
-        for row in rows:
+        for row in txn.rows(domain=domain, state=EventState.QUEUED.value):
             if str(row.get("domain", "")) != domain:
                 continue
             if str(row.get("state", "")) != EventState.QUEUED.value:
                 continue
             if float(row.get("available_at", 0.0) or 0.0) > now:
                 continue
-            if owner_id:
-                payload = row.get("payload") or {}
-                aid = str(payload.get("agent_id", row.get("agent_id", "")))
-                if aid != owner_id:
-                    continue
             cands.append(row)
         cands.sort(key=lambda r: (-int(r.get("priority", 0)), float(r.get("created_at", 0.0))))
         for row in cands:
             et = str(row.get("event_type", ""))
             if now < float(cooldown_until or 0.0) and et not in preempt_types:
                 continue
-            row["state"] = EventState.PICKED.value
-            row["picked_at"] = now
-            return rows, EventRecord.from_dict(row)
-        return rows, None
+            eid = str(row.get("event_id", ""))
+            txn.set(eid, {"state": EventState.PICKED.value, "picked_at": now})
+            return _record(txn.get(eid) or row)
+        return None
 
     return _with_lock(project_id, _mut)
 
 
+def _requeue_or_dead_row(txn: _Txn, event_id: str, now: float, error_code: str, error_message: str, retry_delay_sec: int) -> str:
+    row = txn.get(event_id)
+    if row is None:
+        return ""
+    attempt = int(row.get("attempt", 0)) + 1
+    max_attempts = int(row.get("max_attempts", 3))
+    fields: dict[str, Any] = {
+        "attempt": attempt,
+        "error_code": str(error_code or ""),
+        "error_message": str(error_message or "")[:2000],
+    }
+    if attempt >= max_attempts:
+        fields["state"] = EventState.DEAD.value
+        fields["done_at"] = row.get("done_at") or now
+        txn.set(event_id, fields)
+        return EventState.DEAD.value
+    fields["state"] = EventState.QUEUED.value
+    fields["available_at"] = now + max(0, int(retry_delay_sec))
+    txn.set(event_id, fields)
+    return EventState.QUEUED.value
+
+
 def requeue_or_dead(project_id: str, event_id: str, error_code: str, error_message: str, retry_delay_sec: int = 0) -> str:
     now = time.time()
 
-    def _mut(rows: list[dict[str, Any]]):
-        for row in rows:
-            if str(row.get("event_id", "")) != event_id:
-                continue
-            attempt = int(row.get("attempt", 0)) + 1
-            max_attempts = int(row.get("max_attempts", 3))
-            row["attempt"] = attempt
-            row["error_code"] = str(error_code or "")
-            row["error_message"] = str(error_message or "")[:2000]
-            if attempt >= max_attempts:
-                row["state"] = EventState.DEAD.value
-                row["done_at"] = row.get("done_at") or now
-                return rows, EventState.DEAD.value
-            row["state"] = EventState.QUEUED.value
-            row["available_at"] = now + max(0, int(retry_delay_sec))
-            return rows, EventState.QUEUED.value
-        return rows, ""
+    def _mut(txn: _Txn):
+        return _requeue_or_dead_row(txn, event_id, now, error_code, error_message, retry_delay_sec)
 
     return str(_with_lock(project_id, _mut) or "")
 
 
+def requeue_or_dead_many(project_id: str, items: list[tuple[str, str, str, int]]) -> list[str]:
+    """Batch form of `requeue_or_dead`: `(event_id, error_code, error_message, retry_delay_sec)` per item."""
+    if not items:
+        return []
+    now = time.time()
+
+    def _mut(txn: _Txn):
+        return [_requeue_or_dead_row(txn, str(eid), now, code, msg, delay) for eid, code, msg, delay in items]
+
+    return [str(x or "") for x in (_with_lock(project_id, _mut) or [])]
+
+
 def retry_event(project_id: str, event_id: str) -> bool:
     now = time.time()
 
-    def _mut(rows: list[dict[str, Any]]):
-        for row in rows:
-            if str(row.get("event_id", "")) != event_id:
-                continue
-            st = str(row.get("state", ""))
-            if st not in {EventState.DEAD.value, EventState.FAILED.value}:
-                return rows, False
-            row["state"] = EventState.QUEUED.value
-            row["available_at"] = now
-            row["error_code"] = ""
-            row["error_message"] = ""
-            return rows, True
-        return rows, False
+    def _mut(txn: _Txn):
+        row = txn.get(event_id)
+        if row is None:
+            return False
+        st = str(row.get("state", ""))
+        if st not in {EventState.DEAD.value, EventState.FAILED.value}:
+            return False
+        txn.set(
+            event_id,
+            {
+                "state": EventState.QUEUED.value,
+                "available_at": now,
+                "error_code": "",
+                "error_message": "",
+            },
+        )
+        return True
 
     return bool(_with_lock(project_id, _mut))
 
@@ -312,8 +580,10 @@ def reconcile_stale(project_id: str, timeout_sec: int, domain: str = "") -> int:
     now = time.time()
     timeout_sec = max(5, int(timeout_sec))
 
-    def _mut(rows: list[dict[str, Any]]):
+    def _mut(txn: _Txn):
         recovered = 0
+        rows = txn.rows(domain=domain, state=EventState.PROCESSING.value)
+        rows += txn.rows(domain=domain, state=EventState.PICKED.value)
         for row in rows:
             if domain and str(row.get("domain", "")) != domain:
                 continue
@@ -325,38 +595,154 @@ def reconcile_stale(project_id: str, timeout_sec: int, domain: str = "") -> int:
                 picked = float(row.get("created_at", 0.0) or 0.0)
             if now - picked <= timeout_sec:
                 continue
-            attempt = int(row.get("attempt", 0)) + 1
-            max_attempts = int(row.get("max_attempts", 3))
-            row["attempt"] = attempt
-            if attempt >= max_attempts:
-                row["state"] = EventState.DEAD.value
-                row["done_at"] = row.get("done_at") or now
-                row["error_code"] = "PROCESSING_TIMEOUT"
-                row["error_message"] = f"stale processing timeout > {timeout_sec}s"
-            else:
-                row["state"] = EventState.QUEUED.value
-                row["available_at"] = now
-                row["error_code"] = "PROCESSING_TIMEOUT"
-                row["error_message"] = f"recovered from stale processing > {timeout_sec}s"
+            _requeue_in_flight(
+                txn,
+                row,
+                now,
+                "PROCESSING_TIMEOUT",
+                dead_message=f"stale processing timeout > {timeout_sec}s",
+                requeue_message=f"recovered from stale processing > {timeout_sec}s",
+            )
             recovered += 1
-        return rows, recovered
+        return recovered
 
     return int(_with_lock(project_id, _mut) or 0)
 
 
+def _requeue_in_flight(txn: _Txn, row: dict[str, Any], now: float, error_code: str, *, dead_message: str, requeue_message: str):
+    attempt = int(row.get("attempt", 0)) + 1
+    max_attempts = int(row.get("max_attempts", 3))
+    fields: dict[str, Any] = {"attempt": attempt, "error_code": error_code}
+    if attempt >= max_attempts:
+        fields["state"] = EventState.DEAD.value
+        fields["done_at"] = row.get("done_at") or now
+        fields["error_message"] = dead_message
+    else:
+        fields["state"] = EventState.QUEUED.value
+        fields["available_at"] = now
+        fields["error_message"] = requeue_message
+    txn.set(str(row.get("event_id", "")), fields)
+
+
+def reclaim_agent_events(project_id: str, agent_id: str, reason: str = "") -> int:
+    """Requeue PICKED/PROCESSING events of one agent whose worker lease expired.
+
+    Unlike `reconcile_stale` this does not look at `picked_at`: the lease holder is
+    the only process allowed to have in-flight events for the agent, so once its
+    lease is gone every in-flight row is orphaned.
+    """
+    aid = str(agent_id or "").strip()
+    if not aid:
+        return 0
+    now = time.time()
+    note = f": {reason}" if reason else ""
+
+    def _mut(txn: _Txn):
+        recovered = 0
+        rows = txn.rows(state=EventState.PROCESSING.value, agent_id=aid)
+        rows += txn.rows(state=EventState.PICKED.value, agent_id=aid)
+        for row in rows:
+            _requeue_in_flight(
+                txn,
+                row,
+                now,
+                "LEASE_EXPIRED",
+                dead_message=f"worker lease expired{note}",
+                requeue_message=f"recovered from expired worker lease{note}",
+            )
+            recovered += 1
+        return recovered
+
+    return int(_with_lock(project_id, _mut) or 0)
+
+
+def change_token(project_id: str) -> tuple:
+    """Cheap stat-based token that changes whenever the project's event store is written.
+
+    Lets out-of-process workers notice enqueues without taking the store lock.
+    """
+    if policy.store_backend(project_id) == "sqlite":
+        db = sqlite_store.db_path(project_id)
+        paths = [db, db.with_name(db.name + "-wal")]
+    else:
+        paths = [events_path(project_id), log_path(project_id)]
+    out = []
+    for p in paths:
+        try:
+            st = p.stat()
+            out.append((st.st_size, st.st_mtime_ns))
+        except OSError:
+            out.append((0, 0))
+    return tuple(out)
+
+
 def set_event_meta_field(project_id: str, event_id: str, key: str, value: Any) -> bool:
     k = str(key or "").strip()
     if not k:
         return False
 
-    def _mut(rows: list[dict[str, Any]]):
-        for row in rows:
-            if str(row.get("event_id", "")) != event_id:
-                continue
-            meta = dict(row.get("meta", {}) or {})
-            meta[k] = value
-            row["meta"] = meta
-            return rows, True
-        return rows, False
+    def _mut(txn: _Txn):
+        row = txn.get(event_id)
+        if row is None:
+            return False
+        meta = dict(row.get("meta", {}) or {})
+        meta[k] = value
+        txn.set(event_id, {"meta": meta})
+        return True
 
     return bool(_with_lock(project_id, _mut))
+
+
+def archive_terminal_events(project_id: str, older_than_sec: int | None = None) -> int:
+    """Move terminal rows finished more than `older_than_sec` ago into archive segments.
+
+    Defaults to the project's `event_archive_after_sec`; 0 disables retention.
+    """
+    age = policy.archive_after_sec(project_id) if older_than_sec is None else max(0, int(older_than_sec))
+    if age <= 0:
+        return 0
+    cutoff = time.time() - float(age)
+
+    def _mut(txn: _Txn):
+        expired: list[dict[str, Any]] = []
+        for st in archive.TERMINAL_STATES:
+            for row in txn.rows(state=st.value):
+                done = float(row.get("done_at") or row.get("created_at") or 0.0)
+                if done <= cutoff:
+                    expired.append(row)
+        if not expired:
+            return 0
+        # Segments are written first: a crash before the delete commits only duplicates
+        # archive rows (readers dedupe by event_id; archive_summary's manifest counts
+        # may include them twice), it never loses history.
+        archive.write_segments(project_id, expired)
+        for row in expired:
+            txn.delete(str(row.get("event_id", "")))
+        return len(expired)
+
+    moved = int(_with_lock(project_id, _mut) or 0)
+    if moved > 0 and not _sqlite_enabled(project_id):
+        compact_events(project_id)
+    return moved
+
+
+def list_archived_events(
+    project_id: str,
+    domain: str = "",
+    event_type: str = "",
+    state: EventState | None = None,
+    limit: int = 100,
+    agent_id: str = "",
+    since: float = 0.0,
+    until: float = 0.0,
+) -> list[EventRecord]:
+    return archive.list_archived_events(
+        project_id,
+        domain=domain,
+        event_type=event_type,
+        state=state,
+        limit=limit,
+        agent_id=agent_id,
+        since=since,
+        until=until,
+    )
@@ -0,0 +1,69 @@
+"""Stat-validated in-process cache for small files read on hot paths.
+
+Entries are keyed by file path and stay valid while the file's (inode, size,
+mtime_ns) signature is unchanged; in-process writers also invalidate or `put`
+explicitly, so a hit costs one `stat()` instead of a read and parse. Used by
+Mnemosyne's policy/template registries and the Iris mailbox and outbox indexes.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_Signature = tuple[int, int, int]
+
+
+def file_signature(path: Path) -> _Signature | None:
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class FileCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows: dict[str, tuple[_Signature, Any]] = {}
+
+    def peek(self, path: Path) -> Any | None:
+        sig = file_signature(path)
+        if sig is None:
+            return None
+        with self._lock:
+            hit = self._rows.get(str(path))
+        if hit is None or hit[0] != sig:
+            return None
+        return hit[1]
+
+    def put(self, path: Path, value: Any) -> None:
+        sig = file_signature(path)
+        with self._lock:
+            if sig is None:
+                self._rows.pop(str(path), None)
+            else:
+                self._rows[str(path)] = (sig, value)
+
+    def get(self, path: Path, build: Callable[[], T]) -> T:
+        sig = file_signature(path)
+        if sig is not None:
+            with self._lock:
+                hit = self._rows.get(str(path))
+            if hit is not None and hit[0] == sig:
+                return hit[1]
+        value = build()
+        if sig is not None:
+            # Signature taken before the build: a concurrent rewrite just causes one more rebuild.
+            with self._lock:
+                self._rows[str(path)] = (sig, value)
+        return value
+
+    def invalidate(self, path: Path | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._rows.clear()
+            else:
+                self._rows.pop(str(path), None)
@@ -76,6 +76,7 @@ class HermesContracts:
         return {
             "mode": mode,
             "timeout_sec": int(runtime.get("timeout_sec", 30)),
+            "connect_timeout_sec": float(runtime.get("connect_timeout_sec", 5.0)),
             "rate_per_minute": int(runtime.get("rate_per_minute", 60)),
             "max_concurrency": int(runtime.get("max_concurrency", 2)),
         }
@@ -143,6 +144,7 @@ class HermesContracts:
             response_schema=resp_schema,
             limits={
                 "timeout_sec": runtime["timeout_sec"],
+                "connect_timeout_sec": runtime["connect_timeout_sec"],
                 "rate_per_minute": runtime["rate_per_minute"],
                 "max_concurrency": runtime["max_concurrency"],
             },
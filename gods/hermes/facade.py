@@ -14,6 +14,7 @@ from gods.hermes.errors import (
 )
 from gods.hermes.events import hermes_events
 from gods.hermes.executor import HermesExecutor
+from gods.hermes.http_pool import http_pools
 from gods.hermes.limits import HermesLimiter
 from gods.hermes.models import InvokeRequest, ProtocolSpec
 from gods.hermes.policy import allow_agent_tool_provider
@@ -111,6 +112,10 @@ def events_since(project_id: str, seq: int, limit: int = 200) -> list[dict[str,
     return hermes_events.get_since(seq, project_id=project_id, limit=limit)
 
 
+def http_pool_metrics(project_id: str | None = None) -> list[dict[str, Any]]:
+    return http_pools.metrics(project_id)
+
+
 __all__ = [
     "HermesError",
     "HERMES_BAD_REQUEST",
@@ -143,4 +148,5 @@ __all__ = [
     "release_port",
     "list_ports",
     "events_since",
+    "http_pool_metrics",
 ]
@@ -0,0 +1,153 @@
+"""Pooled HTTP sessions for Hermes http providers."""
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from gods.config import runtime_config
+
+# Minimum gap between utilization snapshots handed back for one pool, so the
+# per-call `http_pool` event stays cheap on busy providers.
+_REPORT_INTERVAL_SEC = 5.0
+
+
+def _pool_settings(project_id: str) -> tuple[int, bool]:
+    proj = runtime_config.projects.get(project_id)
+    size = int(getattr(proj, "hermes_http_pool_size", 8) or 8)
+    keepalive = bool(getattr(proj, "hermes_http_keepalive", True))
+    return max(1, min(64, size)), keepalive
+
+
+def _origin(url: str) -> str:
+    parsed = urlparse(url)
+    scheme = (parsed.scheme or "http").lower()
+    port = parsed.port or (443 if scheme == "https" else 80)
+    return f"{scheme}://{(parsed.hostname or '').lower()}:{port}"
+
+
+class _ProviderPool:
+    """One keep-alive session per (project, provider origin)."""
+
+    def __init__(self, size: int, keepalive: bool):
+        self.size = size
+        self.keepalive = keepalive
+        self.session = requests.Session()
+        # Never block on an exhausted pool: overflow connections are opened and
+        # discarded, and show up as in_use > size in the metrics.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, pool_block=False)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keepalive:
+            self.session.headers["Connection"] = "close"
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.requests = 0
+        self.errors = 0
+        self.reported_at = float("-inf")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pool_size": self.size,
+            "keepalive": self.keepalive,
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "utilization": round(self.in_use / self.size, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+class HermesHttpPools:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: dict[tuple[str, str], _ProviderPool] = {}
+        # Pools replaced after a settings change while requests still held them;
+        # the last of those requests closes the session.
+        self._retired: list[tuple[str, _ProviderPool]] = []
+
+    def _acquire(self, project_id: str, origin: str) -> tuple[_ProviderPool, dict[str, Any] | None]:
+        size, keepalive = _pool_settings(project_id)
+        key = (project_id, origin)
+        now = time.monotonic()
+        stale = None
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None or (pool.size, pool.keepalive) != (size, keepalive):
+                if pool is not None:
+                    if pool.in_use == 0:
+                        stale = pool
+                    else:
+                        self._retired.append((project_id, pool))
+                pool = _ProviderPool(size, keepalive)
+                self._pools[key] = pool
+            pool.in_use += 1
+            pool.requests += 1
+            pool.peak_in_use = max(pool.peak_in_use, pool.in_use)
+            report = None
+            if now - pool.reported_at >= _REPORT_INTERVAL_SEC:
+                pool.reported_at = now
+                report = {"origin": origin, **pool.stats()}
+        if stale is not None:
+            stale.session.close()
+        return pool, report
+
+    def _release(self, pool: _ProviderPool):
+        with self._lock:
+            pool.in_use -= 1
+            drained = pool.in_use == 0 and any(p is pool for _, p in self._retired)
+            if drained:
+                self._retired = [(pid, p) for pid, p in self._retired if p is not pool]
+        if drained:
+            pool.session.close()
+
+    def request(
+        self,
+        project_id: str,
+        method: str,
+        url: str,
+        timeout: float | tuple[float, float],
+        **kwargs: Any,
+    ) -> tuple[requests.Response, dict[str, Any] | None]:
+        """Send through the provider's pooled session.
+
+        Returns the response and a snapshot of pool utilization taken while the
+        request held its connection; the snapshot is None unless
+        `_REPORT_INTERVAL_SEC` has passed since the pool last reported one.
+        """
+        origin = _origin(url)
+        pool, snapshot = self._acquire(project_id, origin)
+        try:
+            return pool.session.request(method=method, url=url, timeout=timeout, **kwargs), snapshot
+        except requests.RequestException:
+            with self._lock:
+                pool.errors += 1
+            raise
+        finally:
+            self._release(pool)
+
+    def metrics(self, project_id: str | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {"project_id": pid, "origin": origin, **pool.stats()}
+                for (pid, origin), pool in sorted(self._pools.items())
+                if project_id is None or pid == project_id
+            ]
+
+    def close(self, project_id: str | None = None):
+        with self._lock:
+            keys = [k for k in self._pools if project_id is None or k[0] == project_id]
+            pools = [self._pools.pop(k) for k in keys]
+            pools += [p for pid, p in self._retired if project_id is None or pid == project_id]
+            self._retired = [(pid, p) for pid, p in self._retired if project_id is not None and pid != project_id]
+        for pool in pools:
+            pool.session.close()
+
+
+http_pools = HermesHttpPools()
+atexit.register(http_pools.close)
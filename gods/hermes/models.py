@@ -33,6 +33,7 @@ class ProtocolLimits(BaseModel):
     max_concurrency: int = 2
     rate_per_minute: int = 60
     timeout_sec: int = 30
+    connect_timeout_sec: float = 5.0
 
 
 class ProtocolSpec(BaseModel):
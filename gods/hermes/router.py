@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 import requests
 
 from gods.hermes.errors import HermesError, HERMES_PROVIDER_ERROR, HERMES_BAD_REQUEST
+from gods.hermes.events import hermes_events
+from gods.hermes.http_pool import http_pools
 from gods.hermes.models import ProtocolSpec
 
 
@@ -61,13 +63,17 @@ def route_provider(spec: ProtocolSpec, project_id: str, payload: dict[str, Any],
         if method not in {"GET", "POST", "PUT", "PATCH", "DELETE"}:
             raise HermesError(HERMES_PROVIDER_ERROR, f"Unsupported HTTP method: {method}")
         body = payload if isinstance(payload, dict) else {}
+        read_timeout = max(1, timeout_sec)
+        connect_timeout = max(0.1, min(float(spec.limits.connect_timeout_sec), float(read_timeout)))
+        body_arg = {"params": body} if method in {"GET", "DELETE"} else {"json": body}
         try:
-            if method in {"GET", "DELETE"}:
-                resp = requests.request(method=method, url=url, params=body, timeout=max(1, timeout_sec))
-            else:
-                resp = requests.request(method=method, url=url, json=body, timeout=max(1, timeout_sec))
+            resp, pool_stats = http_pools.request(
+                project_id, method, url, timeout=(connect_timeout, read_timeout), **body_arg
+            )
         except requests.RequestException as e:
             raise HermesError(HERMES_PROVIDER_ERROR, f"HTTP provider request failed: {e}", retryable=True)
+        if pool_stats is not None:
+            hermes_events.publish("http_pool", project_id, {"name": spec.name, **pool_stats})
         try:
             parsed_body = resp.json()
         except Exception:
@@ -139,26 +139,33 @@ def submit_hermes_notice(
     priority: int,
     dedupe_prefix: str = "hermes_notice",
 ) -> list[str]:
-    sent: list[str] = []
-    for aid in [str(x).strip() for x in (targets or []) if str(x).strip()]:
-        try:
-            submit_message_event(
-                project_id=project_id,
-                to_id=aid,
-                sender_id=sender_id,
-                title=title,
-                content=content,
-                msg_type=msg_type,
-                trigger_pulse=trigger_pulse,
-                priority=priority,
-                dedupe_key=f"{dedupe_prefix}:{aid}:{title}",
-                event_type=EVENT_HERMES_NOTICE,
-                meta={"source": "hermes"},
-            )
-            sent.append(aid)
-        except Exception:
-            continue
-    return sent
+    """Multicast one notice to every target through a single interaction event."""
+    target_ids = list(dict.fromkeys(str(x).strip() for x in (targets or []) if str(x).strip()))
+    if not target_ids:
+        return []
+    payload = {
+        "targets": target_ids,
+        "sender_id": str(sender_id or "").strip(),
+        "title": str(title or "").strip(),
+        "content": str(content or ""),
+        "msg_type": str(msg_type or "private"),
+        "trigger_pulse": bool(trigger_pulse),
+        "mail_priority": int(priority),
+        "attachments": [],
+    }
+    rec = events_bus.EventRecord.create(
+        project_id=project_id,
+        domain="interaction",
+        event_type=EVENT_HERMES_NOTICE,
+        priority=int(priority),
+        payload=payload,
+        dedupe_key=f"{dedupe_prefix}:{title}",
+        max_attempts=3,
+        meta={"source": "hermes"},
+    )
+    rec = events_bus.append_event(rec)
+    ok, result = _dispatch_inline(rec)
+    return list(result.get("sent", []) or []) if ok else []
 
 
 def submit_detach_notice(
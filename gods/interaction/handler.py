@@ -20,9 +20,26 @@ def _require_str(payload: dict, key: str) -> str:
     return val
 
 
+def _grant_attachments(project_id: str, sender_id: str, attachments: list[str], recipients: list[str]):
+    for aid in attachments:
+        try:
+            ref = mnemosyne_facade.head_artifact(aid, sender_id, project_id)
+        except Exception as e:
+            raise InteractionError("INTERACTION_BAD_REQUEST", f"attachment not accessible: {aid}: {e}") from e
+        if str(ref.scope) != "agent":
+            raise InteractionError("INTERACTION_BAD_REQUEST", f"attachment must be agent-scope: {aid}")
+        for to_id in recipients:
+            try:
+                mnemosyne_facade.grant_artifact_access(aid, project_id, sender_id, to_id)
+            except Exception as e:
+                raise InteractionError("INTERACTION_BAD_REQUEST", f"attachment grant failed: {aid}: {e}") from e
+
+
 class _MessageHandler(events_bus.EventHandler):
     def on_process(self, record: events_bus.EventRecord) -> dict:
         payload = record.payload or {}
+        if payload.get("targets"):
+            return self._multicast(record)
         to_id = _require_str(payload, "to_id") if str(payload.get("to_id", "")).strip() else _require_str(payload, "agent_id")
         sender_id = _require_str(payload, "sender_id")
         title = _require_str(payload, "title")
@@ -31,17 +48,7 @@ class _MessageHandler(events_bus.EventHandler):
         trigger_pulse = bool(payload.get("trigger_pulse", True))
         priority = int(payload.get("mail_priority", payload.get("priority", record.priority)))
         attachments = [str(x).strip() for x in list(payload.get("attachments", []) or []) if str(x).strip()]
-        for aid in attachments:
-            try:
-                ref = mnemosyne_facade.head_artifact(aid, sender_id, record.project_id)
-            except Exception as e:
-                raise InteractionError("INTERACTION_BAD_REQUEST", f"attachment not accessible: {aid}: {e}") from e
-            if str(ref.scope) != "agent":
-                raise InteractionError("INTERACTION_BAD_REQUEST", f"attachment must be agent-scope: {aid}")
-            try:
-                mnemosyne_facade.grant_artifact_access(aid, record.project_id, sender_id, to_id)
-            except Exception as e:
-                raise InteractionError("INTERACTION_BAD_REQUEST", f"attachment grant failed: {aid}: {e}") from e
+        _grant_attachments(record.project_id, sender_id, attachments, [to_id])
         out = iris_facade.enqueue_message(
             project_id=record.project_id,
             agent_id=to_id,
@@ -55,6 +62,30 @@ class _MessageHandler(events_bus.EventHandler):
         )
         return {"ok": True, "mail_event_id": out.get("mail_event_id", ""), "to_id": to_id}
 
+    def _multicast(self, record: events_bus.EventRecord) -> dict:
+        payload = record.payload or {}
+        targets = [str(x).strip() for x in list(payload.get("targets", []) or []) if str(x).strip()]
+        sender_id = _require_str(payload, "sender_id")
+        title = _require_str(payload, "title")
+        attachments = [str(x).strip() for x in list(payload.get("attachments", []) or []) if str(x).strip()]
+        _grant_attachments(record.project_id, sender_id, attachments, targets)
+        rows = iris_facade.multicast_message(
+            project_id=record.project_id,
+            agent_ids=targets,
+            sender=sender_id,
+            title=title,
+            content=str(payload.get("content", "")),
+            msg_type=str(payload.get("msg_type", "private")).strip() or "private",
+            trigger_pulse=bool(payload.get("trigger_pulse", True)),
+            pulse_priority=int(payload.get("mail_priority", payload.get("priority", record.priority))),
+            attachments=attachments,
+        )
+        return {
+            "ok": True,
+            "sent": [r["agent_id"] for r in rows],
+            "mail_event_ids": {r["agent_id"]: r["mail_event_id"] for r in rows},
+        }
+
 
 class _ReadHandler(events_bus.EventHandler):
     def on_process(self, record: events_bus.EventRecord) -> dict:
@@ -1,26 +1,31 @@
 """Iris module exports (mailbox domain)."""
-from gods.iris.models import InboxEvent, InboxMessageState, MailEvent, MailEventState
+from gods.iris.models import InboxEvent, InboxMessageState, MailboxSummary, MailEvent, MailEventState
 from gods.iris.outbox_models import OutboxReceipt, OutboxReceiptStatus
 from gods.iris.service import (
     ack_handled,
     enqueue_message,
     fetch_inbox_context,
+    get_mailbox_summary,
     has_pending,
     list_outbox_receipts,
     build_inbox_overview,
+    multicast_message,
 )
 
 __all__ = [
     "InboxEvent",
     "MailEvent",
     "MailEventState",
+    "MailboxSummary",
     "InboxMessageState",
     "OutboxReceipt",
     "OutboxReceiptStatus",
     "ack_handled",
     "enqueue_message",
     "fetch_inbox_context",
+    "get_mailbox_summary",
     "has_pending",
     "list_outbox_receipts",
     "build_inbox_overview",
+    "multicast_message",
 ]
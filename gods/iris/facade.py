@@ -7,15 +7,18 @@ from gods.iris.service import (
     enqueue_message,
     fetch_mailbox_intents,
     get_mailbox_glance,
+    get_mailbox_summary,
     fetch_inbox_context,
     has_pending,
     list_outbox_receipts,
     mark_as_delivered,
+    multicast_message,
 )
 
 __all__ = [
     "enqueue_message",
     "get_mailbox_glance",
+    "get_mailbox_summary",
     "fetch_inbox_context",
     "ack_handled",
     "has_pending",
@@ -23,4 +26,5 @@ __all__ = [
     "build_inbox_overview",
     "fetch_mailbox_intents",
     "mark_as_delivered",
+    "multicast_message",
 ]
@@ -1,10 +1,12 @@
 """Iris unified MailEvent models."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from gods.iris.outbox_models import OutboxReceipt
+
 
 class MailEventState(str, Enum):
     """Unified lifecycle states for Iris single event source."""
@@ -120,3 +122,22 @@ class MailEvent:
 
 
 InboxEvent = MailEvent
+
+
+@dataclass
+class MailboxSummary:
+    """One agent's inbox/outbox aggregate for context builders and status views."""
+
+    agent_id: str
+    state_counts: dict[str, int] = field(default_factory=dict)
+    unread: list[MailEvent] = field(default_factory=list)
+    read_recent: list[MailEvent] = field(default_factory=list)
+    receipt_counts: dict[str, int] = field(default_factory=dict)
+    receipts: list[OutboxReceipt] = field(default_factory=list)
+
+    def count(self, state: MailEventState) -> int:
+        return int(self.state_counts.get(state.value, 0))
+
+    @property
+    def unread_count(self) -> int:
+        return self.count(MailEventState.QUEUED) + self.count(MailEventState.DEFERRED)
@@ -1,15 +1,79 @@
-"""Outbox receipt JSONL store with project-local file locking."""
+"""Outbox receipt JSONL store with project-local file locking.
+
+`outbox_receipts.jsonl` is append-only: receipt rows as they are created, plus
+one `{"op": "status", ...}` patch row per status update batch, which may cover
+many receipts. The parsed log is cached (revalidated by file signature) and
+indexed by receipt_id, message_id, sender and recipient, so lookups never scan
+and a delivered batch costs one append. Patches are folded back into receipt
+rows once they outnumber the receipts.
+"""
 from __future__ import annotations
 
 import fcntl
 import json
+import os
+import threading
 import time
 import uuid
 from pathlib import Path
+from typing import Iterable
 
+from gods.file_cache import FileCache
 from gods.iris.outbox_models import OutboxReceipt, OutboxReceiptStatus
 from gods.paths import runtime_dir, runtime_locks_dir
 
+_COMPACT_MIN_PATCHES = 256
+
+
+class _ReceiptLog:
+    def __init__(self, rows: list[dict]):
+        self.lock = threading.RLock()
+        self.rows: dict[str, dict] = {}
+        self.by_message: dict[str, list[str]] = {}
+        self.by_sender: dict[str, list[str]] = {}
+        self.by_recipient: dict[str, list[str]] = {}
+        self.patches = 0
+        for row in rows:
+            self.apply(row)
+
+    def apply(self, row: dict):
+        if row.get("op") == "status":
+            self.patches += 1
+            for rid in row.get("receipt_ids", []) or []:
+                target = self.rows.get(str(rid))
+                if target is not None:
+                    _set_status(target, str(row.get("status", "")), float(row.get("updated_at", 0.0) or 0.0), row.get("error_message"))
+            return
+        rid = str(row.get("receipt_id", ""))
+        if not rid:
+            return
+        if rid not in self.rows:
+            self.by_message.setdefault(str(row.get("message_id", "")), []).append(rid)
+            self.by_sender.setdefault(str(row.get("from_agent_id", "")), []).append(rid)
+            self.by_recipient.setdefault(str(row.get("to_agent_id", "")), []).append(rid)
+        self.rows[rid] = row
+
+    def select(self, from_agent_id: str = "", to_agent_id: str = "", message_id: str = "") -> list[dict]:
+        if message_id:
+            ids = self.by_message.get(message_id, [])
+        elif from_agent_id:
+            ids = self.by_sender.get(from_agent_id, [])
+        elif to_agent_id:
+            ids = self.by_recipient.get(to_agent_id, [])
+        else:
+            return list(self.rows.values())
+        return [self.rows[rid] for rid in ids]
+
+
+_LOGS = FileCache()
+
+
+def _set_status(row: dict, status: str, now: float, error_message):
+    row["status"] = status
+    row["updated_at"] = now
+    if status == OutboxReceiptStatus.FAILED.value:
+        row["error_message"] = str(error_message or "")[:2000]
+
 
 def _runtime_dir(project_id: str) -> Path:
     path = runtime_dir(project_id)
@@ -43,23 +107,48 @@ def _read_all_rows(path: Path) -> list[dict]:
     return rows
 
 
-def _write_all_rows(path: Path, rows: list[dict]):
+def _write_all_rows(path: Path, rows: Iterable[dict]):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         for row in rows:
             f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
 
 
-def _with_locked_rows(project_id: str, mutator):
+def _append_rows(path: Path, rows: list[dict]):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+
+def _receipt_log(project_id: str) -> _ReceiptLog:
+    path = _receipts_path(project_id)
+    return _LOGS.get(path, lambda: _ReceiptLog(_read_all_rows(path)))
+
+
+def _with_locked_log(project_id: str, mutator):
+    """Run `mutator(log) -> (rows_to_append, result)` under the lock; append the rows in one write and index them."""
     lock = _lock_path(project_id)
     lock.touch(exist_ok=True)
-    receipts = _receipts_path(project_id)
+    path = _receipts_path(project_id)
     with open(lock, "r+", encoding="utf-8") as lf:
         fcntl.flock(lf, fcntl.LOCK_EX)
         try:
-            rows = _read_all_rows(receipts)
-            new_rows, result = mutator(rows)
-            _write_all_rows(receipts, new_rows)
+            log = _receipt_log(project_id)
+            with log.lock:
+                try:
+                    rows, result = mutator(log)
+                    if rows:
+                        _append_rows(path, rows)
+                        for row in rows:
+                            log.apply(row)
+                    if log.patches > max(_COMPACT_MIN_PATCHES, len(log.rows)):
+                        _write_all_rows(path, log.rows.values())
+                        log.patches = 0
+                except BaseException:
+                    _LOGS.invalidate(path)
+                    raise
+                _LOGS.put(path, log)
             return result
         finally:
             fcntl.flock(lf, fcntl.LOCK_UN)
@@ -88,11 +177,71 @@ def create_receipt(
         error_message=str(error_message or ""),
     )
 
-    def _mut(rows: list[dict]):
-        rows.append(receipt.to_dict())
-        return rows, receipt
+    return _with_locked_log(project_id, lambda log: ([receipt.to_dict()], receipt))
+
+
+def create_receipts(
+    project_id: str,
+    from_agent_id: str,
+    deliveries: list[tuple[str, str]],
+    title: str,
+    status: OutboxReceiptStatus = OutboxReceiptStatus.PENDING,
+) -> list[OutboxReceipt]:
+    """One receipt per `(to_agent_id, message_id)` of a multicast, written with a single append."""
+    now = time.time()
+    receipts = [
+        OutboxReceipt(
+            receipt_id=uuid.uuid4().hex,
+            project_id=project_id,
+            from_agent_id=from_agent_id,
+            to_agent_id=to_agent_id,
+            title=title,
+            message_id=message_id,
+            status=status,
+            created_at=now,
+            updated_at=now,
+        )
+        for to_agent_id, message_id in deliveries
+    ]
+    if not receipts:
+        return []
+    return _with_locked_log(project_id, lambda log: ([r.to_dict() for r in receipts], receipts))
+
 
-    return _with_locked_rows(project_id, _mut)
+def update_status_many(
+    project_id: str,
+    message_ids: Iterable[str],
+    status: OutboxReceiptStatus,
+    error_message: str = "",
+) -> list[OutboxReceipt]:
+    """Set `status` on every receipt of the given messages with one appended patch row.
+
+    Returns the updated receipts in `message_ids` order.
+    """
+    mids = list(dict.fromkeys(str(m or "").strip() for m in message_ids if str(m or "").strip()))
+    if not mids:
+        return []
+    now = time.time()
+
+    def _mut(log: _ReceiptLog):
+        rids = [rid for mid in mids for rid in log.by_message.get(mid, [])]
+        if not rids:
+            return [], []
+        patch = {
+            "op": "status",
+            "receipt_ids": rids,
+            "status": status.value,
+            "updated_at": now,
+            "error_message": str(error_message or "")[:2000],
+        }
+        changed = []
+        for rid in rids:
+            row = dict(log.rows[rid])
+            _set_status(row, status.value, now, error_message)
+            changed.append(OutboxReceipt.from_dict(row))
+        return [patch], changed
+
+    return list(_with_locked_log(project_id, _mut) or [])
 
 
 def update_status_by_message_id(
@@ -101,25 +250,20 @@ def update_status_by_message_id(
     status: OutboxReceiptStatus,
     error_message: str = "",
 ) -> list[OutboxReceipt]:
-    now = time.time()
-    mid = str(message_id or "").strip()
-    if not mid:
-        return []
+    return update_status_many(project_id, [message_id], status, error_message=error_message)
 
-    def _mut(rows: list[dict]):
-        changed_rows: list[dict] = []
-        for row in rows:
-            if str(row.get("message_id", "")) != mid:
-                continue
-            row["status"] = status.value
-            row["updated_at"] = now
-            if status == OutboxReceiptStatus.FAILED:
-                row["error_message"] = str(error_message or "")[:2000]
-            changed_rows.append(dict(row))
-        return rows, changed_rows
 
-    rows = list(_with_locked_rows(project_id, _mut) or [])
-    return [OutboxReceipt.from_dict(r) for r in rows]
+def summarize_receipts(project_id: str, from_agent_id: str, limit: int = 20) -> tuple[dict[str, int], list[OutboxReceipt]]:
+    """(status counts over all of the sender's receipts, most recently updated `limit` receipts)."""
+    counts = {s.value: 0 for s in OutboxReceiptStatus}
+    log = _receipt_log(project_id)
+    with log.lock:
+        rows = log.select(from_agent_id=from_agent_id)
+        for row in rows:
+            status = str(row.get("status", OutboxReceiptStatus.PENDING.value))
+            counts[status] = counts.get(status, 0) + 1
+        recent = sorted(rows, key=lambda r: float(r.get("updated_at", r.get("created_at", 0.0)) or 0.0), reverse=True)
+        return counts, [OutboxReceipt.from_dict(r) for r in recent[: max(0, int(limit))]]
 
 
 def list_receipts(
@@ -130,17 +274,16 @@ def list_receipts(
     message_id: str = "",
     limit: int = 100,
 ) -> list[OutboxReceipt]:
-    rows = _read_all_rows(_receipts_path(project_id))
+    log = _receipt_log(project_id)
     out: list[OutboxReceipt] = []
-    for row in rows:
-        if from_agent_id and str(row.get("from_agent_id", "")) != from_agent_id:
-            continue
-        if to_agent_id and str(row.get("to_agent_id", "")) != to_agent_id:
-            continue
-        if status and str(row.get("status", "")) != status:
-            continue
-        if message_id and str(row.get("message_id", "")) != message_id:
-            continue
-        out.append(OutboxReceipt.from_dict(row))
+    with log.lock:
+        for row in log.select(from_agent_id=from_agent_id, to_agent_id=to_agent_id, message_id=message_id):
+            if from_agent_id and str(row.get("from_agent_id", "")) != from_agent_id:
+                continue
+            if to_agent_id and str(row.get("to_agent_id", "")) != to_agent_id:
+                continue
+            if status and str(row.get("status", "")) != status:
+                continue
+            out.append(OutboxReceipt.from_dict(row))
     out.sort(key=lambda x: x.updated_at, reverse=True)
     return out[: max(1, min(limit, 1000))]
@@ -1,15 +1,24 @@
 """Iris service orchestration for unified mail-event delivery."""
 from __future__ import annotations
 
-from gods.iris.models import MailEventState
+from gods.iris.models import MailboxSummary, MailEventState
 from gods.iris.outbox_models import OutboxReceipt, OutboxReceiptStatus
-from gods.iris.outbox_store import create_receipt, list_receipts, update_status_by_message_id
+from gods.iris.outbox_store import (
+    create_receipt,
+    create_receipts,
+    list_receipts,
+    summarize_receipts,
+    update_status_by_message_id,
+    update_status_many,
+)
 from gods.iris.store import (
     deliver_mailbox_events,
     enqueue_mail_event,
+    enqueue_mail_events,
     has_pending_mailbox_events,
     list_mailbox_events,
     mark_mailbox_events_handled,
+    summarize_mailbox_events,
 )
 from gods.mnemosyne import load_memory_policy
 from gods.mnemosyne.facade import (
@@ -41,6 +50,26 @@ def _enqueue_semantic_event(
         dedupe_key="",
     )
 
+
+def _notify_outbox_status(project_id: str, receipts: list[OutboxReceipt]) -> None:
+    for rec in receipts:
+        _enqueue_semantic_event(
+            project_id=project_id,
+            agent_id=rec.from_agent_id,
+            event_type="outbox_status_event",
+            payload={
+                "reason": "outbox_status",
+                "agent_id": rec.from_agent_id,
+                "to_agent_id": rec.to_agent_id,
+                "title": rec.title,
+                "message_id": rec.message_id,
+                "status": rec.status.value,
+                "error_message": "",
+                "attachments_count": 0,
+            },
+        )
+
+
 def _resolve_inbox_received_intent_key(project_id: str, msg_type: str) -> str:
     mt = str(msg_type or "").strip().lower()
     preferred = {
@@ -101,39 +130,108 @@ def enqueue_message(
     }
 
 
+def multicast_message(
+    *,
+    project_id: str,
+    agent_ids: list[str],
+    sender: str,
+    title: str,
+    content: str,
+    msg_type: str,
+    trigger_pulse: bool,
+    pulse_priority: int,
+    attachments: list[str] | None = None,
+) -> list[dict]:
+    """`enqueue_message` for many recipients: one mailbox append per recipient, one events-bus
+    transaction (which wakes every recipient) and one receipt-log write for the whole batch."""
+    if not str(title or "").strip():
+        raise ValueError("title is required")
+    events = enqueue_mail_events(
+        project_id=project_id,
+        agent_ids=agent_ids,
+        event_type="mail_event",
+        priority=int(pulse_priority),
+        payload={"reason": "mail_event", "source": "iris"},
+        sender=sender,
+        title=title,
+        content=content,
+        attachments=attachments,
+        msg_type=msg_type,
+    )
+    receipts = create_receipts(
+        project_id=project_id,
+        from_agent_id=sender,
+        deliveries=[(e.agent_id, e.event_id) for e in events],
+        title=title,
+        status=OutboxReceiptStatus.PENDING,
+    )
+    return [
+        {
+            "agent_id": event.agent_id,
+            "mail_event_id": event.event_id,
+            "title": title,
+            "outbox_receipt_id": receipt.receipt_id,
+            "outbox_status": receipt.status.value,
+            "attachments_count": len(list(event.attachments or [])),
+        }
+        for event, receipt in zip(events, receipts)
+    ]
+
+
+def get_mailbox_summary(
+    project_id: str,
+    agent_id: str,
+    unread_limit: int = 10,
+    handled_limit: int = 10,
+    receipt_limit: int = 20,
+    include_receipts: bool = True,
+) -> MailboxSummary:
+    """Per-state counts, newest unread/handled mail and sent-receipt status counts in one query.
+
+    Limits of 0 skip materializing that list; counts are always complete. Mail counts come from
+    the partition's counter table; `include_receipts=False` also skips the receipt pass.
+    """
+    state_counts, unread, read_recent = summarize_mailbox_events(project_id, agent_id, unread_limit, handled_limit)
+    receipt_counts, receipts = (
+        summarize_receipts(project_id, agent_id, receipt_limit) if include_receipts else ({}, [])
+    )
+    return MailboxSummary(
+        agent_id=agent_id,
+        state_counts=state_counts,
+        unread=unread,
+        read_recent=read_recent,
+        receipt_counts=receipt_counts,
+        receipts=receipts,
+    )
+
+
 def get_mailbox_glance(project_id: str, agent_id: str, budget: int = 10) -> str:
     """
     Returns a concise text summary of the mailbox (inbox + outbox) for LLM awareness.
     A 'physical reality' snapshot, not an incremental intent.
     """
-    # Just read current state from DB
-    read_recent = list_mailbox_events(
-        project_id=project_id,
-        agent_id=agent_id,
-        state=MailEventState.HANDLED,
-        limit=max(1, min(budget, 5)),
+    summary = get_mailbox_summary(
+        project_id,
+        agent_id,
+        unread_limit=10,
+        handled_limit=max(1, min(budget, 5)),
+        receipt_limit=max(1, min(budget * 2, 20)),
     )
-    receipts = list_receipts(project_id=project_id, from_agent_id=agent_id, limit=max(1, min(budget * 2, 20)))
-    
-    unread = list_mailbox_events(project_id=project_id, agent_id=agent_id, state=MailEventState.QUEUED, limit=100)
-    deferred = list_mailbox_events(project_id=project_id, agent_id=agent_id, state=MailEventState.DEFERRED, limit=100)
-    
-    status_count = {"pending": 0, "delivered": 0, "handled": 0, "failed": 0}
-    for r in receipts:
-        if r.status.value in status_count:
-            status_count[r.status.value] += 1
+    status_count = summary.receipt_counts
+    receipts = summary.receipts
 
     lines = [
         "[MAILBOX_GLANCE]",
-        f"- Inbound: {len(unread)} unread, {len(deferred)} deferred, {len(read_recent)} recently handled.",
+        f"- Inbound: {summary.count(MailEventState.QUEUED)} unread, {summary.count(MailEventState.DEFERRED)} deferred, "
+        f"{len(summary.read_recent)} recently handled.",
         f"- Outbound: {status_count['pending']} pending, {status_count['delivered']} delivered, {status_count['handled']} handled, {status_count['failed']} failed.",
     ]
-    
-    if unread:
+
+    if summary.unread:
         lines.append("\n[UNREAD_MESSAGES]")
-        for msg in unread[:10]:
+        for msg in summary.unread:
             lines.append(f"- [from={msg.sender}][title={msg.title}] id={msg.event_id}")
-            
+
     if receipts:
         lines.append("\n[RECENT_SENT_STATUS]")
         for r in receipts[:10]:
@@ -147,28 +245,9 @@ def fetch_inbox_context(project_id: str, agent_id: str, budget: int) -> tuple[st
     events = deliver_mailbox_events(project_id, agent_id, budget)
     if not events:
         return "", []
-    for item in events:
-        updated = update_status_by_message_id(
-            project_id=project_id,
-            message_id=item.event_id,
-            status=OutboxReceiptStatus.DELIVERED,
-        )
-        for rec in updated:
-            _enqueue_semantic_event(
-                project_id=project_id,
-                agent_id=rec.from_agent_id,
-                event_type="outbox_status_event",
-                payload={
-                    "reason": "outbox_status",
-                    "agent_id": rec.from_agent_id,
-                    "to_agent_id": rec.to_agent_id,
-                    "title": rec.title,
-                    "message_id": rec.message_id,
-                    "status": rec.status.value,
-                    "error_message": "",
-                    "attachments_count": 0,
-                },
-            )
+    # One receipt-log write for the whole delivered batch.
+    updated = update_status_many(project_id, [item.event_id for item in events], OutboxReceiptStatus.DELIVERED)
+    _notify_outbox_status(project_id, updated)
 
     lines = []
     for item in events:
@@ -181,26 +260,20 @@ def fetch_inbox_context(project_id: str, agent_id: str, budget: int) -> tuple[st
             f"id={item.event_id}{suffix}: {item.content}"
         )
     ids = [item.event_id for item in events]
-    read_recent = list_mailbox_events(
-        project_id=project_id,
-        agent_id=agent_id,
-        state=MailEventState.HANDLED,
-        limit=max(1, min(budget, 10)),
-    )
-    receipts = list_receipts(project_id=project_id, from_agent_id=agent_id, limit=max(1, min(budget * 3, 50)))
-    unread_count = len(
-        list_mailbox_events(project_id=project_id, agent_id=agent_id, state=MailEventState.QUEUED, limit=1000)
-    ) + len(
-        list_mailbox_events(project_id=project_id, agent_id=agent_id, state=MailEventState.DEFERRED, limit=1000)
+    summary = get_mailbox_summary(
+        project_id,
+        agent_id,
+        unread_limit=0,
+        handled_limit=max(1, min(budget, 10)),
+        receipt_limit=max(1, min(budget * 3, 50)),
     )
-    status_count = {"pending": 0, "delivered": 0, "handled": 0, "failed": 0}
-    for r in receipts:
-        if r.status.value in status_count:
-            status_count[r.status.value] += 1
+    read_recent = summary.read_recent
+    receipts = summary.receipts
+    status_count = summary.receipt_counts
 
     text = (
         "[INBOX SUMMARY]\n"
-        + f"- unread_count={unread_count}\n"
+        + f"- unread_count={summary.unread_count}\n"
         + f"- read_recent_count={len(read_recent)}\n"
         + f"- sent_pending={status_count['pending']} sent_delivered={status_count['delivered']} "
         + f"sent_handled={status_count['handled']} sent_failed={status_count['failed']}\n"
@@ -345,29 +418,9 @@ def build_inbox_overview(project_id: str, agent_id: str, budget: int = 20) -> st
 
 
 def ack_handled(project_id: str, event_ids: list[str], agent_id: str = ""):
-    handled = mark_mailbox_events_handled(project_id, event_ids)
-    for item in handled:
-        updated = update_status_by_message_id(
-            project_id=project_id,
-            message_id=item.event_id,
-            status=OutboxReceiptStatus.HANDLED,
-        )
-        for rec in updated:
-            _enqueue_semantic_event(
-                project_id=project_id,
-                agent_id=rec.from_agent_id,
-                event_type="outbox_status_event",
-                payload={
-                    "reason": "outbox_status",
-                    "agent_id": rec.from_agent_id,
-                    "to_agent_id": rec.to_agent_id,
-                    "title": rec.title,
-                    "message_id": rec.message_id,
-                    "status": rec.status.value,
-                    "error_message": "",
-                    "attachments_count": 0,
-                },
-            )
+    handled = mark_mailbox_events_handled(project_id, event_ids, agent_id=agent_id)
+    updated = update_status_many(project_id, [item.event_id for item in handled], OutboxReceiptStatus.HANDLED)
+    _notify_outbox_status(project_id, updated)
     if not agent_id:
         return
     ids = [str(x.event_id) for x in handled]
@@ -387,6 +440,7 @@ def ack_handled(project_id: str, event_ids: list[str], agent_id: str = ""):
 
 
 def has_pending(project_id: str, agent_id: str) -> bool:
+    """True when the agent has queued or deferred mail (O(1) from the partition counters)."""
     return has_pending_mailbox_events(project_id, agent_id)
 
 
@@ -416,19 +470,4 @@ def mark_as_delivered(project_id: str, message_id: str):
         message_id=message_id,
         status=OutboxReceiptStatus.DELIVERED,
     )
-    for rec in updated:
-        _enqueue_semantic_event(
-            project_id=project_id,
-            agent_id=rec.from_agent_id,
-            event_type="outbox_status_event",
-            payload={
-                "reason": "outbox_status",
-                "agent_id": rec.from_agent_id,
-                "to_agent_id": rec.to_agent_id,
-                "title": rec.title,
-                "message_id": rec.message_id,
-                "status": rec.status.value,
-                "error_message": "",
-                "attachments_count": 0,
-            },
-        )
+    _notify_outbox_status(project_id, updated)
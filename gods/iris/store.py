@@ -1,14 +1,30 @@
-"""Iris mailbox store with project-local file locking."""
+"""Iris mailbox store, partitioned per recipient agent.
+
+Each recipient owns `runtime/mailbox/<agent_id>.jsonl` and its own file lock,
+so senders to different agents never contend and an agent's inbox reads and
+state changes touch only its partition. Parsed partitions are cached with a
+(state -> event ids) index and revalidated by file signature, so repeated
+inbox queries in one pulse do not re-read the file; the same cached partition
+carries the dedupe-key index, so an enqueue dedupe check only looks at live
+rows sharing its key (this replaces the old `mailbox_dedupe.json`). A pre-partition
+`mailbox_events.jsonl` is split into partitions on first access.
+"""
 from __future__ import annotations
 
 import fcntl
 import json
+import os
+import threading
 import time
 import uuid
+from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
 
 from gods import events as events_bus
+from gods.file_cache import FileCache
 from gods.iris.models import MailEvent, MailEventState
+from gods.metrics import latency_metrics
 from gods.paths import runtime_dir, runtime_locks_dir
 
 _ALLOWED_TRANSITIONS: dict[MailEventState, set[MailEventState]] = {
@@ -34,6 +50,80 @@ _ALLOWED_TRANSITIONS: dict[MailEventState, set[MailEventState]] = {
 
 _MAIL_EVENT_TYPES = {"mail_event", "confession", "private", "contract_notice", "contract_fully_committed"}
 
+_DEDUPE_LIVE_STATES = {
+    MailEventState.QUEUED.value,
+    MailEventState.PICKED.value,
+    MailEventState.PROCESSING.value,
+    MailEventState.DEFERRED.value,
+}
+_PENDING_STATES = {MailEventState.QUEUED.value, MailEventState.DEFERRED.value}
+
+
+class _Partition:
+    """One recipient's mailbox rows plus a (state -> event ids) index, in file order,
+    a (dedupe_key -> live event ids) index and a maintained (event_type, state) -> count table."""
+
+    def __init__(self, rows: list[dict]):
+        self.lock = threading.RLock()
+        self.rows: dict[str, dict] = {}
+        self.pos: dict[str, int] = {}
+        self.by_state: dict[str, dict[str, None]] = {}
+        self.by_dedupe: dict[str, dict[str, None]] = {}
+        self.counts: dict[tuple[str, str], int] = {}
+        for row in rows:
+            self.add(row)
+
+    def _count(self, row: dict, state: str, delta: int):
+        key = (str(row.get("event_type", "")), state)
+        self.counts[key] = self.counts.get(key, 0) + delta
+        dk = str(row.get("dedupe_key", "") or "")
+        if not dk or state not in _DEDUPE_LIVE_STATES:
+            return
+        eid = str(row.get("event_id", ""))
+        if delta > 0:
+            self.by_dedupe.setdefault(dk, {})[eid] = None
+            return
+        ids = self.by_dedupe.get(dk)
+        if ids is not None:
+            ids.pop(eid, None)
+            if not ids:
+                del self.by_dedupe[dk]
+
+    def live_with_dedupe_key(self, dedupe_key: str) -> list[dict]:
+        ids = sorted(self.by_dedupe.get(dedupe_key, {}), key=self.pos.__getitem__)
+        return [self.rows[eid] for eid in ids]
+
+    def add(self, row: dict):
+        eid = str(row.get("event_id", ""))
+        old = self.rows.get(eid)
+        if old is not None:
+            self.by_state.get(str(old.get("state", "")), {}).pop(eid, None)
+            self._count(old, str(old.get("state", "")), -1)
+        else:
+            self.pos[eid] = len(self.pos)
+        self.rows[eid] = row
+        self.by_state.setdefault(str(row.get("state", "")), {})[eid] = None
+        self._count(row, str(row.get("state", "")), 1)
+
+    def restate(self, row: dict, old_state: str):
+        eid = str(row.get("event_id", ""))
+        self.by_state.get(old_state, {}).pop(eid, None)
+        self.by_state.setdefault(str(row.get("state", "")), {})[eid] = None
+        self._count(row, old_state, -1)
+        self._count(row, str(row.get("state", "")), 1)
+
+    def in_states(self, states: set[str]) -> list[dict]:
+        ids = [eid for st in states for eid in self.by_state.get(st, {})]
+        if len(states) > 1:
+            ids.sort(key=self.pos.__getitem__)
+        return [self.rows[eid] for eid in ids]
+
+    def ordered(self) -> list[dict]:
+        return list(self.rows.values())
+
+
+_PARTITIONS = FileCache()
+
 
 def _runtime_dir(project_id: str) -> Path:
     path = runtime_dir(project_id)
@@ -41,14 +131,28 @@ def _runtime_dir(project_id: str) -> Path:
     return path
 
 
-def _mailbox_path(project_id: str) -> Path:
+def _legacy_mailbox_path(project_id: str) -> Path:
     return _runtime_dir(project_id) / "mailbox_events.jsonl"
 
 
-def _lock_path(project_id: str) -> Path:
+def _mailbox_dir(project_id: str) -> Path:
+    path = _runtime_dir(project_id) / "mailbox"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _partition_path(project_id: str, agent_id: str) -> Path:
+    return _mailbox_dir(project_id) / f"{agent_id}.jsonl"
+
+
+def _lock_path(project_id: str, agent_id: str = "") -> Path:
     lock_dir = runtime_locks_dir(project_id)
+    if not agent_id:
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        return lock_dir / "mailbox_events.lock"
+    lock_dir = lock_dir / "mailbox"
     lock_dir.mkdir(parents=True, exist_ok=True)
-    return lock_dir / "mailbox_events.lock"
+    return lock_dir / f"{agent_id}.lock"
 
 
 def _read_all_rows(path: Path) -> list[dict]:
@@ -69,27 +173,103 @@ def _read_all_rows(path: Path) -> list[dict]:
 
 def _write_all_rows(path: Path, rows: list[dict]):
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
         for row in rows:
             f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
 
 
-def _with_locked_rows(project_id: str, mutator):
-    lock = _lock_path(project_id)
-    lock.parent.mkdir(parents=True, exist_ok=True)
+@contextmanager
+def _mailbox_lock(project_id: str, agent_id: str = ""):
+    """Exclusive lock on one recipient's partition (or, without agent_id, the legacy mailbox)."""
+    lock = _lock_path(project_id, agent_id)
     lock.touch(exist_ok=True)
-    events = _mailbox_path(project_id)
+    timed = latency_metrics.enabled(project_id)
     with open(lock, "r+", encoding="utf-8") as lf:
         fcntl.flock(lf, fcntl.LOCK_EX)
+        held_at = time.perf_counter() if timed else 0.0
         try:
-            rows = _read_all_rows(events)
-            new_rows, result = mutator(rows)
-            _write_all_rows(events, new_rows)
-            return result
+            yield
         finally:
+            if timed:
+                latency_metrics.observe(
+                    "iris_store_lock_hold_ms", (time.perf_counter() - held_at) * 1000.0, project_id=project_id
+                )
             fcntl.flock(lf, fcntl.LOCK_UN)
 
 
+def _migrate_legacy(project_id: str):
+    """Split a pre-partition `mailbox_events.jsonl` into per-recipient files (once)."""
+    legacy = _legacy_mailbox_path(project_id)
+    if not legacy.exists():
+        return
+    with _mailbox_lock(project_id):
+        if not legacy.exists():
+            return
+        grouped: dict[str, list[dict]] = {}
+        for row in _read_all_rows(legacy):
+            grouped.setdefault(str(row.get("agent_id", "")), []).append(row)
+        for agent_id, rows in grouped.items():
+            with _mailbox_lock(project_id, agent_id):
+                path = _partition_path(project_id, agent_id)
+                part = _Partition(_read_all_rows(path))
+                for row in rows:
+                    if str(row.get("event_id", "")) not in part.rows:
+                        part.add(row)
+                _write_all_rows(path, part.ordered())
+                _PARTITIONS.invalidate(path)
+        (_runtime_dir(project_id) / "mailbox_dedupe.json").unlink(missing_ok=True)
+        legacy.unlink()
+
+
+def _load_partition(path: Path) -> _Partition:
+    return _PARTITIONS.get(path, lambda: _Partition(_read_all_rows(path)))
+
+
+def _partition(project_id: str, agent_id: str) -> _Partition:
+    _migrate_legacy(project_id)
+    return _load_partition(_partition_path(project_id, agent_id))
+
+
+def _partition_agents(project_id: str) -> list[str]:
+    _migrate_legacy(project_id)
+    return sorted(p.stem for p in _mailbox_dir(project_id).glob("*.jsonl"))
+
+
+def _with_locked_partition(project_id: str, agent_id: str, mutator):
+    """Run `mutator(part) -> (changed, result)` under the partition lock; rewrite it when changed."""
+    # Migration takes the legacy lock before partition locks; never call it while holding one.
+    _migrate_legacy(project_id)
+    path = _partition_path(project_id, agent_id)
+    with _mailbox_lock(project_id, agent_id):
+        part = _load_partition(path)
+        with part.lock:
+            try:
+                changed, result = mutator(part)
+                if changed:
+                    _write_all_rows(path, part.ordered())
+            except BaseException:
+                _PARTITIONS.invalidate(path)
+                raise
+            _PARTITIONS.put(path, part)
+        return result
+
+
+def _append_row(path: Path, row: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def _find_live_duplicate(part: _Partition, dedupe_key: str, win_start: float) -> dict | None:
+    for row in part.live_with_dedupe_key(dedupe_key):
+        if float(row.get("created_at", 0.0)) < win_start:
+            continue
+        return row
+    return None
+
+
 def _mail_event_match(row: dict) -> bool:
     et = str(row.get("event_type", ""))
     return et in _MAIL_EVENT_TYPES
@@ -129,26 +309,8 @@ def enqueue_mail_event(
     payload = payload or {}
     dedupe_key = str(dedupe_key or "").strip()
 
-    def _mut(rows: list[dict]):
-        if dedupe_key and dedupe_window_sec > 0:
-            win_start = now - float(dedupe_window_sec)
-            for row in rows:
-                if str(row.get("agent_id", "")) != agent_id:
-                    continue
-                if str(row.get("dedupe_key", "")) != dedupe_key:
-                    continue
-                if str(row.get("state", "")) not in {
-                    MailEventState.QUEUED.value,
-                    MailEventState.PICKED.value,
-                    MailEventState.PROCESSING.value,
-                    MailEventState.DEFERRED.value,
-                }:
-                    continue
-                if float(row.get("created_at", 0.0)) < win_start:
-                    continue
-                return rows, (MailEvent.from_dict(row), False)
-
-        event = MailEvent(
+    def _new_event() -> MailEvent:
+        return MailEvent(
             event_id=uuid.uuid4().hex,
             project_id=project_id,
             agent_id=agent_id,
@@ -168,36 +330,103 @@ def enqueue_mail_event(
             available_at=now,
             meta=meta or {},
         )
+
+    def _enqueue(part: _Partition):
+        if dedupe_key and dedupe_window_sec > 0:
+            dup = _find_live_duplicate(part, dedupe_key, now - float(dedupe_window_sec))
+            if dup is not None:
+                return False, (MailEvent.from_dict(dup), False)
+        event = _new_event()
         row = event.to_dict()
-        rows.append(row)
-        return rows, (event, True)
+        # Enqueue appends one line instead of rewriting the partition.
+        _append_row(_partition_path(project_id, agent_id), row)
+        part.add(row)
+        return False, (event, True)
 
-    event, created = _with_locked_rows(project_id, _mut)
+    event, created = _with_locked_partition(project_id, agent_id, _enqueue)
     if created:
-        bus_row = events_bus.EventRecord.create(
-            project_id=project_id,
-            domain="iris",
-            event_type=str(event.event_type or "mail_event"),
-            priority=int(event.priority),
-            payload={
-                "agent_id": event.agent_id,
-                "sender": event.sender,
-                "title": event.title,
-                "content": event.content,
-                "attachments": list(event.attachments or []),
-                "msg_type": event.msg_type,
-                "reason": str((event.payload or {}).get("reason", "mail_event")),
-                "source": str((event.payload or {}).get("source", "iris")),
-            },
-            dedupe_key=event.dedupe_key,
-            max_attempts=int(event.max_attempts),
-            event_id=event.event_id,
-            meta=event.meta or {},
-        )
-        events_bus.append_event(bus_row)
+        events_bus.append_event(_bus_record(event))
     return event
 
 
+def enqueue_mail_events(
+    project_id: str,
+    agent_ids: list[str],
+    event_type: str,
+    priority: int,
+    payload: dict | None = None,
+    sender: str = "",
+    title: str = "",
+    content: str = "",
+    attachments: list[str] | None = None,
+    msg_type: str = "private",
+    max_attempts: int = 3,
+    meta: dict | None = None,
+) -> list[MailEvent]:
+    """Multicast: one QUEUED mail per recipient, one append per recipient partition and
+    a single events-bus transaction for all of them (no dedupe).
+
+    Recipients are de-duplicated; the result follows `agent_ids` order.
+    """
+    now = time.time()
+    recipients = list(dict.fromkeys(str(x).strip() for x in (agent_ids or []) if str(x).strip()))
+    base = MailEvent(
+        event_id="",
+        project_id=project_id,
+        agent_id="",
+        event_type=str(event_type or "mail_event").strip() or "mail_event",
+        priority=int(priority),
+        created_at=now,
+        state=MailEventState.QUEUED,
+        payload=payload or {},
+        sender=sender,
+        title=title,
+        msg_type=msg_type,
+        content=content,
+        attachments=[str(x).strip() for x in list(attachments or []) if str(x).strip()],
+        max_attempts=max(1, int(max_attempts)),
+        available_at=now,
+        meta=meta or {},
+    )
+    events: list[MailEvent] = []
+    for agent_id in recipients:
+        event = replace(base, event_id=uuid.uuid4().hex, agent_id=agent_id)
+        row = event.to_dict()
+
+        def _append(part: _Partition, agent_id=agent_id, row=row):
+            _append_row(_partition_path(project_id, agent_id), row)
+            part.add(row)
+            return False, None
+
+        _with_locked_partition(project_id, agent_id, _append)
+        events.append(event)
+    events_bus.append_events([_bus_record(e) for e in events])
+    return events
+
+
+def _bus_record(event: MailEvent) -> events_bus.EventRecord:
+    return events_bus.EventRecord.create(
+        project_id=event.project_id,
+        domain="iris",
+        event_type=str(event.event_type or "mail_event"),
+        priority=int(event.priority),
+        payload={
+            "agent_id": event.agent_id,
+            "sender": event.sender,
+            "title": event.title,
+            "content": event.content,
+            "attachments": list(event.attachments or []),
+            "msg_type": event.msg_type,
+            "reason": str((event.payload or {}).get("reason", "mail_event")),
+            "source": str((event.payload or {}).get("source", "iris")),
+        },
+        dedupe_key=event.dedupe_key,
+        max_attempts=int(event.max_attempts),
+        event_id=event.event_id,
+        meta=event.meta or {},
+    )
+
+
 def list_mail_events(
     project_id: str,
     agent_id: str = "",
@@ -205,16 +434,16 @@ def list_mail_events(
     event_type: str = "",
     limit: int = 100,
 ) -> list[MailEvent]:
-    rows = _read_all_rows(_mailbox_path(project_id))
+    agents = [agent_id] if agent_id else _partition_agents(project_id)
     out: list[MailEvent] = []
-    for row in rows:
-        if agent_id and str(row.get("agent_id", "")) != agent_id:
-            continue
-        if state and str(row.get("state", "")) != state.value:
-            continue
-        if event_type and str(row.get("event_type", "")) != event_type:
-            continue
-        out.append(MailEvent.from_dict(row))
+    for aid in agents:
+        part = _partition(project_id, aid)
+        with part.lock:
+            rows = part.in_states({state.value}) if state else part.ordered()
+            for row in rows:
+                if event_type and str(row.get("event_type", "")) != event_type:
+                    continue
+                out.append(MailEvent.from_dict(row))
     out.sort(key=lambda x: (-int(x.priority), float(x.created_at)))
     return out[: max(1, min(limit, 2000))]
 
@@ -236,16 +465,41 @@ def list_mailbox_events(
     return rows[-max(1, limit) :]
 
 
+def mailbox_state_counts(project_id: str, agent_id: str, event_type: str = "mail_event") -> dict[str, int]:
+    """Per-state counts for one recipient, read from the maintained counter table."""
+    part = _partition(project_id, agent_id)
+    with part.lock:
+        return {state: n for (et, state), n in part.counts.items() if et == event_type and n > 0}
+
+
+def _newest(rows: list[dict], limit: int) -> list[MailEvent]:
+    if limit <= 0:
+        return []
+    rows = sorted(rows, key=lambda r: float(r.get("created_at", 0.0) or 0.0))[-limit:]
+    return [MailEvent.from_dict(r) for r in rows]
+
+
+def summarize_mailbox_events(
+    project_id: str,
+    agent_id: str,
+    unread_limit: int = 10,
+    handled_limit: int = 10,
+) -> tuple[dict[str, int], list[MailEvent], list[MailEvent]]:
+    """(state counts, newest unread, newest handled) for one recipient's mail, in one partition pass.
+
+    Only the returned rows are materialized as MailEvent; both lists are in created_at order.
+    """
+    part = _partition(project_id, agent_id)
+    with part.lock:
+        counts = {state: n for (et, state), n in part.counts.items() if et == "mail_event" and n > 0}
+        unread = [r for r in part.in_states(_PENDING_STATES) if str(r.get("event_type", "")) == "mail_event"]
+        handled = [r for r in part.in_states({MailEventState.HANDLED.value}) if str(r.get("event_type", "")) == "mail_event"]
+        return counts, _newest(unread, int(unread_limit)), _newest(handled, int(handled_limit))
+
+
 def has_pending_mailbox_events(project_id: str, agent_id: str) -> bool:
-    rows = _read_all_rows(_mailbox_path(project_id))
-    for row in rows:
-        if str(row.get("agent_id", "")) != agent_id:
-            continue
-        if str(row.get("event_type", "")) != "mail_event":
-            continue
-        if str(row.get("state", "")) in {MailEventState.QUEUED.value, MailEventState.DEFERRED.value}:
-            return True
-    return False
+    counts = mailbox_state_counts(project_id, agent_id)
+    return any(counts.get(state, 0) > 0 for state in _PENDING_STATES)
 
 
 def deliver_mailbox_events(
@@ -259,19 +513,16 @@ def deliver_mailbox_events(
     preferred = [str(x).strip() for x in (preferred_event_ids or []) if str(x).strip()]
     preferred_set = set(preferred)
 
-    def _mut(rows: list[dict]):
+    def _mut(part: _Partition):
         candidates: list[dict] = []
-        for row in rows:
-            if str(row.get("agent_id", "")) != agent_id:
-                continue
+        for row in part.in_states(_PENDING_STATES):
             if str(row.get("event_type", "")) != "mail_event":
                 continue
-            state = str(row.get("state", ""))
-            if state not in {MailEventState.QUEUED.value, MailEventState.DEFERRED.value}:
-                continue
             if float(row.get("available_at", 0.0) or 0.0) > now:
                 continue
             candidates.append(row)
+        if not candidates:
+            return False, []
 
         deliverable: list[dict] = []
         used_ids: set[str] = set()
@@ -307,38 +558,50 @@ def deliver_mailbox_events(
             overflow.append(row)
 
         for row in deliverable:
+            old = str(row.get("state", ""))
             _update_state_fields(row, MailEventState.DELIVERED, now)
+            part.restate(row, old)
         for row in overflow:
-            cur = MailEventState(str(row.get("state", MailEventState.QUEUED.value)))
-            if MailEventState.DEFERRED in _ALLOWED_TRANSITIONS.get(cur, set()):
+            old = str(row.get("state", MailEventState.QUEUED.value))
+            if MailEventState.DEFERRED in _ALLOWED_TRANSITIONS.get(MailEventState(old), set()):
                 _update_state_fields(row, MailEventState.DEFERRED, now)
+                part.restate(row, old)
 
         events = [MailEvent.from_dict(r) for r in deliverable]
         events.sort(key=lambda x: x.created_at)
-        return rows, events
+        return True, events
 
-    return list(_with_locked_rows(project_id, _mut) or [])
+    return list(_with_locked_partition(project_id, agent_id, _mut) or [])
 
 
-def mark_mailbox_events_handled(project_id: str, event_ids: list[str]) -> list[MailEvent]:
+def mark_mailbox_events_handled(project_id: str, event_ids: list[str], agent_id: str = "") -> list[MailEvent]:
+    """Move delivered/deferred mail to HANDLED; without `agent_id` every partition is checked."""
     ids = {str(x) for x in (event_ids or []) if x}
     if not ids:
         return []
     now = time.time()
 
-    def _mut(rows: list[dict]):
+    def _mut(part: _Partition):
         changed_rows: list[dict] = []
-        for row in rows:
-            eid = str(row.get("event_id", ""))
-            if eid not in ids:
+        for eid in ids:
+            row = part.rows.get(eid)
+            if row is None:
                 continue
             if str(row.get("event_type", "")) != "mail_event":
                 continue
-            cur = MailEventState(str(row.get("state", MailEventState.QUEUED.value)))
-            if MailEventState.HANDLED in _ALLOWED_TRANSITIONS.get(cur, set()):
+            old = str(row.get("state", MailEventState.QUEUED.value))
+            if MailEventState.HANDLED in _ALLOWED_TRANSITIONS.get(MailEventState(old), set()):
                 _update_state_fields(row, MailEventState.HANDLED, now)
+                part.restate(row, old)
                 changed_rows.append(dict(row))
-        return rows, changed_rows
+        return bool(changed_rows), changed_rows
 
-    changed = list(_with_locked_rows(project_id, _mut) or [])
+    changed: list[dict] = []
+    for aid in [agent_id] if agent_id else _partition_agents(project_id):
+        part = _partition(project_id, aid)
+        with part.lock:
+            if ids.isdisjoint(part.rows):
+                continue
+        changed += _with_locked_partition(project_id, aid, _mut)
+    changed.sort(key=lambda r: float(r.get("created_at", 0.0)))
     return [MailEvent.from_dict(row) for row in changed]
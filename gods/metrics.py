@@ -0,0 +1,115 @@
+"""Process-wide latency histograms for scheduling and storage hot paths.
+
+Recording is opt-in per project (`angelia_latency_metrics_enabled`); when off,
+callers pay one config lookup and skip timing entirely. Series are keyed by
+metric name plus `project` / `agent` / `event_type` labels and use fixed
+millisecond buckets, so `observe` is a bisect and three integer updates.
+Output is a JSON snapshot or Prometheus text exposition.
+"""
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Any
+
+from gods.config import runtime_config
+
+BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000, 300000)
+
+_LABEL_NAMES = ("project", "agent", "event_type")
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect_left(BUCKETS_MS, value_ms)] += 1
+        self.sum += value_ms
+        self.count += 1
+
+    def cumulative(self) -> list[int]:
+        out: list[int] = []
+        acc = 0
+        for c in self.counts:
+            acc += c
+            out.append(acc)
+        return out
+
+
+def _fmt_le(bound: float) -> str:
+    return str(int(bound)) if float(bound).is_integer() else str(bound)
+
+
+def _escape(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class LatencyHistograms:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, tuple[str, str, str]], _Histogram] = {}
+
+    @staticmethod
+    def enabled(project_id: str) -> bool:
+        proj = runtime_config.projects.get(project_id)
+        return bool(getattr(proj, "angelia_latency_metrics_enabled", False)) if proj else False
+
+    def observe(self, name: str, value_ms: float, *, project_id: str, agent_id: str = "", event_type: str = ""):
+        if not self.enabled(project_id):
+            return
+        key = (str(name), (str(project_id), str(agent_id or ""), str(event_type or "")))
+        v = max(0.0, float(value_ms))
+        with self._lock:
+            h = self._series.get(key)
+            if h is None:
+                h = _Histogram()
+                self._series[key] = h
+            h.observe(v)
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        with self._lock:
+            items = [(k, list(h.cumulative()), h.sum, h.count) for k, h in self._series.items()]
+        out: dict[str, list[dict[str, Any]]] = {}
+        for (name, labels), cum, total, count in sorted(items, key=lambda x: x[0]):
+            buckets = {_fmt_le(b): cum[i] for i, b in enumerate(BUCKETS_MS)}
+            buckets["+Inf"] = cum[-1]
+            out.setdefault(name, []).append(
+                {
+                    "labels": {k: v for k, v in zip(_LABEL_NAMES, labels) if v},
+                    "count": count,
+                    "sum_ms": round(total, 3),
+                    "buckets": buckets,
+                }
+            )
+        return out
+
+    def prometheus(self, counters: dict[str, int] | None = None, prefix: str = "gods") -> str:
+        lines: list[str] = []
+        if counters:
+            metric = f"{prefix}_angelia_events_total"
+            lines.append(f"# TYPE {metric} counter")
+            for k in sorted(counters):
+                lines.append(f'{metric}{{name="{_escape(k)}"}} {int(counters[k])}')
+        for name, series in self.snapshot().items():
+            metric = f"{prefix}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for s in series:
+                base = ",".join(f'{k}="{_escape(v)}"' for k, v in s["labels"].items())
+                sep = "," if base else ""
+                for le, c in s["buckets"].items():
+                    lines.append(f'{metric}_bucket{{{base}{sep}le="{le}"}} {c}')
+                lines.append(f"{metric}_sum{{{base}}} {s['sum_ms']}")
+                lines.append(f"{metric}_count{{{base}}} {s['count']}")
+        return "\n".join(lines) + "\n"
+
+
+latency_metrics = LatencyHistograms()
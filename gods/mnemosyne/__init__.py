@@ -16,6 +16,7 @@ from gods.mnemosyne.chronicle_index import (
     list_chronicle_index_texts,
     rebuild_chronicle_markdown_from_index,
 )
+from gods.mnemosyne.intent_index import rebuild_intent_offset_index
 from gods.mnemosyne.policy_registry import (
     MemoryPolicyMissingError,
     MemoryTemplateMissingError,
@@ -27,9 +28,11 @@ from gods.mnemosyne.policy_registry import (
 )
 from gods.mnemosyne.intent_schema_registry import template_vars_for_intent, validate_intent_contract
 from gods.mnemosyne.compaction import (
+    compaction_metrics,
     ensure_compacted,
     load_chronicle_for_context,
     note_llm_token_io,
+    schedule_compaction,
 )
 from gods.mnemosyne.context_materials import (
     read_profile,
@@ -43,8 +46,11 @@ from gods.mnemosyne.journal import record_inbox_digest, inbox_digest_path
 from gods.mnemosyne.artifacts import (
     put_artifact_text,
     put_artifact_bytes,
+    put_artifact_stream,
     head_artifact,
     get_artifact_bytes,
+    open_artifact,
+    read_artifact_range,
     materialize_artifact,
     list_artifacts,
     is_valid_artifact_id,
@@ -71,6 +77,7 @@ from gods.mnemosyne.pulse_ledger import (
     append_pulse_entries,
     discard_incomplete_frames,
     list_pulse_entries,
+    list_pulse_segments,
     group_pulses,
     trim_truncated_head,
     validate_pulse_integrity,
@@ -93,6 +100,7 @@ __all__ = [
     "list_chronicle_index_entries",
     "list_chronicle_index_texts",
     "rebuild_chronicle_markdown_from_index",
+    "rebuild_intent_offset_index",
     "MemoryPolicyMissingError",
     "MemoryTemplateMissingError",
     "ensure_memory_policy",
@@ -102,9 +110,11 @@ __all__ = [
     "validate_memory_policy",
     "template_vars_for_intent",
     "validate_intent_contract",
+    "compaction_metrics",
     "ensure_compacted",
     "load_chronicle_for_context",
     "note_llm_token_io",
+    "schedule_compaction",
     "read_profile",
     "read_task_state",
     "chronicle_path",
@@ -117,8 +127,11 @@ __all__ = [
     "inbox_digest_path",
     "put_artifact_text",
     "put_artifact_bytes",
+    "put_artifact_stream",
     "head_artifact",
     "get_artifact_bytes",
+    "open_artifact",
+    "read_artifact_range",
     "materialize_artifact",
     "list_artifacts",
     "is_valid_artifact_id",
@@ -140,6 +153,7 @@ __all__ = [
     "append_pulse_entries",
     "discard_incomplete_frames",
     "list_pulse_entries",
+    "list_pulse_segments",
     "group_pulses",
     "trim_truncated_head",
     "validate_pulse_integrity",
@@ -1,14 +1,25 @@
-"""Mnemosyne artifact storage (namespace + immutable blobs)."""
+"""Mnemosyne artifact storage (namespace + immutable blobs).
+
+Blobs are content-addressed files under `blobs/<sha256>.bin` and never change
+once written. Uploads can stream (`put_artifact_stream`): chunks are hashed
+while being spooled to a temp file that is renamed into place, so payload size
+never bounds process memory. Reads go through `open_artifact` (read-only file
+object) or `read_artifact_range`; `materialize_artifact` clones the blob
+(reflink where the filesystem supports it, kernel `sendfile` otherwise).
+"""
 from __future__ import annotations
 
 import fcntl
 import hashlib
 import json
 import mimetypes
+import os
 import re
+import shutil
 import time
+import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterable
 
 from gods.mnemosyne.artifact_acl import evaluate_artifact_acl
 from gods.mnemosyne.artifact_contracts import ArtifactRef, ArtifactScope
@@ -132,18 +143,24 @@ def _guess_ext(mime: str) -> str:
     return ext or ".bin"
 
 
-def put_artifact_bytes(
+CHUNK_SIZE = 1024 * 1024
+_FICLONE = 0x40049409  # linux/fs.h: share extents copy-on-write (btrfs, xfs, overlay on those)
+
+
+def _commit_artifact(
     scope: str,
     project_id: str,
     owner_agent_id: str,
     actor_id: str,
-    data: bytes,
-    mime: str = "application/octet-stream",
-    tags: list[str] | None = None,
+    *,
+    sha: str,
+    size: int,
+    mime: str,
+    tags: list[str] | None,
+    place_blob: Callable[[Path], None],
 ) -> ArtifactRef:
     sc = _normalize_scope(scope)
     project_key = _project_key(sc, project_id)
-    sha = hashlib.sha256(data).hexdigest()
     now = time.time()
     owner = str(owner_agent_id or "").strip()
     mime_val = str(mime or "application/octet-stream").strip() or "application/octet-stream"
@@ -156,7 +173,7 @@ def put_artifact_bytes(
         project_id=("" if sc == "global" else str(project_id or "").strip()),
         owner_agent_id=owner,
         mime=mime_val,
-        size=len(data),
+        size=int(size),
         sha256=sha,
         created_at=now,
     )
@@ -190,10 +207,82 @@ def put_artifact_bytes(
     ref = _with_lock(sc, project_key, _mut)
     blob = _blob_path(sc, project_key, ref.sha256)
     if not blob.exists():
-        blob.write_bytes(data)
+        place_blob(blob)
     return ref
 
 
+def _spool_path(blob_dir: Path) -> Path:
+    return blob_dir / f".upload-{uuid.uuid4().hex}.tmp"
+
+
+def put_artifact_bytes(
+    scope: str,
+    project_id: str,
+    owner_agent_id: str,
+    actor_id: str,
+    data: bytes,
+    mime: str = "application/octet-stream",
+    tags: list[str] | None = None,
+) -> ArtifactRef:
+    def _place(blob: Path) -> None:
+        tmp = _spool_path(blob.parent)
+        tmp.write_bytes(data)
+        tmp.replace(blob)
+
+    return _commit_artifact(
+        scope,
+        project_id,
+        owner_agent_id,
+        actor_id,
+        sha=hashlib.sha256(data).hexdigest(),
+        size=len(data),
+        mime=mime,
+        tags=tags,
+        place_blob=_place,
+    )
+
+
+def put_artifact_stream(
+    scope: str,
+    project_id: str,
+    owner_agent_id: str,
+    actor_id: str,
+    source: BinaryIO | Iterable[bytes],
+    mime: str = "application/octet-stream",
+    tags: list[str] | None = None,
+) -> ArtifactRef:
+    """Store a binary file object (read in CHUNK_SIZE pieces) or an iterable of byte chunks."""
+    sc = _normalize_scope(scope)
+    tmp = _spool_path(_blobs_dir(sc, _project_key(sc, project_id)))
+    hasher = hashlib.sha256()
+    size = 0
+    if hasattr(source, "read"):
+        chunks: Iterable[bytes] = iter(lambda: source.read(CHUNK_SIZE), b"")  # type: ignore[union-attr]
+    else:
+        chunks = source  # type: ignore[assignment]
+    try:
+        with tmp.open("wb") as out:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                hasher.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        return _commit_artifact(
+            scope,
+            project_id,
+            owner_agent_id,
+            actor_id,
+            sha=hasher.hexdigest(),
+            size=size,
+            mime=mime,
+            tags=tags,
+            place_blob=lambda blob: tmp.replace(blob),
+        )
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
 def put_artifact_text(
     scope: str,
     project_id: str,
@@ -313,7 +402,7 @@ def head_artifact(artifact_id: str, actor_id: str, project_id: str) -> ArtifactR
     return ref
 
 
-def get_artifact_bytes(artifact_id: str, actor_id: str, project_id: str) -> bytes:
+def _readable_blob(artifact_id: str, actor_id: str, project_id: str) -> tuple[ArtifactRef, Path]:
     row, scope, key = _find_artifact_row(artifact_id, project_id)
     ref = _row_to_ref(row)
     grants = set(_read_grants(scope, key).get(ref.artifact_id, [])) if scope == "agent" else set()
@@ -329,16 +418,56 @@ def get_artifact_bytes(artifact_id: str, actor_id: str, project_id: str) -> byte
     blob = _blob_path(scope, key, ref.sha256)
     if not blob.exists():
         raise FileNotFoundError(f"artifact blob missing: {artifact_id}")
+    return ref, blob
+
+
+def open_artifact(artifact_id: str, actor_id: str, project_id: str) -> BinaryIO:
+    """Read-only binary file object over the blob; callers close it (or use `with`)."""
+    _, blob = _readable_blob(artifact_id, actor_id, project_id)
+    return blob.open("rb")
+
+
+def read_artifact_range(artifact_id: str, actor_id: str, project_id: str, offset: int = 0, length: int = -1) -> bytes:
+    """Bytes `[offset, offset + length)` of the blob (`length < 0` reads to EOF)."""
+    off = max(0, int(offset or 0))
+    with open_artifact(artifact_id, actor_id, project_id) as f:
+        f.seek(off)
+        return f.read(int(length)) if int(length) >= 0 else f.read()
+
+
+def get_artifact_bytes(artifact_id: str, actor_id: str, project_id: str) -> bytes:
+    _, blob = _readable_blob(artifact_id, actor_id, project_id)
     return blob.read_bytes()
 
 
+def _clone_file(src: Path, dst: Path) -> None:
+    with src.open("rb") as fin, dst.open("wb") as fout:
+        try:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+            return
+        except OSError:
+            pass
+        size = os.fstat(fin.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(fout.fileno(), fin.fileno(), offset, size - offset)
+                if sent <= 0:
+                    break
+                offset += sent
+        except OSError:
+            fin.seek(offset)
+            fout.seek(offset)
+            shutil.copyfileobj(fin, fout, CHUNK_SIZE)
+
+
 def materialize_artifact(artifact_id: str, actor_id: str, project_id: str, target_dir: str) -> str:
-    ref = head_artifact(artifact_id, actor_id, project_id)
-    data = get_artifact_bytes(artifact_id, actor_id, project_id)
+    # Not a hardlink: the materialized file is the caller's to edit, the blob must stay immutable.
+    ref, blob = _readable_blob(artifact_id, actor_id, project_id)
     d = Path(str(target_dir or "").strip())
     d.mkdir(parents=True, exist_ok=True)
     path = d / f"{ref.artifact_id}{_guess_ext(ref.mime)}"
-    path.write_bytes(data)
+    _clone_file(blob, path)
     return str(path)
 
 
@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Any
 
 from gods.mnemosyne.compaction import chronicle_path
+from gods.mnemosyne.intent_writer import flush_agent_writes
+from gods.mnemosyne.jsonl_tail import tail_jsonl
 from gods.paths import mnemosyne_dir
 
 
@@ -23,24 +25,13 @@ def append_chronicle_index_entry(project_id: str, agent_id: str, row: dict[str,
 
 
 def list_chronicle_index_entries(project_id: str, agent_id: str, limit: int = 300) -> list[dict[str, Any]]:
+    flush_agent_writes(project_id, agent_id)
     path = _index_path(project_id, agent_id)
     if not path.exists():
         return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(obj, dict):
-                rows.append(obj)
     if limit <= 0:
         return []
-    return rows[-max(1, min(int(limit), 5000)) :]
+    return tail_jsonl(path, max(1, min(int(limit), 5000)))
 
 
 def list_chronicle_index_texts(project_id: str, agent_id: str, limit: int = 300) -> list[str]:
@@ -53,6 +44,7 @@ def list_chronicle_index_texts(project_id: str, agent_id: str, limit: int = 300)
 
 
 def rebuild_chronicle_markdown_from_index(project_id: str, agent_id: str) -> dict[str, Any]:
+    flush_agent_writes(project_id, agent_id)
     rows = list_chronicle_index_entries(project_id, agent_id, limit=5000)
     lines: list[str] = []
     for row in rows:
@@ -1,12 +1,24 @@
-"""Mnemosyne chronicle compaction (token-triggered, strategy-switchable)."""
+"""Mnemosyne chronicle compaction (token-triggered, strategy-switchable).
+
+Chronicle size is tracked by a per-agent running counter that only decodes the
+bytes appended since the last check. Crossing `memory_compact_trigger_tokens`
+queues a job on a small background pool (`schedule_compaction`); the pulse path
+never waits for it and always reads the last committed chronicle. A job splices
+entries appended while it ran onto the compacted body and swaps the file in
+atomically. `compaction_metrics` reports queue lag and bytes archived.
+"""
 from __future__ import annotations
 
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from gods.config import runtime_config
+from gods.metrics import latency_metrics
+from gods.mnemosyne.intent_writer import agent_writer, flush_agent_writes
 from gods.paths import mnemosyne_dir
 
 
@@ -38,6 +50,40 @@ def _tok_len(text: str) -> int:
     return max(1, len(str(text or "")) // 4)
 
 
+# Running chronicle sizes: path -> (inode, bytes counted, chars counted).
+_COUNTERS: dict[str, tuple[int, int, int]] = {}
+_COUNTERS_GUARD = threading.Lock()
+
+
+def _count_chronicle_chars(path: Path) -> int | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    key = str(path)
+    with _COUNTERS_GUARD:
+        hit = _COUNTERS.get(key)
+    if hit is not None and hit[0] == st.st_ino and hit[1] == st.st_size:
+        return hit[2]
+    if hit is not None and hit[0] == st.st_ino and hit[1] < st.st_size:
+        # Append-only growth: decode just the new tail.
+        with path.open("rb") as f:
+            f.seek(hit[1])
+            tail = f.read()
+        size, chars = hit[1] + len(tail), hit[2] + len(tail.decode("utf-8", errors="replace"))
+    else:
+        raw = path.read_bytes()
+        size, chars = len(raw), len(raw.decode("utf-8", errors="replace"))
+    with _COUNTERS_GUARD:
+        _COUNTERS[key] = (st.st_ino, size, chars)
+    return chars
+
+
+def chronicle_tokens(project_id: str, agent_id: str) -> int:
+    chars = _count_chronicle_chars(chronicle_path(project_id, agent_id))
+    return 0 if chars is None else max(1, chars // 4)
+
+
 def _project(project_id: str):
     return runtime_config.projects.get(project_id)
 
@@ -211,95 +257,236 @@ def _build_compact_summary(project_id: str, agent_id: str, old_entries: list[str
     return _rule_based_summary(old_entries, seed_block), "rule_based"
 
 
+def _append_archive_chunk(project_id: str, agent_id: str, old_text: str, entries: int) -> int:
+    chunk = "\n\n# ARCHIVE_CHUNK\n" + f"timestamp={time.time():.3f}\n" + f"entries={entries}\n\n" + old_text
+    if not old_text.endswith("\n"):
+        chunk += "\n"
+    chunk += "\n---\n"
+    data = chunk.encode("utf-8")
+    with archive_path(project_id, agent_id).open("ab") as af:
+        af.write(data)
+    return len(data)
+
+
+def _commit_compacted(project_id: str, agent_id: str, path: Path, new_content: str, read_upto: int) -> str:
+    """Swap in the compacted chronicle, keeping entries appended after byte `read_upto`."""
+    w = agent_writer(project_id, agent_id)
+    with w.lock:
+        # Holding the writer lock keeps in-process appends out until the new file is in place.
+        w.commit()
+        with path.open("rb") as f:
+            f.seek(read_upto)
+            tail = f.read().decode("utf-8", errors="replace")
+        content = new_content + tail
+        tmp = path.with_name(f"{path.name}.compact.tmp")
+        tmp.write_text(content, encoding="utf-8")
+        tmp.replace(path)
+        st = path.stat()
+        with _COUNTERS_GUARD:
+            _COUNTERS[str(path)] = (st.st_ino, st.st_size, len(content))
+    return content
+
+
 def ensure_compacted(project_id: str, agent_id: str) -> dict[str, Any]:
+    """Compact now if over the trigger (synchronous; the pulse path uses `schedule_compaction`)."""
+    flush_agent_writes(project_id, agent_id)
     p = chronicle_path(project_id, agent_id)
     if not p.exists():
         return {"performed": False, "reason": "chronicle_missing"}
-    content = p.read_text(encoding="utf-8")
-    total_tokens = _tok_len(content)
+    total_tokens = chronicle_tokens(project_id, agent_id)
     trigger = compact_trigger_tokens(project_id)
     if total_tokens < trigger:
         return {"performed": False, "reason": "under_threshold", "tokens": total_tokens, "trigger": trigger}
 
-    seed_block, body = _split_seed_block(content)
-    entries = _split_entries(body)
-    if len(entries) <= 1:
-        # Single huge block fallback: keep tail window and archive the rest.
-        body_text = str(body or "")
-        keep_chars = max(8000, int(trigger * 4 * 0.35))
-        if len(body_text) <= keep_chars:
-            return {"performed": False, "reason": "insufficient_entries", "tokens": total_tokens, "trigger": trigger}
-        old_blob = body_text[:-keep_chars]
-        kept_blob = body_text[-keep_chars:]
-        summary, actual = _build_compact_summary(project_id, agent_id, [old_blob], seed_block)
-        ap = archive_path(project_id, agent_id)
-        with ap.open("a", encoding="utf-8") as af:
-            af.write("\n\n# ARCHIVE_CHUNK\n")
-            af.write(f"timestamp={time.time():.3f}\n")
-            af.write("entries=1\n\n")
-            af.write(old_blob)
-            if not old_blob.endswith("\n"):
-                af.write("\n")
-            af.write("\n---\n")
-        new_content = seed_block + summary + "\n\n---\n\n" + kept_blob
-        p.write_text(new_content, encoding="utf-8")
-        after_tokens = _tok_len(new_content)
+    with _agent_lock(project_id, agent_id):
+        raw = p.read_bytes()
+        content = raw.decode("utf-8", errors="replace")
+        total_tokens = _tok_len(content)
+        if total_tokens < trigger:
+            return {"performed": False, "reason": "under_threshold", "tokens": total_tokens, "trigger": trigger}
+        seed_block, body = _split_seed_block(content)
+        entries = _split_entries(body)
+        if len(entries) <= 1:
+            # Single huge block fallback: keep tail window and archive the rest.
+            body_text = str(body or "")
+            keep_chars = max(8000, int(trigger * 4 * 0.35))
+            if len(body_text) <= keep_chars:
+                return {"performed": False, "reason": "insufficient_entries", "tokens": total_tokens, "trigger": trigger}
+            old_blob = body_text[:-keep_chars]
+            kept_blob = body_text[-keep_chars:]
+            summary, actual = _build_compact_summary(project_id, agent_id, [old_blob], seed_block)
+            archived_bytes = _append_archive_chunk(project_id, agent_id, old_blob, 1)
+            new_content = _commit_compacted(
+                project_id, agent_id, p, seed_block + summary + "\n\n---\n\n" + kept_blob, len(raw)
+            )
+            return {
+                "performed": True,
+                "strategy": actual,
+                "tokens_before": total_tokens,
+                "tokens_after": _tok_len(new_content),
+                "trigger": trigger,
+                "archived_entries": 1,
+                "kept_entries": 1,
+                "archived_bytes": archived_bytes,
+            }
+
+        # Keep recent window and always keep high-value entries from older history.
+        target_keep = max(1200, int(trigger * 0.35))
+        kept: list[str] = []
+        used = 0
+        for e in reversed(entries):
+            t = _tok_len(e)
+            if used + t > target_keep:
+                continue
+            kept.append(e)
+            used += t
+        kept.reverse()
+        keep_set = set(kept)
+        old = [e for e in entries if e not in keep_set]
+        if not old:
+            return {"performed": False, "reason": "no_old_entries", "tokens": total_tokens, "trigger": trigger}
+
+        summary, actual = _build_compact_summary(project_id, agent_id, old, seed_block)
+        archived_bytes = _append_archive_chunk(project_id, agent_id, "".join(old), len(old))
+        new_body = summary + "\n\n---\n\n" + "".join(kept)
+        new_content = _commit_compacted(project_id, agent_id, p, seed_block + new_body, len(raw))
         return {
             "performed": True,
             "strategy": actual,
             "tokens_before": total_tokens,
-            "tokens_after": after_tokens,
+            "tokens_after": _tok_len(new_content),
             "trigger": trigger,
-            "archived_entries": 1,
-            "kept_entries": 1,
+            "archived_entries": len(old),
+            "kept_entries": len(kept),
+            "archived_bytes": archived_bytes,
         }
 
-    # Keep recent window and always keep high-value entries from older history.
-    target_keep = max(1200, int(trigger * 0.35))
-    kept: list[str] = []
-    used = 0
-    for e in reversed(entries):
-        t = _tok_len(e)
-        if used + t > target_keep:
-            continue
-        kept.append(e)
-        used += t
-    kept.reverse()
-    keep_set = set(kept)
-    old = [e for e in entries if e not in keep_set]
-    if not old:
-        return {"performed": False, "reason": "no_old_entries", "tokens": total_tokens, "trigger": trigger}
-
-    summary, actual = _build_compact_summary(project_id, agent_id, old, seed_block)
-
-    ap = archive_path(project_id, agent_id)
-    with ap.open("a", encoding="utf-8") as af:
-        af.write("\n\n# ARCHIVE_CHUNK\n")
-        af.write(f"timestamp={time.time():.3f}\n")
-        af.write(f"entries={len(old)}\n\n")
-        af.write("".join(old))
-        if not str(old[-1]).endswith("\n"):
-            af.write("\n")
-        af.write("\n---\n")
-
-    new_body = summary + "\n\n---\n\n" + "".join(kept)
-    new_content = seed_block + new_body
-    p.write_text(new_content, encoding="utf-8")
-    after_tokens = _tok_len(new_content)
-    return {
-        "performed": True,
-        "strategy": actual,
-        "tokens_before": total_tokens,
-        "tokens_after": after_tokens,
-        "trigger": trigger,
-        "archived_entries": len(old),
-        "kept_entries": len(kept),
+
+_COMPACTION_WORKERS = 2
+
+_AGENT_LOCKS: dict[tuple[str, str], threading.Lock] = {}
+_STATE_GUARD = threading.Lock()
+_EXECUTOR: ThreadPoolExecutor | None = None
+_QUEUED: dict[tuple[str, str], float] = {}
+# Token count at the last no-op run; skip re-queueing until the chronicle grows past it.
+_NOOP_AT: dict[tuple[str, str], int] = {}
+_STATS: dict[tuple[str, str], dict[str, Any]] = {}
+_DONE = threading.Condition(_STATE_GUARD)
+
+
+def _agent_lock(project_id: str, agent_id: str) -> threading.Lock:
+    key = (str(project_id), str(agent_id))
+    with _STATE_GUARD:
+        lock = _AGENT_LOCKS.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _AGENT_LOCKS[key] = lock
+        return lock
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _STATE_GUARD:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=_COMPACTION_WORKERS, thread_name_prefix="mnemosyne-compact")
+        return _EXECUTOR
+
+
+def _stats_row(key: tuple[str, str]) -> dict[str, Any]:
+    row = _STATS.get(key)
+    if row is None:
+        row = {"queued": 0, "runs": 0, "performed": 0, "failed": 0, "bytes_archived": 0, "last_lag_ms": 0.0}
+        _STATS[key] = row
+    return row
+
+
+def _run_compaction_job(project_id: str, agent_id: str):
+    key = (str(project_id), str(agent_id))
+    result: dict[str, Any] = {}
+    failed = False
+    try:
+        result = ensure_compacted(project_id, agent_id)
+    except Exception:
+        failed = True
+    finished = time.time()
+    with _DONE:
+        queued_at = _QUEUED.pop(key, finished)
+        lag_ms = (finished - queued_at) * 1000.0
+        row = _stats_row(key)
+        row["runs"] += 1
+        row["last_lag_ms"] = round(lag_ms, 3)
+        if failed:
+            row["failed"] += 1
+        elif result.get("performed"):
+            row["performed"] += 1
+            row["bytes_archived"] += int(result.get("archived_bytes", 0) or 0)
+            _NOOP_AT.pop(key, None)
+        elif result.get("reason") != "under_threshold":
+            _NOOP_AT[key] = int(result.get("tokens", 0) or 0)
+        _DONE.notify_all()
+    latency_metrics.observe("mnemosyne_compaction_lag_ms", lag_ms, project_id=project_id, agent_id=agent_id)
+
+
+def schedule_compaction(project_id: str, agent_id: str) -> bool:
+    """Queue a background compaction if the chronicle is over the trigger; returns True if queued."""
+    tokens = chronicle_tokens(project_id, agent_id)
+    if tokens < compact_trigger_tokens(project_id):
+        return False
+    key = (str(project_id), str(agent_id))
+    with _STATE_GUARD:
+        if key in _QUEUED:
+            return False
+        noop_at = _NOOP_AT.get(key)
+        if noop_at is not None and tokens <= noop_at + compact_trigger_tokens(project_id) // 10:
+            return False
+        _QUEUED[key] = time.time()
+        _stats_row(key)["queued"] += 1
+    _executor().submit(_run_compaction_job, project_id, agent_id)
+    return True
+
+
+def wait_for_compaction(project_id: str, agent_id: str, timeout: float = 30.0) -> bool:
+    """Block until no compaction is queued or running for the agent; False on timeout."""
+    key = (str(project_id), str(agent_id))
+    deadline = time.time() + max(0.0, float(timeout))
+    with _DONE:
+        while key in _QUEUED:
+            left = deadline - time.time()
+            if left <= 0:
+                return False
+            _DONE.wait(left)
+    return True
+
+
+def compaction_metrics(project_id: str | None = None) -> dict[str, Any]:
+    now = time.time()
+    with _STATE_GUARD:
+        rows = [
+            {
+                "project_id": pid,
+                "agent_id": aid,
+                **stats,
+                "pending": (pid, aid) in _QUEUED,
+                "pending_lag_ms": round((now - _QUEUED[(pid, aid)]) * 1000.0, 3) if (pid, aid) in _QUEUED else 0.0,
+            }
+            for (pid, aid), stats in sorted(_STATS.items())
+            if project_id is None or pid == str(project_id)
+        ]
+    totals = {
+        "queued": sum(r["queued"] for r in rows),
+        "runs": sum(r["runs"] for r in rows),
+        "performed": sum(r["performed"] for r in rows),
+        "failed": sum(r["failed"] for r in rows),
+        "bytes_archived": sum(r["bytes_archived"] for r in rows),
+        "pending": sum(1 for r in rows if r["pending"]),
     }
+    return {"totals": totals, "agents": rows}
 
 
 def load_chronicle_for_context(project_id: str, agent_id: str, fallback: str = "") -> str:
-    # Build-time guard: keep prompt chronicle bounded by token trigger before injection.
-    ensure_compacted(project_id, agent_id)
+    # Never compact inline: queue it if due and serve the last committed chronicle.
+    flush_agent_writes(project_id, agent_id)
+    schedule_compaction(project_id, agent_id)
     p = chronicle_path(project_id, agent_id)
     if not p.exists():
         return str(fallback or "")
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Any
 
 from gods.mnemosyne.policy_registry import load_memory_policy
+from gods.mnemosyne.intent_writer import flush_agent_writes
+from gods.mnemosyne.jsonl_tail import tail_jsonl
 from gods.mnemosyne.template_registry import render_memory_template
 from gods.paths import mnemosyne_dir
 
@@ -48,11 +50,14 @@ def _render_llm_context_from_intent_row(project_id: str, row: dict[str, Any], po
 
 
 def rebuild_context_index_from_intents(project_id: str, agent_id: str, limit: int = 5000) -> dict[str, Any]:
+    flush_agent_writes(project_id, agent_id)
     intents_path = _intents_path(project_id, agent_id)
     idx_path = _index_path(project_id, agent_id)
     policy_map = load_memory_policy(project_id)
     rows: list[dict[str, Any]] = []
-    if intents_path.exists():
+    if limit > 0:
+        rows = tail_jsonl(intents_path, max(1, min(int(limit), 50000)))
+    elif intents_path.exists():
         with intents_path.open("r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
@@ -64,8 +69,6 @@ def rebuild_context_index_from_intents(project_id: str, agent_id: str, limit: in
                     continue
                 if isinstance(obj, dict):
                     rows.append(obj)
-    if limit > 0:
-        rows = rows[-max(1, min(int(limit), 50000)) :]
     rebuilt_rows: list[dict[str, Any]] = []
     for row in rows:
         rendered = _render_llm_context_from_intent_row(project_id, row, policy_map)
@@ -103,24 +106,13 @@ def append_context_index_entry(project_id: str, agent_id: str, row: dict[str, An
 
 
 def list_context_index_entries(project_id: str, agent_id: str, limit: int = 200) -> list[dict[str, Any]]:
+    flush_agent_writes(project_id, agent_id)
     path = _index_path(project_id, agent_id)
     if not path.exists():
         return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(obj, dict):
-                rows.append(obj)
     if limit <= 0:
         return []
-    return rows[-max(1, min(int(limit), 5000)) :]
+    return tail_jsonl(path, max(1, min(int(limit), 5000)))
 
 
 def list_context_index_texts(project_id: str, agent_id: str, limit: int = 200) -> list[str]:
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Any
 
 from gods.paths import mnemosyne_dir
+from gods.mnemosyne.intent_writer import flush_agent_writes
+from gods.mnemosyne.jsonl_tail import tail_jsonl
 
 
 def _mn_root(project_id: str) -> Path:
@@ -35,19 +37,7 @@ def chronicle_path(project_id: str, agent_id: str) -> Path:
 
 
 def _read_jsonl(path: Path, limit: int = 200) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rows.append(json.loads(line))
-            except Exception:
-                continue
-    return rows[-max(1, int(limit)) :]
+    return tail_jsonl(path, max(1, int(limit)))
 
 
 def read_profile(project_id: str, agent_id: str) -> str:
@@ -72,6 +62,7 @@ def load_agent_directives(project_id: str, agent_id: str) -> str:
 
 
 def ensure_agent_memory_seeded(project_id: str, agent_id: str, directives: str, agent_workspace: Path):
+    flush_agent_writes(project_id, agent_id)
     mem_path = chronicle_path(project_id, agent_id)
     if mem_path.exists():
         try:
@@ -6,6 +6,7 @@ import time
 from pathlib import Path
 from typing import Any
 
+from gods.mnemosyne.jsonl_tail import last_jsonl_row, tail_jsonl
 from gods.paths import mnemosyne_dir
 
 
@@ -16,21 +17,7 @@ def context_reports_path(project_id: str, agent_id: str) -> Path:
 
 
 def _read_jsonl(path: Path, limit: int = 200) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(row, dict):
-                rows.append(row)
-    return rows[-max(1, int(limit)) :]
+    return tail_jsonl(path, max(1, int(limit)))
 
 
 def list_context_reports(project_id: str, agent_id: str, limit: int = 20) -> list[dict[str, Any]]:
@@ -38,8 +25,7 @@ def list_context_reports(project_id: str, agent_id: str, limit: int = 20) -> lis
 
 
 def latest_context_report(project_id: str, agent_id: str) -> dict[str, Any] | None:
-    rows = list_context_reports(project_id, agent_id, limit=1)
-    return rows[-1] if rows else None
+    return last_jsonl_row(context_reports_path(project_id, agent_id))
 
 
 def record_context_report(project_id: str, agent_id: str, payload: dict[str, Any]):
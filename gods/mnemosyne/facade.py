@@ -10,7 +10,7 @@ from gods.mnemosyne import (
     record_intent,
     fetch_intents_between,
 )
-from gods.mnemosyne.compaction import load_chronicle_for_context
+from gods.mnemosyne.compaction import compaction_metrics, load_chronicle_for_context
 from gods.mnemosyne.context_materials import (
     read_profile,
     read_task_state,
@@ -30,12 +30,18 @@ from gods.mnemosyne.chronicle_index import (
     list_chronicle_index_texts,
     rebuild_chronicle_markdown_from_index,
 )
+from gods.mnemosyne.intent_index import rebuild_intent_offset_index
+from gods.mnemosyne.intent_writer import flush_agent_writes
+from gods.mnemosyne.intent_schema_registry import flush_observed_schema
 from gods.mnemosyne.policy_registry import default_memory_policy, required_intent_keys
 from gods.mnemosyne.artifacts import (
     put_artifact_text,
     put_artifact_bytes,
+    put_artifact_stream,
     head_artifact,
     get_artifact_bytes,
+    open_artifact,
+    read_artifact_range,
     materialize_artifact,
     list_artifacts,
     is_valid_artifact_id,
@@ -62,6 +68,7 @@ from gods.mnemosyne.pulse_ledger import (
     append_pulse_entries,
     discard_incomplete_frames,
     list_pulse_entries,
+    list_pulse_segments,
     group_pulses,
     trim_truncated_head,
     validate_pulse_integrity,
@@ -144,6 +151,7 @@ __all__ = [
     "record_janus_compaction_base_intent",
     "render_intents_for_llm",
     "load_chronicle_for_context",
+    "compaction_metrics",
     "read_profile",
     "read_task_state",
     "chronicle_path",
@@ -158,14 +166,20 @@ __all__ = [
     "list_chronicle_index_entries",
     "list_chronicle_index_texts",
     "rebuild_chronicle_markdown_from_index",
+    "rebuild_intent_offset_index",
+    "flush_agent_writes",
+    "flush_observed_schema",
     "record_inbox_digest",
     "inbox_digest_path",
     "default_memory_policy",
     "required_intent_keys",
     "put_artifact_text",
     "put_artifact_bytes",
+    "put_artifact_stream",
     "head_artifact",
     "get_artifact_bytes",
+    "open_artifact",
+    "read_artifact_range",
     "materialize_artifact",
     "list_artifacts",
     "is_valid_artifact_id",
@@ -188,6 +202,7 @@ __all__ = [
     "append_pulse_entries",
     "discard_incomplete_frames",
     "list_pulse_entries",
+    "list_pulse_segments",
     "group_pulses",
     "trim_truncated_head",
     "validate_pulse_integrity",
@@ -0,0 +1,183 @@
+"""Mnemosyne intent offset index (derived, rebuildable).
+
+Sparse sidecar for `intents/<agent>.jsonl`: one `{"seq", "offset"}` row every
+`INDEX_STRIDE` intent seqs, pointing at the byte where that intent's line
+starts. Range readers seek to the nearest checkpoint at or before their start
+seq instead of scanning the ledger from byte 0. Checkpoints are verified on
+use; a missing or stale sidecar is rebuilt from the ledger.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Iterator
+
+from gods.paths import mnemosyne_dir
+from gods.mnemosyne.intent_writer import flush_agent_writes
+
+INDEX_STRIDE = 128
+
+# Parsed sidecars: path -> ((inode, size, mtime_ns), seqs, offsets).
+_CACHE: dict[str, tuple[tuple[int, int, int], list[int], list[int]]] = {}
+_CACHE_GUARD = threading.Lock()
+
+
+def _intents_path(project_id: str, agent_id: str) -> Path:
+    p = mnemosyne_dir(project_id) / "intents" / f"{agent_id}.jsonl"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def _index_path(project_id: str, agent_id: str) -> Path:
+    p = mnemosyne_dir(project_id) / "intent_offsets" / f"{agent_id}.jsonl"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def _to_int(v: Any, default: int = 0) -> int:
+    try:
+        return int(v)
+    except Exception:
+        return default
+
+
+def _row_seq(raw: bytes) -> int | None:
+    line = raw.strip()
+    if not line:
+        return None
+    try:
+        row = json.loads(line)
+    except Exception:
+        return None
+    if not isinstance(row, dict):
+        return None
+    return _to_int(row.get("intent_seq"), 0)
+
+
+def rebuild_intent_offset_index(project_id: str, agent_id: str) -> dict[str, Any]:
+    intents_path = _intents_path(project_id, agent_id)
+    idx_path = _index_path(project_id, agent_id)
+    rows: list[dict[str, int]] = []
+    if intents_path.exists():
+        offset = 0
+        with intents_path.open("rb") as f:
+            for raw in f:
+                if raw.endswith(b"\n"):
+                    seq = _row_seq(raw)
+                    if seq and seq % INDEX_STRIDE == 0:
+                        rows.append({"seq": seq, "offset": offset})
+                offset += len(raw)
+    tmp = idx_path.with_suffix(".jsonl.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+    tmp.replace(idx_path)
+    return {
+        "project_id": project_id,
+        "agent_id": agent_id,
+        "checkpoints": len(rows),
+        "path": str(idx_path),
+    }
+
+
+def note_intent_offset(project_id: str, agent_id: str, seq: int, offset: int) -> None:
+    """Called after an intent line was appended at `offset`; records a checkpoint every stride."""
+    idx_path = _index_path(project_id, agent_id)
+    if not idx_path.exists() and offset > 0:
+        # Ledger predates the sidecar: index its whole history once.
+        rebuild_intent_offset_index(project_id, agent_id)
+        return
+    seq = _to_int(seq, 0)
+    if seq <= 0 or seq % INDEX_STRIDE != 0:
+        if not idx_path.exists():
+            idx_path.touch()
+        return
+    with idx_path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"seq": seq, "offset": int(offset)}) + "\n")
+
+
+def _load_checkpoints(idx_path: Path) -> tuple[list[int], list[int]] | None:
+    try:
+        st = idx_path.stat()
+    except FileNotFoundError:
+        return None
+    sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+    key = str(idx_path)
+    with _CACHE_GUARD:
+        hit = _CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1], hit[2]
+    pairs: list[tuple[int, int]] = []
+    with idx_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                pairs.append((_to_int(row.get("seq"), 0), _to_int(row.get("offset"), -1)))
+    pairs = sorted(p for p in pairs if p[0] > 0 and p[1] >= 0)
+    seqs = [p[0] for p in pairs]
+    offsets = [p[1] for p in pairs]
+    with _CACHE_GUARD:
+        _CACHE[key] = (sig, seqs, offsets)
+    return seqs, offsets
+
+
+def _checkpoint_holds(intents_path: Path, seq: int, offset: int) -> bool:
+    with intents_path.open("rb") as f:
+        f.seek(offset)
+        return _row_seq(f.readline()) == seq
+
+
+def seek_offset(project_id: str, agent_id: str, start_seq: int) -> int:
+    """Byte offset to start scanning from to see every intent with seq >= `start_seq`."""
+    flush_agent_writes(project_id, agent_id)
+    start_seq = _to_int(start_seq, 0)
+    if start_seq <= INDEX_STRIDE:
+        return 0
+    intents_path = _intents_path(project_id, agent_id)
+    if not intents_path.exists():
+        return 0
+    idx_path = _index_path(project_id, agent_id)
+    for attempt in range(2):
+        loaded = _load_checkpoints(idx_path)
+        if loaded is None:
+            rebuild_intent_offset_index(project_id, agent_id)
+            continue
+        seqs, offsets = loaded
+        i = bisect_right(seqs, start_seq) - 1
+        if i < 0:
+            return 0
+        if _checkpoint_holds(intents_path, seqs[i], offsets[i]):
+            return offsets[i]
+        if attempt == 0:
+            # Ledger was rewritten or a concurrent append skewed the offset.
+            rebuild_intent_offset_index(project_id, agent_id)
+    return 0
+
+
+def iter_intent_rows(project_id: str, agent_id: str, start_seq: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield ledger rows from the checkpoint covering `start_seq` onward (callers filter and stop)."""
+    flush_agent_writes(project_id, agent_id)
+    path = _intents_path(project_id, agent_id)
+    if not path.exists():
+        return
+    offset = seek_offset(project_id, agent_id, start_seq)
+    with path.open("rb") as f:
+        f.seek(offset)
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                yield row
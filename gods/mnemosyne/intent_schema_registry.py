@@ -1,12 +1,24 @@
-"""Intent payload schema registry and observed-variable collector."""
+"""Intent payload schema registry and observed-variable collector.
+
+Observed payload shapes are aggregated in process: `observe_intent_payload`
+only folds the payload into a per-project pending delta. Deltas are merged into
+`intent_payload_observed.json` (read-merge-atomic-replace) once the oldest one
+is `OBSERVED_FLUSH_SEC` old, at pulse end via `flush_observed_schema`, and at
+exit. Readers merge pending deltas over the on-disk snapshot.
+"""
 from __future__ import annotations
 
+import atexit
+import copy
 import json
+import os
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
+from gods.file_cache import FileCache
 from gods.mnemosyne.intent_registry import is_registered_intent_key
 from gods.paths import mnemosyne_dir
 
@@ -30,6 +42,11 @@ def observed_schema_path(project_id: str) -> Path:
     return _mn_root(project_id) / "intent_payload_observed.json"
 
 
+OBSERVED_FLUSH_SEC = 2.0
+
+_OBSERVED_CACHE = FileCache()
+
+
 def _read_observed(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
@@ -41,7 +58,10 @@ def _read_observed(path: Path) -> dict[str, Any]:
 
 
 def _write_observed(path: Path, data: dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+    _OBSERVED_CACHE.invalidate(path)
 
 
 def _type_name(v: Any) -> str:
@@ -62,40 +82,117 @@ def _type_name(v: Any) -> str:
     return type(v).__name__
 
 
-def observed_schema(project_id: str) -> dict[str, Any]:
-    return _read_observed(observed_schema_path(project_id))
-
-
-def observe_intent_payload(project_id: str, intent_key: str, payload: dict[str, Any] | None) -> None:
-    key = str(intent_key or "").strip()
-    if not key:
-        return
-    data = dict(payload or {})
-    path = observed_schema_path(project_id)
-    raw = _read_observed(path)
+def _merge_row(raw: dict[str, Any], key: str, delta: dict[str, Any]) -> None:
     row = raw.get(key)
     if not isinstance(row, dict):
         row = {"fields": {}, "count": 0, "updated_at": 0.0}
     fields = row.get("fields")
     if not isinstance(fields, dict):
         fields = {}
-    row["count"] = int(row.get("count", 0) or 0) + 1
-    row["updated_at"] = time.time()
-    for k, v in data.items():
-        fk = str(k).strip()
-        if not fk:
-            continue
+    row["count"] = int(row.get("count", 0) or 0) + int(delta["count"])
+    row["updated_at"] = max(float(row.get("updated_at", 0.0) or 0.0), float(delta["updated_at"]))
+    for fk, (types_seen, last_value) in delta["fields"].items():
         cur = fields.get(fk)
         if not isinstance(cur, dict):
             cur = {"types": [], "last_seen_value": ""}
         types = {str(x) for x in list(cur.get("types") or []) if str(x).strip()}
-        types.add(_type_name(v))
-        cur["types"] = sorted(types)
-        cur["last_seen_value"] = str(v)
+        cur["types"] = sorted(types | types_seen)
+        cur["last_seen_value"] = last_value
         fields[fk] = cur
     row["fields"] = fields
     raw[key] = row
-    _write_observed(path, raw)
+
+
+class _ObservedAggregator:
+    """Pending per-project deltas: intent_key -> {count, updated_at, fields: {name: (types, last_value)}}."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, dict[str, Any]]] = {}
+        self._first_at: dict[str, float] = {}
+        # Serializes read-merge-replace of one file across flushing threads.
+        self._flush_lock = threading.Lock()
+
+    def add(self, project_id: str, key: str, data: dict[str, Any]) -> bool:
+        """Fold one payload in; returns True when the project's deltas are due for a flush."""
+        now = time.time()
+        with self._lock:
+            rows = self._pending.setdefault(project_id, {})
+            first = self._first_at.setdefault(project_id, now)
+            delta = rows.get(key)
+            if delta is None:
+                delta = {"count": 0, "updated_at": 0.0, "fields": {}}
+                rows[key] = delta
+            delta["count"] += 1
+            delta["updated_at"] = now
+            fields = delta["fields"]
+            for k, v in data.items():
+                fk = str(k).strip()
+                if not fk:
+                    continue
+                hit = fields.get(fk)
+                types = hit[0] if hit is not None else set()
+                types.add(_type_name(v))
+                fields[fk] = (types, str(v))
+            return now - first >= OBSERVED_FLUSH_SEC
+
+    def pending(self, project_id: str) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            rows = self._pending.get(project_id) or {}
+            return {
+                key: {
+                    "count": d["count"],
+                    "updated_at": d["updated_at"],
+                    "fields": {fk: (set(t), v) for fk, (t, v) in d["fields"].items()},
+                }
+                for key, d in rows.items()
+            }
+
+    def flush(self, project_id: str) -> int:
+        with self._flush_lock:
+            with self._lock:
+                rows = self._pending.pop(project_id, None)
+                self._first_at.pop(project_id, None)
+            if not rows:
+                return 0
+            path = observed_schema_path(project_id)
+            raw = _read_observed(path)
+            for key, delta in rows.items():
+                _merge_row(raw, key, delta)
+            _write_observed(path, raw)
+            return len(rows)
+
+    def projects(self) -> list[str]:
+        with self._lock:
+            return list(self._pending)
+
+
+_AGGREGATOR = _ObservedAggregator()
+
+
+def observed_schema(project_id: str) -> dict[str, Any]:
+    path = observed_schema_path(project_id)
+    raw = copy.deepcopy(_OBSERVED_CACHE.get(path, lambda: _read_observed(path)))
+    for key, delta in _AGGREGATOR.pending(project_id).items():
+        _merge_row(raw, key, delta)
+    return raw
+
+
+def observe_intent_payload(project_id: str, intent_key: str, payload: dict[str, Any] | None) -> None:
+    key = str(intent_key or "").strip()
+    if not key:
+        return
+    if _AGGREGATOR.add(project_id, key, dict(payload or {})):
+        _AGGREGATOR.flush(project_id)
+
+
+def flush_observed_schema(project_id: str | None = None) -> int:
+    """Write pending observations to disk (one project, or all); returns intent keys merged."""
+    targets = [project_id] if project_id is not None else _AGGREGATOR.projects()
+    return sum(_AGGREGATOR.flush(pid) for pid in targets)
+
+
+atexit.register(flush_observed_schema)
 
 
 def schema_for_intent(intent_key: str) -> dict[str, list[str]]:
@@ -0,0 +1,217 @@
+"""Per-agent group-commit writer for the `record_intent` fan-out.
+
+Every intent lands in up to five append-only files. The intents ledger row is
+appended immediately together with its seq (see `seq_lease`); the derived
+lines (chronicle, chronicle index, runtime events, context index) are buffered
+per agent by `_AgentWriter` and committed as a group through long-lived append
+handles, one write per file per group.
+
+The commit point follows `memory_intent_durability`:
+
+- `intent`   commit at the end of every `record_intent` (default; same
+             visibility as unbuffered appends),
+- `pulse`    commit when the Angelia pulse ends or the agent goes idle,
+- `interval` commit once the oldest pending line is `memory_intent_flush_ms`
+             old, and at pulse end.
+
+Lines written by a commit have reached the OS (they survive a process crash,
+not a host crash). In-process readers of these files call `flush_agent_writes`
+first, so buffering never hides a row from the process that recorded it; other
+processes see derived rows at the commit point.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
+
+from gods.config import runtime_config
+
+_ALLOWED_DURABILITY = {"intent", "pulse", "interval"}
+_MAX_WRITERS = 256
+
+
+def _project(project_id: str):
+    return runtime_config.projects.get(project_id)
+
+
+def intent_durability(project_id: str) -> str:
+    proj = _project(project_id)
+    raw = str(getattr(proj, "memory_intent_durability", "intent") if proj else "intent").strip().lower()
+    return raw if raw in _ALLOWED_DURABILITY else "intent"
+
+
+def intent_flush_ms(project_id: str) -> int:
+    proj = _project(project_id)
+    v = int(getattr(proj, "memory_intent_flush_ms", 200) if proj else 200)
+    return max(10, min(v, 10000))
+
+
+class _AgentWriter:
+    def __init__(self, project_id: str, agent_id: str):
+        self.project_id = project_id
+        self.agent_id = agent_id
+        self.lock = threading.RLock()
+        self._pending: dict[Path, list[tuple[bytes, Callable[[int], None] | None]]] = {}
+        self._after_commit: dict[str, Callable[[], None]] = {}
+        self._first_pending_at = 0.0
+        self._handles: dict[Path, BinaryIO] = {}
+        # Files whose last commit failed mid-line; the next write first ends that torn line.
+        self._torn: set[Path] = set()
+
+    def stage(self, path: Path, text: str, on_offset: Callable[[int], None] | None = None):
+        with self.lock:
+            if not self._pending:
+                self._first_pending_at = time.time()
+            self._pending.setdefault(path, []).append((text.encode("utf-8"), on_offset))
+
+    def after_commit(self, key: str, fn: Callable[[], None]):
+        with self.lock:
+            self._after_commit[key] = fn
+
+    def due(self, flush_ms: int) -> bool:
+        with self.lock:
+            return bool(self._pending) and (time.time() - self._first_pending_at) * 1000.0 >= flush_ms
+
+    def _handle(self, path: Path) -> BinaryIO:
+        fh = self._handles.get(path)
+        if fh is not None:
+            try:
+                # Rotated/compacted/deleted files must not keep receiving writes on the old inode.
+                if os.stat(path).st_ino == os.fstat(fh.fileno()).st_ino:
+                    return fh
+            except FileNotFoundError:
+                pass
+            fh.close()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unbuffered: a failed write leaves nothing queued in a userspace buffer.
+        fh = path.open("ab", buffering=0)
+        self._handles[path] = fh
+        return fh
+
+    def _drop_handle(self, path: Path):
+        fh = self._handles.pop(path, None)
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                pass
+
+    def _write_path(
+        self, path: Path, items: list[tuple[bytes, Callable[[int], None] | None]]
+    ) -> tuple[int, OSError | None]:
+        """Append `items`; returns how many were fully written and the OSError that stopped it."""
+        try:
+            fh = self._handle(path)
+            if path in self._torn:
+                fh.write(b"\n")
+                self._torn.discard(path)
+            offset = os.fstat(fh.fileno()).st_size
+        except OSError as e:
+            self._drop_handle(path)
+            return 0, e
+        blob = memoryview(b"".join(data for data, _cb in items))
+        written = 0
+        err: OSError | None = None
+        try:
+            while written < len(blob):
+                written += fh.write(blob[written:]) or 0
+        except OSError as e:
+            self._drop_handle(path)
+            err = e
+        done, end = 0, 0
+        for data, cb in items:
+            if end + len(data) > written:
+                break
+            if cb is not None:
+                cb(offset + end)
+            end += len(data)
+            done += 1
+        if end < written:
+            self._torn.add(path)
+        return done, err
+
+    def commit(self):
+        """Write every pending line; on OSError unwritten lines stay pending and it re-raises.
+
+        After-commit hooks run only once all staged lines are on disk.
+        """
+        with self.lock:
+            for path in list(self._pending):
+                items = self._pending[path]
+                done, err = self._write_path(path, items)
+                if done >= len(items):
+                    del self._pending[path]
+                else:
+                    self._pending[path] = items[done:]
+                if err is not None:
+                    raise err
+            hooks, self._after_commit = self._after_commit, {}
+            for fn in hooks.values():
+                fn()
+
+    def close(self):
+        with self.lock:
+            try:
+                self.commit()
+            finally:
+                for fh in self._handles.values():
+                    fh.close()
+                self._handles.clear()
+
+
+_WRITERS: "OrderedDict[tuple[str, str], _AgentWriter]" = OrderedDict()
+_WRITERS_GUARD = threading.Lock()
+
+
+def agent_writer(project_id: str, agent_id: str) -> _AgentWriter:
+    key = (str(project_id), str(agent_id))
+    evicted: list[_AgentWriter] = []
+    with _WRITERS_GUARD:
+        w = _WRITERS.get(key)
+        if w is None:
+            w = _AgentWriter(*key)
+            _WRITERS[key] = w
+            while len(_WRITERS) > _MAX_WRITERS:
+                evicted.append(_WRITERS.popitem(last=False)[1])
+        else:
+            _WRITERS.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return w
+
+
+def commit_point(project_id: str, agent_id: str):
+    """Called after one intent was staged: commit now if the durability mode says so."""
+    w = agent_writer(project_id, agent_id)
+    mode = intent_durability(project_id)
+    if mode == "intent" or (mode == "interval" and w.due(intent_flush_ms(project_id))):
+        w.commit()
+
+
+def flush_agent_writes(project_id: str, agent_id: str | None = None):
+    """Commit pending lines (one agent, or every agent of the project)."""
+    with _WRITERS_GUARD:
+        targets = [
+            w
+            for (pid, aid), w in _WRITERS.items()
+            if pid == str(project_id) and (agent_id is None or aid == str(agent_id))
+        ]
+    for w in targets:
+        w.commit()
+
+
+def close_all_writers() -> dict[str, Any]:
+    with _WRITERS_GUARD:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for w in writers:
+        w.close()
+    return {"closed": len(writers)}
+
+
+atexit.register(close_all_writers)
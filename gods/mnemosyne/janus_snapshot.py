@@ -5,11 +5,15 @@ import fcntl
 import hashlib
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Any, Literal, TypedDict
 
 from gods.paths import mnemosyne_dir
+from gods.mnemosyne.intent_index import iter_intent_rows
+from gods.mnemosyne.intent_writer import flush_agent_writes
+from gods.mnemosyne.jsonl_tail import tail_jsonl
 
 
 CardKind = Literal["task", "event", "mailbox", "tool", "chronicle_summary", "policy", "derived"]
@@ -314,57 +318,44 @@ def build_cards_from_intents(
     to_intent_seq: int = 0,
     limit: int = 1000,
 ) -> list[ContextCard]:
-    path = _intents_path(project_id, agent_id)
-    if not path.exists():
-        return []
     min_seq = max(0, int(from_intent_seq or 0))
     max_seq = int(to_intent_seq or 0)
     rows: list[ContextCard] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
-            seq = _to_int(row.get("intent_seq"), 0)
-            if seq <= min_seq:
-                continue
-            if max_seq > 0 and seq > max_seq:
-                continue
-            key = str(row.get("intent_key", "") or "")
-            if not key:
-                continue
-            iid = str(row.get("intent_id", "") or "").strip() or f"{agent_id}:{seq}"
-            kind = _kind_from_intent(key)
-            payload = row.get("payload")
-            pld = payload if isinstance(payload, dict) else {}
-            anchor_seq = _to_int(pld.get("anchor_seq"), 0) if key == "llm.response" else 0
-            pulse_id = str(pld.get("pulse_id", "") or "").strip()
-            rows.append(
-                ContextCard(
-                    card_id=_card_id_for_row(row),
-                    kind=kind,
-                    text=_card_text_for_row(row),
-                    source_intent_ids=[iid],
-                    source_intent_seq_max=max(0, seq),
-                    derived_from_card_ids=[],
-                    supersedes_card_ids=[],
-                    compression_type="",
-                    meta={
-                        "intent_key": key,
-                        "source_kind": str(row.get("source_kind", "") or ""),
-                        "anchor_seq": int(anchor_seq),
-                        "pulse_id": pulse_id,
-                        "payload": dict(pld),
-                    },
-                    created_at=float(row.get("timestamp") or time.time()),
-                )
+    for row in iter_intent_rows(project_id, agent_id, min_seq + 1):
+        seq = _to_int(row.get("intent_seq"), 0)
+        if seq <= min_seq:
+            continue
+        if max_seq > 0 and seq > max_seq:
+            break
+        key = str(row.get("intent_key", "") or "")
+        if not key:
+            continue
+        iid = str(row.get("intent_id", "") or "").strip() or f"{agent_id}:{seq}"
+        kind = _kind_from_intent(key)
+        payload = row.get("payload")
+        pld = payload if isinstance(payload, dict) else {}
+        anchor_seq = _to_int(pld.get("anchor_seq"), 0) if key == "llm.response" else 0
+        pulse_id = str(pld.get("pulse_id", "") or "").strip()
+        rows.append(
+            ContextCard(
+                card_id=_card_id_for_row(row),
+                kind=kind,
+                text=_card_text_for_row(row),
+                source_intent_ids=[iid],
+                source_intent_seq_max=max(0, seq),
+                derived_from_card_ids=[],
+                supersedes_card_ids=[],
+                compression_type="",
+                meta={
+                    "intent_key": key,
+                    "source_kind": str(row.get("source_kind", "") or ""),
+                    "anchor_seq": int(anchor_seq),
+                    "pulse_id": pulse_id,
+                    "payload": dict(pld),
+                },
+                created_at=float(row.get("timestamp") or time.time()),
             )
+        )
     if limit > 0:
         rows = rows[-max(1, min(int(limit), 20000)) :]
     return rows
@@ -434,6 +425,7 @@ def build_cards_from_intent_views(
     - long view: chronicle_index rows with source_intent_seq <= split_intent_seq
     - short view: context_index rows with source_intent_seq > split_intent_seq
     """
+    flush_agent_writes(project_id, agent_id)
     split_seq = max(0, int(split_intent_seq or 0))
     max_seq = int(to_intent_seq or 0)
     out: list[ContextCard] = []
@@ -489,26 +481,85 @@ def build_cards_from_intent_views(
     return out
 
 
+# Sequence head per intent ledger: path -> (inode, size, mtime_ns, consumed_end, max_seq).
+# A matching stat() answers directly; growth is read incrementally from `consumed_end`.
+_SEQ_HEADS: dict[str, tuple[int, int, int, int, int]] = {}
+_SEQ_HEADS_GUARD = threading.Lock()
+_SEQ_TAIL_CHUNK = 64 * 1024
+
+
+def _max_seq_in_lines(lines: list[bytes]) -> tuple[int, bool]:
+    last = 0
+    found = False
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except Exception:
+            continue
+        if not isinstance(row, dict) or "intent_seq" not in row:
+            continue
+        found = True
+        seq = _to_int(row.get("intent_seq"), 0)
+        if seq > last:
+            last = seq
+    return last, found
+
+
+def _scan_intent_seq_range(path: Path, start: int, end: int) -> tuple[int, int]:
+    """Max seq over complete lines in [start, end); returns (seq, offset after last newline)."""
+    with path.open("rb") as f:
+        f.seek(start)
+        data = f.read(max(0, end - start))
+    cut = data.rfind(b"\n")
+    if cut < 0:
+        return 0, start
+    seq, _found = _max_seq_in_lines(data[: cut + 1].split(b"\n"))
+    return seq, start + cut + 1
+
+
+def _tail_intent_seq(path: Path, size: int) -> tuple[int, int]:
+    """Reverse tail read: widen a window back from `size` until it holds a row carrying `intent_seq`."""
+    window = _SEQ_TAIL_CHUNK
+    with path.open("rb") as f:
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            data = f.read(size - start)
+            cut = data.rfind(b"\n")
+            body = data[: cut + 1] if cut >= 0 else b""
+            if start > 0:
+                # The first line of the window may be cut mid-row.
+                nl = body.find(b"\n")
+                body = body[nl + 1 :] if nl >= 0 else b""
+            seq, found = _max_seq_in_lines(body.split(b"\n"))
+            if found or start == 0:
+                return seq, (start + cut + 1 if cut >= 0 else start)
+            window *= 4
+
+
 def latest_intent_seq(project_id: str, agent_id: str) -> int:
+    flush_agent_writes(project_id, agent_id)
     path = _intents_path(project_id, agent_id)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return 0
-    last = 0
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
-            seq = _to_int(row.get("intent_seq"), 0)
-            if seq > last:
-                last = seq
-    return int(last)
+    key = str(path)
+    with _SEQ_HEADS_GUARD:
+        head = _SEQ_HEADS.get(key)
+    if head is not None and head[:3] == (st.st_ino, st.st_size, st.st_mtime_ns):
+        return head[4]
+    if head is not None and head[0] == st.st_ino and st.st_size >= head[3]:
+        delta, end = _scan_intent_seq_range(path, head[3], st.st_size)
+        seq = max(head[4], delta)
+    else:
+        seq, end = _tail_intent_seq(path, st.st_size)
+    with _SEQ_HEADS_GUARD:
+        _SEQ_HEADS[key] = (st.st_ino, st.st_size, st.st_mtime_ns, end, seq)
+    return int(seq)
 
 
 def record_snapshot_compression(project_id: str, agent_id: str, row: dict[str, Any]) -> dict[str, Any]:
@@ -525,23 +576,9 @@ def record_snapshot_compression(project_id: str, agent_id: str, row: dict[str, A
 
 def list_snapshot_compressions(project_id: str, agent_id: str, limit: int = 50) -> list[dict[str, Any]]:
     path = _compression_log_path(project_id, agent_id)
-    if not path.exists():
-        return []
-    out: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(row, dict):
-                out.append(row)
     if limit <= 0:
         return []
-    return out[-max(1, min(int(limit), 5000)) :]
+    return tail_jsonl(path, max(1, min(int(limit), 5000)))
 
 
 def _record_derived_rows(project_id: str, agent_id: str, compression_row: dict[str, Any]) -> None:
@@ -574,20 +611,6 @@ def _record_derived_rows(project_id: str, agent_id: str, compression_row: dict[s
 
 def list_derived_cards(project_id: str, agent_id: str, limit: int = 100) -> list[dict[str, Any]]:
     path = _derived_log_path(project_id, agent_id)
-    if not path.exists():
-        return []
-    out: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if isinstance(row, dict):
-                out.append(row)
     if limit <= 0:
         return []
-    return out[-max(1, min(int(limit), 10000)) :]
+    return tail_jsonl(path, max(1, min(int(limit), 10000)))
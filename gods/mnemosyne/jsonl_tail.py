@@ -0,0 +1,69 @@
+"""Reverse JSONL reader for last-N queries over append-only Mnemosyne logs.
+
+Reads backward from EOF in fixed-size blocks and decodes only complete lines,
+so the cost of `tail_jsonl(path, n)` is bounded by the bytes of the last `n`
+rows rather than the file length. Blank, torn, or non-object lines are skipped
+the same way the forward readers skip them.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+BLOCK_SIZE = 64 * 1024
+
+
+def _parse(raw: bytes) -> dict[str, Any] | None:
+    line = raw.strip()
+    if not line:
+        return None
+    try:
+        row = json.loads(line)
+    except Exception:
+        return None
+    return row if isinstance(row, dict) else None
+
+
+def iter_jsonl_reverse(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[dict[str, Any]]:
+    """Yield object rows newest-first."""
+    try:
+        f = path.open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        pos = f.seek(0, 2)
+        carry = b""
+        while pos > 0:
+            step = min(max(1, int(block_size)), pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + carry).split(b"\n")
+            # lines[0] may start mid-row; keep it until the previous block completes it.
+            carry = lines[0]
+            for raw in reversed(lines[1:]):
+                row = _parse(raw)
+                if row is not None:
+                    yield row
+        row = _parse(carry)
+        if row is not None:
+            yield row
+
+
+def tail_jsonl(path: Path, limit: int, block_size: int = BLOCK_SIZE) -> list[dict[str, Any]]:
+    """Last `limit` object rows, in file order."""
+    if limit <= 0:
+        return []
+    out: list[dict[str, Any]] = []
+    for row in iter_jsonl_reverse(path, block_size=block_size):
+        out.append(row)
+        if len(out) >= limit:
+            break
+    out.reverse()
+    return out
+
+
+def last_jsonl_row(path: Path) -> dict[str, Any] | None:
+    for row in iter_jsonl_reverse(path):
+        return row
+    return None
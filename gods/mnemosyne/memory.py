@@ -2,13 +2,11 @@
 from __future__ import annotations
 
 import json
-import os
 import re
 import time
-import fcntl
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from gods.mnemosyne.contracts import MemoryDecision, MemoryIntent, MemorySinkPolicy
 from gods.mnemosyne.policy_registry import (
@@ -16,12 +14,15 @@ from gods.mnemosyne.policy_registry import (
     ensure_intent_policy_rule,
     ensure_memory_policy,
     load_memory_policy as _load_strict_policy,
+    policy_rule,
 )
 from gods.mnemosyne.intent_schema_registry import observe_intent_payload, validate_intent_contract
 from gods.paths import mnemosyne_dir
-from gods.mnemosyne.compaction import ensure_compacted
-from gods.mnemosyne.context_index import append_context_index_entry
-from gods.mnemosyne.chronicle_index import append_chronicle_index_entry
+from gods.mnemosyne.compaction import schedule_compaction
+from gods.mnemosyne.intent_index import iter_intent_rows, note_intent_offset
+from gods.mnemosyne.intent_writer import agent_writer, commit_point
+from gods.mnemosyne.jsonl_tail import iter_jsonl_reverse
+from gods.mnemosyne.seq_lease import append_with_seqs
 
 
 def _mn_root(project_id: str) -> Path:
@@ -58,6 +59,18 @@ def _chronicle_path(project_id: str, agent_id: str) -> Path:
     return p
 
 
+def _chronicle_index_path(project_id: str, agent_id: str) -> Path:
+    p = _mn_root(project_id) / "chronicle_index" / f"{agent_id}.jsonl"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def _context_index_path(project_id: str, agent_id: str) -> Path:
+    p = _mn_root(project_id) / "context_index" / f"{agent_id}.jsonl"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    return p
+
+
 def load_memory_policy(project_id: str) -> dict[str, Any]:
     # Strict typed policy: no default fallback.
     ensure_memory_policy(project_id)
@@ -68,20 +81,38 @@ def _append_chronicle(project_id: str, agent_id: str, text: str):
     path = _chronicle_path(project_id, agent_id)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     entry = f"\n### 📖 Entry [{timestamp}]\n{text or ''}\n\n---\n"
-    with path.open("a", encoding="utf-8") as f:
-        f.write(entry)
+    agent_writer(project_id, agent_id).stage(path, entry)
+
+
+def _append_jsonl(project_id: str, agent_id: str, path: Path, row: dict[str, Any]):
+    agent_writer(project_id, agent_id).stage(path, json.dumps(dict(row or {}), ensure_ascii=False) + "\n")
 
 
 def _append_runtime_event(project_id: str, agent_id: str, row: dict[str, Any]):
-    path = _runtime_events_path(project_id, agent_id)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    _append_jsonl(project_id, agent_id, _runtime_events_path(project_id, agent_id), row)
 
 
-def _append_intent(project_id: str, agent_id: str, row: dict[str, Any]):
-    path = _intents_path(project_id, agent_id)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+def _append_intent(project_id: str, agent_id: str, build_row: Callable[[int], dict[str, Any]]) -> dict[str, Any]:
+    """Allocate the next intent seq and append `build_row(seq)` under the ledger's seq lock.
+
+    The ledger row bypasses the group-commit writer: other processes append to the
+    same ledger, and file order must stay seq order.
+    """
+    built: list[dict[str, Any]] = []
+
+    def _render(seq: int) -> bytes:
+        built.append(build_row(seq))
+        return (json.dumps(built[0], ensure_ascii=False) + "\n").encode("utf-8")
+
+    append_with_seqs(
+        _intent_seq_path(project_id, agent_id),
+        _intents_path(project_id, agent_id),
+        1,
+        _render,
+        floor=lambda: _tail_max_intent_seq(project_id, agent_id),
+        on_append=lambda seq, offset: note_intent_offset(project_id, agent_id, seq, offset),
+    )
+    return built[0]
 
 
 def _scan_max_intent_seq(project_id: str, agent_id: str) -> int:
@@ -113,79 +144,53 @@ def _scan_max_intent_seq(project_id: str, agent_id: str) -> int:
     return max(max_seq, rows)
 
 def fetch_intents_between(project_id: str, agent_id: str, start_seq: int, end_seq: int) -> list[MemoryIntent]:
-    path = _intents_path(project_id, agent_id)
-    if not path.exists() or start_seq > end_seq:
+    if start_seq > end_seq:
         return []
     out = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
+    for row in iter_intent_rows(project_id, agent_id, start_seq):
+        try:
+            seq = int(row.get("intent_seq", 0) or 0)
+        except Exception:
+            continue
+        if start_seq <= seq <= end_seq:
             try:
-                seq = int(row.get("intent_seq", 0) or 0)
+                intent = MemoryIntent(
+                    intent_key=str(row.get("intent_key", "") or ""),
+                    project_id=str(row.get("project_id", "") or ""),
+                    agent_id=str(row.get("agent_id", "") or ""),
+                    source_kind=str(row.get("source_kind", "") or ""),
+                    payload=row.get("payload", {}) or {},
+                    fallback_text=str(row.get("fallback_text", "") or ""),
+                    timestamp=float(row.get("timestamp") or time.time()),
+                )
+                setattr(intent, "intent_seq", seq)
+                setattr(intent, "intent_id", str(row.get("intent_id", "") or ""))
+                out.append(intent)
             except Exception:
                 continue
-            if start_seq <= seq <= end_seq:
-                try:
-                    intent = MemoryIntent(
-                        intent_key=str(row.get("intent_key", "") or ""),
-                        project_id=str(row.get("project_id", "") or ""),
-                        agent_id=str(row.get("agent_id", "") or ""),
-                        source_kind=str(row.get("source_kind", "") or ""),
-                        payload=row.get("payload", {}) or {},
-                        fallback_text=str(row.get("fallback_text", "") or ""),
-                        timestamp=float(row.get("timestamp") or time.time()),
-                    )
-                    setattr(intent, "intent_seq", seq)
-                    setattr(intent, "intent_id", str(row.get("intent_id", "") or ""))
-                    out.append(intent)
-                except Exception:
-                    continue
-            if seq > end_seq:
-                break
+        if seq > end_seq:
+            break
     return out
 
 
 
-def _next_intent_seq(project_id: str, agent_id: str) -> int:
-    path = _intent_seq_path(project_id, agent_id)
-    with path.open("a+", encoding="utf-8") as f:
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+def _tail_max_intent_seq(project_id: str, agent_id: str) -> int:
+    """Highest persisted intent seq, read from the ledger tail (full scan only for seq-less legacy files)."""
+    path = _intents_path(project_id, agent_id)
+    for row in iter_jsonl_reverse(path):
         try:
-            f.seek(0)
-            raw = str(f.read() or "").strip()
-            try:
-                current = int(raw)
-            except Exception:
-                current = 0
-            if current <= 0:
-                current = _scan_max_intent_seq(project_id, agent_id)
-            nxt = max(1, current + 1)
-            f.seek(0)
-            f.truncate()
-            f.write(str(nxt))
-            f.flush()
-            os.fsync(f.fileno())
-            return nxt
-        finally:
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return int(row.get("intent_seq"))
+        except Exception:
+            continue
+    return _scan_max_intent_seq(project_id, agent_id) if path.exists() else 0
 
 
 def _resolve_policy(intent: MemoryIntent) -> MemorySinkPolicy:
-    policy = load_memory_policy(intent.project_id)
     key = str(intent.intent_key or "").strip()
-    rule = policy.get(key)
+    rule = policy_rule(intent.project_id, key)
     if not isinstance(rule, dict):
-        rule = ensure_intent_policy_rule(intent.project_id, key)
-        policy = load_memory_policy(intent.project_id)
-        rule = policy.get(key)
+        ensure_intent_policy_rule(intent.project_id, key)
+        rule = policy_rule(intent.project_id, key)
     if not isinstance(rule, dict):
         raise MemoryPolicyMissingError(f"no memory policy for intent_key='{key}' in project={intent.project_id}")
     tpl_chronicle = str(rule.get("chronicle_template_key", "") or "").strip()
@@ -274,10 +279,15 @@ def _render_intent_for_llm_context(intent: MemoryIntent) -> str | None:
         return None
 
 
+def _compact_quietly(project_id: str, agent_id: str):
+    try:
+        schedule_compaction(project_id, agent_id)
+    except Exception:
+        pass
+
+
 def _persist_intent(intent: MemoryIntent) -> dict[str, Any]:
     ts = float(intent.timestamp or time.time())
-    intent_seq = _next_intent_seq(intent.project_id, intent.agent_id)
-    intent_id = f"{intent.agent_id}:{intent_seq}"
     validate_intent_contract(intent.intent_key, intent.source_kind, intent.payload or {})
     observe_intent_payload(intent.project_id, intent.intent_key, intent.payload or {})
     sink = _resolve_policy(intent)
@@ -290,12 +300,41 @@ def _persist_intent(intent: MemoryIntent) -> dict[str, Any]:
 
     llm_context_rendered = _render_intent_for_llm_context(intent)
 
+    # Single source-of-truth persistence for memory pipeline: raw intent ledger.
+    # The seq is allocated together with this append; derived rows below reuse it.
+    ledger_row = _append_intent(
+        intent.project_id,
+        intent.agent_id,
+        lambda seq: {
+            "timestamp": ts,
+            "intent_key": str(intent.intent_key or ""),
+            "project_id": str(intent.project_id or ""),
+            "agent_id": str(intent.agent_id or ""),
+            "intent_seq": seq,
+            "intent_id": f"{intent.agent_id}:{seq}",
+            "source_kind": str(intent.source_kind or ""),
+            "payload": dict(intent.payload or {}),
+            "fallback_text": str(intent.fallback_text or ""),
+            "policy": {
+                "to_chronicle": sink.to_chronicle,
+                "to_runtime_log": sink.to_runtime_log,
+                "to_llm_context": sink.to_llm_context,
+                "chronicle_template_key": sink.chronicle_template_key,
+                "runtime_log_template_key": sink.runtime_log_template_key,
+                "llm_context_template_key": sink.llm_context_template_key,
+            },
+        },
+    )
+    intent_seq = int(ledger_row["intent_seq"])
+    intent_id = str(ledger_row["intent_id"])
+
     chronicle_written = False
     if sink.to_chronicle and str(chronicle_text or "").strip():
         _append_chronicle(intent.project_id, intent.agent_id, chronicle_text)
-        append_chronicle_index_entry(
+        _append_jsonl(
             intent.project_id,
             intent.agent_id,
+            _chronicle_index_path(intent.project_id, intent.agent_id),
             {
                 "timestamp": ts,
                 "intent_key": str(intent.intent_key or ""),
@@ -305,10 +344,10 @@ def _persist_intent(intent: MemoryIntent) -> dict[str, Any]:
                 "rendered": str(chronicle_text or ""),
             },
         )
-        try:
-            ensure_compacted(intent.project_id, intent.agent_id)
-        except Exception:
-            pass
+        # Token check is incremental; compaction itself runs on the background pool.
+        agent_writer(intent.project_id, intent.agent_id).after_commit(
+            "compact", lambda: _compact_quietly(intent.project_id, intent.agent_id)
+        )
         chronicle_written = True
 
     runtime_written = False
@@ -336,36 +375,12 @@ def _persist_intent(intent: MemoryIntent) -> dict[str, Any]:
         )
         runtime_written = True
 
-    # Single source-of-truth persistence for memory pipeline: raw intent ledger.
-    _append_intent(
-        intent.project_id,
-        intent.agent_id,
-        {
-            "timestamp": ts,
-            "intent_key": str(intent.intent_key or ""),
-            "project_id": str(intent.project_id or ""),
-            "agent_id": str(intent.agent_id or ""),
-            "intent_seq": intent_seq,
-            "intent_id": intent_id,
-            "source_kind": str(intent.source_kind or ""),
-            "payload": dict(intent.payload or {}),
-            "fallback_text": str(intent.fallback_text or ""),
-            "policy": {
-                "to_chronicle": sink.to_chronicle,
-                "to_runtime_log": sink.to_runtime_log,
-                "to_llm_context": sink.to_llm_context,
-                "chronicle_template_key": sink.chronicle_template_key,
-                "runtime_log_template_key": sink.runtime_log_template_key,
-                "llm_context_template_key": sink.llm_context_template_key,
-            },
-        },
-    )
-
     # Derived context index (rebuildable): Janus/Chaos read path.
     if llm_context_rendered:
-        append_context_index_entry(
+        _append_jsonl(
             intent.project_id,
             intent.agent_id,
+            _context_index_path(intent.project_id, intent.agent_id),
             {
                 "timestamp": ts,
                 "intent_key": str(intent.intent_key or ""),
@@ -376,6 +391,8 @@ def _persist_intent(intent: MemoryIntent) -> dict[str, Any]:
             },
         )
 
+    commit_point(intent.project_id, intent.agent_id)
+
     decision = MemoryDecision(
         intent_key=intent.intent_key,
         chronicle_written=chronicle_written,
@@ -5,10 +5,15 @@ import json
 from pathlib import Path
 from typing import Any
 
+from gods.file_cache import FileCache
 from gods.mnemosyne.intent_registry import tool_intent_names, registered_intent_keys, is_registered_intent_key
 from gods.mnemosyne.template_registry import ensure_memory_templates, list_memory_templates
 from gods.paths import mnemosyne_dir
 
+# Normalized policy per file, and the file versions `ensure_memory_policy` already migrated.
+_POLICY_CACHE = FileCache()
+_ENSURED_CACHE = FileCache()
+
 
 class MemoryPolicyMissingError(RuntimeError):
     """Raised when an intent key has no strict policy entry."""
@@ -116,6 +121,15 @@ def _load_raw_policy(path: Path, *, project_id: str) -> dict[str, Any]:
     return raw
 
 
+def _write_policy(path: Path, raw: dict[str, Any], *, ensured: bool) -> None:
+    path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+    _POLICY_CACHE.invalidate(path)
+    if ensured:
+        _ENSURED_CACHE.put(path, True)
+    else:
+        _ENSURED_CACHE.invalidate(path)
+
+
 def _normalize_rule(rule: dict[str, Any], *, intent_key: str, project_id: str) -> dict[str, Any]:
     unknown_fields = sorted(set(rule.keys()) - _RULE_KEYS)
     if unknown_fields:
@@ -137,12 +151,14 @@ def ensure_memory_policy(project_id: str) -> Path:
     from gods.mnemosyne.template_registry import ensure_memory_templates
     ensure_memory_templates(project_id)
     path = policy_path(project_id)
+    if _ENSURED_CACHE.peek(path):
+        return path
     path.parent.mkdir(parents=True, exist_ok=True)
     
     default_payload = default_memory_policy()
     
     if not path.exists():
-        path.write_text(json.dumps(default_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_policy(path, default_payload, ensured=True)
         return path
 
     raw = _load_raw_policy(path, project_id=project_id)
@@ -172,7 +188,9 @@ def ensure_memory_policy(project_id: str) -> Path:
                 raw[k] = normalized
                 changed = True
     if changed:
-        path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_policy(path, raw, ensured=True)
+    else:
+        _ENSURED_CACHE.put(path, True)
     return path
 
 
@@ -187,25 +205,39 @@ def ensure_intent_policy_rule(project_id: str, intent_key: str) -> dict[str, Any
         # Weak-mode: allow dynamic intent keys and auto-seed default rule.
         rule = default_intent_rule(key)
         raw[key] = rule
-        path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_policy(path, raw, ensured=True)
     if not isinstance(rule, dict):
         raise MemoryPolicyMissingError(f"memory policy key must be object for '{key}' in project={project_id}")
     return _normalize_rule(rule, intent_key=key, project_id=project_id)
 
 
-def load_memory_policy(project_id: str, *, ensure_exists: bool = True) -> dict[str, dict[str, Any]]:
+def _cached_policy(project_id: str, *, ensure_exists: bool) -> dict[str, dict[str, Any]]:
     if ensure_exists:
         ensure_memory_policy(project_id)
     path = policy_path(project_id)
     if not path.exists():
         return {}
-    raw = _load_raw_policy(path, project_id=project_id)
-    out: dict[str, dict[str, Any]] = {}
-    for key, rule in raw.items():
-        if not isinstance(rule, dict):
-            continue
-        out[str(key)] = _normalize_rule(rule, intent_key=str(key), project_id=project_id)
-    return out
+
+    def _build() -> dict[str, dict[str, Any]]:
+        raw = _load_raw_policy(path, project_id=project_id)
+        out: dict[str, dict[str, Any]] = {}
+        for key, rule in raw.items():
+            if not isinstance(rule, dict):
+                continue
+            out[str(key)] = _normalize_rule(rule, intent_key=str(key), project_id=project_id)
+        return out
+
+    return _POLICY_CACHE.get(path, _build)
+
+
+def load_memory_policy(project_id: str, *, ensure_exists: bool = True) -> dict[str, dict[str, Any]]:
+    return {k: dict(v) for k, v in _cached_policy(project_id, ensure_exists=ensure_exists).items()}
+
+
+def policy_rule(project_id: str, intent_key: str) -> dict[str, Any] | None:
+    """One normalized rule from the cached policy (None when the key has no rule yet)."""
+    rule = _cached_policy(project_id, ensure_exists=True).get(str(intent_key or "").strip())
+    return dict(rule) if rule is not None else None
 
 
 def validate_memory_policy(project_id: str, *, ensure_exists: bool = True) -> dict[str, Any]:
@@ -225,7 +257,7 @@ def validate_memory_policy(project_id: str, *, ensure_exists: bool = True) -> di
             raw[k] = default_intent_rule(k)
             changed = True
         if changed:
-            path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+            _write_policy(path, raw, ensured=False)
         policy = load_memory_policy(project_id, ensure_exists=False)
         missing = [k for k in required if k not in policy]
 
@@ -297,5 +329,5 @@ def upsert_policy_rule(
     if llm_context_template_key is not None:
         normalized["llm_context_template_key"] = str(llm_context_template_key or "").strip()
     raw[key] = normalized
-    path.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_policy(path, raw, ensured=True)
     return normalized
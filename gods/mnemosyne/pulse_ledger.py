@@ -1,15 +1,32 @@
-"""PulseLedger: append-only pulse event source of truth."""
+"""PulseLedger: append-only pulse event source of truth.
+
+Storage is segmented per agent under `pulse_ledger/<agent>/`: rows are appended
+to one active segment, which is sealed once it reaches
+`memory_pulse_segment_kb` and optionally gzip-compressed
+(`memory_pulse_segment_compress`). `manifest.json` records every segment with
+its seq and timestamp range, so `from_seq` / `since_ts` / tail-limit queries
+open only the segments they need. A legacy single-file ledger is split into
+segments on first access.
+"""
 from __future__ import annotations
 
+import contextlib
+import copy
+import gzip
 import json
 import logging
 import os
 import fcntl
+import shutil
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal, TypedDict
+from typing import Any, Iterator, Literal, TypedDict
 
+from gods.config import runtime_config
+from gods.file_cache import FileCache
+from gods.mnemosyne.jsonl_tail import iter_jsonl_reverse
+from gods.mnemosyne.seq_lease import note_appended, reserve_seqs
 from gods.paths import mnemosyne_dir
 
 logger = logging.getLogger(__name__)
@@ -70,36 +87,254 @@ _KIND_ORDER: dict[str, int] = {
 }
 
 
-def _ledger_path(project_id: str, agent_id: str) -> Path:
-    p = mnemosyne_dir(project_id) / "pulse_ledger" / f"{agent_id}.jsonl"
-    p.parent.mkdir(parents=True, exist_ok=True)
+def _ledger_dir(project_id: str, agent_id: str) -> Path:
+    p = mnemosyne_dir(project_id) / "pulse_ledger" / str(agent_id)
+    p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+def _legacy_ledger_path(project_id: str, agent_id: str) -> Path:
+    return mnemosyne_dir(project_id) / "pulse_ledger" / f"{agent_id}.jsonl"
+
+
+def _project(project_id: str):
+    return runtime_config.projects.get(project_id)
+
+
+def segment_max_bytes(project_id: str) -> int:
+    proj = _project(project_id)
+    kb = int(getattr(proj, "memory_pulse_segment_kb", 4096) if proj else 4096)
+    return max(64, min(kb, 1048576)) * 1024
+
+
+def segment_compress(project_id: str) -> str:
+    proj = _project(project_id)
+    raw = str(getattr(proj, "memory_pulse_segment_compress", "gzip") if proj else "gzip").strip().lower()
+    return raw if raw in {"none", "gzip"} else "gzip"
+
+
+_MANIFESTS = FileCache()
+
+
+def _manifest_path(ledger_dir: Path) -> Path:
+    return ledger_dir / "manifest.json"
+
+
+@contextlib.contextmanager
+def _ledger_lock(ledger_dir: Path):
+    with (ledger_dir / ".lock").open("a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _read_manifest(ledger_dir: Path) -> dict[str, Any] | None:
+    path = _manifest_path(ledger_dir)
+
+    def build() -> dict[str, Any] | None:
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if not isinstance(raw, dict) or not isinstance(raw.get("segments"), list):
+            return None
+        return raw
+
+    return _MANIFESTS.get(path, build)
+
+
+def _save_manifest(ledger_dir: Path, manifest: dict[str, Any]) -> None:
+    path = _manifest_path(ledger_dir)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+    _MANIFESTS.invalidate(path)
+
+
+def _segment_name(index: int) -> str:
+    return f"{int(index):08d}.jsonl"
+
+
+def _open_segment(ledger_dir: Path, name: str):
+    path = ledger_dir / name
+    try:
+        if name.endswith(".gz"):
+            return gzip.open(path, "rt", encoding="utf-8")
+        return path.open("r", encoding="utf-8")
+    except FileNotFoundError:
+        if name.endswith(".gz"):
+            raise
+    # Compressed concurrently: the manifest we hold still names the plain file.
+    return gzip.open(ledger_dir / f"{name}.gz", "rt", encoding="utf-8")
+
+
+def _iter_segment(ledger_dir: Path, name: str) -> Iterator[dict[str, Any]]:
+    try:
+        f = _open_segment(ledger_dir, name)
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                yield row
+
+
+def _segment_stats(ledger_dir: Path, name: str) -> dict[str, Any]:
+    seqs: list[int] = []
+    tss: list[float] = []
+    for row in _iter_segment(ledger_dir, name):
+        try:
+            seqs.append(int(row.get("seq", 0) or 0))
+            tss.append(float(row.get("ts", 0.0) or 0.0))
+        except Exception:
+            continue
+    return {
+        "first_seq": min(seqs) if seqs else 0,
+        "last_seq": max(seqs) if seqs else 0,
+        "first_ts": min(tss) if tss else 0.0,
+        "last_ts": max(tss) if tss else 0.0,
+        "rows": len(seqs),
+    }
+
+
+def _seal_segment(ledger_dir: Path, manifest: dict[str, Any], seg: dict[str, Any]) -> None:
+    """Freeze `seg` with its ranges and open the next active segment (caller holds the lock)."""
+    seg.update(_segment_stats(ledger_dir, seg["name"]))
+    seg["bytes"] = (ledger_dir / seg["name"]).stat().st_size
+    seg["sealed"] = True
+    nxt = int(manifest.get("next_index", 1) or 1)
+    manifest["next_index"] = nxt + 1
+    manifest["segments"].append({"name": _segment_name(nxt), "sealed": False})
+
+
+def _compress_segment(ledger_dir: Path, name: str) -> None:
+    """gzip one sealed segment outside the append lock, then swap the manifest entry."""
+    src = ledger_dir / name
+    dst = ledger_dir / f"{name}.gz"
+    tmp = ledger_dir / f"{name}.gz.tmp"
+    try:
+        with src.open("rb") as fin, gzip.open(tmp, "wb") as fout:
+            shutil.copyfileobj(fin, fout)
+    except FileNotFoundError:
+        return
+    tmp.replace(dst)
+    with _ledger_lock(ledger_dir):
+        manifest = copy.deepcopy(_read_manifest(ledger_dir))
+        if manifest is None:
+            return
+        for seg in manifest["segments"]:
+            if seg.get("name") == name:
+                seg["name"] = dst.name
+                seg["compressed"] = "gzip"
+        _save_manifest(ledger_dir, manifest)
+    src.unlink(missing_ok=True)
+
+
+def _migrate_legacy(project_id: str, agent_id: str, ledger_dir: Path) -> tuple[dict[str, Any], list[str]]:
+    """Split a pre-segmentation `<agent>.jsonl` into segments (caller holds the lock)."""
+    manifest: dict[str, Any] = {"version": 1, "next_index": 2, "segments": [{"name": _segment_name(1), "sealed": False}]}
+    legacy = _legacy_ledger_path(project_id, agent_id)
+    if not legacy.is_file():
+        return manifest, []
+    limit = segment_max_bytes(project_id)
+    sealed: list[str] = []
+    out = (ledger_dir / _segment_name(1)).open("wb")
+    try:
+        with legacy.open("rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    raw += b"\n"
+                out.write(raw)
+                if out.tell() >= limit:
+                    out.close()
+                    seg = manifest["segments"][-1]
+                    _seal_segment(ledger_dir, manifest, seg)
+                    sealed.append(seg["name"])
+                    out = (ledger_dir / manifest["segments"][-1]["name"]).open("wb")
+    finally:
+        out.close()
+    return manifest, sealed
+
+
+def _manifest_for(project_id: str, agent_id: str, ledger_dir: Path) -> dict[str, Any]:
+    manifest = _read_manifest(ledger_dir)
+    if manifest is not None:
+        return manifest
+    with _ledger_lock(ledger_dir):
+        manifest = _read_manifest(ledger_dir)
+        if manifest is not None:
+            return manifest
+        manifest, sealed = _migrate_legacy(project_id, agent_id, ledger_dir)
+        _save_manifest(ledger_dir, manifest)
+        # Only drop the legacy file once the manifest naming its segments is durable.
+        _legacy_ledger_path(project_id, agent_id).unlink(missing_ok=True)
+    if segment_compress(project_id) == "gzip":
+        for name in sealed:
+            _compress_segment(ledger_dir, name)
+    return _read_manifest(ledger_dir) or manifest
+
+
+def _write_rows(project_id: str, agent_id: str, rows: list[PulseLedgerEntry]) -> None:
+    """Assign seqs to `rows` and append them; both happen under the ledger lock."""
+    ledger_dir = _ledger_dir(project_id, agent_id)
+    _manifest_for(project_id, agent_id, ledger_dir)
+    sealed_name = ""
+    with _ledger_lock(ledger_dir):
+        manifest = _read_manifest(ledger_dir)
+        active = manifest["segments"][-1]
+        path = ledger_dir / active["name"]
+        start = reserve_seqs(
+            _seq_path(project_id, agent_id),
+            path,
+            len(rows),
+            floor=lambda: _tail_max_seq(ledger_dir, manifest["segments"]),
+        )
+        for i, row in enumerate(rows):
+            row["seq"] = int(start + i)
+        data = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(data)
+            size = f.tell()
+        note_appended(path, start + len(rows) - 1)
+        if size >= segment_max_bytes(project_id):
+            manifest = copy.deepcopy(manifest)
+            seg = manifest["segments"][-1]
+            _seal_segment(ledger_dir, manifest, seg)
+            _save_manifest(ledger_dir, manifest)
+            sealed_name = seg["name"]
+    if sealed_name and segment_compress(project_id) == "gzip":
+        _compress_segment(ledger_dir, sealed_name)
+
+
+def list_pulse_segments(project_id: str, agent_id: str) -> list[dict[str, Any]]:
+    """Manifest rows, oldest first; the last one is the active (unsealed) segment."""
+    ledger_dir = _ledger_dir(project_id, agent_id)
+    return copy.deepcopy(_manifest_for(project_id, agent_id, ledger_dir)["segments"])
+
+
 def _seq_path(project_id: str, agent_id: str) -> Path:
     p = mnemosyne_dir(project_id) / "pulse_ledger_seq" / f"{agent_id}.txt"
     p.parent.mkdir(parents=True, exist_ok=True)
     return p
 
 
-def _next_seq(project_id: str, agent_id: str, n: int = 1) -> int:
-    path = _seq_path(project_id, agent_id)
-    with path.open("a+", encoding="utf-8") as f:
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+def _tail_max_seq(ledger_dir: Path, segments: list[dict[str, Any]]) -> int:
+    """Highest seq already in the ledger: the active segment's tail, else the last sealed range."""
+    for row in iter_jsonl_reverse(ledger_dir / str(segments[-1]["name"])):
         try:
-            f.seek(0)
-            raw = str(f.read() or "").strip()
-            cur = int(raw) if raw.isdigit() else 0
-            nxt = max(1, cur + 1)
-            end = nxt + max(1, int(n)) - 1
-            f.seek(0)
-            f.truncate()
-            f.write(str(end))
-            f.flush()
-            os.fsync(f.fileno())
-            return nxt
-        finally:
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return int(row.get("seq", 0) or 0)
+        except Exception:
+            continue
+    return max([int(s.get("last_seq", 0) or 0) for s in segments if s.get("sealed")] or [0])
 
 
 def append_pulse_entry(
@@ -118,7 +353,7 @@ def append_pulse_entry(
     if not pid:
         raise ValueError("pulse_id is required")
     row: PulseLedgerEntry = {
-        "seq": int(_next_seq(project_id, agent_id, 1)),
+        "seq": 0,
         "project_id": str(project_id),
         "agent_id": str(agent_id),
         "pulse_id": pid,
@@ -128,9 +363,7 @@ def append_pulse_entry(
         "origin": origin,
         "trace_id": str(trace_id or ""),
     }
-    path = _ledger_path(project_id, agent_id)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    _write_rows(project_id, agent_id, [row])
     return row
 
 
@@ -143,10 +376,9 @@ def append_pulse_entries(
     items = [dict(x) for x in list(rows or []) if isinstance(x, dict)]
     if not items:
         return []
-    start = _next_seq(project_id, agent_id, len(items))
     out: list[PulseLedgerEntry] = []
     now = time.time()
-    for i, row in enumerate(items):
+    for row in items:
         pid = str(row.get("pulse_id", "") or "").strip()
         if not pid:
             raise ValueError("pulse_id is required in append_pulse_entries")
@@ -155,7 +387,7 @@ def append_pulse_entries(
             raise ValueError(f"invalid pulse ledger kind: {kind}")
         out.append(
             {
-                "seq": int(start + i),
+                "seq": 0,
                 "project_id": str(project_id),
                 "agent_id": str(agent_id),
                 "pulse_id": pid,
@@ -166,10 +398,7 @@ def append_pulse_entries(
                 "trace_id": str(row.get("trace_id", "") or ""),
             }
         )
-    path = _ledger_path(project_id, agent_id)
-    with path.open("a", encoding="utf-8") as f:
-        for row in out:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    _write_rows(project_id, agent_id, out)
     return out
 
 
@@ -182,54 +411,81 @@ def list_pulse_entries(
     limit: int = 4000,
     since_ts: float = 0.0,
 ) -> list[PulseLedgerEntry]:
-    """Read entries from the ledger with seq/ts/limit filtering."""
-    path = _ledger_path(project_id, agent_id)
-    if not path.exists():
+    """Read entries from the ledger with seq/ts/limit filtering.
+
+    Sealed segments whose manifest range cannot match are skipped; segments
+    are read newest-first until `limit` rows are collected.
+    """
+    ledger_dir = _ledger_dir(project_id, agent_id)
+    if not _legacy_ledger_path(project_id, agent_id).is_file() and not _manifest_path(ledger_dir).exists():
         return []
+    segments = _manifest_for(project_id, agent_id, ledger_dir)["segments"]
     lo = max(0, int(from_seq or 0))
     hi = int(to_seq or 0)
     lim = max(1, min(int(limit or 4000), 200000))
     sts = float(since_ts or 0.0)
+
+    def _may_match(seg: dict[str, Any]) -> bool:
+        if not seg.get("sealed"):
+            return True
+        if int(seg.get("last_seq", 0) or 0) <= lo:
+            return False
+        if hi > 0 and int(seg.get("first_seq", 0) or 0) > hi:
+            return False
+        if sts > 0 and float(seg.get("last_ts", 0.0) or 0.0) < sts:
+            return False
+        return True
+
+    chunks: list[list[PulseLedgerEntry]] = []
+    total = 0
+    for seg in reversed([x for x in segments if _may_match(x)]):
+        rows = _filter_rows(_iter_segment(ledger_dir, str(seg["name"])), project_id, agent_id, lo, hi, sts)
+        chunks.append(rows)
+        total += len(rows)
+        if total >= lim:
+            break
+    out = [row for rows in reversed(chunks) for row in rows]
+    return out[-lim:]
+
+
+def _filter_rows(
+    rows: Iterator[dict[str, Any]],
+    project_id: str,
+    agent_id: str,
+    lo: int,
+    hi: int,
+    sts: float,
+) -> list[PulseLedgerEntry]:
     out: list[PulseLedgerEntry] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
-            seq = int(row.get("seq", 0) or 0)
-            if seq <= lo:
-                continue
-            if hi > 0 and seq > hi:
-                continue
-            ts = float(row.get("ts", 0.0) or 0.0)
-            if sts > 0 and ts < sts:
-                continue
-            try:
-                kind = str(row.get("kind", "") or "")
-                if kind not in _KIND_ORDER:
-                    continue
-                out.append(
-                    {
-                        "seq": seq,
-                        "project_id": str(row.get("project_id", project_id) or project_id),
-                        "agent_id": str(row.get("agent_id", agent_id) or agent_id),
-                        "pulse_id": str(row.get("pulse_id", "") or ""),
-                        "kind": kind,  # type: ignore[typeddict-item]
-                        "ts": ts,
-                        "payload": dict(row.get("payload", {}) or {}),
-                        "origin": str(row.get("origin", "internal") or "internal"),  # type: ignore[typeddict-item]
-                        "trace_id": str(row.get("trace_id", "") or ""),
-                    }
-                )
-            except Exception:
+    for row in rows:
+        seq = int(row.get("seq", 0) or 0)
+        if seq <= lo:
+            continue
+        if hi > 0 and seq > hi:
+            continue
+        ts = float(row.get("ts", 0.0) or 0.0)
+        if sts > 0 and ts < sts:
+            continue
+        try:
+            kind = str(row.get("kind", "") or "")
+            if kind not in _KIND_ORDER:
                 continue
-    return out[-lim:]
+            out.append(
+                {
+                    "seq": seq,
+                    "project_id": str(row.get("project_id", project_id) or project_id),
+                    "agent_id": str(row.get("agent_id", agent_id) or agent_id),
+                    "pulse_id": str(row.get("pulse_id", "") or ""),
+                    "kind": kind,  # type: ignore[typeddict-item]
+                    "ts": ts,
+                    "payload": dict(row.get("payload", {}) or {}),
+                    "origin": str(row.get("origin", "internal") or "internal"),  # type: ignore[typeddict-item]
+                    "trace_id": str(row.get("trace_id", "") or ""),
+                }
+            )
+        except Exception:
+            continue
+    return out
 
 
 def group_pulses(entries: list[PulseLedgerEntry]) -> list[PulseFrameRaw]:
@@ -0,0 +1,114 @@
+"""Sequence allocation for append-only Mnemosyne ledgers.
+
+Several processes append to the same agent's ledgers (the API process, Angelia
+workers, supervised children), and readers rely on file order being seq order:
+range scans stop at the first seq past the range, sparse offset checkpoints
+seek forward, the tail row is taken as the maximum and sealed segments record
+seq ranges. So a seq is never handed out ahead of its row: it is reserved and
+the row appended inside one critical section.
+
+- `append_with_seqs` holds `flock` on the high-water-mark file while it
+  reserves the seqs and appends the rendered rows.
+- Ledgers that already serialize appends under their own lock (the pulse
+  ledger) call `reserve_seqs` while holding it, then `note_appended`.
+
+The high-water mark is written without fsync. Each process remembers the
+(inode, size, last seq) it left a ledger at; when the ledger no longer matches
+(another process appended, or it was rewritten) the next seq is
+max(high-water mark, highest seq on the ledger tail) + 1, so a lost or lagging
+mark can never reissue a seq that is already on disk.
+"""
+from __future__ import annotations
+
+import fcntl
+import os
+import threading
+from pathlib import Path
+from typing import Callable, TextIO
+
+_HEADS: dict[str, tuple[int, int, int]] = {}
+_GUARD = threading.Lock()
+
+
+def _reserve(f: TextIO, ledger: Path, n: int, floor: Callable[[], int]) -> int:
+    f.seek(0)
+    raw = str(f.read() or "").strip()
+    base = int(raw) if raw.isdigit() else 0
+    with _GUARD:
+        head = _HEADS.get(str(ledger))
+    try:
+        st = os.stat(ledger)
+        sig = (st.st_ino, st.st_size)
+    except FileNotFoundError:
+        sig = None
+    if head is not None and sig is not None and head[:2] == sig:
+        base = max(base, head[2])
+    else:
+        base = max(base, int(floor() or 0))
+    first = base + 1
+    f.seek(0)
+    f.truncate()
+    f.write(str(first + max(1, int(n)) - 1))
+    f.flush()
+    return first
+
+
+def reserve_seqs(hwm: Path, ledger: Path, n: int, *, floor: Callable[[], int]) -> int:
+    """Reserve `n` consecutive seqs for `ledger`; returns the first.
+
+    The caller must hold the lock that serializes appends to `ledger` and append
+    the rows (then call `note_appended`) before releasing it.
+    """
+    hwm.parent.mkdir(parents=True, exist_ok=True)
+    with hwm.open("a+", encoding="utf-8") as f:
+        return _reserve(f, ledger, n, floor)
+
+
+def note_appended(ledger: Path, last_seq: int) -> None:
+    """Remember where this process left `ledger` after appending up to `last_seq`."""
+    st = os.stat(ledger)
+    with _GUARD:
+        _HEADS[str(ledger)] = (st.st_ino, st.st_size, int(last_seq))
+
+
+def append_with_seqs(
+    hwm: Path,
+    ledger: Path,
+    n: int,
+    render: Callable[[int], bytes],
+    *,
+    floor: Callable[[], int],
+    on_append: Callable[[int, int], None] | None = None,
+) -> tuple[int, int]:
+    """Reserve `n` seqs and append `render(first)` to `ledger` under one flock.
+
+    `on_append(first, offset)` runs before the lock is released, so side indexes
+    keyed by seq are written in seq order too. Returns (first seq, byte offset
+    the rendered rows start at).
+    """
+    n = max(1, int(n))
+    hwm.parent.mkdir(parents=True, exist_ok=True)
+    ledger.parent.mkdir(parents=True, exist_ok=True)
+    with hwm.open("a+", encoding="utf-8") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            first = _reserve(f, ledger, n, floor)
+            data = render(first)
+            with ledger.open("ab") as out:
+                offset = out.seek(0, os.SEEK_END)
+                out.write(data)
+            note_appended(ledger, first + n - 1)
+            if on_append is not None:
+                on_append(first, offset)
+            return first, offset
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def forget_ledger_heads(prefix: Path | None = None) -> int:
+    """Forget remembered ledger heads (all, or those under `prefix`)."""
+    with _GUARD:
+        keys = [k for k in _HEADS if prefix is None or k.startswith(str(prefix))]
+        for k in keys:
+            _HEADS.pop(k, None)
+    return len(keys)
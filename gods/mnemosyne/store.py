@@ -7,6 +7,8 @@ import uuid
 from pathlib import Path
 from typing import Any
 
+from gods.mnemosyne.jsonl_tail import tail_jsonl
+
 VALID_VAULTS = {"agent", "human", "system"}
 
 
@@ -70,20 +72,8 @@ def write_entry(project_id: str, vault: str, author: str, title: str, content: s
 
 def list_entries(project_id: str, vault: str, limit: int = 50) -> list[dict[str, Any]]:
     idx = _index_path(project_id, vault)
-    if not idx.exists():
-        return []
-    out: list[dict[str, Any]] = []
-    with idx.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
     lim = max(1, min(int(limit), 500))
-    return out[-lim:]
+    return tail_jsonl(idx, lim)
 
 
 def read_entry(project_id: str, vault: str, entry_id: str) -> dict[str, Any] | None:
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 from typing import Any, Literal
 
+from gods.file_cache import FileCache
 from gods.paths import mnemosyne_dir
 
 TemplateScope = Literal["runtime_log", "chronicle", "llm_context"]
@@ -14,6 +16,9 @@ TemplateScope = Literal["runtime_log", "chronicle", "llm_context"]
 _KEY_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_.-]{1,127}$")
 _MAX_TEMPLATE_LENGTH = 12000
 
+# Merged (defaults + project overrides) templates per scope file.
+_TEMPLATES_CACHE = FileCache()
+
 _DEFAULT_RUNTIME_LOG_TEMPLATES: dict[str, str] = {
     "memory_event_mail_event": "[EVENT] mail_event stage=$stage event_id=$event_id reason=$event_type",
     "memory_event_timer": "[EVENT] timer stage=$stage reason=$event_type",
@@ -136,28 +141,36 @@ def ensure_memory_templates(project_id: str) -> None:
             path.write_text(json.dumps(_scope_defaults(scope), ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def list_memory_templates(project_id: str, scope: TemplateScope) -> dict[str, str]:
+def _cached_templates(project_id: str, scope: TemplateScope) -> dict[str, str]:
     ensure_memory_templates(project_id)
     path = _scope_path(project_id, scope)
-    raw = _read_json_obj(path)
-    out: dict[str, str] = {}
-    for k, v in _scope_defaults(scope).items():
-        try:
-            key = _validate_key(str(k))
-            out[key] = _validate_body(str(v))
-        except Exception:
-            continue
-    for k, v in raw.items():
-        try:
-            key = _validate_key(str(k))
-            out[key] = _validate_body(str(v))
-        except Exception:
-            continue
-    return out
+
+    def _build() -> dict[str, str]:
+        raw = _read_json_obj(path)
+        out: dict[str, str] = {}
+        for k, v in _scope_defaults(scope).items():
+            try:
+                key = _validate_key(str(k))
+                out[key] = _validate_body(str(v))
+            except Exception:
+                continue
+        for k, v in raw.items():
+            try:
+                key = _validate_key(str(k))
+                out[key] = _validate_body(str(v))
+            except Exception:
+                continue
+        return out
+
+    return _TEMPLATES_CACHE.get(path, _build)
+
+
+def list_memory_templates(project_id: str, scope: TemplateScope) -> dict[str, str]:
+    return dict(_cached_templates(project_id, scope))
 
 
 def get_memory_template(project_id: str, scope: TemplateScope, key: str) -> str:
-    templates = list_memory_templates(project_id, scope)
+    templates = _cached_templates(project_id, scope)
     k = _validate_key(key)
     if k not in templates:
         raise KeyError(k)
@@ -177,10 +190,16 @@ def upsert_memory_template(project_id: str, scope: TemplateScope, key: str, body
     k = _validate_key(key)
     clean[k] = _validate_body(body)
     path.write_text(json.dumps(clean, ensure_ascii=False, indent=2), encoding="utf-8")
+    _TEMPLATES_CACHE.invalidate(path)
     return {"scope": scope, "key": k, "template": clean[k]}
 
 
+@lru_cache(maxsize=1024)
+def _compiled_template(text: str) -> Template:
+    return Template(text)
+
+
 def render_memory_template(project_id: str, scope: TemplateScope, key: str, render_vars: dict[str, Any]) -> str:
     text = get_memory_template(project_id, scope, key)
     vars_safe = {str(k): "" if v is None else str(v) for k, v in (render_vars or {}).items()}
-    return Template(text).safe_substitute(**vars_safe)
+    return _compiled_template(text).safe_substitute(**vars_safe)
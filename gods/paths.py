@@ -4,8 +4,11 @@ from __future__ import annotations
 from pathlib import Path
 
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
 def repo_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return _REPO_ROOT
 
 
 def projects_root() -> Path:
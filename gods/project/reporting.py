@@ -9,6 +9,7 @@ import urllib.request
 from pathlib import Path
 from typing import Any
 
+from gods import events as events_bus
 from gods.hermes import store as hermes_store
 from gods.mnemosyne import write_entry
 
@@ -85,6 +86,15 @@ def _mnemosyne_summary(project_id: str) -> dict[str, int]:
     return result
 
 
+def _event_bus_summary(project_id: str) -> dict[str, Any]:
+    live: dict[str, int] = {}
+    for st in events_bus.EventState:
+        n = len(events_bus.list_events(project_id, state=st, limit=5000))
+        if n:
+            live[st.value] = n
+    return {"live_by_state": live, "archive": events_bus.archive_summary(project_id)}
+
+
 def _to_function_id(owner: str, clause_id: str) -> str:
     owner = str(owner or "").strip()
     clause_id = str(clause_id or "").strip()
@@ -368,6 +378,17 @@ def _markdown_from_report(report: dict[str, Any]) -> str:
     lines.append(f"- agent: {mnemo.get('agent', 0)}")
     lines.append(f"- system: {mnemo.get('system', 0)}")
     lines.append("")
+    lines.append("## Event Bus Retention")
+    ebus = report.get("event_bus_summary", {}) or {}
+    live = ebus.get("live_by_state", {}) or {}
+    arch = ebus.get("archive", {}) or {}
+    lines.append(f"- Live events: {sum(live.values())}")
+    for k, v in sorted(live.items()):
+        lines.append(f"  - {k}: {v}")
+    lines.append(f"- Archived events: {arch.get('total', 0)} in {arch.get('segment_count', 0)} segments ({arch.get('bytes', 0)} bytes)")
+    if arch.get("segment_count"):
+        lines.append(f"- Archive range: {arch.get('first_day', '')} .. {arch.get('last_day', '')}")
+    lines.append("")
     lines.append("## Risks & Suggested Next Checks")
     if report["invocation_count"] == 0:
         lines.append("- Risk: no protocol invocation data; run at least one protocol call.")
@@ -412,6 +433,7 @@ def build_project_report(project_id: str, write_mirror: bool = True) -> dict[str
             "owners": owners,
         },
         "mnemosyne_summary": _mnemosyne_summary(project_id),
+        "event_bus_summary": _event_bus_summary(project_id),
         "protocol_execution_validation": _build_protocol_execution_validation(
             contract_rows=contract_rows,
             protocol_rows=protocol_rows,
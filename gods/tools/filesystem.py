@@ -4,6 +4,7 @@ File reading, writing, and manipulation tools with territory isolation.
 """
 from pathlib import Path
 import builtins
+import io
 import json
 import os
 from langchain_core.tools import tool
@@ -159,7 +160,6 @@ def _slice_page(rows: list, page: int, page_size: int) -> list:
 
 def _read_artifact_virtual(agent_territory: Path, artifact_id: str, caller_id: str, project_id: str, start: int, end: int) -> str:
     ref = mnemosyne_facade.head_artifact(artifact_id, caller_id, project_id)
-    data = mnemosyne_facade.get_artifact_bytes(artifact_id, caller_id, project_id)
     s = int(start or 1)
     e = int(end or 0)
     if s < 1:
@@ -176,9 +176,18 @@ def _read_artifact_virtual(agent_territory: Path, artifact_id: str, caller_id: s
             "end must be >= start (or 0 for EOF).",
             "Use start/end with 1-based inclusive numbers, or set end=0 to read to EOF.",
         )
+    # Stream the blob: only the requested lines are kept, whatever the artifact size.
+    lines: builtins.list[str] = []
+    total = 0
     try:
-        text = data.decode("utf-8")
-    except Exception:
+        with mnemosyne_facade.open_artifact(artifact_id, caller_id, project_id) as raw:
+            # newline="" keeps every break so splitlines() below matches str.splitlines() on the whole text.
+            for chunk in io.TextIOWrapper(raw, encoding="utf-8", errors="strict", newline=""):
+                for line in chunk.splitlines():
+                    total += 1
+                    if total >= s and (e <= 0 or total <= e):
+                        lines.append(line)
+    except UnicodeDecodeError:
         body = (
             "[READ_ARTIFACT]\n"
             f"path: {ARTIFACT_SCHEME}{ref.artifact_id}\n"
@@ -191,8 +200,6 @@ def _read_artifact_virtual(agent_territory: Path, artifact_id: str, caller_id: s
         )
         return _cwd_prefix(agent_territory, body)
 
-    lines = text.splitlines()
-    total = len(lines)
     if total == 0:
         selected = ""
         range_label = f"{s}-0"
@@ -205,7 +212,7 @@ def _read_artifact_virtual(agent_territory: Path, artifact_id: str, caller_id: s
                 "Use list() to inspect resources and choose a valid range.",
             )
         end_idx = total if e <= 0 else min(e, total)
-        selected = "\n".join(lines[s - 1 : end_idx])
+        selected = "\n".join(lines)
         range_label = f"{s}-{end_idx}"
 
     body = (
@@ -59,22 +59,22 @@ def upload_artifact(
         p = validate_path(caller_id, project_id, path)
         if not p.exists() or not p.is_file():
             return json.dumps({"ok": False, "error": f"file not found: {path}"}, ensure_ascii=False)
-        data = p.read_bytes()
         mime_val = str(mime or "").strip() or str(mimetypes.guess_type(str(p))[0] or "application/octet-stream")
         tags = json.loads(tags_json) if str(tags_json or "").strip() else []
         if not isinstance(tags, list):
             return json.dumps({"ok": False, "error": "tags_json must be JSON array"}, ensure_ascii=False)
         sc = str(scope or "agent").strip().lower()
         owner = caller_id if sc == "agent" else ""
-        ref = mnemosyne_facade.put_artifact_bytes(
-            scope=sc,
-            project_id=project_id,
-            owner_agent_id=owner,
-            actor_id=caller_id,
-            data=data,
-            mime=mime_val,
-            tags=[str(x).strip() for x in tags if str(x).strip()],
-        )
+        with p.open("rb") as f:
+            ref = mnemosyne_facade.put_artifact_stream(
+                scope=sc,
+                project_id=project_id,
+                owner_agent_id=owner,
+                actor_id=caller_id,
+                source=f,
+                mime=mime_val,
+                tags=[str(x).strip() for x in tags if str(x).strip()],
+            )
         return json.dumps(
             {
                 "ok": True,
@@ -0,0 +1,101 @@
+"""Idle-world benchmark for Angelia workers: push wakeups vs. legacy 1s polling.
+
+Runs N idle agents for a fixed duration and reports process CPU time and
+event-store lock acquisitions. `--mode poll` replays the old idle loop
+(reclaim + has_pending + has_queued every second per agent) for comparison.
+
+Usage:
+    python scripts/bench_angelia_idle.py --agents 30 --seconds 60 --history 100 --mode both
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from gods import events as events_bus
+from gods.angelia import policy, store
+from gods.angelia.worker import WorkerContext, worker_loop
+from gods.iris.facade import has_pending
+
+PROJECT_ID = "bench_angelia_idle"
+
+
+def _legacy_poll_loop(ctx: WorkerContext) -> None:
+    timeout = policy.processing_timeout_sec(ctx.project_id)
+    while not ctx.stop_event.wait(1.0):
+        store.reclaim_stale_processing(ctx.project_id, timeout)
+        has_pending(ctx.project_id, ctx.agent_id)
+        store.has_queued(ctx.project_id, ctx.agent_id)
+
+
+def _run(mode: str, agents: int, seconds: float, history: int) -> dict:
+    shutil.rmtree(Path("projects") / PROJECT_ID, ignore_errors=True)
+    # Seed a realistic amount of finished history so each scan has something to read.
+    for i in range(agents * history):
+        rec = events_bus.append_event(
+            events_bus.EventRecord.create(
+                project_id=PROJECT_ID,
+                domain="angelia",
+                event_type="timer",
+                priority=10,
+                payload={"agent_id": f"bench_{i % agents}"},
+            )
+        )
+        events_bus.transition_state(PROJECT_ID, rec.event_id, events_bus.EventState.DONE)
+
+    target = worker_loop if mode == "push" else _legacy_poll_loop
+    stop = threading.Event()
+    threads = []
+    locks_before = events_bus.lock_stats()
+    cpu_before = time.process_time()
+    for i in range(agents):
+        ctx = WorkerContext(project_id=PROJECT_ID, agent_id=f"bench_{i}", stop_event=stop)
+        th = threading.Thread(target=target, args=(ctx,), daemon=True)
+        th.start()
+        threads.append(th)
+    time.sleep(seconds)
+    stop.set()
+    if mode == "push":
+        from gods.angelia.mailbox import angelia_mailbox
+
+        angelia_mailbox.notify_project(PROJECT_ID)
+    for th in threads:
+        th.join(timeout=5.0)
+    cpu = time.process_time() - cpu_before
+    locks_after = events_bus.lock_stats()
+    shutil.rmtree(Path("projects") / PROJECT_ID, ignore_errors=True)
+    return {
+        "mode": mode,
+        "agents": agents,
+        "seconds": seconds,
+        "history": history,
+        "cpu_sec": round(cpu, 3),
+        "lock_exclusive": locks_after["exclusive"] - locks_before["exclusive"],
+        "lock_shared": locks_after["shared"] - locks_before["shared"],
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--agents", type=int, default=30)
+    ap.add_argument("--seconds", type=float, default=60.0)
+    ap.add_argument("--history", type=int, default=20, help="finished events seeded per agent")
+    ap.add_argument("--mode", choices=["push", "poll", "both"], default="both")
+    args = ap.parse_args()
+    modes = ["poll", "push"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        r = _run(mode, args.agents, args.seconds, args.history)
+        print(
+            f"{r['mode']:>5}: agents={r['agents']} history={r['history']} seconds={r['seconds']} cpu={r['cpu_sec']}s "
+            f"locks(ex={r['lock_exclusive']}, sh={r['lock_shared']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
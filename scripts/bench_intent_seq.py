@@ -0,0 +1,89 @@
+"""Per-pulse cost of `latest_intent_seq` on a large intent ledger.
+
+Seeds one agent with N intents, then times the calls a pulse makes (worker
+base seq plus the Chaos snapshot checks) with the maintained sequence head
+against the legacy full-file scan. One intent is appended between pulses, as
+a real pulse would.
+
+Usage:
+    python scripts/bench_intent_seq.py --intents 100000 --pulses 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from gods.mnemosyne import janus_snapshot
+
+PROJECT_ID = "bench_intent_seq"
+AGENT_ID = "bench"
+CALLS_PER_PULSE = 3
+
+
+def _legacy_latest_intent_seq(project_id: str, agent_id: str) -> int:
+    path = janus_snapshot._intents_path(project_id, agent_id)
+    if not path.exists():
+        return 0
+    last = 0
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                last = max(last, int(row.get("intent_seq", 0) or 0))
+    return last
+
+
+def _row(seq: int) -> str:
+    return json.dumps(
+        {"intent_id": f"{AGENT_ID}:{seq}", "intent_seq": seq, "intent_key": "llm.response", "fallback_text": "ok " * 20}
+    ) + "\n"
+
+
+def _run(fn, intents: int, pulses: int) -> float:
+    path = janus_snapshot._intents_path(PROJECT_ID, AGENT_ID)
+    seq = intents
+    started = time.perf_counter()
+    for _ in range(pulses):
+        for _ in range(CALLS_PER_PULSE):
+            fn(PROJECT_ID, AGENT_ID)
+        seq += 1
+        with path.open("a", encoding="utf-8") as f:
+            f.write(_row(seq))
+    return (time.perf_counter() - started) / pulses * 1000.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--intents", type=int, default=100000)
+    ap.add_argument("--pulses", type=int, default=50)
+    args = ap.parse_args()
+    shutil.rmtree(Path("projects") / PROJECT_ID, ignore_errors=True)
+    path = janus_snapshot._intents_path(PROJECT_ID, AGENT_ID)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with path.open("w", encoding="utf-8") as f:
+            f.writelines(_row(i) for i in range(1, args.intents + 1))
+        legacy = _run(_legacy_latest_intent_seq, args.intents, args.pulses)
+        head = _run(janus_snapshot.latest_intent_seq, args.intents, args.pulses)
+        assert janus_snapshot.latest_intent_seq(PROJECT_ID, AGENT_ID) == _legacy_latest_intent_seq(PROJECT_ID, AGENT_ID)
+        print(f"intents={args.intents} pulses={args.pulses} calls/pulse={CALLS_PER_PULSE}")
+        print(f"legacy scan: {legacy:.3f} ms/pulse")
+        print(f"seq head:    {head:.3f} ms/pulse ({legacy / max(head, 1e-9):.0f}x)")
+    finally:
+        shutil.rmtree(Path("projects") / PROJECT_ID, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
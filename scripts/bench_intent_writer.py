@@ -0,0 +1,79 @@
+"""Throughput of `record_intent` per `memory_intent_durability` mode.
+
+Records N tool-result intents for one agent (every intent reaches the intents
+ledger, runtime log and context index) and reports intents/sec. `pulse` mode
+flushes once every `--per-pulse` intents, as the Angelia worker does at pulse
+end.
+
+Usage:
+    python scripts/bench_intent_writer.py --intents 2000 --per-pulse 20
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from gods.config import ProjectConfig, runtime_config
+from gods.mnemosyne import MemoryIntent, record_intent
+from gods.mnemosyne.intent_writer import flush_agent_writes
+
+PROJECT_ID = "bench_intent_writer"
+AGENT_ID = "bench"
+
+
+def _intent(n: int) -> MemoryIntent:
+    return MemoryIntent(
+        intent_key="tool.read.error",
+        project_id=PROJECT_ID,
+        agent_id=AGENT_ID,
+        source_kind="tool",
+        payload={
+            "tool_name": "read",
+            "status": "error",
+            "args": {"path": f"{n}.txt"},
+            "result": "read failed",
+            "result_compact": "read failed",
+        },
+        fallback_text=f"[TOOL] read error {n}",
+        timestamp=time.time(),
+    )
+
+
+def _run(mode: str, intents: int, per_pulse: int) -> float:
+    shutil.rmtree(Path("projects") / PROJECT_ID, ignore_errors=True)
+    runtime_config.projects[PROJECT_ID] = ProjectConfig(memory_intent_durability=mode)
+    record_intent(_intent(-1))  # seed policy files outside the timed loop
+    flush_agent_writes(PROJECT_ID, AGENT_ID)
+    started = time.perf_counter()
+    for i in range(intents):
+        record_intent(_intent(i))
+        if (i + 1) % per_pulse == 0:
+            flush_agent_writes(PROJECT_ID, AGENT_ID)
+    flush_agent_writes(PROJECT_ID, AGENT_ID)
+    elapsed = time.perf_counter() - started
+    shutil.rmtree(Path("projects") / PROJECT_ID, ignore_errors=True)
+    return intents / max(elapsed, 1e-9)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--intents", type=int, default=2000)
+    ap.add_argument("--per-pulse", type=int, default=20)
+    ap.add_argument("--mode", choices=["intent", "pulse", "interval", "all"], default="all")
+    args = ap.parse_args()
+    modes = ["intent", "pulse", "interval"] if args.mode == "all" else [args.mode]
+    try:
+        for mode in modes:
+            rate = _run(mode, args.intents, max(1, args.per_pulse))
+            print(f"{mode:>8}: {rate:,.0f} intents/sec ({args.intents} intents, flush every {args.per_pulse})")
+    finally:
+        runtime_config.projects.pop(PROJECT_ID, None)
+
+
+if __name__ == "__main__":
+    main()
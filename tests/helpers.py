@@ -0,0 +1,35 @@
+"""Helpers shared across test suites."""
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from gods import events as events_bus
+
+
+def event_record(
+    project_id: str,
+    agent_id: str,
+    priority: int = 50,
+    event_type: str = "manual",
+    dedupe_key: str = "",
+) -> events_bus.EventRecord:
+    """An Angelia event for `agent_id`, not yet appended."""
+    return events_bus.EventRecord.create(
+        project_id=project_id,
+        domain="angelia",
+        event_type=event_type,
+        priority=priority,
+        payload={"agent_id": agent_id},
+        dedupe_key=dedupe_key,
+    )
+
+
+def wait_until(cond: Callable[[], bool], timeout: float = 3.0) -> bool:
+    """Poll `cond` until it holds or `timeout` seconds pass; returns its last value."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return cond()
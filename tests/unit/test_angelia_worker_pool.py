@@ -0,0 +1,78 @@
+import shutil
+import time
+from pathlib import Path
+
+from gods import events as events_bus
+from gods.angelia import worker_pool
+from gods.config import ProjectConfig, runtime_config
+from gods.events import leases
+from tests.helpers import event_record, wait_until
+
+
+def _patch_pool(monkeypatch, agents: list[str]):
+    monkeypatch.setattr(worker_pool, "worker_loop", lambda ctx: ctx.stop_event.wait())
+    monkeypatch.setattr(worker_pool.agent_registry, "list_active_agents", lambda pid: list(agents))
+    # Keep the in-memory test project instead of reloading config.json.
+    monkeypatch.setattr(worker_pool.LeasedWorkerPool, "_refresh_config", lambda self: None)
+
+
+def test_event_leases_exclusive_until_expired():
+    project_id = "unit_event_leases"
+    try:
+        assert leases.acquire_lease(project_id, "alpha", "w1", 30) == (True, "")
+        assert leases.acquire_lease(project_id, "alpha", "w2", 30) == (False, "")
+        assert leases.acquire_lease(project_id, "alpha", "w1", 30) == (True, "")
+        assert leases.renew_leases(project_id, "w2", ["alpha"], 30) == []
+
+        # An expired lease is taken over and the previous owner is reported.
+        leases.acquire_lease(project_id, "beta", "w1", -1)
+        assert leases.acquire_lease(project_id, "beta", "w2", 30) == (True, "w1")
+
+        assert leases.release_leases(project_id, "w1") == 1
+        snap = leases.list_leases(project_id)
+        assert [(r["agent_id"], r["owner_id"]) for r in snap["leases"]] == [("beta", "w2")]
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_worker_pool_shares_agents_and_reclaims_expired_leases(monkeypatch):
+    project_id = "unit_angelia_worker_pool"
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(
+        simulation_enabled=True,
+        angelia_supervisor_mode="processes",
+        angelia_lease_ttl_sec=30,
+    )
+    _patch_pool(monkeypatch, ["alpha", "beta"])
+    a = worker_pool.LeasedWorkerPool(owner_id="wa", project_ids={project_id})
+    b = worker_pool.LeasedWorkerPool(owner_id="wb", project_ids={project_id})
+    try:
+        # A crashed owner left an in-flight event behind an expired lease.
+        rec = events_bus.append_event(event_record(project_id, "alpha", priority=80))
+        events_bus.transition_state(project_id, rec.event_id, events_bus.EventState.PROCESSING)
+        leases.acquire_lease(project_id, "alpha", "crashed", -1)
+
+        now = time.time()
+        a.tick(now)
+        assert sorted(aid for _pid, aid in a.held(project_id)) == ["alpha", "beta"]
+        row = events_bus.list_events(project_id, agent_id="alpha")[0]
+        assert row.state == events_bus.EventState.QUEUED
+        assert row.error_code == "LEASE_EXPIRED"
+
+        # A second member joins: both converge on one agent each.
+        b.tick(now)
+        assert b.held(project_id) == []
+        a.tick(now + 11)
+        assert wait_until(lambda: (a.tick(now + 11) or len(a.held(project_id)) == 1))
+        b.tick(now + 11)
+        assert len(b.held(project_id)) == 1
+        owners = {r["agent_id"]: r["owner_id"] for r in leases.list_leases(project_id)["leases"]}
+        assert sorted(owners.values()) == ["wa", "wb"]
+    finally:
+        a.shutdown()
+        b.shutdown()
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
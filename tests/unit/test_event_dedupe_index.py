@@ -0,0 +1,78 @@
+from pathlib import Path
+import shutil
+
+import pytest
+
+from gods import events as events_bus
+from gods.events import store
+from gods.iris import store as iris_store
+from tests.helpers import event_record
+
+
+def _timer(project_id: str, agent_id: str) -> events_bus.EventRecord:
+    return event_record(project_id, agent_id, priority=10, event_type="timer", dedupe_key=f"timer:{agent_id}")
+
+
+def test_event_dedupe_index_tracks_live_rows_only():
+    project_id = "unit_event_dedupe_index"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        first = events_bus.append_event(_timer(project_id, "a"), dedupe_window_sec=60)
+        assert events_bus.append_event(_timer(project_id, "a"), dedupe_window_sec=60).event_id == first.event_id
+        assert events_bus.append_event(_timer(project_id, "b"), dedupe_window_sec=60).event_id != first.event_id
+
+        # Terminal rows leave the index, so the next heartbeat is accepted.
+        events_bus.transition_state(project_id, first.event_id, events_bus.EventState.DONE)
+        second = events_bus.append_event(_timer(project_id, "a"), dedupe_window_sec=60)
+        assert second.event_id != first.event_id
+
+        # Replay from disk rebuilds the same index; outside the window there is no match.
+        store._LOGS.clear()
+        assert events_bus.append_event(_timer(project_id, "a"), dedupe_window_sec=60).event_id == second.event_id
+        index = store._event_log(project_id).sync(writable=False)
+        assert set(index.by_dedupe[(project_id, "timer", "timer:a")]) == {second.event_id}
+        assert index.live_duplicate(project_id, "timer", "timer:a", since=second.created_at + 1) is None
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_iris_enqueue_dedupe_uses_window_and_live_state(monkeypatch):
+    project_id = "unit_iris_dedupe_index"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+    def _enqueue(key: str, window: int = 60):
+        return iris_store.enqueue_mail_event(
+            project_id=project_id,
+            agent_id="a",
+            event_type="mail_event",
+            priority=100,
+            title="t",
+            content="c",
+            dedupe_key=key,
+            dedupe_window_sec=window,
+        )
+
+    try:
+        first = _enqueue("k")
+        assert _enqueue("k").event_id == first.event_id
+        assert _enqueue("k", window=0).event_id != first.event_id
+        assert len(iris_store.list_mail_events(project_id, agent_id="a")) == 2
+
+        iris_store.mark_mailbox_events_handled(project_id, [first.event_id])
+        # The other live "k" row (window=0 enqueue) is still a duplicate.
+        other = [e for e in iris_store.list_mail_events(project_id, agent_id="a") if e.event_id != first.event_id][0]
+        assert _enqueue("k").event_id == other.event_id
+
+        # A dropped in-memory index is rebuilt from the agent's partition.
+        iris_store._PARTITIONS.invalidate()
+        assert _enqueue("k").event_id == other.event_id
+
+        # The dedupe check looks up its key instead of scanning the live backlog.
+        for i in range(50):
+            _enqueue(f"bulk-{i}")
+        monkeypatch.setattr(iris_store._Partition, "in_states", lambda *_: pytest.fail("scanned live rows"))
+        assert _enqueue("k").event_id == other.event_id
+        assert _enqueue("bulk-7").event_id != other.event_id
+        assert _enqueue("new").event_id not in {other.event_id, first.event_id}
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,66 @@
+from pathlib import Path
+import shutil
+
+from gods import events as events_bus
+from gods.angelia import store as angelia_store
+from gods.events import store
+from tests.helpers import event_record
+
+
+def test_ready_queue_orders_by_priority_and_tracks_transitions():
+    project_id = "unit_event_ready_queue_order"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        low = events_bus.append_event(event_record(project_id, "a", priority=10))
+        high = events_bus.append_event(event_record(project_id, "a", priority=90))
+        mid = events_bus.append_event(event_record(project_id, "a", priority=50))
+        events_bus.append_event(event_record(project_id, "b", priority=99))
+        now = mid.created_at + 1
+
+        ids = [r.event_id for r in events_bus.list_ready_events(project_id, "a", now=now)]
+        assert ids == [high.event_id, mid.event_id, low.event_id]
+
+        events_bus.transition_state(project_id, high.event_id, events_bus.EventState.PICKED)
+        events_bus.requeue_or_dead(project_id, mid.event_id, "E", "later", retry_delay_sec=30)
+        ids = [r.event_id for r in events_bus.list_ready_events(project_id, "a", now=now)]
+        assert ids == [low.event_id]
+        # The retried event becomes ready once its available_at passes.
+        ids = [r.event_id for r in events_bus.list_ready_events(project_id, "a", now=now + 60)]
+        assert ids == [mid.event_id, low.event_id]
+
+        # A fresh replay (another process) rebuilds the same queues from disk.
+        store._LOGS.clear()
+        ids = [r.event_id for r in events_bus.list_ready_events(project_id, "a", now=now + 60, limit=1)]
+        assert ids == [mid.event_id]
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_pick_batch_touches_only_own_ready_events_and_keeps_cooldown_rules():
+    project_id = "unit_event_ready_queue_batch"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        manual = [events_bus.append_event(event_record(project_id, "a", priority=60 - i)) for i in range(40)]
+        timer = events_bus.append_event(event_record(project_id, "a", priority=1, event_type="timer"))
+        events_bus.append_event(event_record(project_id, "b", priority=100))
+        now = timer.created_at + 1
+
+        # Cooldown skips the 40 manual events at the head, so the page must widen to reach the timer.
+        got = angelia_store.pick_batch_events(
+            project_id,
+            "a",
+            now=now,
+            cooldown_until=now + 60,
+            preempt_types={"timer"},
+            limit=5,
+            force_after_sec=3600,
+        )
+        assert [e.event_id for e in got] == [timer.event_id]
+
+        got = angelia_store.pick_batch_events(project_id, "a", now=now, cooldown_until=0.0, preempt_types=set(), limit=3)
+        assert [e.event_id for e in got] == [e.event_id for e in manual[:3]]
+        assert all(e.agent_id == "a" for e in got)
+        assert len(events_bus.list_ready_events(project_id, "a", now=now, limit=100)) == 37
+        assert len(events_bus.list_ready_events(project_id, "b", now=now)) == 1
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,95 @@
+from pathlib import Path
+import json
+import shutil
+
+from gods import events as events_bus
+from gods.config import ProjectConfig, runtime_config
+from gods.events import archive, store
+from tests.helpers import event_record
+
+
+def test_archive_moves_old_terminal_rows_out_of_hot_store():
+    project_id = "unit_event_store_archive_move"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        done = events_bus.append_event(event_record(project_id, "a"))
+        dead = events_bus.append_event(event_record(project_id, "b", event_type="timer"))
+        live = events_bus.append_event(event_record(project_id, "a"))
+        events_bus.transition_state(project_id, done.event_id, events_bus.EventState.DONE)
+        events_bus.transition_state(project_id, dead.event_id, events_bus.EventState.DEAD)
+
+        assert events_bus.archive_terminal_events(project_id, older_than_sec=0) == 0
+        # Back-date done_at instead of sleeping.
+        for eid in (done.event_id, dead.event_id):
+            store._with_lock(project_id, lambda txn, eid=eid: txn.set(eid, {"done_at": 1_000.0}))
+        assert events_bus.archive_terminal_events(project_id, older_than_sec=3600) == 2
+
+        assert [r.event_id for r in events_bus.list_events(project_id, limit=10)] == [live.event_id]
+        snap = events_bus.events_path(project_id).read_text(encoding="utf-8").splitlines()
+        assert [json.loads(x)["event_id"] for x in snap] == [live.event_id]
+
+        segments = archive.list_segments(project_id)
+        assert [s["day"] for s in segments] == ["19700101"]
+        got = events_bus.list_archived_events(project_id, agent_id="b")
+        assert [r.event_id for r in got] == [dead.event_id]
+        assert got[0].state == events_bus.EventState.DEAD
+        assert events_bus.list_archived_events(project_id, since=86400 * 2) == []
+
+        summary = events_bus.archive_summary(project_id)
+        assert summary["total"] == 2 and summary["by_state"] == {"done": 1, "dead": 1}
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_archive_respects_project_retention_and_sqlite_backend():
+    project_id = "unit_event_store_archive_sqlite"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    try:
+        runtime_config.projects[project_id] = ProjectConfig(event_store_backend="sqlite", event_archive_after_sec=0)
+        ev = events_bus.append_event(event_record(project_id, "a"))
+        events_bus.transition_state(project_id, ev.event_id, events_bus.EventState.DONE)
+        store._with_lock(project_id, lambda txn: txn.set(ev.event_id, {"done_at": 1_000.0}))
+        assert events_bus.archive_terminal_events(project_id) == 0
+
+        runtime_config.projects[project_id] = ProjectConfig(event_store_backend="sqlite", event_archive_after_sec=60)
+        assert events_bus.archive_terminal_events(project_id) == 1
+        assert events_bus.list_events(project_id) == []
+        assert [r.event_id for r in events_bus.list_archived_events(project_id)] == [ev.event_id]
+    finally:
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_archive_summary_reads_segment_manifests(monkeypatch):
+    project_id = "unit_event_store_archive_manifest"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        rows = [
+            {"event_id": f"e{i}", "state": "done" if i % 3 else "dead", "done_at": 1_000.0 + i * 86400.0}
+            for i in range(4)
+        ]
+        archive.write_segments(project_id, rows[:2])
+        archive.write_segments(project_id, rows)
+        manifest = archive.manifest_path(project_id, "19700101")
+        assert json.loads(manifest.read_text(encoding="utf-8"))["rows"] == 2
+
+        def _no_decompress(path):
+            raise AssertionError("archive_summary must not read segments")
+
+        monkeypatch.setattr(archive, "_read_segment", _no_decompress)
+        summary = events_bus.archive_summary(project_id)
+        assert summary["segment_count"] == 4
+        assert summary["total"] == 6
+        assert summary["by_state"] == {"dead": 3, "done": 3}
+        monkeypatch.undo()
+
+        # A missing manifest is rebuilt once from its segment (deduping by event_id).
+        manifest.unlink()
+        assert events_bus.archive_summary(project_id)["total"] == 5
+        assert json.loads(manifest.read_text(encoding="utf-8"))["by_state"] == {"dead": 1}
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
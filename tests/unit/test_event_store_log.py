@@ -0,0 +1,140 @@
+from pathlib import Path
+import json
+import shutil
+
+from gods import events as events_bus
+from gods.events import event_log, store
+from tests.helpers import event_record
+
+
+def _fresh_view() -> None:
+    # Simulate another process: drop the cached replay so the next call reloads from disk.
+    store._LOGS.clear()
+
+
+def test_transitions_append_to_log_without_rewriting_snapshot():
+    project_id = "unit_event_store_log_append"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        a = events_bus.append_event(event_record(project_id, "a"))
+        b = events_bus.append_event(event_record(project_id, "b", priority=90))
+        snap = events_bus.events_path(project_id)
+        snap_before = snap.read_bytes()
+
+        assert events_bus.transition_state(project_id, a.event_id, events_bus.EventState.PROCESSING)
+        assert events_bus.set_event_meta_field(project_id, b.event_id, "k", "v")
+        assert snap.read_bytes() == snap_before
+
+        lines = events_bus.log_path(project_id).read_text(encoding="utf-8").splitlines()
+        ops = [json.loads(x)["op"] for x in lines]
+        assert ops == ["open", "put", "put", "set", "set"]
+
+        _fresh_view()
+        rows = {r.event_id: r for r in events_bus.list_events(project_id, limit=10)}
+        assert rows[a.event_id].state == events_bus.EventState.PROCESSING
+        assert rows[b.event_id].meta == {"k": "v"}
+        assert [r.event_id for r in events_bus.list_events(project_id, agent_id="b")] == [b.event_id]
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_compaction_folds_log_into_snapshot_and_other_views_reload():
+    project_id = "unit_event_store_log_compact"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        ids = [events_bus.append_event(event_record(project_id, "a", priority=i)).event_id for i in range(5)]
+        events_bus.transition_state(project_id, ids[0], events_bus.EventState.DONE)
+        # Warm a second view before compaction to verify it notices the new snapshot.
+        other = event_log.EventLog(events_bus.events_path(project_id), events_bus.log_path(project_id))
+        assert len(other.sync(writable=False)) == 5
+
+        assert events_bus.compact_events(project_id) == 5
+        log_lines = events_bus.log_path(project_id).read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 1 and json.loads(log_lines[0])["op"] == "open"
+        snap_rows = [json.loads(x) for x in events_bus.events_path(project_id).read_text(encoding="utf-8").splitlines()]
+        assert [r["event_id"] for r in snap_rows] == ids
+        assert snap_rows[0]["state"] == "done"
+
+        events_bus.transition_state(project_id, ids[1], events_bus.EventState.PICKED)
+        idx = other.sync(writable=False)
+        assert idx.get(ids[0])["state"] == "done"
+        assert idx.get(ids[1])["state"] == "picked"
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_torn_log_tail_is_ignored_and_truncated_by_next_writer():
+    project_id = "unit_event_store_log_torn"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        a = events_bus.append_event(event_record(project_id, "a"))
+        with open(events_bus.log_path(project_id), "a", encoding="utf-8") as f:
+            f.write('{"op": "set", "event_id": "')
+        _fresh_view()
+        assert [r.event_id for r in events_bus.list_events(project_id)] == [a.event_id]
+
+        b = events_bus.append_event(event_record(project_id, "b"))
+        _fresh_view()
+        assert {r.event_id for r in events_bus.list_events(project_id)} == {a.event_id, b.event_id}
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_dedupe_and_pick_next_use_replayed_state():
+    project_id = "unit_event_store_log_pick"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        first = events_bus.append_event(event_record(project_id, "a", dedupe_key="k"), dedupe_window_sec=60)
+        again = events_bus.append_event(event_record(project_id, "a", dedupe_key="k"), dedupe_window_sec=60)
+        assert again.event_id == first.event_id
+        hi = events_bus.append_event(event_record(project_id, "a", priority=99))
+
+        picked = events_bus.pick_next(
+            project_id, domain="angelia", preempt_types=set(), cooldown_until=0.0, now=hi.created_at + 1, owner_id="a"
+        )
+        assert picked is not None and picked.event_id == hi.event_id
+        assert picked.state == events_bus.EventState.PICKED
+        none_for_b = events_bus.pick_next(
+            project_id, domain="angelia", preempt_types=set(), cooldown_until=0.0, now=hi.created_at + 1, owner_id="b"
+        )
+        assert none_for_b is None
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_transition_many_commits_batch_in_one_lock_hold():
+    project_id = "unit_event_store_log_many"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        a = events_bus.append_event(event_record(project_id, "a"))
+        b = events_bus.append_event(event_record(project_id, "a"))
+        c = events_bus.append_event(event_record(project_id, "a"))
+        before = events_bus.lock_stats()["exclusive"]
+        oks = events_bus.transition_many(
+            project_id,
+            [
+                (a.event_id, events_bus.EventState.PROCESSING),
+                (b.event_id, events_bus.EventState.PROCESSING),
+                ("missing", events_bus.EventState.PROCESSING),
+            ],
+        )
+        assert oks == [True, True, False]
+        assert events_bus.lock_stats()["exclusive"] - before == 1
+
+        # Same per-event validation as transition_state: PROCESSING -> PICKED is rejected.
+        oks = events_bus.transition_many(
+            project_id,
+            [(a.event_id, events_bus.EventState.PICKED), (c.event_id, events_bus.EventState.FAILED, "E", "boom")],
+        )
+        assert oks == [False, True]
+        states = events_bus.requeue_or_dead_many(project_id, [(a.event_id, "E", "x", 0), (b.event_id, "E", "y", 5)])
+        assert states == ["queued", "queued"]
+
+        _fresh_view()
+        rows = {r.event_id: r for r in events_bus.list_events(project_id, limit=10)}
+        assert rows[a.event_id].state == events_bus.EventState.QUEUED
+        assert rows[b.event_id].available_at > rows[a.event_id].available_at
+        assert rows[c.event_id].state == events_bus.EventState.FAILED
+        assert rows[c.event_id].error_message == "boom"
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,137 @@
+from pathlib import Path
+import shutil
+import sqlite3
+
+from gods import events as events_bus
+from gods.config import ProjectConfig, runtime_config
+from gods.events import sqlite_store
+from tests.helpers import event_record
+
+
+def _use_sqlite(project_id: str):
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(event_store_backend="sqlite")
+    return old
+
+
+def _restore(project_id: str, old):
+    if old is None:
+        runtime_config.projects.pop(project_id, None)
+    else:
+        runtime_config.projects[project_id] = old
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_sqlite_backend_migrates_jsonl_history_on_first_use():
+    project_id = "unit_event_store_sqlite_migrate"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    try:
+        a = events_bus.append_event(event_record(project_id, "a"))
+        events_bus.transition_state(project_id, a.event_id, events_bus.EventState.DONE)
+        b = events_bus.append_event(event_record(project_id, "b", priority=90))
+
+        _use_sqlite(project_id)
+        rows = {r.event_id: r for r in events_bus.list_events(project_id, limit=10)}
+        assert set(rows) == {a.event_id, b.event_id}
+        assert rows[a.event_id].state == events_bus.EventState.DONE
+        assert sqlite_store.db_path(project_id).exists()
+        runtime = events_bus.events_path(project_id).parent
+        assert (runtime / "events.log.jsonl.migrated").exists()
+        assert not (runtime / "events.log.jsonl").exists()
+        assert events_bus.events_path(project_id).read_text(encoding="utf-8") == ""
+        # Second call is a no-op once the database exists.
+        assert events_bus.migrate_events_to_sqlite(project_id)["imported"] == 0
+    finally:
+        _restore(project_id, old)
+
+
+def test_sqlite_backend_pick_dedupe_and_transitions():
+    project_id = "unit_event_store_sqlite_ops"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = _use_sqlite(project_id)
+    try:
+        first = events_bus.append_event(event_record(project_id, "a", event_type="timer", dedupe_key="t"), dedupe_window_sec=60)
+        again = events_bus.append_event(event_record(project_id, "a", event_type="timer", dedupe_key="t"), dedupe_window_sec=60)
+        assert again.event_id == first.event_id
+        mail = events_bus.append_event(event_record(project_id, "a", priority=100, event_type="mail_event"))
+        events_bus.append_event(event_record(project_id, "b", priority=100))
+
+        now = mail.created_at + 1
+        # During cooldown only preempt types are eligible.
+        picked = events_bus.pick_next(
+            project_id, domain="angelia", preempt_types={"timer"}, cooldown_until=now + 60, now=now, owner_id="a"
+        )
+        assert picked is not None and picked.event_id == first.event_id
+        assert picked.state == events_bus.EventState.PICKED
+        picked = events_bus.pick_next(
+            project_id, domain="angelia", preempt_types=set(), cooldown_until=0.0, now=now, owner_id="a"
+        )
+        assert picked is not None and picked.event_id == mail.event_id
+        assert events_bus.pick_next(
+            project_id, domain="angelia", preempt_types=set(), cooldown_until=0.0, now=now, owner_id="a"
+        ) is None
+
+        assert events_bus.transition_state(project_id, mail.event_id, events_bus.EventState.PROCESSING)
+        assert events_bus.requeue_or_dead(project_id, mail.event_id, "E", "boom", retry_delay_sec=0) == "queued"
+        assert events_bus.set_event_meta_field(project_id, mail.event_id, "k", 1)
+        row = events_bus.list_events(project_id, event_type="mail_event")[0]
+        assert row.attempt == 1 and row.error_code == "E" and row.meta == {"k": 1}
+        assert [r.event_id for r in events_bus.list_events(project_id, agent_id="b")] != []
+        assert not (Path("projects") / project_id / "runtime" / "events.log.jsonl").exists()
+    finally:
+        _restore(project_id, old)
+
+
+def test_sqlite_schema_uses_wal_and_indexes():
+    project_id = "unit_event_store_sqlite_schema"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = _use_sqlite(project_id)
+    try:
+        events_bus.append_event(event_record(project_id, "a"))
+        conn = sqlite3.connect(str(sqlite_store.db_path(project_id)))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert {"idx_events_pick", "idx_events_agent", "idx_events_dedupe"} <= names
+        finally:
+            conn.close()
+    finally:
+        _restore(project_id, old)
+
+
+def test_failed_sqlite_import_leaves_no_database_and_is_retried(monkeypatch):
+    project_id = "unit_event_store_sqlite_import_fail"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    try:
+        a = events_bus.append_event(event_record(project_id, "a"))
+        events_bus.append_event(event_record(project_id, "b"))
+        runtime = events_bus.events_path(project_id).parent
+        calls = {"n": 0}
+        real = sqlite_store._to_params
+
+        def _flaky(row):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise OSError("disk full")
+            return real(row)
+
+        monkeypatch.setattr(sqlite_store, "_to_params", _flaky)
+        try:
+            events_bus.migrate_events_to_sqlite(project_id)
+        except OSError:
+            pass
+        else:
+            raise AssertionError("import failure was swallowed")
+        assert not sqlite_store.db_path(project_id).exists()
+        assert not (runtime / "events.db.tmp").exists()
+        assert (runtime / "events.log.jsonl").stat().st_size > 0
+        assert not (runtime / "events.log.jsonl.migrated").exists()
+
+        monkeypatch.setattr(sqlite_store, "_to_params", real)
+        _use_sqlite(project_id)
+        assert a.event_id in {r.event_id for r in events_bus.list_events(project_id, limit=10)}
+        assert len(events_bus.list_events(project_id, limit=10)) == 2
+    finally:
+        _restore(project_id, old)
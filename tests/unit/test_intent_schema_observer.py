@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne import intent_schema_registry as registry
+
+
+def test_observed_schema_aggregates_in_memory_and_flushes_atomically(monkeypatch):
+    project_id = "unit_intent_schema_observer"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    monkeypatch.setattr(registry, "OBSERVED_FLUSH_SEC", 3600.0)
+    try:
+        path = registry.observed_schema_path(project_id)
+        for i in range(50):
+            registry.observe_intent_payload(project_id, "unit.observe", {"n": i, "tag": "x" if i % 2 else None})
+        assert not path.exists()
+
+        # Readers see pending deltas before they reach disk.
+        row = registry.observed_schema(project_id)["unit.observe"]
+        assert row["count"] == 50
+        assert row["fields"]["n"] == {"types": ["int"], "last_seen_value": "49"}
+        assert row["fields"]["tag"]["types"] == ["null", "str"]
+        assert registry.template_vars_for_intent(project_id, "unit.observe")["observed_vars"] == ["n", "tag"]
+
+        assert registry.flush_observed_schema(project_id) == 1
+        disk = json.loads(path.read_text(encoding="utf-8"))
+        assert disk["unit.observe"]["count"] == 50
+        assert list(path.parent.glob("*.tmp")) == []
+
+        # New deltas merge over the persisted snapshot, on read and on flush.
+        registry.observe_intent_payload(project_id, "unit.observe", {"n": 1.5})
+        assert registry.observed_schema(project_id)["unit.observe"]["fields"]["n"]["types"] == ["float", "int"]
+        registry.flush_observed_schema(project_id)
+        disk = json.loads(path.read_text(encoding="utf-8"))
+        assert disk["unit.observe"]["count"] == 51
+        assert disk["unit.observe"]["fields"]["n"]["types"] == ["float", "int"]
+        assert registry.flush_observed_schema(project_id) == 0
+    finally:
+        registry.flush_observed_schema(project_id)
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
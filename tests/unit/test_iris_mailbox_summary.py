@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from gods.agents.registry import register_agent
+from gods.config import ProjectConfig, runtime_config
+from gods.iris import MailEventState
+from gods.iris import facade as iris_facade
+
+
+def _send(project_id: str, sender: str, agent_id: str, title: str) -> dict:
+    return iris_facade.enqueue_message(
+        project_id=project_id,
+        agent_id=agent_id,
+        sender=sender,
+        title=title,
+        content="c",
+        msg_type="personal",
+        trigger_pulse=False,
+        pulse_priority=100,
+    )
+
+
+def test_mailbox_summary_counts_states_and_receipts_in_one_query():
+    project_id = "unit_iris_summary"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    # Receipt updates notify the sender through Angelia, so every sender must be active;
+    # "processes" mode keeps the supervisor from starting pulse workers for them.
+    runtime_config.projects[project_id] = ProjectConfig(angelia_supervisor_mode="processes")
+    try:
+        for agent_id in ("s", "a", "b", "c"):
+            (base / "agents" / agent_id).mkdir(parents=True, exist_ok=True)
+            register_agent(project_id, agent_id, active=True)
+        sent = [_send(project_id, "s", "a", f"m{i}") for i in range(5)]
+        _, delivered = iris_facade.fetch_inbox_context(project_id, "a", budget=2)
+        assert delivered == [m["mail_event_id"] for m in sent[:2]]
+        iris_facade.ack_handled(project_id, delivered, agent_id="a")
+        _send(project_id, "a", "b", "out1")
+        out2 = _send(project_id, "a", "b", "out2")
+        iris_facade.mark_as_delivered(project_id, out2["mail_event_id"])
+        _send(project_id, "c", "b", "other")
+
+        summary = iris_facade.get_mailbox_summary(project_id, "a", unread_limit=2, handled_limit=1, receipt_limit=1)
+        assert summary.count(MailEventState.HANDLED) == 2
+        assert summary.count(MailEventState.DEFERRED) == 3
+        assert summary.unread_count == 3
+        assert [e.title for e in summary.unread] == ["m3", "m4"]
+        assert [e.event_id for e in summary.read_recent] == [sent[1]["mail_event_id"]]
+        assert summary.receipt_counts["pending"] == 1
+        assert summary.receipt_counts["delivered"] == 1
+        assert len(summary.receipts) == 1
+
+        quiet = iris_facade.get_mailbox_summary(project_id, "z", unread_limit=0, handled_limit=0, include_receipts=False)
+        assert quiet.unread_count == 0 and quiet.unread == [] and quiet.receipts == []
+
+        glance = iris_facade.get_mailbox_glance(project_id, "a")
+        assert "- Inbound: 0 unread, 3 deferred, 2 recently handled." in glance
+        assert "- Outbound: 1 pending, 1 delivered, 0 handled, 0 failed." in glance
+    finally:
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(base, ignore_errors=True)
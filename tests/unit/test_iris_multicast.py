@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods import events as events_bus
+from gods.iris import MailEventState
+from gods.iris import facade as iris_facade
+
+
+def test_multicast_writes_each_store_once_and_queues_every_recipient():
+    project_id = "unit_iris_multicast"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    try:
+        rows = iris_facade.multicast_message(
+            project_id=project_id,
+            agent_ids=["a", "b", "a", "c"],
+            sender="Hermes",
+            title="Contract Fully Committed",
+            content="all in",
+            msg_type="contract_fully_committed",
+            trigger_pulse=False,
+            pulse_priority=90,
+        )
+        assert [r["agent_id"] for r in rows] == ["a", "b", "c"]
+        for r in rows:
+            summary = iris_facade.get_mailbox_summary(project_id, r["agent_id"], include_receipts=False)
+            assert summary.state_counts == {MailEventState.QUEUED.value: 1}
+            assert [e.event_id for e in summary.unread] == [r["mail_event_id"]]
+            assert summary.unread[0].content == "all in"
+
+        receipts = (base / "runtime" / "outbox_receipts.jsonl").read_text(encoding="utf-8").splitlines()
+        assert sorted(json.loads(x)["to_agent_id"] for x in receipts) == ["a", "b", "c"]
+        assert {r.to_agent_id for r in iris_facade.list_outbox_receipts(project_id, from_agent_id="Hermes")} == {"a", "b", "c"}
+
+        bus = events_bus.list_events(project_id, domain="iris", limit=50)
+        assert {e.event_id for e in bus} == {r["mail_event_id"] for r in rows}
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def test_append_events_runs_one_transaction_and_fires_hooks_per_record():
+    project_id = "unit_events_append_many"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    seen: list[str] = []
+
+    def _hook(record: events_bus.EventRecord):
+        if record.project_id == project_id:
+            seen.append(record.event_id)
+
+    events_bus.register_enqueue_hook(_hook)
+    try:
+        records = [
+            events_bus.EventRecord.create(
+                project_id=project_id,
+                domain="iris",
+                event_type="mail_event",
+                priority=10,
+                payload={"agent_id": f"a{i}"},
+            )
+            for i in range(3)
+        ]
+        out = events_bus.append_events(records)
+        assert [r.event_id for r in out] == seen == [r.event_id for r in records]
+        assert len(events_bus.list_events(project_id, limit=10)) == 3
+    finally:
+        from gods.events.enqueue_hooks import _HOOKS
+
+        _HOOKS.remove(_hook)
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
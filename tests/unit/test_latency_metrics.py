@@ -0,0 +1,60 @@
+from pathlib import Path
+import shutil
+
+from gods import events as events_bus
+from gods.config import ProjectConfig, runtime_config
+from gods.metrics import LatencyHistograms, latency_metrics
+from tests.helpers import event_record
+
+
+def test_latency_histograms_are_opt_in_and_render_prometheus():
+    on, off = "unit_latency_metrics_on", "unit_latency_metrics_off"
+    old = {pid: runtime_config.projects.get(pid) for pid in (on, off)}
+    runtime_config.projects[on] = ProjectConfig(angelia_latency_metrics_enabled=True)
+    runtime_config.projects[off] = ProjectConfig()
+    hist = LatencyHistograms()
+    try:
+        hist.observe("angelia_pulse_duration_ms", 3, project_id=off, agent_id="a", event_type="timer")
+        assert hist.snapshot() == {}
+
+        for v in (0.5, 3, 40, 400000):
+            hist.observe("angelia_pulse_duration_ms", v, project_id=on, agent_id="a", event_type="timer")
+        series = hist.snapshot()["angelia_pulse_duration_ms"]
+        assert series[0]["labels"] == {"project": on, "agent": "a", "event_type": "timer"}
+        assert series[0]["count"] == 4
+        assert series[0]["buckets"]["1"] == 1
+        assert series[0]["buckets"]["5"] == 2
+        assert series[0]["buckets"]["300000"] == 3
+        assert series[0]["buckets"]["+Inf"] == 4
+
+        text = hist.prometheus(counters={"pulse_runs": 4})
+        assert "# TYPE gods_angelia_events_total counter" in text
+        assert 'gods_angelia_events_total{name="pulse_runs"} 4' in text
+        assert "# TYPE gods_angelia_pulse_duration_ms histogram" in text
+        assert f'gods_angelia_pulse_duration_ms_bucket{{project="{on}",agent="a",event_type="timer",le="+Inf"}} 4' in text
+        assert f'gods_angelia_pulse_duration_ms_count{{project="{on}",agent="a",event_type="timer"}} 4' in text
+    finally:
+        for pid, cfg in old.items():
+            if cfg is None:
+                runtime_config.projects.pop(pid, None)
+            else:
+                runtime_config.projects[pid] = cfg
+
+
+def test_event_store_records_lock_hold_when_enabled():
+    project_id = "unit_latency_metrics_store"
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(angelia_latency_metrics_enabled=True)
+    latency_metrics.reset()
+    try:
+        events_bus.append_event(event_record(project_id, "a", priority=80))
+        series = latency_metrics.snapshot()["event_store_lock_hold_ms"]
+        assert [s["labels"] for s in series] == [{"project": project_id}]
+        assert series[0]["count"] >= 1
+    finally:
+        latency_metrics.reset()
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
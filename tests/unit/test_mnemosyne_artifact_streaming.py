@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import io
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne import facade as mnemosyne_facade
+from gods.tools.filesystem import _read_artifact_virtual
+
+
+def test_stream_upload_dedupes_with_bytes_upload_and_supports_range_reads():
+    project_id = "unit_artifact_stream"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    try:
+        payload = b"".join(f"line {i}\n".encode("utf-8") for i in range(1, 5001))
+        r1 = mnemosyne_facade.put_artifact_stream(
+            scope="project",
+            project_id=project_id,
+            owner_agent_id="",
+            actor_id="alpha",
+            source=io.BytesIO(payload),
+            mime="text/plain",
+        )
+        r2 = mnemosyne_facade.put_artifact_stream(
+            scope="project",
+            project_id=project_id,
+            owner_agent_id="",
+            actor_id="alpha",
+            source=(payload[i : i + 777] for i in range(0, len(payload), 777)),
+            mime="text/plain",
+        )
+        r3 = mnemosyne_facade.put_artifact_bytes(
+            scope="project",
+            project_id=project_id,
+            owner_agent_id="",
+            actor_id="alpha",
+            data=payload,
+            mime="text/plain",
+        )
+        assert r1.artifact_id == r2.artifact_id == r3.artifact_id
+        assert r1.size == len(payload)
+        blobs = base / "mnemosyne" / "artifacts" / "blobs"
+        assert [p.name for p in blobs.iterdir()] == [f"{r1.sha256}.bin"]
+
+        assert mnemosyne_facade.read_artifact_range(r1.artifact_id, "beta", project_id, 7, 7) == b"line 2\n"
+        assert mnemosyne_facade.read_artifact_range(r1.artifact_id, "beta", project_id, len(payload) - 10) == payload[-10:]
+        with mnemosyne_facade.open_artifact(r1.artifact_id, "beta", project_id) as f:
+            assert f.read() == payload
+
+        out = mnemosyne_facade.materialize_artifact(r1.artifact_id, "beta", project_id, str(base / "tmp"))
+        assert Path(out).read_bytes() == payload
+
+        view = _read_artifact_virtual(base, r1.artifact_id, "beta", project_id, 4999, 0)
+        assert "line_range: 4999-5000" in view
+        assert "total_lines: 5000" in view
+        assert view.endswith("---\nline 4999\nline 5000")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def test_read_artifact_virtual_reports_binary_payloads():
+    project_id = "unit_artifact_stream_bin"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    try:
+        ref = mnemosyne_facade.put_artifact_stream(
+            scope="project",
+            project_id=project_id,
+            owner_agent_id="",
+            actor_id="alpha",
+            source=io.BytesIO(b"ok\n\xff\xfe\x00"),
+        )
+        view = _read_artifact_virtual(base, ref.artifact_id, "alpha", project_id, 1, 0)
+        assert "content: <binary; text preview unavailable>" in view
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import shutil
+import threading
+from pathlib import Path
+
+from gods.config import ProjectConfig, runtime_config
+from gods.mnemosyne import compaction
+
+
+def _entry(i: int) -> str:
+    return f"\n### 📖 Entry [2026-01-01 00:00:00]\nentry {i}: " + ("x" * 180) + "\n\n---\n"
+
+
+def test_chronicle_token_counter_tracks_appends_incrementally():
+    project_id, agent_id = "unit_mn_chronicle_tokens", "tester"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        path = compaction.chronicle_path(project_id, agent_id)
+        assert compaction.chronicle_tokens(project_id, agent_id) == 0
+        path.write_text("### SYSTEM_SEED\nseed\n\n---\n", encoding="utf-8")
+        for i in range(20):
+            with path.open("a", encoding="utf-8") as f:
+                f.write(_entry(i))
+            assert compaction.chronicle_tokens(project_id, agent_id) == len(path.read_text(encoding="utf-8")) // 4
+        path.write_text("short", encoding="utf-8")
+        assert compaction.chronicle_tokens(project_id, agent_id) == 1
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_compaction_runs_in_background_and_keeps_concurrent_appends(monkeypatch):
+    project_id, agent_id = "unit_mn_background_compaction", "tester"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(
+        memory_compact_trigger_tokens=2000,
+        memory_compact_strategy="rule_based",
+    )
+    gate = threading.Event()
+    real_summary = compaction._build_compact_summary
+
+    def slow_summary(*args, **kwargs):
+        gate.wait(10)
+        return real_summary(*args, **kwargs)
+
+    monkeypatch.setattr(compaction, "_build_compact_summary", slow_summary)
+    try:
+        path = compaction.chronicle_path(project_id, agent_id)
+        path.write_text("### SYSTEM_SEED\nseed\n\n---\n" + "".join(_entry(i) for i in range(60)), encoding="utf-8")
+
+        assert compaction.schedule_compaction(project_id, agent_id) is True
+        assert compaction.schedule_compaction(project_id, agent_id) is False  # already queued
+        # The pulse path keeps reading the last committed chronicle while the job runs.
+        assert "MEMORY_COMPACTED_V2" not in compaction.load_chronicle_for_context(project_id, agent_id)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(_entry(999))
+        gate.set()
+        assert compaction.wait_for_compaction(project_id, agent_id, timeout=10)
+
+        text = path.read_text(encoding="utf-8")
+        assert text.startswith("### SYSTEM_SEED")
+        assert "MEMORY_COMPACTED_V2" in text
+        assert "entry 999:" in text
+        assert compaction.chronicle_tokens(project_id, agent_id) == len(text) // 4
+
+        stats = compaction.compaction_metrics(project_id)
+        assert stats["totals"]["performed"] == 1
+        assert stats["totals"]["pending"] == 0
+        assert stats["totals"]["bytes_archived"] == compaction.archive_path(project_id, agent_id).stat().st_size
+        assert stats["agents"][0]["last_lag_ms"] > 0
+    finally:
+        gate.set()
+        compaction.wait_for_compaction(project_id, agent_id, timeout=10)
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import shutil
+import time
+from pathlib import Path
+
+from gods.config import ProjectConfig, runtime_config
+from gods.mnemosyne import MemoryIntent, record_intent
+from gods.mnemosyne.facade import fetch_intents_between, flush_agent_writes
+
+
+def _intent(project_id: str, agent_id: str, n: int) -> MemoryIntent:
+    return MemoryIntent(
+        intent_key="tool.read.error",
+        project_id=project_id,
+        agent_id=agent_id,
+        source_kind="tool",
+        payload={
+            "tool_name": "read",
+            "status": "error",
+            "args": {"path": f"{n}.txt"},
+            "result": "read failed",
+            "result_compact": "read failed",
+        },
+        fallback_text=f"[TOOL] read error {n}",
+        timestamp=time.time(),
+    )
+
+
+def _lines(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    return [x for x in path.read_text(encoding="utf-8").splitlines() if x.strip()]
+
+
+def test_pulse_durability_buffers_until_flush_or_read():
+    project_id = "unit_mn_intent_writer"
+    agent_id = "alpha"
+    root = Path("projects") / project_id
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(memory_intent_durability="pulse")
+    shutil.rmtree(root, ignore_errors=True)
+    ledger = root / "mnemosyne" / "intents" / f"{agent_id}.jsonl"
+    runtime_log = root / "mnemosyne" / "runtime_events" / f"{agent_id}.jsonl"
+    try:
+        seqs = [record_intent(_intent(project_id, agent_id, i))["intent_seq"] for i in range(3)]
+        assert seqs == [seqs[0], seqs[0] + 1, seqs[0] + 2]
+        # The ledger row is appended with its seq; only derived files are buffered.
+        assert len(_lines(ledger)) == 3
+        assert _lines(runtime_log) == []
+        assert int((root / "mnemosyne" / "intent_seq" / f"{agent_id}.txt").read_text()) == seqs[-1]
+
+        # In-process readers commit pending lines first.
+        assert [i.intent_seq for i in fetch_intents_between(project_id, agent_id, seqs[0], seqs[-1])] == seqs
+        assert len(_lines(runtime_log)) == 3
+
+        # A removed file is reopened rather than written through a stale handle.
+        runtime_log.unlink()
+        record_intent(_intent(project_id, agent_id, 3))
+        flush_agent_writes(project_id, agent_id)
+        assert len(_lines(runtime_log)) == 1
+
+        runtime_config.projects[project_id] = ProjectConfig(memory_intent_durability="interval", memory_intent_flush_ms=10)
+        record_intent(_intent(project_id, agent_id, 4))
+        assert len(_lines(runtime_log)) == 1
+        time.sleep(0.02)
+        record_intent(_intent(project_id, agent_id, 5))
+        assert len(_lines(runtime_log)) == 3
+    finally:
+        flush_agent_writes(project_id)
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(root, ignore_errors=True)
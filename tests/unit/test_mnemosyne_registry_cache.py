@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne import policy_registry, template_registry
+
+
+def test_policy_cache_skips_parsing_until_file_changes(monkeypatch):
+    project_id = "unit_mn_registry_cache_policy"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        assert policy_registry.policy_rule(project_id, "llm.response") is not None
+        parses = []
+        real = policy_registry._load_raw_policy
+        monkeypatch.setattr(policy_registry, "_load_raw_policy", lambda *a, **k: parses.append(1) or real(*a, **k))
+        for _ in range(5):
+            policy_registry.policy_rule(project_id, "llm.response")
+            policy_registry.load_memory_policy(project_id)
+        assert parses == []
+
+        # In-process writes invalidate explicitly.
+        policy_registry.upsert_policy_rule(project_id, "llm.response", to_runtime_log=True)
+        assert policy_registry.policy_rule(project_id, "llm.response")["to_runtime_log"] is True
+
+        # Out-of-process edits are caught by the file signature.
+        path = policy_registry.policy_path(project_id)
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw["llm.response"]["to_runtime_log"] = False
+        path.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
+        assert policy_registry.policy_rule(project_id, "llm.response")["to_runtime_log"] is False
+
+        # Callers get copies, not the cached rule.
+        policy_registry.load_memory_policy(project_id)["llm.response"]["to_chronicle"] = "mutated"
+        assert policy_registry.policy_rule(project_id, "llm.response")["to_chronicle"] != "mutated"
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_template_cache_follows_upserts_and_external_edits():
+    project_id = "unit_mn_registry_cache_templates"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        render = lambda: template_registry.render_memory_template(project_id, "runtime_log", "unit_tpl", {"x": 1})
+        template_registry.upsert_memory_template(project_id, "runtime_log", "unit_tpl", "a=$x")
+        assert render() == "a=1"
+        template_registry.upsert_memory_template(project_id, "runtime_log", "unit_tpl", "b=$x")
+        assert render() == "b=1"
+
+        path = template_registry.runtime_log_templates_path(project_id)
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw["unit_tpl"] = "edited=$x"
+        path.write_text(json.dumps(raw), encoding="utf-8")
+        assert render() == "edited=1"
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
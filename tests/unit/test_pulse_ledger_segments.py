@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods.config import ProjectConfig, runtime_config
+from gods.mnemosyne import pulse_ledger
+
+
+def _rows(n: int, start: int = 0) -> list[dict]:
+    return [
+        {"pulse_id": f"p{(start + i) // 4}", "kind": "llm.response", "payload": {"i": start + i, "pad": "x" * 400}}
+        for i in range(n)
+    ]
+
+
+def test_pulse_ledger_rotates_compresses_and_prunes_segments(monkeypatch):
+    project_id, agent_id = "unit_pulse_ledger_segments", "a"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(memory_pulse_segment_kb=64)
+    try:
+        for k in range(10):
+            pulse_ledger.append_pulse_entries(project_id, agent_id, _rows(100, k * 100))
+        segments = pulse_ledger.list_pulse_segments(project_id, agent_id)
+        sealed = [s for s in segments if s["sealed"]]
+        assert len(sealed) >= 5 and not segments[-1]["sealed"]
+        assert all(s["name"].endswith(".jsonl.gz") for s in sealed)
+        assert sealed[0]["first_seq"] == 1
+        assert all(a["last_seq"] < b["first_seq"] for a, b in zip(sealed, sealed[1:]))
+
+        all_rows = pulse_ledger.list_pulse_entries(project_id, agent_id, limit=5000)
+        assert [r["seq"] for r in all_rows] == list(range(1, 1001))
+        assert all_rows[0]["payload"]["i"] == 0
+
+        opened: list[str] = []
+        real_iter = pulse_ledger._iter_segment
+        monkeypatch.setattr(pulse_ledger, "_iter_segment", lambda d, name: opened.append(name) or real_iter(d, name))
+        tail = pulse_ledger.list_pulse_entries(project_id, agent_id, limit=10)
+        assert [r["seq"] for r in tail] == list(range(991, 1001))
+        assert len(opened) <= 2
+
+        opened.clear()
+        mid = sealed[2]
+        window = pulse_ledger.list_pulse_entries(
+            project_id, agent_id, from_seq=mid["first_seq"] - 1, to_seq=mid["last_seq"], limit=5000
+        )
+        assert [r["seq"] for r in window] == list(range(mid["first_seq"], mid["last_seq"] + 1))
+        assert opened[-1] == mid["name"] and sealed[0]["name"] not in opened
+
+        opened.clear()
+        late = pulse_ledger.list_pulse_entries(project_id, agent_id, since_ts=sealed[-1]["last_ts"] + 1e-6, limit=5000)
+        assert all(r["seq"] > sealed[-1]["last_seq"] for r in late)
+        assert not any(s["name"] in opened for s in sealed)
+    finally:
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_legacy_single_file_ledger_is_split_on_first_access():
+    project_id, agent_id = "unit_pulse_ledger_legacy", "a"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(memory_pulse_segment_kb=64, memory_pulse_segment_compress="none")
+    try:
+        legacy = Path("projects") / project_id / "mnemosyne" / "pulse_ledger" / f"{agent_id}.jsonl"
+        legacy.parent.mkdir(parents=True, exist_ok=True)
+        with legacy.open("w", encoding="utf-8") as f:
+            for i, row in enumerate(_rows(300)):
+                f.write(json.dumps({"seq": i + 1, "ts": float(i), **row}) + "\n")
+        (legacy.parent.parent / "pulse_ledger_seq").mkdir(parents=True, exist_ok=True)
+        (legacy.parent.parent / "pulse_ledger_seq" / f"{agent_id}.txt").write_text("300", encoding="utf-8")
+
+        assert [r["seq"] for r in pulse_ledger.list_pulse_entries(project_id, agent_id, limit=3)] == [298, 299, 300]
+        assert not legacy.exists()
+        segments = pulse_ledger.list_pulse_segments(project_id, agent_id)
+        assert len(segments) >= 2 and all(s["name"].endswith(".jsonl") for s in segments)
+
+        row = pulse_ledger.append_pulse_entry(project_id, agent_id, pulse_id="p-new", kind="pulse.start")
+        assert row["seq"] == 301
+        assert pulse_ledger.list_pulse_entries(project_id, agent_id, from_seq=299)[-1]["pulse_id"] == "p-new"
+    finally:
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
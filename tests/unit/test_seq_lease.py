@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne import load_memory_policy, pulse_ledger, seq_lease
+from gods.mnemosyne.facade import MemoryIntent, fetch_intents_between, record_intent
+
+
+def _file_seqs(path: Path, key: str) -> list[int]:
+    return [int(json.loads(x)[key]) for x in path.read_text(encoding="utf-8").splitlines() if x.strip()]
+
+
+def _run_in_two_processes(target, *args):
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=target, args=(i, *args)) for i in range(2)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+    assert [p.exitcode for p in procs] == [0, 0]
+
+
+def _append_raw(worker: int, hwm: str, ledger: str):
+    hwm_p, ledger_p = Path(hwm), Path(ledger)
+
+    def _floor() -> int:
+        rows = _file_seqs(ledger_p, "seq") if ledger_p.exists() else []
+        return rows[-1] if rows else 0
+
+    for _ in range(200):
+        seq_lease.append_with_seqs(
+            hwm_p, ledger_p, 1, lambda seq: (json.dumps({"seq": seq, "w": worker}) + "\n").encode(), floor=_floor
+        )
+
+
+def test_append_with_seqs_keeps_file_order_across_processes(tmp_path):
+    hwm, ledger = tmp_path / "seq.txt", tmp_path / "ledger.jsonl"
+    _run_in_two_processes(_append_raw, str(hwm), str(ledger))
+    assert _file_seqs(ledger, "seq") == list(range(1, 401))
+    assert int(hwm.read_text()) == 400
+
+    # A lagging high-water mark is reconciled against the ledger tail.
+    hwm.write_text("7")
+    seq_lease.forget_ledger_heads(tmp_path)
+    first, offset = seq_lease.append_with_seqs(
+        hwm, ledger, 2, lambda seq: b'{"seq": %d}\n{"seq": %d}\n' % (seq, seq + 1), floor=lambda: _file_seqs(ledger, "seq")[-1]
+    )
+    assert first == 401 and offset > 0
+    assert _file_seqs(ledger, "seq")[-2:] == [401, 402]
+
+
+def _record_intents(worker: int, project_id: str):
+    for n in range(40):
+        record_intent(
+            MemoryIntent(
+                intent_key="tool.read.error",
+                project_id=project_id,
+                agent_id="shared",
+                source_kind="tool",
+                payload={"tool_name": "read", "status": "error", "args": {"path": f"{worker}-{n}"},
+                         "result": "x", "result_compact": "x"},
+                fallback_text=f"[TOOL] read error {worker}-{n}",
+            )
+        )
+
+
+def _append_pulses(worker: int, project_id: str):
+    for n in range(60):
+        pulse_ledger.append_pulse_entry(project_id, "shared", pulse_id=f"p{worker}-{n}", kind="pulse.start")
+
+
+def test_intent_and_pulse_ledgers_stay_in_seq_order_with_two_writer_processes():
+    project_id = "unit_seq_lease_two_procs"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        load_memory_policy(project_id)  # create the policy file before the writers race for it
+        _run_in_two_processes(_record_intents, project_id)
+        ledger = Path("projects") / project_id / "mnemosyne" / "intents" / "shared.jsonl"
+        assert _file_seqs(ledger, "intent_seq") == list(range(1, 81))
+        assert [i.intent_seq for i in fetch_intents_between(project_id, "shared", 1, 80)] == list(range(1, 81))
+
+        _run_in_two_processes(_append_pulses, project_id)
+        rows = pulse_ledger.list_pulse_entries(project_id, "shared", limit=1000)
+        assert sorted(r["seq"] for r in rows) == list(range(1, 121))
+        segment = pulse_ledger._ledger_dir(project_id, "shared") / pulse_ledger.list_pulse_segments(project_id, "shared")[-1]["name"]
+        assert _file_seqs(segment, "seq") == list(range(1, 121))
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+
+
+def test_pulse_ledger_seq_reconciles_against_ledger_tail():
+    project_id, agent_id = "unit_seq_lease_pulse", "a"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        rows = pulse_ledger.append_pulse_entries(
+            project_id, agent_id, [{"pulse_id": "p1", "kind": "pulse.start"} for _ in range(5)]
+        )
+        assert [r["seq"] for r in rows] == [1, 2, 3, 4, 5]
+
+        # Simulate a lost high-water mark after rows reached the ledger.
+        seq_lease.forget_ledger_heads()
+        pulse_ledger._seq_path(project_id, agent_id).write_text("2", encoding="utf-8")
+        row = pulse_ledger.append_pulse_entry(project_id, agent_id, pulse_id="p2", kind="pulse.start")
+        assert row["seq"] == 6
+
+        # Deleting the ledger and its high-water mark restarts the sequence.
+        shutil.rmtree(Path("projects") / project_id)
+        row = pulse_ledger.append_pulse_entry(project_id, agent_id, pulse_id="p3", kind="pulse.start")
+        assert row["seq"] == 1
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
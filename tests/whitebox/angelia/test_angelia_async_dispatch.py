@@ -0,0 +1,69 @@
+# @whitebox-reason: verify the async pulse dispatcher bounds concurrency and honours AngeliaMailbox deadlines.
+import threading
+import time
+
+from gods.angelia import async_dispatch
+from gods.angelia.mailbox import angelia_mailbox
+from gods.config import ProjectConfig, runtime_config
+from tests.helpers import wait_until
+
+
+def _patch_worker(monkeypatch, drain):
+    monkeypatch.setattr(async_dispatch, "drain_ready_events", drain)
+    monkeypatch.setattr(async_dispatch, "mark_worker_started", lambda pid, aid: None)
+    monkeypatch.setattr(async_dispatch, "mark_worker_stopped", lambda pid, aid: None)
+    monkeypatch.setattr(async_dispatch, "has_idle_work", lambda pid, aid: False)
+
+
+def test_async_dispatcher_bounds_pulses_by_project_concurrency(monkeypatch):
+    project_id = "unit_angelia_async_bound"
+    old = runtime_config.projects.get(project_id)
+    runtime_config.projects[project_id] = ProjectConfig(llm_project_max_concurrency=2, llm_global_max_concurrency=4)
+    guard = threading.Lock()
+    state = {"running": 0, "peak": 0, "calls": []}
+
+    def _drain(ctx):
+        with guard:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            state["calls"].append(ctx.agent_id)
+        time.sleep(0.05)
+        with guard:
+            state["running"] -= 1
+
+    _patch_worker(monkeypatch, _drain)
+    dispatcher = async_dispatch.AsyncPulseDispatcher()
+    try:
+        agents = [f"async_{i}" for i in range(12)]
+        for aid in agents:
+            dispatcher.register(project_id, aid)
+        assert wait_until(lambda: set(state["calls"]) == set(agents))
+        assert state["peak"] <= 2
+        pulse_threads = [t for t in threading.enumerate() if t.name.startswith("angelia-pulse")]
+        assert 0 < len(pulse_threads) <= 4
+    finally:
+        dispatcher.stop()
+        if old is None:
+            runtime_config.projects.pop(project_id, None)
+        else:
+            runtime_config.projects[project_id] = old
+
+
+def test_async_dispatcher_honours_mailbox_deadlines(monkeypatch):
+    project_id = "unit_angelia_async_deadline"
+    calls: list[float] = []
+    _patch_worker(monkeypatch, lambda ctx: calls.append(time.time()))
+    dispatcher = async_dispatch.AsyncPulseDispatcher()
+    try:
+        dispatcher.register(project_id, "deadline_a")
+        assert wait_until(lambda: len(calls) == 1)
+        due = time.time() + 0.2
+        angelia_mailbox.notify_at(project_id, "deadline_a", due)
+        assert wait_until(lambda: len(calls) == 2)
+        assert calls[1] >= due - 0.01
+        dispatcher.unregister(project_id, "deadline_a")
+        angelia_mailbox.notify(project_id, "deadline_a")
+        time.sleep(0.1)
+        assert len(calls) == 2
+    finally:
+        dispatcher.stop()
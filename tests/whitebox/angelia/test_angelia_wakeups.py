@@ -0,0 +1,47 @@
+# @whitebox-reason: verify AngeliaMailbox deadline wakes and the worker arming them from delayed/cooldown events.
+from pathlib import Path
+import shutil
+import time
+
+from gods import events as events_bus
+from gods.angelia import worker
+from gods.angelia.mailbox import AngeliaMailbox, angelia_mailbox
+from tests.helpers import event_record
+
+
+def test_mailbox_deadline_wakes_before_timeout_and_earliest_wins():
+    box = AngeliaMailbox()
+    t0 = time.time()
+    box.notify_at("p", "a", t0 + 5.0)
+    box.notify_at("p", "a", t0 + 0.1)
+    assert box.wait("p", "a", timeout=3.0) is True
+    assert time.time() - t0 < 1.0
+    # Deadline is consumed; plain timeout afterwards.
+    assert box.wait("p", "a", timeout=0.05) is False
+
+    box.notify_project("p")
+    assert box.wait("p", "a", timeout=0.05) is True
+
+
+def test_worker_arms_wake_for_delayed_and_cooldown_blocked_events():
+    project_id = "unit_angelia_wakeups"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        rec = events_bus.append_event(event_record(project_id, "waker"))
+        now = time.time()
+        events_bus.requeue_or_dead(project_id, rec.event_id, "E", "retry later", retry_delay_sec=30)
+        slot = angelia_mailbox._slot(project_id, "waker")
+        slot.wake_at = 0.0
+
+        worker._schedule_next_wake(project_id, "waker", now, cooldown_until=0.0, force_after_sec=0.0)
+        due = events_bus.next_ready_at(project_id, "waker", now=now)
+        assert due > now and slot.wake_at == due
+
+        # Once due but held back by cooldown, the wake is armed at cooldown end.
+        later = due + 1
+        slot.wake_at = 0.0
+        worker._schedule_next_wake(project_id, "waker", later, cooldown_until=later + 20, force_after_sec=0.0)
+        assert slot.wake_at == later + 20
+    finally:
+        angelia_mailbox._slot(project_id, "waker").wake_at = 0.0
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,94 @@
+# @whitebox-reason: drive route_provider against a local server and check pool reuse, report throttling and retired-pool closing.
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gods.hermes import facade as hermes_facade
+from gods.hermes import http_pool
+from gods.hermes.http_pool import http_pools
+from gods.hermes.models import ProtocolSpec
+from gods.hermes.router import route_provider
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: list[int] = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        _Handler.peers.append(self.client_address[1])
+        data = json.dumps({"echo": body}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        return None
+
+
+def test_http_provider_reuses_pooled_connection_and_reports_utilization():
+    project_id = "unit_hermes_http_pool"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _Handler.peers = []
+    try:
+        spec = ProtocolSpec(
+            name="pool.echo",
+            provider={"type": "http", "project_id": project_id, "url": f"http://127.0.0.1:{server.server_port}/x"},
+            limits={"timeout_sec": 7, "connect_timeout_sec": 0.5},
+        )
+        for i in range(3):
+            out = route_provider(spec, project_id, {"i": i}, timeout_sec=spec.limits.timeout_sec)
+            assert out == {"result": {"echo": {"i": i}}, "status_code": 200}
+
+        assert len(_Handler.peers) == 3
+        assert len(set(_Handler.peers)) == 1
+
+        [metrics] = hermes_facade.http_pool_metrics(project_id)
+        assert metrics["origin"] == f"http://127.0.0.1:{server.server_port}"
+        assert metrics["requests"] == 3
+        assert metrics["in_use"] == 0
+        assert metrics["peak_in_use"] == 1
+        assert metrics["pool_size"] == 8
+
+        # Only the first call reports; the rest fall inside the report interval.
+        events = [e for e in hermes_facade.events_since(project_id, 0) if e["type"] == "http_pool"]
+        assert len(events) == 1
+        assert events[0]["payload"]["name"] == "pool.echo"
+        assert events[0]["payload"]["in_use"] == 1
+        assert events[0]["payload"]["utilization"] == round(1 / 8, 3)
+    finally:
+        http_pools.close(project_id)
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_replaced_while_in_use_is_closed_by_its_last_request(monkeypatch):
+    project_id = "unit_hermes_http_pool_retire"
+    origin = "http://127.0.0.1:9"
+    closed: list[int] = []
+    try:
+        old, report = http_pools._acquire(project_id, origin)
+        assert report is not None and report["in_use"] == 1
+        monkeypatch.setattr(old.session, "close", lambda: closed.append(old.size))
+
+        monkeypatch.setattr(http_pool, "_pool_settings", lambda pid: (4, True))
+        new, _ = http_pools._acquire(project_id, origin)
+        assert new is not old and new.size == 4
+        assert closed == []
+
+        http_pools._release(new)
+        assert closed == []
+        http_pools._release(old)
+        assert closed == [8]
+        assert http_pools._retired == []
+        [metrics] = hermes_facade.http_pool_metrics(project_id)
+        assert metrics["pool_size"] == 4 and metrics["in_use"] == 0
+    finally:
+        http_pools.close(project_id)
@@ -0,0 +1,82 @@
+# @whitebox-reason: check the per-recipient mailbox files, the cached state index and the legacy single-file split.
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods.iris import store as iris_store
+from gods.iris.models import MailEventState
+
+
+def _enqueue(project_id: str, agent_id: str, title: str):
+    return iris_store.enqueue_mail_event(
+        project_id=project_id,
+        agent_id=agent_id,
+        event_type="mail_event",
+        priority=100,
+        sender="s",
+        title=title,
+        content=title,
+    )
+
+
+def test_mailbox_is_partitioned_per_recipient_with_state_index():
+    project_id = "unit_iris_partitions"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    try:
+        a1 = _enqueue(project_id, "a", "a1")
+        a2 = _enqueue(project_id, "a", "a2")
+        b1 = _enqueue(project_id, "b", "b1")
+        mailbox = base / "runtime" / "mailbox"
+        assert sorted(p.name for p in mailbox.glob("*.jsonl")) == ["a.jsonl", "b.jsonl"]
+
+        delivered = iris_store.deliver_mailbox_events(project_id, "a", budget=1)
+        assert [e.event_id for e in delivered] == [a1.event_id]
+        deferred = iris_store.list_mailbox_events(project_id, "a", state=MailEventState.DEFERRED)
+        assert [e.event_id for e in deferred] == [a2.event_id]
+        assert iris_store.has_pending_mailbox_events(project_id, "b") is True
+
+        # Partition "b" is untouched by agent a's state changes.
+        b_rows = [json.loads(x) for x in (mailbox / "b.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert [r["state"] for r in b_rows] == ["queued"]
+
+        handled = iris_store.mark_mailbox_events_handled(project_id, [a1.event_id, b1.event_id])
+        assert {e.event_id for e in handled} == {a1.event_id, b1.event_id}
+        assert iris_store.has_pending_mailbox_events(project_id, "a") is True
+        assert iris_store.has_pending_mailbox_events(project_id, "b") is False
+
+        # A write from another process (new file signature) is picked up by the cached index.
+        a_path = mailbox / "a.jsonl"
+        rows = [json.loads(x) for x in a_path.read_text(encoding="utf-8").splitlines()]
+        for r in rows:
+            r["state"] = "handled"
+        a_path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+        assert iris_store.has_pending_mailbox_events(project_id, "a") is False
+        assert len(iris_store.list_mail_events(project_id, state=MailEventState.HANDLED)) == 3
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def test_legacy_single_file_mailbox_is_split_on_first_access():
+    project_id = "unit_iris_partitions_legacy"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    try:
+        legacy = base / "runtime" / "mailbox_events.jsonl"
+        legacy.parent.mkdir(parents=True, exist_ok=True)
+        rows = [
+            {"event_id": "e1", "project_id": project_id, "agent_id": "a", "event_type": "mail_event",
+             "priority": 100, "created_at": 1.0, "state": "queued", "available_at": 0.0},
+            {"event_id": "e2", "project_id": project_id, "agent_id": "b", "event_type": "mail_event",
+             "priority": 100, "created_at": 2.0, "state": "handled", "available_at": 0.0},
+        ]
+        legacy.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+
+        assert iris_store.has_pending_mailbox_events(project_id, "a") is True
+        assert not legacy.exists()
+        assert [e.event_id for e in iris_store.list_mail_events(project_id)] == ["e1", "e2"]
+        assert (base / "runtime" / "mailbox" / "b.jsonl").exists()
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
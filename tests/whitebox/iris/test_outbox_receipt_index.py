@@ -0,0 +1,58 @@
+# @whitebox-reason: check the receipt log layout (one status patch row per batch, compaction threshold) and the cached-log fold.
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods.iris import outbox_store
+from gods.iris.outbox_models import OutboxReceiptStatus
+
+
+def test_update_status_many_appends_one_patch_and_indexes_lookups():
+    project_id = "unit_outbox_index"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    try:
+        for i in range(4):
+            outbox_store.create_receipt(project_id, "s", f"r{i % 2}", f"t{i}", f"m{i}")
+        path = base / "runtime" / "outbox_receipts.jsonl"
+        before = len(path.read_text(encoding="utf-8").splitlines())
+
+        updated = outbox_store.update_status_many(project_id, ["m2", "m0", "missing"], OutboxReceiptStatus.DELIVERED)
+        assert [r.message_id for r in updated] == ["m2", "m0"]
+        assert all(r.status == OutboxReceiptStatus.DELIVERED for r in updated)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == before + 1
+        assert json.loads(lines[-1])["op"] == "status"
+
+        failed = outbox_store.update_status_by_message_id(project_id, "m1", OutboxReceiptStatus.FAILED, error_message="boom")
+        assert failed[0].error_message == "boom"
+
+        assert {r.message_id for r in outbox_store.list_receipts(project_id, to_agent_id="r0")} == {"m0", "m2"}
+        assert outbox_store.list_receipts(project_id, message_id="m1")[0].status == OutboxReceiptStatus.FAILED
+        assert len(outbox_store.list_receipts(project_id, status="delivered")) == 2
+
+        # A cold reader folds the patch rows the same way.
+        outbox_store._LOGS.invalidate()
+        counts, recent = outbox_store.summarize_receipts(project_id, "s", limit=10)
+        assert counts == {"pending": 1, "delivered": 2, "handled": 0, "failed": 1}
+        assert len(recent) == 4
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def test_receipt_log_compacts_status_patches(monkeypatch):
+    project_id = "unit_outbox_compact"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    monkeypatch.setattr(outbox_store, "_COMPACT_MIN_PATCHES", 3)
+    try:
+        outbox_store.create_receipt(project_id, "s", "r", "t", "m")
+        for status in ["delivered", "handled", "delivered", "handled"]:
+            outbox_store.update_status_many(project_id, ["m"], OutboxReceiptStatus(status))
+        rows = [json.loads(x) for x in (base / "runtime" / "outbox_receipts.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert all("op" not in r for r in rows)
+        assert rows[0]["status"] == "handled"
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
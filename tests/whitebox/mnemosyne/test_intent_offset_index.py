@@ -0,0 +1,49 @@
+# @whitebox-reason: verify the sparse intent offset index against raw ledger appends and range fetches.
+import json
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne import intent_index
+from gods.mnemosyne.janus_snapshot import build_cards_from_intents
+from gods.mnemosyne.memory import _append_intent, fetch_intents_between
+
+
+def _row(agent_id: str, seq: int) -> dict:
+    return {
+        "intent_id": f"{agent_id}:{seq}",
+        "intent_seq": seq,
+        "intent_key": "agent.mode.freeform",
+        "project_id": "p",
+        "agent_id": agent_id,
+        "source_kind": "agent",
+        "payload": {"n": seq},
+        "fallback_text": f"row {seq}",
+        "timestamp": float(seq),
+    }
+
+
+def test_intent_range_reads_seek_through_sparse_offset_index():
+    project_id = "unit_intent_offset_index"
+    agent_id = "alpha"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        for seq in range(1, 1001):
+            assert _append_intent(project_id, agent_id, lambda s: _row(agent_id, s))["intent_seq"] == seq
+        ledger = intent_index._intents_path(project_id, agent_id)
+        offset = intent_index.seek_offset(project_id, agent_id, 900)
+        assert offset > 0
+        assert json.loads(ledger.read_bytes()[offset:].split(b"\n", 1)[0])["intent_seq"] == 896
+
+        assert [i.intent_seq for i in fetch_intents_between(project_id, agent_id, 900, 905)] == list(range(900, 906))
+        cards = build_cards_from_intents(project_id, agent_id, from_intent_seq=990, to_intent_seq=995)
+        assert [c["source_intent_seq_max"] for c in cards] == list(range(991, 996))
+
+        # A lost sidecar is rebuilt from the ledger.
+        intent_index._index_path(project_id, agent_id).unlink()
+        assert intent_index.seek_offset(project_id, agent_id, 900) == offset
+
+        # A rewritten ledger invalidates stale checkpoints instead of returning wrong rows.
+        ledger.write_text("".join(json.dumps(_row(agent_id, s)) + "\n" for s in range(500, 1001)), encoding="utf-8")
+        assert [i.intent_seq for i in fetch_intents_between(project_id, agent_id, 899, 900)] == [899, 900]
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,46 @@
+# @whitebox-reason: verify the cached intent seq head in janus_snapshot across appends, torn tails and rewrites.
+import json
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne import janus_snapshot
+from gods.mnemosyne.janus_snapshot import latest_intent_seq
+
+
+def _append(path: Path, rows: list[dict], tail: str = ""):
+    with path.open("a", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+        f.write(tail)
+
+
+def test_latest_intent_seq_head_tracks_appends_tears_and_rewrites():
+    project_id = "unit_intent_seq_head"
+    agent_id = "alpha"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        assert latest_intent_seq(project_id, agent_id) == 0
+        path = janus_snapshot._intents_path(project_id, agent_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Legacy rows without intent_seq are skipped; the long history exceeds one tail window.
+        pad = "x" * 200
+        _append(path, [{"intent_seq": i, "payload": pad} for i in range(1, 1001)])
+        _append(path, [{"intent_key": "legacy", "payload": pad} for _ in range(500)])
+        assert path.stat().st_size > janus_snapshot._SEQ_TAIL_CHUNK
+        assert latest_intent_seq(project_id, agent_id) == 1000
+        assert latest_intent_seq(project_id, agent_id) == 1000
+
+        # A torn trailing row is ignored until its newline lands.
+        _append(path, [{"intent_seq": 1001}], tail='{"intent_seq": 10')
+        assert latest_intent_seq(project_id, agent_id) == 1001
+        _append(path, [], tail="02}\n")
+        assert latest_intent_seq(project_id, agent_id) == 1002
+
+        # A rewritten (compacted) ledger is re-read from its tail.
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"intent_seq": 7}) + "\n", encoding="utf-8")
+        tmp.replace(path)
+        assert latest_intent_seq(project_id, agent_id) == 7
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
@@ -0,0 +1,62 @@
+# @whitebox-reason: inject a failing append handle into _AgentWriter to check staged lines survive write errors.
+from __future__ import annotations
+
+import errno
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gods.mnemosyne.intent_writer import agent_writer
+
+
+class _FullDisk:
+    """Writes a few bytes of the first chunk, then fails like a full disk."""
+
+    def __init__(self, real):
+        self.real = real
+        self.calls = 0
+
+    def fileno(self):
+        return self.real.fileno()
+
+    def write(self, data):
+        self.calls += 1
+        if self.calls == 1:
+            return self.real.write(bytes(data[:5]))
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    def close(self):
+        self.real.close()
+
+
+def test_commit_keeps_unwritten_lines_and_hooks_after_oserror():
+    project_id = "unit_intent_writer_enospc"
+    base = Path("projects") / project_id
+    shutil.rmtree(base, ignore_errors=True)
+    path = base / "ledger.jsonl"
+    w = agent_writer(project_id, "alpha")
+    offsets: list[int] = []
+    hooks: list[str] = []
+    try:
+        w.stage(path, '{"n": 0}\n', offsets.append)
+        w.commit()
+        w.stage(path, '{"n": 1}\n', offsets.append)
+        w.stage(path, '{"n": 2}\n', offsets.append)
+        w.after_commit("seq", lambda: hooks.append("ran"))
+        w._handles[path] = _FullDisk(w._handles[path])
+
+        with pytest.raises(OSError):
+            w.commit()
+        assert hooks == []
+        assert offsets == [0]
+
+        w.commit()
+        assert hooks == ["ran"]
+        lines = path.read_text(encoding="utf-8").split("\n")
+        # The torn fragment is closed off on its own line instead of corrupting the retry.
+        assert lines == ['{"n": 0}', '{"n":', '{"n": 1}', '{"n": 2}', ""]
+        assert offsets == [0, 15, 24]
+    finally:
+        w.close()
+        shutil.rmtree(base, ignore_errors=True)
@@ -0,0 +1,41 @@
+# @whitebox-reason: verify backward JSONL tail reads (torn lines, block edges) behind context reports.
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from gods.mnemosyne.context_reports import latest_context_report, list_context_reports, record_context_report
+from gods.mnemosyne.jsonl_tail import iter_jsonl_reverse, last_jsonl_row, tail_jsonl
+
+
+def test_tail_jsonl_reads_backward_across_blocks_and_skips_torn_lines(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    lines = [json.dumps({"i": i, "text": "é" * (i % 7)}, ensure_ascii=False) for i in range(100)]
+    lines.insert(40, "{torn")
+    lines.insert(60, "")
+    lines.insert(70, "[1, 2]")
+    path.write_text("\n".join(lines) + "\n" + '{"i": 100, "te', encoding="utf-8")
+
+    for block in (1, 7, 64, 1 << 16):
+        assert [r["i"] for r in tail_jsonl(path, 5, block_size=block)] == [95, 96, 97, 98, 99]
+        assert [r["i"] for r in iter_jsonl_reverse(path, block_size=block)] == list(range(99, -1, -1))
+    assert tail_jsonl(path, 0) == []
+    assert len(tail_jsonl(path, 1000)) == 100
+    assert tail_jsonl(tmp_path / "missing.jsonl", 5) == []
+    assert last_jsonl_row(path) == {"i": 99, "text": "é"}
+
+
+def test_context_report_listings_use_the_tail():
+    project_id, agent_id = "unit_mn_jsonl_tail_reports", "tester"
+    shutil.rmtree(Path("projects") / project_id, ignore_errors=True)
+    try:
+        assert latest_context_report(project_id, agent_id) is None
+        for i in range(300):
+            record_context_report(project_id, agent_id, {"n": i})
+        with (Path("projects") / project_id / "mnemosyne" / "context_reports" / f"{agent_id}.jsonl").open("a") as f:
+            f.write('{"n": 300, "torn')
+        assert latest_context_report(project_id, agent_id)["n"] == 299
+        assert [r["n"] for r in list_context_reports(project_id, agent_id, limit=3)] == [297, 298, 299]
+    finally:
+        shutil.rmtree(Path("projects") / project_id, ignore_errors=True)